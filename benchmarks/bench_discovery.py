@@ -0,0 +1,359 @@
+"""
+Benchmark discovery Step 1: mesin InnerTube (HTTP, tanpa browser) vs Selenium (Chrome headless) pada feed
+Shorts lokal yang dibangun dari data InnerTube rekaman di tests/fixtures/innertube (data yang sama dengan
+stub server di tests/test_innertube.py), tanpa request ke YouTube.
+
+Tile rekaman (kedua layout: reelItemRenderer dan shortsLockupViewModel) diulang dengan ID baru sampai
+--pages halaman x --tiles-per-page tile. Stub server menyajikan feed yang sama dalam dua bentuk:
+ytInitialData + response /youtubei/v1/browse untuk mesin InnerTube, dan halaman HTML yang memuat tile
+halaman berikutnya saat di-scroll (dari response continuation yang sama) untuk mesin Selenium.
+Setiap mesin dijalankan di proses Python terpisah. Dicatat wall time, jumlah URL, dan peak RSS: proses
+Python saja, serta proses Python + semua proses anak (chromedriver dan Chrome), disampling setiap 50 ms.
+
+Pemakaian (Selenium butuh Chrome dan paket dari requirements.txt):
+    python benchmarks/bench_discovery.py --pages 40 --tiles-per-page 48
+    python benchmarks/bench_discovery.py --engines innertube
+"""
+import argparse
+import copy
+import html
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cli  # noqa: E402
+import gui  # noqa: E402
+from tests.helpers import build_innertube_channel_page, load_innertube_fixture  # noqa: E402
+
+try:
+    import psutil # Opsional: RSS proses anak lintas platform; tanpa psutil dibaca dari /proc (Linux)
+except ImportError:
+    psutil = None
+
+STUB_CHANNEL_URL = "https://www.youtube.com/@stub"
+RECORDED_PAGES = ("shorts_tab_initial_data.json", "shorts_continuation_page_2.json", "shorts_continuation_page_3.json")
+SELENIUM_PAGE_PATH = "/bench/@stub/shorts" # Versi DOM tab Shorts yang dibuka Selenium
+RSS_SAMPLE_INTERVAL = 0.05 # Detik antar sampel RSS
+# GIF 1x1 untuk thumbnail, agar halaman Selenium memuat gambar dari stub server, bukan dari i.ytimg.com
+THUMBNAIL_GIF = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+
+# Halaman tab Shorts untuk Selenium: tile halaman pertama, lalu tile berikutnya dimuat dari /bench/tiles saat di-scroll
+SELENIUM_SHORTS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Stub Shorts</title></head>
+<body>
+<div id="grid">%(tiles)s</div>
+<ytd-continuation-item-renderer id="continuation" data-token="%(token)s" style="display:block;height:40px">Loading...</ytd-continuation-item-renderer>
+<script>
+let loading = false;
+async function loadMore() {
+    const continuation = document.getElementById('continuation');
+    if (!continuation || loading) return;
+    loading = true;
+    const response = await fetch('/bench/tiles', {method: 'POST', body: JSON.stringify({continuation: continuation.dataset.token})});
+    const page = await response.json();
+    document.getElementById('grid').insertAdjacentHTML('beforeend', page.html);
+    if (page.token) continuation.dataset.token = page.token; else continuation.remove();
+    loading = false;
+}
+window.addEventListener('scroll', () => {
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 800) loadMore();
+});
+</script>
+</body></html>
+"""
+
+
+# --- Feed Sintetis dari Data Rekaman ---
+
+def find_rich_grid(data):
+    """Mengembalikan dict richGridRenderer di ytInitialData (tempat tile grid halaman pertama)."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get('richGridRenderer'), dict):
+                return node['richGridRenderer']
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    raise ValueError("richGridRenderer not found in recorded initial data.")
+
+
+def continuation_item(token):
+    """Item continuation grid dengan format yang sama seperti di ytInitialData rekaman."""
+    return {"continuationItemRenderer": {
+        "trigger": "CONTINUATION_TRIGGER_ON_ITEM_SHOWN",
+        "continuationEndpoint": {"continuationCommand": {"token": token, "request": "CONTINUATION_REQUEST_TYPE_BROWSE"}},
+    }}
+
+
+def build_feed(pages, tiles_per_page):
+    """
+    Membangun feed Shorts dengan mengulang tile rekaman dengan ID baru.
+
+    Returns:
+        tuple: (ytInitialData halaman pertama, dict token continuation -> response /browse, jumlah video).
+    """
+    recorded = [load_innertube_fixture(name) for name in RECORDED_PAGES]
+    templates = []
+    for data in recorded:
+        for item in gui.find_innertube_grid_items(data):
+            template_id = gui.read_innertube_shorts_tile(item) if isinstance(item, dict) else None
+            if template_id:
+                templates.append((json.dumps(item), template_id))
+
+    initial_data = None
+    continuations = {}
+    for page in range(pages):
+        items = []
+        for position in range(tiles_per_page):
+            template_json, template_id = templates[(page * tiles_per_page + position) % len(templates)]
+            items.append(json.loads(template_json.replace(template_id, f"b{page:04d}x{position:05d}")))
+        if page < pages - 1:
+            items.append(continuation_item(f"PAGE_{page + 2}"))
+        if page == 0:
+            initial_data = copy.deepcopy(recorded[0])
+            find_rich_grid(initial_data)['contents'] = items
+        else:
+            response = copy.deepcopy(recorded[1])
+            response['onResponseReceivedActions'][0]['appendContinuationItemsAction']['continuationItems'] = items
+            continuations[f"PAGE_{page + 1}"] = response
+    return initial_data, continuations, pages * tiles_per_page
+
+
+def render_tiles_html(data, base_url):
+    """Merender tile grid data InnerTube sebagai elemen ytd-rich-item-renderer. Mengembalikan (html, token)."""
+    page_metadata = {}
+    video_ids, token = gui.parse_innertube_shorts_page(data, page_metadata)
+    tiles = []
+    for video_id in video_ids:
+        fields = page_metadata.get(video_id, {})
+        tiles.append(
+            f'<ytd-rich-item-renderer style="display:block;height:400px"><a href="/shorts/{video_id}">'
+            f'<img width="210" height="374" alt="" src="{base_url}/vi/{video_id}/frame0.jpg">'
+            f'<h3>{html.escape(fields.get("title", ""))}</h3></a>'
+            f'<span class="shortsLockupViewModelHostMetadataSubhead">{html.escape(fields.get("view_count", ""))}</span>'
+            f'</ytd-rich-item-renderer>'
+        )
+    return "".join(tiles), token
+
+
+def start_stub_server(initial_data, continuations):
+    """
+    Menjalankan stub server YouTube lokal (thread daemon) untuk kedua mesin.
+
+    Returns:
+        ThreadingHTTPServer: Server yang berjalan (base URL dari server_address).
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/vi/"):
+                self.reply(THUMBNAIL_GIF, "image/gif")
+            elif self.path == SELENIUM_PAGE_PATH:
+                self.reply_selenium_page()
+            elif self.path == "/@stub/shorts":
+                self.reply(build_innertube_channel_page(initial_data).encode("utf-8"), "text/html")
+            else:
+                self.send_error(404)
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            response = continuations.get(payload.get("continuation"))
+            if response is None:
+                self.send_error(404)
+            elif self.path.startswith("/bench/tiles"):
+                tiles_html, token = render_tiles_html(response, self.base_url())
+                self.reply(json.dumps({"html": tiles_html, "token": token}).encode("utf-8"), "application/json")
+            elif self.path.startswith("/youtubei/v1/browse"):
+                self.reply(json.dumps(response).encode("utf-8"), "application/json")
+            else:
+                self.send_error(404)
+
+        def reply_selenium_page(self):
+            tiles_html, token = render_tiles_html(initial_data, self.base_url())
+            page = SELENIUM_SHORTS_PAGE % {'tiles': tiles_html, 'token': html.escape(token or "")}
+            self.reply(page.encode("utf-8"), "text/html")
+
+        def base_url(self):
+            return f"http://{self.headers['Host']}"
+
+        def reply(self, body, content_type):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# --- Pengukuran RSS ---
+
+def read_process_tree_rss(root_pid):
+    """
+    Membaca RSS proses root_pid dan total RSS proses itu beserta semua turunannya.
+
+    Returns:
+        tuple: (RSS proses root dalam byte, RSS total dalam byte), atau (None, None) jika tidak bisa dibaca.
+    """
+    if psutil is not None:
+        root = psutil.Process(root_pid)
+        own_rss = root.memory_info().rss
+        total_rss = own_rss
+        for child in root.children(recursive=True):
+            try:
+                total_rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return own_rss, total_rss
+    if not os.path.isdir("/proc"):
+        return None, None
+    children_by_parent = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as f:
+                parent_pid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children_by_parent.setdefault(parent_pid, []).append(int(name))
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    own_rss = total_rss = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children_by_parent.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                rss = int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            continue
+        total_rss += rss
+        if pid == root_pid:
+            own_rss = rss
+    return own_rss, total_rss
+
+
+class PeakRssSampler:
+    """Thread yang menyampling RSS proses ini (dan turunannya) secara berkala dan menyimpan nilai tertingginya."""
+
+    def __init__(self):
+        self.peak_own = 0
+        self.peak_total = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def sample(self):
+        own_rss, total_rss = read_process_tree_rss(os.getpid())
+        if own_rss is not None:
+            self.peak_own = max(self.peak_own, own_rss)
+            self.peak_total = max(self.peak_total, total_rss)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.sample()
+            self.stop_event.wait(RSS_SAMPLE_INTERVAL)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop_event.set()
+        self.thread.join()
+        self.sample()
+
+
+# --- Menjalankan Mesin Discovery ---
+
+def run_engine(engine, base_url):
+    """Menjalankan satu mesin discovery terhadap stub server (di proses worker). Mengembalikan dict hasil."""
+    # Selenium selalu membuka https://www.youtube.com/...; arahkan ke halaman DOM stub server.
+    # InnerTube memakai base_url dengan path tab Shorts biasa (/@stub/shorts)
+    if engine == "selenium":
+        gui.build_channel_shorts_url = lambda channel_url: f"{base_url}{SELENIUM_PAGE_PATH}"
+    selenium_options = {option_key: default for option_key, _, default, _ in cli.SELENIUM_OPTION_FLAGS}
+    selenium_options['reuse_browser'] = False # Browser ditutup di akhir run, seperti run pertama tanpa sesi hangat
+    with PeakRssSampler() as sampler:
+        start = time.perf_counter()
+        if engine == "innertube":
+            urls = gui.get_all_shorts_urls_innertube(STUB_CHANNEL_URL, None, None, gui.NullProgressVar(), threading.Event(),
+                                                     base_url=base_url)
+        else:
+            urls = gui.get_all_shorts_urls_selenium(STUB_CHANNEL_URL, None, selenium_options, gui.SCROLLING_METHODS["Send END Key"],
+                                                    None, gui.NullProgressVar(), threading.Event())
+        wall_seconds = time.perf_counter() - start
+        gui.webdriver_pool.close()
+    return {'urls': len(urls), 'wall_seconds': wall_seconds, 'peak_python_rss': sampler.peak_own, 'peak_total_rss': sampler.peak_total}
+
+
+def run_engine_in_subprocess(engine, base_url):
+    """
+    Menjalankan run_engine di proses Python baru, agar peak RSS satu mesin tidak terbawa ke mesin lain.
+
+    Returns:
+        dict or None: Hasil run, atau None jika mesin gagal dijalankan (misal Selenium/Chrome tidak terpasang).
+    """
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", engine, base_url],
+                            capture_output=True, text=True)
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith("RESULT "):
+            return json.loads(line[len("RESULT "):])
+    print(f"{engine} failed (exit code {result.returncode}):\n{(result.stderr or result.stdout)[-1500:]}", file=sys.stderr)
+    return None
+
+
+def format_megabytes(value):
+    return f"{value / 1048576:.1f}" if value else "-"
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--worker":
+        print("RESULT " + json.dumps(run_engine(sys.argv[2], sys.argv[3])), flush=True)
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmark InnerTube vs Selenium Shorts discovery on a local recorded feed.")
+    parser.add_argument("--pages", type=int, default=20, help="Feed pages (initial page + continuations, default: 20).")
+    parser.add_argument("--tiles-per-page", type=int, default=48, help="Shorts tiles per page (default: 48, like YouTube).")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per engine (default: 3).")
+    parser.add_argument("--engines", nargs="+", choices=["innertube", "selenium"], default=["innertube", "selenium"])
+    args = parser.parse_args()
+
+    initial_data, continuations, total_videos = build_feed(args.pages, args.tiles_per_page)
+    server = start_stub_server(initial_data, continuations)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"Stub feed: {total_videos} Shorts in {args.pages} pages at {base_url}/@stub/shorts")
+    print(f"{'engine':<10} {'URLs':>6} {'wall s':>8} {'min s':>7} {'peak Python RSS MB':>19} {'peak total RSS MB':>18}")
+    try:
+        for engine in args.engines:
+            runs = [run_engine_in_subprocess(engine, base_url) for _ in range(args.runs)]
+            runs = [run for run in runs if run is not None]
+            if not runs:
+                print(f"{engine:<10} {'failed':>6}")
+                continue
+            wall_times = [run['wall_seconds'] for run in runs]
+            print(f"{engine:<10} {runs[0]['urls']:>6} {statistics.median(wall_times):>8.2f} {min(wall_times):>7.2f} "
+                  f"{format_megabytes(max(run['peak_python_rss'] for run in runs)):>19} "
+                  f"{format_megabytes(max(run['peak_total_rss'] for run in runs)):>18}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("peak total RSS = Python process + child processes (chromedriver and Chrome for Selenium), sampled every "
+          f"{int(RSS_SAMPLE_INTERVAL * 1000)} ms.")
+
+
+if __name__ == "__main__":
+    main()
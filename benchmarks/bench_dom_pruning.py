@@ -0,0 +1,152 @@
+"""
+Benchmark harvest Selenium dengan dan tanpa DOM pruning pada feed Shorts sintetis (tanpa request ke YouTube).
+
+Halaman lokal meniru grid Shorts sebuah channel: setiap scroll ke bawah menambahkan satu halaman tile
+(dengan elemen continuation di bawahnya, seperti YouTube) sampai --tiles tile tercapai. Scroll loop memakai
+fungsi yang sama dengan gui.get_all_shorts_urls_selenium (observer tile, wait adaptive, harvest JS, pruning).
+Untuk setiap mode dicatat latensi per scroll (scroll + tunggu tile baru + harvest + prune), jumlah node DOM,
+dan JS heap Chrome (performance.memory, setelah garbage collection).
+
+Pemakaian (butuh Chrome dan paket dari requirements.txt):
+    python benchmarks/bench_dom_pruning.py --tiles 5000
+"""
+import argparse
+import os
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gui  # noqa: E402
+
+# Halaman Shorts sintetis: %(total)d tile, %(page_size)d tile per "halaman" lanjutan, dimuat setelah %(delay_ms)d ms
+SYNTHETIC_SHORTS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Synthetic Shorts feed</title></head>
+<body>
+<div id="grid"></div>
+<ytd-continuation-item-renderer id="continuation" style="display:block;height:40px">Loading...</ytd-continuation-item-renderer>
+<script>
+const TOTAL = %(total)d, PAGE_SIZE = %(page_size)d, DELAY_MS = %(delay_ms)d;
+let loaded = 0, loading = false;
+function loadPage() {
+    loading = true;
+    setTimeout(() => {
+        const grid = document.getElementById('grid');
+        for (let i = 0; i < PAGE_SIZE && loaded < TOTAL; i++, loaded++) {
+            const tile = document.createElement('ytd-rich-item-renderer');
+            tile.style.display = 'block';
+            tile.style.height = '400px';
+            const id = 'v' + String(loaded).padStart(10, '0');
+            // Subtree per tile kira-kira sebesar tile YouTube (thumbnail, judul, metadata, overlay)
+            tile.innerHTML = '<a href="/shorts/' + id + '"><img width="210" height="374" alt="">' +
+                '<h3>Short ' + loaded + '</h3></a>' +
+                '<span class="shortsLockupViewModelHostMetadataSubhead">' + loaded + ' views</span>' +
+                '<div><div><span></span></div></div>'.repeat(30);
+            grid.appendChild(tile);
+        }
+        if (loaded >= TOTAL) document.getElementById('continuation').remove();
+        loading = false;
+    }, DELAY_MS);
+}
+window.addEventListener('scroll', () => {
+    if (!loading && loaded < TOTAL && window.innerHeight + window.scrollY >= document.body.scrollHeight - 800) loadPage();
+});
+loadPage();
+</script>
+</body></html>
+"""
+
+# Mengukur jumlah node DOM dan JS heap yang terpakai (Chrome: performance.memory)
+MEASURE_PAGE_JS = """
+return {
+    nodes: document.getElementsByTagName('*').length,
+    heap: performance.memory ? performance.memory.usedJSHeapSize : 0,
+};
+"""
+
+
+def create_benchmark_driver(extra_arguments=()):
+    """Chrome headless dengan opsi dasar yang sama seperti scraping (tanpa proxy), ditambah extra_arguments."""
+    from selenium import webdriver
+    options = webdriver.ChromeOptions()
+    for argument in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu", "--disable-extensions",
+                     *extra_arguments):
+        options.add_argument(argument)
+    return gui.create_chrome_driver(options)
+
+
+def run_mode(driver, page_uri, prune, total_tiles, sample_every):
+    """
+    Menjalankan scroll loop sampai semua tile di-harvest.
+
+    Returns:
+        tuple: (latensi per scroll dalam detik, list sampel (jumlah ID, node DOM, heap byte)).
+    """
+    driver.get(page_uri)
+    tiles_added_counter = driver.execute_script(gui.INSTALL_SHORTS_TILE_OBSERVER_JS) or 0
+    seen_ids = set()
+    latencies = []
+    samples = []
+    unpruned_count = 0
+    while len(seen_ids) < total_tiles:
+        start = time.perf_counter()
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        wait_result = gui.wait_for_new_shorts_tiles(driver, tiles_added_counter)
+        tiles_added_counter = wait_result.get('added', tiles_added_counter)
+        new_ids = gui.harvest_new_shorts_ids(driver, seen_ids)
+        if prune:
+            unpruned_count += len(new_ids)
+            if unpruned_count >= gui.SELENIUM_PRUNE_MIN_NEW_TILES:
+                gui.prune_harvested_shorts_tiles(driver, gui.SELENIUM_PRUNE_KEEP_TILES)
+                unpruned_count = 0
+        latencies.append(time.perf_counter() - start)
+
+        if len(latencies) % sample_every == 0 or len(seen_ids) >= total_tiles:
+            driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+            measured = driver.execute_script(MEASURE_PAGE_JS)
+            samples.append((len(seen_ids), measured['nodes'], measured['heap']))
+        if not new_ids and not wait_result.get('has_continuation', True):
+            break # Feed sintetis habis lebih awal (seharusnya tidak terjadi)
+    return latencies, samples
+
+
+def print_report(mode_name, latencies, samples):
+    """Mencetak latensi per scroll di awal vs akhir feed, serta node DOM dan heap per sampel."""
+    window = max(1, len(latencies) // 10)
+    first_ms = statistics.mean(latencies[:window]) * 1000
+    last_ms = statistics.mean(latencies[-window:]) * 1000
+    print(f"\n== {mode_name}: {len(latencies)} scrolls ==")
+    print(f"Per-scroll latency: first 10% {first_ms:.1f} ms, last 10% {last_ms:.1f} ms ({last_ms / first_ms:.2f}x)")
+    print(f"{'harvested':>10} {'DOM nodes':>10} {'JS heap MB':>11}")
+    for harvested, nodes, heap in samples:
+        print(f"{harvested:>10} {nodes:>10} {heap / 1048576:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Selenium Shorts harvesting with and without DOM pruning.")
+    parser.add_argument("--tiles", type=int, default=3000, help="Number of synthetic Shorts tiles in the feed (default: 3000).")
+    parser.add_argument("--page-size", type=int, default=24, help="Tiles added per continuation page (default: 24).")
+    parser.add_argument("--load-delay-ms", type=int, default=50, help="Simulated continuation load time in ms (default: 50).")
+    parser.add_argument("--sample-every", type=int, default=20, help="Measure DOM nodes and JS heap every N scrolls (default: 20).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        page_path = os.path.join(temp_directory, "shorts.html")
+        with open(page_path, "w", encoding="utf-8") as f:
+            f.write(SYNTHETIC_SHORTS_PAGE % {'total': args.tiles, 'page_size': args.page_size, 'delay_ms': args.load_delay_ms})
+        page_uri = pathlib.Path(page_path).as_uri()
+
+        driver = create_benchmark_driver()
+        try:
+            for mode_name, prune in (("Incremental JS Harvest", False), ("Streaming Harvest + DOM Pruning", True)):
+                latencies, samples = run_mode(driver, page_uri, prune, args.tiles, args.sample_every)
+                print_report(mode_name, latencies, samples)
+        finally:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
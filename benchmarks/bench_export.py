@@ -0,0 +1,154 @@
+"""
+Benchmark ekspor metadata: gui.export_rows untuk setiap format di gui.EXPORT_FORMATS (xlsx/csv/jsonl/parquet)
+vs penulisan lama (pd.DataFrame(metadata_list) lalu to_excel), tanpa jaringan.
+
+Dua skenario dengan metadata sintetis (judul dan deskripsi panjang multibahasa, deskripsi berisi baris baru):
+file metadata per batch (gui.BATCH_SIZE baris, ditulis --batches kali) dan satu file untuk seluruh channel
+(--channel-rows baris, seperti master status atau ekspor satu channel besar). Baris dibangun dari list dict
+metadata di dalam pengukuran, seperti gui.save_metadata_to_file. Waktu tulis adalah median dari --runs run
+tanpa tracemalloc; peak memori Python diukur di run terpisah dengan tracemalloc (alokasi Python saja,
+buffer C di luar allocator Python tidak terhitung). Format yang library-nya tidak terpasang dilewati.
+
+Pemakaian:
+    python benchmarks/bench_export.py --channel-rows 20000 --description-chars 2000
+"""
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gui  # noqa: E402
+
+COLUMNS = ['Link URL', 'Title', 'Description']
+LEGACY_WRITER = "pandas to_excel (old)"
+
+# Potongan teks deskripsi (multibahasa, hashtag, emoji) yang diulang sampai panjang yang diminta
+DESCRIPTION_WORDS = ("shorts", "video", "terbaru", "subscribe", "#fyp", "#shorts", "tutorial", "memasak", "résumé",
+                     "naïve", "日本語", "한국어", "🎬", "🔥", "https://example.com/link", "\n")
+
+# Library yang dibutuhkan setiap writer (nama modul untuk importlib.util.find_spec)
+WRITER_REQUIREMENTS = {
+    "xlsx": ("openpyxl",),
+    "csv": (),
+    "jsonl": (),
+    "parquet": ("pandas", ("pyarrow", "fastparquet")), # pyarrow atau fastparquet
+    LEGACY_WRITER: ("pandas", "openpyxl"),
+}
+
+
+def build_metadata(count, description_chars, seed):
+    """
+    Membuat list dict metadata sintetis (url/title/description) yang sama untuk setiap seed.
+
+    Returns:
+        list: Dict metadata dengan key url, title, description.
+    """
+    generator = random.Random(seed)
+    metadata_list = []
+    for index in range(count):
+        words = []
+        length = 0
+        while length < description_chars:
+            word = generator.choice(DESCRIPTION_WORDS)
+            words.append(word)
+            length += len(word) + 1
+        metadata_list.append({
+            'url': f"https://www.youtube.com/shorts/b{seed:03d}x{index:07d}",
+            'title': f"Short #{index} " + " ".join(generator.choice(DESCRIPTION_WORDS[:14]) for _ in range(8)),
+            'description': " ".join(words)[:description_chars],
+        })
+    return metadata_list
+
+
+def find_missing_modules(writer_name):
+    """Mengembalikan nama library yang dibutuhkan writer tetapi tidak terpasang (list kosong jika lengkap)."""
+    missing = []
+    for requirement in WRITER_REQUIREMENTS[writer_name]:
+        alternatives = requirement if isinstance(requirement, tuple) else (requirement,)
+        if not any(importlib.util.find_spec(name) is not None for name in alternatives):
+            missing.append(" or ".join(alternatives))
+    return missing
+
+
+def write_metadata(writer_name, output_filepath, metadata_list):
+    """Menulis metadata_list dengan writer baru (export_rows) atau dengan cara lama (DataFrame + to_excel)."""
+    if writer_name == LEGACY_WRITER:
+        df = gui.pd.DataFrame(metadata_list)
+        df = df[['url', 'title', 'description']]
+        df.rename(columns={'url': 'Link URL', 'title': 'Title', 'description': 'Description'}, inplace=True)
+        df.to_excel(output_filepath, index=False)
+    else:
+        rows = [(item.get('url'), item.get('title'), item.get('description')) for item in metadata_list]
+        gui.export_rows(output_filepath, COLUMNS, rows, writer_name)
+
+
+def measure_writer(writer_name, metadata_batches, output_directory, runs):
+    """
+    Menulis semua batch metadata dengan satu writer.
+
+    Returns:
+        tuple: (median waktu per file dalam detik, peak memori tracemalloc dalam byte, ukuran file terakhir dalam byte).
+    """
+    extension = "xlsx" if writer_name == LEGACY_WRITER else writer_name
+    output_filepath = os.path.join(output_directory, f"bench.{extension}")
+    write_metadata(writer_name, output_filepath, metadata_batches[0]) # Pemanasan: import library lazy di luar pengukuran
+
+    timings = []
+    for _ in range(runs):
+        for metadata_list in metadata_batches:
+            start = time.perf_counter()
+            write_metadata(writer_name, output_filepath, metadata_list)
+            timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        peak = 0
+        for metadata_list in metadata_batches:
+            tracemalloc.reset_peak()
+            write_metadata(writer_name, output_filepath, metadata_list)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+    return statistics.median(timings), peak, os.path.getsize(output_filepath)
+
+
+def print_scenario(title, metadata_batches, output_directory, runs):
+    """Mengukur semua writer untuk satu skenario dan mencetak tabelnya."""
+    row_count = len(metadata_batches[0])
+    print(f"\n== {title}: {len(metadata_batches)} file(s) x {row_count} rows ==")
+    print(f"{'writer':<22} {'ms/file':>9} {'rows/s':>10} {'peak MB':>8} {'file MB':>8}")
+    for writer_name in (*gui.EXPORT_FORMATS.values(), LEGACY_WRITER):
+        missing = find_missing_modules(writer_name)
+        if missing:
+            print(f"{writer_name:<22} skipped (not installed: {', '.join(missing)})")
+            continue
+        seconds, peak, file_size = measure_writer(writer_name, metadata_batches, output_directory, runs)
+        print(f"{writer_name:<22} {seconds * 1000:>9.1f} {row_count / seconds:>10.0f} "
+              f"{peak / 1048576:>8.1f} {file_size / 1048576:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark metadata export writers (write time and peak memory).")
+    parser.add_argument("--batches", type=int, default=10, help=f"Batch files of {gui.BATCH_SIZE} rows to write (default: 10).")
+    parser.add_argument("--channel-rows", type=int, default=20000, help="Rows in the whole-channel file (default: 20000).")
+    parser.add_argument("--description-chars", type=int, default=2000,
+                        help="Characters per description (default: 2000; YouTube allows up to 5000).")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per writer (default: 3).")
+    args = parser.parse_args()
+
+    batch_metadata = [build_metadata(gui.BATCH_SIZE, args.description_chars, seed) for seed in range(args.batches)]
+    channel_metadata = [build_metadata(args.channel_rows, args.description_chars, args.batches)]
+    with tempfile.TemporaryDirectory() as output_directory:
+        print_scenario("Batch metadata files", batch_metadata, output_directory, args.runs)
+        print_scenario("Whole channel", channel_metadata, output_directory, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Benchmark Lean Scraping: harvest Selenium dengan profil Chrome biasa vs profil lean (gui.LEAN_PROFILE_CHROME_ARGUMENTS
++ gui.apply_lean_profile) pada feed Shorts sintetis yang memuat aset sungguhan, tanpa request ke YouTube.
+
+Feed-nya sama dengan bench_dom_pruning.py (tile ditambahkan per halaman saat di-scroll), tetapi disajikan oleh
+stub server HTTP lokal, karena pemblokiran lean bekerja pada pola URL. Setiap tile memuat thumbnail PNG sungguhan
+dengan URL unik (noise acak, kira-kira sebesar thumbnail Shorts), halaman memuat web font dari /fonts/ dalam
+beberapa weight, dan setiap --video-every tile memuat preview video autoplay (muted) dari /preview/.
+Font diambil dari --font-file atau font pertama yang ditemukan di folder font sistem; video dari --video-file
+atau dibuat dengan ffmpeg (testsrc). Jika salah satunya tidak tersedia, aset itu dilewati dengan peringatan.
+
+Setiap mode dijalankan di Chrome baru dengan scroll loop yang sama (bench_dom_pruning.run_mode, tanpa pruning).
+Dicatat latensi per scroll, total waktu scroll, node DOM dan JS heap di akhir, peak RSS proses ini + chromedriver
++ Chrome, serta jumlah request dan byte yang benar-benar disajikan stub server per jenis aset (request yang
+diblokir Chrome tidak pernah sampai ke server).
+
+Pemakaian (butuh Chrome dan paket dari requirements.txt):
+    python benchmarks/bench_lean_profile.py --tiles 1500
+    python benchmarks/bench_lean_profile.py --font-file /path/Roboto-Regular.ttf --video-file /path/preview.mp4
+"""
+import argparse
+import os
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gui  # noqa: E402
+from bench_discovery import PeakRssSampler, format_megabytes  # noqa: E402
+from bench_dom_pruning import MEASURE_PAGE_JS, create_benchmark_driver, run_mode  # noqa: E402
+
+THUMBNAIL_SIZE = (180, 320) # Lebar x tinggi PNG thumbnail (rasio 9:16 seperti Shorts)
+FONT_WEIGHTS = (400, 500, 700) # Setiap weight = satu URL font terpisah, seperti Roboto di YouTube
+FONT_EXTENSIONS = (".woff2", ".woff", ".ttf", ".otf")
+FONT_SEARCH_DIRECTORIES = ("/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts"),
+                           os.path.expanduser("~/.local/share/fonts"), "/Library/Fonts", "/System/Library/Fonts",
+                           r"C:\Windows\Fonts")
+ASSET_TYPES = ("image", "font", "video", "page")
+
+# Halaman Shorts sintetis dengan aset. Placeholder __NAMA__ diganti dengan str.replace (CSS memakai tanda %)
+LEAN_BENCH_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Synthetic Shorts feed with assets</title>
+<style>
+__FONT_FACES__
+body { font-family: 'BenchSans', sans-serif; }
+h3 { font-weight: 700; }
+span { font-weight: 500; }
+</style></head>
+<body>
+<div id="grid"></div>
+<ytd-continuation-item-renderer id="continuation" style="display:block;height:40px">Loading...</ytd-continuation-item-renderer>
+<script>
+const TOTAL = __TOTAL__, PAGE_SIZE = __PAGE_SIZE__, DELAY_MS = __DELAY_MS__, VIDEO_EVERY = __VIDEO_EVERY__;
+let loaded = 0, loading = false;
+function loadPage() {
+    loading = true;
+    setTimeout(() => {
+        const grid = document.getElementById('grid');
+        for (let i = 0; i < PAGE_SIZE && loaded < TOTAL; i++, loaded++) {
+            const tile = document.createElement('ytd-rich-item-renderer');
+            tile.style.display = 'block';
+            tile.style.height = '400px';
+            const id = 'v' + String(loaded).padStart(10, '0');
+            const preview = VIDEO_EVERY && loaded % VIDEO_EVERY === 0
+                ? '<video autoplay muted loop playsinline width="210" height="374" src="/preview/' + id + '.mp4"></video>' : '';
+            tile.innerHTML = '<a href="/shorts/' + id + '"><img width="210" height="374" alt="" src="/vi/' + id + '/frame0.png">' +
+                '<h3>Short ' + loaded + '</h3></a>' + preview +
+                '<span class="shortsLockupViewModelHostMetadataSubhead">' + loaded + ' views</span>' +
+                '<div><div><span></span></div></div>'.repeat(30);
+            grid.appendChild(tile);
+        }
+        if (loaded >= TOTAL) document.getElementById('continuation').remove();
+        loading = false;
+    }, DELAY_MS);
+}
+window.addEventListener('scroll', () => {
+    if (!loading && loaded < TOTAL && window.innerHeight + window.scrollY >= document.body.scrollHeight - 800) loadPage();
+});
+loadPage();
+</script>
+</body></html>
+"""
+
+
+# --- Aset ---
+
+def build_noise_png(width, height):
+    """
+    Membuat PNG RGB valid berisi noise acak (3 bit per kanal), supaya ukurannya setelah kompresi
+    mendekati thumbnail sungguhan dan browser benar-benar men-decode gambar.
+
+    Returns:
+        bytes: Isi file PNG.
+    """
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    rows = b"".join(b"\x00" + bytes(value & 0xE0 for value in os.urandom(width * 3)) for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(rows, 6)) + chunk(b"IEND", b""))
+
+
+def find_font_file():
+    """Mencari file font pertama di folder font sistem. Mengembalikan path, atau None jika tidak ada."""
+    for directory in FONT_SEARCH_DIRECTORIES:
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if name.lower().endswith(FONT_EXTENSIONS):
+                    return os.path.join(root, name)
+    return None
+
+
+def create_preview_video(temp_directory):
+    """
+    Membuat video preview MP4 3 detik (360x640) dengan ffmpeg.
+
+    Returns:
+        str or None: Path video, atau None jika ffmpeg tidak ada atau gagal.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return None
+    video_path = os.path.join(temp_directory, "preview.mp4")
+    result = subprocess.run([ffmpeg_path, "-loglevel", "error", "-y", "-f", "lavfi", "-i", "testsrc2=size=360x640:rate=30",
+                             "-t", "3", "-pix_fmt", "yuv420p", "-movflags", "+faststart", video_path], capture_output=True)
+    return video_path if result.returncode == 0 else None
+
+
+def build_font_faces(font_path):
+    """CSS @font-face untuk setiap weight di FONT_WEIGHTS (kosong jika tidak ada font)."""
+    if font_path is None:
+        return ""
+    extension = os.path.splitext(font_path)[1].lower()
+    return "\n".join(f"@font-face {{ font-family: 'BenchSans'; font-weight: {weight}; "
+                     f"src: url('/fonts/bench-{weight}{extension}'); }}" for weight in FONT_WEIGHTS)
+
+
+# --- Stub Server ---
+
+def start_asset_server(page_html, font_path, font_bytes, video_bytes):
+    """
+    Menjalankan stub server lokal (thread daemon) untuk halaman feed dan asetnya.
+    Setiap URL thumbnail mendapat PNG baru, seperti thumbnail yang berbeda per video.
+
+    Returns:
+        tuple: (ThreadingHTTPServer, dict statistik jenis aset -> [jumlah request, byte], lock untuk statistik).
+    """
+    stats = {asset_type: [0, 0] for asset_type in ASSET_TYPES}
+    font_content_type = "font/" + os.path.splitext(font_path)[1].lower().lstrip(".") if font_path else None
+    stats_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/vi/"):
+                self.reply("image", build_noise_png(*THUMBNAIL_SIZE), "image/png")
+            elif self.path.startswith("/fonts/") and font_bytes is not None:
+                self.reply("font", font_bytes, font_content_type)
+            elif self.path.startswith("/preview/") and video_bytes is not None:
+                self.reply("video", video_bytes, "video/mp4")
+            elif self.path == "/@stub/shorts":
+                self.reply("page", page_html.encode("utf-8"), "text/html")
+            else:
+                self.send_error(404)
+
+        def reply(self, asset_type, body, content_type):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                return # Chrome membatalkan request (misal video yang tidak jadi diputar)
+            with stats_lock:
+                stats[asset_type][0] += 1
+                stats[asset_type][1] += len(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats, stats_lock
+
+
+# --- Menjalankan Mode ---
+
+def run_profile(lean, page_uri, args, stats, stats_lock):
+    """
+    Menjalankan satu mode di Chrome baru.
+
+    Returns:
+        dict: Hasil run (latensi, node DOM, heap, peak RSS, statistik request per jenis aset).
+    """
+    with stats_lock:
+        for counters in stats.values():
+            counters[:] = [0, 0]
+    with PeakRssSampler() as sampler:
+        driver = create_benchmark_driver(gui.LEAN_PROFILE_CHROME_ARGUMENTS if lean else ())
+        try:
+            blocking_enabled = gui.apply_lean_profile(driver) if lean else False
+            start = time.perf_counter()
+            latencies, _ = run_mode(driver, page_uri, False, args.tiles, args.sample_every)
+            scroll_seconds = time.perf_counter() - start
+            driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+            measured = driver.execute_script(MEASURE_PAGE_JS)
+        finally:
+            driver.quit()
+    with stats_lock:
+        served = {asset_type: tuple(counters) for asset_type, counters in stats.items()}
+    return {'latencies': latencies, 'scroll_seconds': scroll_seconds, 'nodes': measured['nodes'], 'heap': measured['heap'],
+            'peak_total_rss': sampler.peak_total, 'served': served, 'blocking_enabled': blocking_enabled}
+
+
+def print_report(mode_name, result):
+    """Mencetak hasil satu mode: latensi, memori, dan request/byte per jenis aset."""
+    latencies = result['latencies']
+    window = max(1, len(latencies) // 10)
+    print(f"\n== {mode_name}: {len(latencies)} scrolls in {result['scroll_seconds']:.1f} s ==")
+    if mode_name.startswith("Lean"):
+        print(f"CDP request blocking: {'enabled' if result['blocking_enabled'] else 'unavailable (Chrome flags only)'}")
+    print(f"Per-scroll latency: mean {statistics.mean(latencies) * 1000:.1f} ms, "
+          f"first 10% {statistics.mean(latencies[:window]) * 1000:.1f} ms, "
+          f"last 10% {statistics.mean(latencies[-window:]) * 1000:.1f} ms")
+    print(f"DOM nodes {result['nodes']}, JS heap {format_megabytes(result['heap'])} MB, "
+          f"peak RSS (Python + chromedriver + Chrome) {format_megabytes(result['peak_total_rss'])} MB")
+    print(f"{'asset':>6} {'requests':>9} {'served MB':>10}")
+    for asset_type in ASSET_TYPES:
+        requests_count, served_bytes = result['served'][asset_type]
+        print(f"{asset_type:>6} {requests_count:>9} {served_bytes / 1048576:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Selenium Shorts harvesting with the full vs lean Chrome profile.")
+    parser.add_argument("--tiles", type=int, default=1500, help="Number of synthetic Shorts tiles in the feed (default: 1500).")
+    parser.add_argument("--page-size", type=int, default=24, help="Tiles added per continuation page (default: 24).")
+    parser.add_argument("--load-delay-ms", type=int, default=50, help="Simulated continuation load time in ms (default: 50).")
+    parser.add_argument("--video-every", type=int, default=12, help="Add an autoplay video preview every N tiles (0 = none, default: 12).")
+    parser.add_argument("--font-file", help="Web font served from /fonts/ (default: first font found in the system font folders).")
+    parser.add_argument("--video-file", help="MP4 served as the video preview (default: generated with ffmpeg if available).")
+    parser.add_argument("--sample-every", type=int, default=20, help="Measure DOM nodes and JS heap every N scrolls (default: 20).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        font_path = args.font_file or find_font_file()
+        if font_path is None:
+            print("Warning: no font file found; pass --font-file to include web fonts.", file=sys.stderr)
+        video_path = args.video_file or (create_preview_video(temp_directory) if args.video_every else None)
+        if video_path is None and args.video_every:
+            print("Warning: ffmpeg not available; pass --video-file to include video previews.", file=sys.stderr)
+        font_bytes = open(font_path, "rb").read() if font_path else None
+        video_bytes = open(video_path, "rb").read() if video_path else None
+
+        page_html = (LEAN_BENCH_PAGE.replace("__FONT_FACES__", build_font_faces(font_path))
+                     .replace("__TOTAL__", str(args.tiles)).replace("__PAGE_SIZE__", str(args.page_size))
+                     .replace("__DELAY_MS__", str(args.load_delay_ms))
+                     .replace("__VIDEO_EVERY__", str(args.video_every if video_bytes is not None else 0)))
+        server, stats, stats_lock = start_asset_server(page_html, font_path, font_bytes, video_bytes)
+        page_uri = f"http://127.0.0.1:{server.server_address[1]}/@stub/shorts"
+        print(f"Assets: {THUMBNAIL_SIZE[0]}x{THUMBNAIL_SIZE[1]} PNG thumbnails, "
+              f"font {os.path.basename(font_path) if font_path else 'none'}, "
+              f"video {os.path.basename(video_path) + f' every {args.video_every} tiles' if video_bytes else 'none'}")
+        try:
+            for mode_name, lean in (("Full profile", False), ("Lean profile", True)):
+                print_report(mode_name, run_profile(lean, page_uri, args, stats, stats_lock))
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark waktu startup cli.py dan gui.py (import modul, tanpa membangun window dan tanpa jaringan).
+
+Setiap pengukuran dijalankan di proses Python baru dengan -X importtime, supaya cache import proses
+sebelumnya tidak ikut terhitung. Untuk setiap target dicatat wall time proses, waktu import kumulatif
+modul cli/gui menurut -X importtime, dan library berat mana yang ikut dimuat saat startup
+(seharusnya tidak ada: semuanya dimuat saat pertama dipakai, lihat gui.LazyModule).
+
+Pemakaian:
+    python benchmarks/bench_startup.py --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Library yang tidak boleh dimuat hanya karena cli.py/gui.py diimpor
+HEAVY_MODULES = ("tkinter", "ttkthemes", "yt_dlp", "pandas", "openpyxl", "selenium", "webdriver_manager", "pyarrow")
+
+# Target: (nama, kode Python yang dijalankan, nama modul yang waktu import-nya dilaporkan)
+STARTUP_TARGETS = (
+    ("import cli", "import cli", "cli"),
+    ("import gui", "import gui", "gui"),
+    # argparse keluar dengan SystemExit setelah --help; ditangkap agar laporan modul tetap dicetak
+    ("cli.py --help", "import sys, runpy\nsys.argv = ['cli.py', '--help']\ntry:\n    runpy.run_path('cli.py', run_name='__main__')\n"
+                      "except SystemExit:\n    pass", None),
+)
+
+# Dicetak di akhir proses yang diukur: modul berat yang sudah ada di sys.modules
+REPORT_LOADED_MODULES_CODE = (
+    "\nimport sys as _sys\n"
+    "print('LOADED=' + ','.join(sorted({name.split('.')[0] for name in _sys.modules} & set(%r))))\n" % (HEAVY_MODULES,)
+)
+
+
+def parse_importtime(stderr, module_name):
+    """
+    Mengambil waktu import kumulatif (detik) satu modul top-level dari output -X importtime.
+
+    Returns:
+        float or None: Waktu kumulatif, atau None jika modul tidak ada di output.
+    """
+    for line in stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module_name:
+            return int(fields[1]) / 1_000_000
+    return None
+
+
+def measure_startup(code, module_name):
+    """
+    Menjalankan kode di proses Python baru dan mengukur startup-nya.
+
+    Returns:
+        tuple: (wall time detik, waktu import modul dalam detik atau None, list modul berat yang dimuat).
+    """
+    command = [sys.executable, "-X", "importtime", "-c", code + REPORT_LOADED_MODULES_CODE]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=REPO_DIRECTORY, capture_output=True, text=True)
+    wall_seconds = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{code!r} failed with exit code {result.returncode}:\n{result.stderr[-2000:]}")
+    loaded = []
+    for line in result.stdout.splitlines():
+        if line.startswith("LOADED="):
+            loaded = [name for name in line[len("LOADED="):].split(",") if name]
+    import_seconds = parse_importtime(result.stderr, module_name) if module_name else None
+    return wall_seconds, import_seconds, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the startup time of cli.py and gui.py.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs per target (default: 5).")
+    args = parser.parse_args()
+
+    baseline_wall = statistics.median(measure_startup("pass", None)[0] for _ in range(args.runs))
+    print(f"Bare interpreter startup: {baseline_wall * 1000:.0f} ms (median of {args.runs})")
+    print(f"{'target':<16} {'wall ms':>8} {'import ms':>10}  heavy modules loaded")
+    for target_name, code, module_name in STARTUP_TARGETS:
+        runs = [measure_startup(code, module_name) for _ in range(args.runs)]
+        wall_ms = statistics.median(run[0] for run in runs) * 1000
+        import_times = [run[1] for run in runs if run[1] is not None]
+        import_ms = f"{statistics.median(import_times) * 1000:.0f}" if import_times else "-"
+        loaded = sorted({name for run in runs for name in run[2]})
+        print(f"{target_name:<16} {wall_ms:>8.0f} {import_ms:>10}  {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+# Entry point command-line (tanpa GUI Tkinter) untuk Shorts Bulk DL & Metadata Batcher.
+# Menjalankan pipeline yang sama dengan GUI (discovery -> metadata -> batch -> download) untuk satu
+# atau beberapa channel, melaporkan progress ke stdout, dan keluar dengan exit code yang bisa dibaca mesin.
+#
+# Contoh:
+#   python cli.py https://www.youtube.com/@NamaChannel -o /data/shorts
+#   python cli.py --channels-file channels.txt -o /data/shorts --discovery-engine innertube --download-workers 4
+#   python cli.py --channels-file channels.txt -o /data/shorts --channel-workers 4 --browser-slots 2
+#
+# Exit code:
+#   0   Semua channel selesai tanpa download yang gagal (termasuk channel yang sudah up to date)
+#   1   Ada video yang gagal didownload (lihat batching_error/ dan master status)
+#   2   Argumen command-line tidak valid
+#   3   Tidak ada Shorts (atau metadata) yang bisa diproses untuk minimal satu channel
+#   4   Error tak terduga saat menjalankan pipeline
+#   130 Dibatalkan dengan Ctrl+C
+import argparse # Untuk parsing argumen command-line
+import os # Untuk membuat folder output per channel
+import sys # Untuk exit code dan pesan error ke stderr
+from threading import Thread, Event, Lock # Pipeline dijalankan di thread terpisah agar Ctrl+C bisa membatalkan dengan rapi
+
+import gui # Semua logika pipeline ada di gui.py; GUI hanya dibangun oleh gui.main(), jadi aman diimpor tanpa display
+
+# --- Exit Code ---
+EXIT_OK = 0
+EXIT_DOWNLOAD_FAILURES = 1
+EXIT_USAGE = 2 # Sama dengan exit code argparse untuk argumen tidak valid
+EXIT_NO_SHORTS = 3
+EXIT_PIPELINE_ERROR = 4
+EXIT_CANCELLED = 130
+
+# Opsi Selenium WebDriver: (key di settings['selenium_options'], nama flag CLI, nilai default seperti di GUI, keterangan)
+SELENIUM_OPTION_FLAGS = (
+    ("headless", "headless", True, "Run Chrome headless (--headless=new)"),
+    ("no_sandbox", "disable-sandbox", True, "Pass --no-sandbox to Chrome"),
+    ("disable_dev_shm_usage", "disable-dev-shm-usage", True, "Pass --disable-dev-shm-usage to Chrome"),
+    ("disable_notifications", "disable-notifications", True, "Pass --disable-notifications to Chrome"),
+    ("disable_extensions", "disable-extensions", True, "Pass --disable-extensions to Chrome"),
+    ("disable_gpu", "disable-gpu", True, "Pass --disable-gpu to Chrome"),
+    ("enable_webgl", "enable-webgl", False, "Pass --enable-webgl to Chrome"),
+    ("enable_smooth_scrolling", "enable-smooth-scrolling", False, "Pass --enable-smooth-scrolling to Chrome"),
+    ("lang_en_US", "lang-en-us", True, "Pass --lang=en-US to Chrome"),
+    ("start_maximized", "start-maximized", False, "Pass --start-maximized to Chrome"),
+    ("reuse_browser", "reuse-browser", True, "Keep the Chrome session warm and reuse it for the next channel"),
+    ("lean_profile", "lean-profile", False, "Block images, video and fonts while scraping (lean scraping profile, opt-in)"),
+)
+
+
+class ConsoleProgressVar:
+    """
+    Pengganti tk.StringVar/tk.IntVar untuk CLI: setiap nilai baru dicetak ke stdout dengan format tertentu.
+    Nilai yang sama berturut-turut tidak dicetak ulang. Aman dipanggil dari beberapa worker thread.
+    """
+
+    def __init__(self, line_format):
+        """
+        Args:
+            line_format (str): Format baris output, misal "[progress] {}%".
+        """
+        self.line_format = line_format
+        self.value = None
+        self.lock = Lock()
+
+    def set(self, value):
+        with self.lock:
+            if value == self.value:
+                return
+            self.value = value
+        print(self.line_format.format(value), flush=True)
+
+    def get(self):
+        return self.value
+
+
+# --- Validasi Argumen ---
+
+def positive_int(value):
+    """Tipe argparse: integer > 0."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+def non_negative_int(value):
+    """Tipe argparse: integer >= 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be a non-negative integer")
+    return number
+
+def non_negative_float(value):
+    """Tipe argparse: angka >= 0."""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be a non-negative number")
+    return number
+
+
+def build_argument_parser():
+    """
+    Membuat parser argumen CLI. Setiap opsi GUI punya padanan di sini, dengan default yang sama.
+
+    Returns:
+        argparse.ArgumentParser: Parser argumen.
+    """
+    parser = argparse.ArgumentParser(
+        description="Download YouTube Shorts and their metadata in batches, without the GUI.",
+        epilog="Exit codes: 0 ok, 1 some downloads failed, 2 invalid arguments, 3 no Shorts found, 4 unexpected error, 130 cancelled.",
+    )
+    parser.add_argument("channels", nargs="*", metavar="CHANNEL_URL", help="YouTube channel URL(s) to process, in order.")
+    parser.add_argument("--channels-file", help="Text file with one channel URL per line (empty lines and # comments are ignored).")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Main output folder. With several channels, each channel gets its own subfolder.")
+    parser.add_argument("-n", "--limit", type=positive_int, default=None, help="Maximum number of Shorts per channel (default: all).")
+    parser.add_argument("--format", default="Best Quality (Default)",
+                        help=f"Video format: one of {list(gui.FORMAT_OPTIONS.keys())} or a raw yt-dlp format string.")
+    parser.add_argument("--delay", type=non_negative_int, default=gui.DEFAULT_DOWNLOAD_DELAY_SECONDS,
+                        help="Average spacing in seconds between download starts (0 disables pacing).")
+    parser.add_argument("--retries", type=non_negative_int, default=gui.DEFAULT_RETRIES, help="yt-dlp retries per video.")
+    parser.add_argument("--proxy", default=None, help="Proxy for Selenium, metadata and downloads (e.g. http://host:port).")
+    parser.add_argument("--discovery-engine", choices=list(gui.DISCOVERY_ENGINES.values()), default=gui.DISCOVERY_ENGINES["Selenium (Browser)"])
+    parser.add_argument("--pipeline-mode", choices=list(gui.PIPELINE_MODES.values()), default=gui.PIPELINE_MODES["Staged (Default)"])
+
+    performance = parser.add_argument_group("performance options")
+    performance.add_argument("--metadata-workers", type=positive_int, default=gui.DEFAULT_METADATA_WORKERS)
+    performance.add_argument("--metadata-rate", type=non_negative_float, default=gui.DEFAULT_METADATA_RATE_LIMIT,
+                             help="Requests per second shared by metadata fetches and downloads (0 = unlimited); --delay also spaces downloads.")
+    performance.add_argument("--metadata-cache-ttl", type=non_negative_float, default=gui.DEFAULT_METADATA_CACHE_TTL_DAYS,
+                             help="Metadata cache TTL in days (0 = cache off).")
+    performance.add_argument("--download-engine", choices=list(gui.DOWNLOAD_ENGINES.values()), default=gui.DOWNLOAD_ENGINES["In-Process yt-dlp (Fast)"])
+    performance.add_argument("--download-workers", type=positive_int, default=gui.DEFAULT_DOWNLOAD_WORKERS,
+                             help="Concurrent downloads, shared by all channels in the queue.")
+    performance.add_argument("--rate-burst", type=positive_int, default=gui.DEFAULT_RATE_BURST)
+    performance.add_argument("--rate-jitter", choices=list(gui.RATE_JITTER_MODES.values()), default=gui.RATE_JITTER_MODES["None"])
+    performance.add_argument("--no-download-archive", action="store_true",
+                             help=f"Do not skip Shorts listed in {gui.DOWNLOAD_ARCHIVE_FILENAME}.")
+    performance.add_argument("--known-stop", type=non_negative_int, default=gui.DEFAULT_KNOWN_STOP_THRESHOLD,
+                             help="Stop discovery after N consecutive already-downloaded Shorts (0 = off).")
+    performance.add_argument("--resume", action="store_true", help=f"Resume an unfinished run from {gui.CHECKPOINT_FILENAME}.")
+    performance.add_argument("--channel-workers", type=positive_int, default=gui.DEFAULT_CHANNEL_WORKERS,
+                             help="Number of channels processed at the same time.")
+    performance.add_argument("--browser-slots", type=positive_int, default=gui.DEFAULT_BROWSER_SLOTS,
+                             help="Maximum number of Selenium browsers running at the same time across all channels.")
+    performance.add_argument("--export-format", choices=list(gui.EXPORT_FORMATS.values()), default=gui.EXPORT_FORMATS["Excel (.xlsx)"],
+                             help="File format for batch metadata and the master status file.")
+    performance.add_argument("--metadata-source", choices=list(gui.METADATA_SOURCES.values()), default=gui.METADATA_SOURCES["yt-dlp Extraction (Default)"],
+                             help="'dom' takes title/views from the channel page and skips yt-dlp metadata (no descriptions), "
+                                  "'dom_description' still fetches descriptions with yt-dlp.")
+    performance.add_argument("--metadata-profile", choices=list(gui.METADATA_PROFILES.values()), default=gui.METADATA_PROFILES["Full Extraction (Default)"],
+                             help="'full' (default) is the full extraction; 'fast' skips yt-dlp format processing, player JS and DASH/HLS manifests.")
+    performance.add_argument("--single-pass", action="store_true",
+                             help=f"Save each video's Step 2 info dict under {gui.INFO_JSON_DIRNAME}/ and download from it instead of resolving the video again.")
+
+    selenium = parser.add_argument_group("selenium options")
+    for option_key, flag_name, default, help_text in SELENIUM_OPTION_FLAGS:
+        selenium.add_argument(f"--{flag_name}", dest=f"selenium_{option_key}", action=argparse.BooleanOptionalAction,
+                              default=default, help=help_text)
+    selenium.add_argument("--scrolling-method", choices=list(gui.SCROLLING_METHODS.values()), default=gui.SCROLLING_METHODS["Send END Key"])
+    selenium.add_argument("--harvest-mode", choices=list(gui.HARVEST_MODES.values()), default=gui.HARVEST_MODES["Incremental JS Harvest (Fast)"])
+    selenium.add_argument("--scroll-wait-mode", choices=list(gui.SCROLL_WAIT_MODES.values()), default=gui.SCROLL_WAIT_MODES["Adaptive (Wait for New Tiles)"])
+    return parser
+
+
+def read_channel_urls(args, parser):
+    """
+    Menggabungkan URL channel dari argumen dan --channels-file (urutan dipertahankan, duplikat dibuang).
+
+    Returns:
+        list: Daftar URL channel.
+    """
+    channel_urls = gui.parse_channel_urls(args.channels)
+    if args.channels_file:
+        try:
+            channel_urls = gui.parse_channel_urls(channel_urls + gui.read_channel_urls_file(args.channels_file))
+        except OSError as e:
+            parser.error(f"cannot read --channels-file: {e}")
+    if not channel_urls:
+        parser.error("no channel URL given (pass CHANNEL_URL arguments or --channels-file)")
+    return channel_urls
+
+
+def build_settings(args, main_output_directory):
+    """
+    Membuat dictionary settings pipeline (lihat gui.PIPELINE_SETTINGS_KEYS) dari argumen CLI.
+    channel_url diisi per channel oleh gui.ChannelJobQueue.
+
+    Returns:
+        dict: Konfigurasi proses bersama untuk gui.ChannelJobQueue.
+    """
+    return {
+        'channel_url': None,
+        'num_videos_limit': args.limit,
+        'main_output_directory': main_output_directory,
+        'format_string': gui.FORMAT_OPTIONS.get(args.format, args.format),
+        'retries': args.retries,
+        'download_delay_seconds': args.delay,
+        'proxy': args.proxy or None,
+        'pipeline_mode': args.pipeline_mode,
+        'discovery_engine': args.discovery_engine,
+        'selenium_options': {option_key: getattr(args, f"selenium_{option_key}") for option_key, _, _, _ in SELENIUM_OPTION_FLAGS},
+        'scrolling_method': args.scrolling_method,
+        'harvest_mode': args.harvest_mode,
+        'scroll_wait_mode': args.scroll_wait_mode,
+        'metadata_workers': args.metadata_workers,
+        'metadata_rate_limit': args.metadata_rate,
+        'metadata_cache_ttl_days': args.metadata_cache_ttl,
+        'download_engine': args.download_engine,
+        'download_workers': args.download_workers,
+        'rate_burst': args.rate_burst,
+        'rate_jitter': args.rate_jitter,
+        'use_download_archive': not args.no_download_archive,
+        'known_stop_threshold': args.known_stop,
+        'resume': args.resume,
+        'export_format': args.export_format,
+        'metadata_source': args.metadata_source,
+        'metadata_profile': args.metadata_profile,
+        'single_pass': args.single_pass,
+    }
+
+
+def run_channel_queue(settings, channel_urls, channel_workers, browser_slots):
+    """
+    Menjalankan antrian channel (gui.ChannelJobQueue) di thread terpisah dan menunggu sampai selesai.
+    Ctrl+C membatalkan semua channel dengan rapi (sama seperti tombol Cancel di GUI).
+
+    Args:
+        settings (dict): Konfigurasi proses bersama untuk semua channel.
+        channel_urls (list): Daftar URL channel.
+        channel_workers (int): Jumlah channel yang diproses bersamaan.
+        browser_slots (int): Jumlah maksimum browser Selenium bersamaan.
+
+    Returns:
+        list or None: Daftar gui.ChannelJob, atau None jika antrian gagal dijalankan.
+    """
+    gui.cancel_event.clear()
+    job_queue = gui.ChannelJobQueue(settings, channel_urls, ConsoleProgressVar("[progress] {}%"), ConsoleProgressVar("[status] {}"),
+                                    gui.cancel_event, channel_workers=channel_workers, browser_slots=browser_slots)
+    result = {}
+    finished = Event()
+
+    def queue_thread():
+        try:
+            result['jobs'] = job_queue.run()
+        except Exception as e:
+            print(f"An unexpected error occurred during the process: {e}", file=sys.stderr)
+        finally:
+            # Tulis master status final semua channel (juga saat dibatalkan atau error)
+            gui.finish_master_status_compactor()
+            finished.set()
+
+    thread = Thread(target=queue_thread, name="cli-pipeline")
+    thread.start()
+    # Menunggu lewat Event (bukan Thread.join) karena join yang terinterupsi Ctrl+C bisa
+    # membuat is_alive() keliru melaporkan thread sudah selesai
+    while not finished.is_set():
+        try:
+            finished.wait(0.5)
+        except KeyboardInterrupt:
+            if gui.cancel_event.is_set():
+                continue
+            print("Cancellation requested (Ctrl+C). Waiting for running steps to stop...", flush=True)
+            gui.request_cancellation()
+    thread.join()
+    return result.get('jobs')
+
+
+def get_job_exit_code(job):
+    """
+    Menentukan exit code satu channel dari hasil run-nya.
+
+    Args:
+        job (gui.ChannelJob): Job channel yang sudah selesai.
+
+    Returns:
+        int: Exit code untuk channel ini.
+    """
+    if job.outcome is None:
+        return EXIT_PIPELINE_ERROR
+    if job.outcome == gui.PIPELINE_RESULT_CANCELLED:
+        return EXIT_CANCELLED
+    if job.outcome == gui.PIPELINE_RESULT_NO_SHORTS:
+        return EXIT_NO_SHORTS
+    return EXIT_DOWNLOAD_FAILURES if job.failed_count() else EXIT_OK
+
+
+def main(argv=None):
+    """
+    Entry point CLI.
+
+    Args:
+        argv (list or None): Argumen command-line (None = sys.argv).
+
+    Returns:
+        int: Exit code proses (exit code terburuk dari semua channel).
+    """
+    parser = build_argument_parser()
+    args = parser.parse_args(argv)
+    channel_urls = read_channel_urls(args, parser)
+
+    main_output_directory = os.path.abspath(args.output)
+    try:
+        os.makedirs(main_output_directory, exist_ok=True)
+    except OSError as e:
+        print(f"Error creating main output directory {main_output_directory}: {e}", file=sys.stderr)
+        return EXIT_PIPELINE_ERROR
+
+    # Dengan beberapa channel, setiap channel mendapat subfolder sendiri di dalam folder output (lihat gui.ChannelJobQueue)
+    jobs = run_channel_queue(build_settings(args, main_output_directory), channel_urls, args.channel_workers, args.browser_slots)
+    if jobs is None:
+        exit_code = EXIT_PIPELINE_ERROR
+    elif gui.cancel_event.is_set() or any(job.outcome == gui.PIPELINE_RESULT_CANCELLED for job in jobs):
+        exit_code = EXIT_CANCELLED # Ctrl+C membatalkan seluruh antrian channel
+    else:
+        exit_code = max(get_job_exit_code(job) for job in jobs)
+        if len(jobs) > 1:
+            for job in jobs:
+                print(f"Channel {job.index}/{len(jobs)} {job.channel_url}: exit code {get_job_exit_code(job)}", flush=True)
+
+    # Pastikan master status final selesai ditulis sebelum proses keluar
+    gui.finish_master_status_compactor(wait=True)
+    gui.webdriver_pool.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
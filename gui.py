@@ -1,37 +1,105 @@
 # Import modul yang diperlukan
-import tkinter as tk  # Modul standar Python untuk membuat GUI
-from tkinter import ttk, filedialog, messagebox  # Widget tambahan, dialog file, dan kotak pesan
-from threading import Thread, Event  # Untuk menjalankan operasi di thread terpisah dan sinyal pembatalan
+import importlib # Untuk import modul berat secara lazy (lihat LazyModule)
+import atexit # Untuk menutup sesi WebDriver yang masih hangat saat proses keluar
+from threading import Thread, Event, Lock, Condition, BoundedSemaphore  # Untuk menjalankan operasi di thread terpisah, sinyal pembatalan, dan sinkronisasi
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures, FIRST_COMPLETED # Untuk worker pool concurrent (metadata & download)
+from collections import deque, Counter # Untuk antrian hasil in-flight pada pipeline streaming dan ringkasan antrian channel
+import queue # Untuk berbagi resource antar worker thread
+import sqlite3 # Untuk cache metadata persisten antar run
+import sys # Untuk menulis pesan error ke stderr saat berjalan tanpa GUI
 import os  # Untuk berinteraksi dengan sistem operasi, seperti membuat direktori
-import yt_dlp  # Pustaka untuk mendownload video dari YouTube dan situs lain
 import subprocess  # Untuk menjalankan perintah eksternal, di sini digunakan untuk yt-dlp
-import pandas as pd  # Pustaka untuk manipulasi data dan ekspor ke Excel/CSV
-import math # Untuk perhitungan batch
+import random # Untuk jitter penjadwal laju request
 import time # Untuk jeda antar download
+import csv # Untuk master status CSV yang ditulis berkala selama proses
+import json # Untuk parsing data halaman/response InnerTube YouTube
+import re # Untuk mencari konfigurasi ytcfg di HTML halaman
+import urllib.request # Untuk request HTTP discovery InnerTube (tanpa browser)
+import urllib.error
+import urllib.parse
 
-# --- Import Modul Selenium ---
-# Pastikan Anda sudah menginstal pustaka selenium dan webdriver-manager:
-# pip install selenium webdriver-manager
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
-# --- End Import Modul Selenium ---
+
+class LazyModule:
+    """
+    Proxy modul yang baru benar-benar diimpor saat atribut pertamanya diakses.
+    Modul berat (Tkinter, pandas, yt-dlp) tidak lagi dimuat saat startup, sehingga jendela GUI dan
+    output CLI muncul lebih cepat, dan run yang tidak memakai sebuah subsistem tidak membayar biaya importnya.
+    """
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+
+    def __getattr__(self, name):
+        # import_module hanya mengambil dari sys.modules setelah import pertama
+        return getattr(importlib.import_module(self.module_name), name)
+
+tk = LazyModule("tkinter")  # Modul standar Python untuk membuat GUI (hanya dimuat oleh GUI, tidak oleh cli.py)
+ttk = LazyModule("tkinter.ttk")  # Widget tambahan
+filedialog = LazyModule("tkinter.filedialog")  # Dialog pilih folder
+messagebox = LazyModule("tkinter.messagebox")  # Kotak pesan
+yt_dlp = LazyModule("yt_dlp")  # Pustaka untuk mendownload video dari YouTube dan situs lain (dimuat saat metadata/download pertama)
+pd = LazyModule("pandas")  # Pustaka untuk manipulasi data (hanya dipakai untuk ekspor Parquet)
+
+# Modul Selenium (selenium, webdriver-manager) dan openpyxl diimpor di dalam fungsi yang memakainya:
+# pip install selenium webdriver-manager openpyxl
 
 
 # --- Konfigurasi Default ---
 BATCH_SIZE = 100 # Jumlah video Shorts per batch/folder. Bisa diubah sesuai kebutuhan.
 DEFAULT_DOWNLOAD_DELAY_SECONDS = 5 # Nilai default jeda dalam detik antara setiap upaya download video.
 DEFAULT_RETRIES = 3 # Nilai default jumlah percobaan ulang download per video.
+DEFAULT_METADATA_WORKERS = 4 # Nilai default jumlah worker concurrent untuk pengambilan metadata (Step 2).
+DEFAULT_METADATA_RATE_LIMIT = 4 # Nilai default batas request metadata per detik (0 = tanpa batas), dibagi oleh semua worker.
+METADATA_CACHE_FILENAME = "shorts_metadata_cache.sqlite3" # Nama file cache metadata SQLite di folder output utama
+DEFAULT_RATE_BURST = 1 # Nilai default jumlah request (metadata/download) yang boleh berjalan berturut-turut tanpa jeda.
+DEFAULT_DOWNLOAD_WORKERS = 1 # Nilai default jumlah download yang berjalan bersamaan (1 = berurutan seperti sebelumnya).
+DEFAULT_CHANNEL_WORKERS = 2 # Nilai default jumlah channel yang diproses bersamaan pada antrian multi-channel.
+DEFAULT_BROWSER_SLOTS = 2 # Nilai default jumlah maksimum browser Chrome yang berjalan bersamaan pada antrian multi-channel.
+DEFAULT_METADATA_CACHE_TTL_DAYS = 7 # Nilai default umur maksimum (hari) entri cache metadata (0 = cache nonaktif).
+DOWNLOAD_ARCHIVE_FILENAME = "download_archive.txt" # Nama file arsip download (format --download-archive yt-dlp) di folder output utama
+DEFAULT_KNOWN_STOP_THRESHOLD = 10 # Nilai default jumlah video berturut-turut yang sudah ada di arsip sebelum discovery berhenti (0 = nonaktif).
+DOWNLOAD_ARCHIVE_EXTRACTOR_KEY = "youtube" # Key extractor yt-dlp yang ditulis di setiap baris arsip
+CHECKPOINT_FILENAME = "pipeline_checkpoint.jsonl" # Nama file jurnal checkpoint (untuk resume) di folder output utama
+CHECKPOINT_DONE_STATUSES = ('Downloaded', 'Skipped (Already Downloaded)') # Status video yang tidak perlu diproses ulang saat resume
+INFO_JSON_DIRNAME = ".info_json" # Folder (di folder output utama) berisi info dict Step 2 per video untuk mode single-pass
+INFO_JSON_MAX_AGE_SECONDS = 4 * 3600 # Umur maksimum file .info.json sebelum diabaikan (URL stream YouTube kedaluwarsa setelah ~6 jam)
+MASTER_STATUS_COMPACT_INTERVAL_SECONDS = 30 # Interval (detik) penulisan ulang master status di background selama proses berjalan
+METADATA_CACHE_MAX_ENTRIES = 50000 # Jumlah maksimum entri cache; entri paling lama di-evict jika terlampaui.
+STREAMING_QUEUE_SIZE = 50 # Kapasitas queue antar tahap pada pipeline streaming (backpressure ke tahap sebelumnya)
+STREAMING_POLL_INTERVAL = 0.5 # Interval (detik) pengecekan pembatalan saat tahap streaming menunggu queue
+PROGRESS_UPDATE_INTERVAL_MS = 100 # Interval (ms) main loop Tk menerapkan event progress dari worker thread
 ERROR_FOLDER_NAME = "batching_error" # Nama folder untuk menyimpan log error
 SELENIUM_SCROLL_PAUSE_TIME = 5 # Jeda waktu (detik) antar scroll untuk memberi waktu konten memuat (ditingkatkan menjadi 5 detik)
 SELENIUM_SCROLL_ATTEMPTS_TIMEOUT = 900 # Timeout maksimum (detik) untuk proses scrolling
 SELENIUM_ELEMENT_TIMEOUT = 20 # Timeout (detik) untuk menunggu elemen muncul di halaman
 SELENIUM_NO_NEW_ELEMENTS_THRESHOLD = 7 # Jumlah scroll attempt tanpa elemen baru sebelum dianggap selesai
+SELENIUM_ADAPTIVE_WAIT_TIMEOUT = 10 # Timeout fallback (detik) menunggu tile baru setelah scroll pada mode adaptive
+SELENIUM_ADAPTIVE_SETTLE_MS = 300 # Tunggu (ms) hingga tidak ada mutasi baru sebelum dianggap satu "halaman" selesai dimuat
+SELENIUM_ADAPTIVE_END_GRACE_MS = 1500 # Waktu (ms) tanpa elemen continuation sebelum feed dianggap habis
+SELENIUM_ADAPTIVE_END_CONFIRMATIONS = 2 # Jumlah konfirmasi berturut-turut "feed habis" sebelum berhenti scrolling
+SELENIUM_ADAPTIVE_NO_NEW_THRESHOLD = 3 # Jumlah timeout berturut-turut (continuation masih ada) sebelum berhenti scrolling
+CHROMEDRIVER_PATH_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "youtube_shorts_downloader", "chromedriver_path.json") # Cache path binary ChromeDriver hasil webdriver_manager (per user, bukan per folder output)
+CHROMEDRIVER_PATH_CACHE_TTL_HOURS = 24 # Umur maksimum (jam) cache path ChromeDriver sebelum di-resolve ulang (mengikuti update Chrome)
+WEBDRIVER_POOL_SIZE = 2 # Jumlah maksimum sesi WebDriver idle yang disimpan "hangat" untuk channel berikutnya
+WEBDRIVER_MAX_PAGES_PER_SESSION = 10 # Sesi WebDriver di-recycle (quit) setelah membuka sekian halaman channel
+# Profil scraping ringan: scraping hanya butuh href tile Shorts, jadi gambar, video dan font tidak perlu diunduh
+LEAN_PROFILE_CHROME_ARGUMENTS = (
+    "--blink-settings=imagesEnabled=false", # Jangan memuat gambar (thumbnail, avatar)
+    "--disable-remote-fonts", # Jangan mengunduh web font
+    "--autoplay-policy=user-gesture-required", # Preview video tidak diputar otomatis
+    "--mute-audio",
+)
+LEAN_PROFILE_BLOCKED_URL_PATTERNS = ( # Pola URL yang diblokir lewat CDP Network.setBlockedURLs ('*' = wildcard)
+    "*i.ytimg.com/*", "*yt3.ggpht.com/*", "*yt3.googleusercontent.com/*", # Thumbnail dan avatar channel
+    "*googlevideo.com/videoplayback*", # Stream video/audio preview
+    "*fonts.gstatic.com/*", "*fonts.googleapis.com/*",
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.mp4*", "*.webm*", "*.m4a*",
+)
+INNERTUBE_BASE_URL = "https://www.youtube.com" # Base URL untuk discovery InnerTube (bisa diganti ke stub server lokal)
+INNERTUBE_REQUEST_TIMEOUT = 30 # Timeout (detik) per request HTTP InnerTube
+INNERTUBE_MAX_PAGES = 2000 # Batas aman jumlah halaman continuation yang diikuti
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Safari/537.36"
 
 # Mapping nama format user-friendly ke string format yt-dlp
 # yt-dlp akan mencoba memilih format terbaik yang sesuai dengan kriteria ini.
@@ -54,35 +122,747 @@ SCROLLING_METHODS = {
     "Scroll by Viewport (JS)": "js_scroll_by_viewport",
 }
 
+# Opsi mesin discovery URL Shorts (Step 1)
+DISCOVERY_ENGINES = {
+    "Selenium (Browser)": "selenium", # Chrome + auto-scrolling
+    "InnerTube HTTP (Browserless)": "innertube", # HTTP biasa mengikuti continuation token dari data halaman
+}
+
+# Opsi mesin download (Step 4)
+DOWNLOAD_ENGINES = {
+    "In-Process yt-dlp (Fast)": "in_process", # Satu instance yt_dlp.YoutubeDL dipakai ulang untuk banyak video
+    "Subprocess yt-dlp (Legacy)": "subprocess", # Satu proses yt-dlp baru per video (fallback)
+}
+
+# Opsi mode pipeline
+PIPELINE_MODES = {
+    "Staged (Default)": "staged", # Scroll semua -> metadata semua -> download per batch
+    "Streaming (Download While Scanning)": "streaming", # Discovery, metadata, dan download berjalan bersamaan
+}
+
+RATE_STAGE_DOWNLOAD = "download" # Nama tahap download di RateScheduler (dibatasi jeda antar download selain anggaran bersama)
+
+# Distribusi jitter untuk penjadwal laju request (metadata & download); laju rata-rata tetap sama
+RATE_JITTER_MODES = {
+    "None": "none",
+    "Uniform (0.5x - 1.5x)": "uniform",
+    "Exponential (Poisson)": "exponential",
+}
+
+# Format file ekspor metadata batch dan master status (key = ekstensi file)
+EXPORT_FORMATS = {
+    "Excel (.xlsx)": "xlsx", # Ditulis streaming dengan openpyxl write-only
+    "CSV (.csv)": "csv",
+    "JSON Lines (.jsonl)": "jsonl",
+    "Parquet (.parquet, needs pyarrow)": "parquet",
+}
+
+# Opsi sumber metadata (Step 2). Mode DOM memakai title/view count/thumbnail yang sudah di-harvest dari tile
+# Shorts saat discovery (Step 1), sehingga extract_info yt-dlp hanya dijalankan untuk field yang tidak ada di halaman
+METADATA_SOURCES = {
+    "yt-dlp Extraction (Default)": "ytdlp", # extract_info lengkap per video (title + description)
+    "DOM Harvest (Title/Views, Skip Step 2)": "dom", # Tanpa description; yt-dlp hanya untuk video tanpa title di halaman
+    "DOM Harvest + yt-dlp Description": "dom_description", # Description tetap dari yt-dlp, ditambah view count/thumbnail dari halaman
+}
+
+# Opsi profil ekstraksi yt-dlp untuk metadata (Step 2). Hanya title dan description yang disimpan,
+# jadi profil cepat melewati pemrosesan format, player JS (signature) dan manifest DASH/HLS
+METADATA_PROFILES = {
+    "Full Extraction (Default)": "full", # force_generic_extractor + ekstraksi dan pemrosesan format lengkap seperti sebelumnya
+    "Fast (Skip Formats/Player JS)": "fast", # Extractor YouTube langsung, extract_info(process=False), tanpa player JS/manifest
+}
+
+# Key dictionary settings yang dipakai oleh fungsi pipeline (run_staged_pipeline / run_streaming_pipeline)
+PIPELINE_SETTINGS_KEYS = (
+    'channel_url', 'num_videos_limit', 'main_output_directory', 'format_string', 'retries',
+    'download_delay_seconds', 'proxy', 'pipeline_mode', 'discovery_engine', 'selenium_options',
+    'scrolling_method', 'harvest_mode', 'scroll_wait_mode', 'metadata_workers', 'metadata_rate_limit',
+    'metadata_cache_ttl_days', 'download_engine', 'download_workers',
+    'rate_burst', 'rate_jitter', 'use_download_archive', 'known_stop_threshold',
+    'resume', 'export_format', 'metadata_source', 'metadata_profile', 'single_pass',
+)
+# Key opsional: 'download_slots' (threading.Semaphore slot download bersama) dan 'request_scheduler'
+# (RateScheduler bersama), keduanya diisi oleh ChannelJobQueue
+
+# Penanda akhir aliran data antar tahap pipeline streaming
+STREAM_END = object()
+
+# Hasil akhir sebuah run pipeline (nilai kembalian run_pipeline)
+PIPELINE_RESULT_COMPLETED = "completed" # Semua batch selesai diproses (bisa ada video yang gagal)
+PIPELINE_RESULT_UP_TO_DATE = "up_to_date" # Semua Shorts yang ditemukan sudah ada di arsip download
+PIPELINE_RESULT_NO_SHORTS = "no_shorts" # Tidak ada Shorts (atau metadata) yang bisa diproses
+PIPELINE_RESULT_CANCELLED = "cancelled" # Dibatalkan oleh user
+
+# Opsi cara menunggu konten baru setelah setiap scroll
+SCROLL_WAIT_MODES = {
+    "Adaptive (Wait for New Tiles)": "adaptive", # Lanjut segera setelah tile baru muncul, akhir feed dari continuation YouTube
+    "Fixed Pause (Legacy)": "fixed", # Selalu tidur SELENIUM_SCROLL_PAUSE_TIME detik per scroll
+}
+
+# Opsi metode pengambilan (harvest) URL Shorts dari halaman selama scrolling
+HARVEST_MODES = {
+    "Incremental JS Harvest (Fast)": "js_incremental", # Satu execute_script per scroll, hanya ID baru yang dikirim balik
+    "Streaming Harvest + DOM Pruning (Long Feeds)": "js_pruning", # Seperti incremental, lalu tile yang sudah di-harvest dihapus dari DOM
+    "Element Count (Legacy)": "element_count", # find_elements tiap scroll + get_attribute('href') per elemen di akhir
+}
+# Mode harvest yang mengambil ID baru tiap scroll (mendukung on_new_urls per scroll dan early stop run inkremental)
+INCREMENTAL_HARVEST_MODES = (HARVEST_MODES["Incremental JS Harvest (Fast)"], HARVEST_MODES["Streaming Harvest + DOM Pruning (Long Feeds)"])
+SELENIUM_PRUNE_KEEP_TILES = 48 # Jumlah tile Shorts terakhir yang tetap di DOM pada mode pruning (sisanya dihapus setelah di-harvest)
+SELENIUM_PRUNE_MIN_NEW_TILES = 48 # Pruning dijalankan (round-trip terpisah) setiap sejumlah ID baru ini, bukan setiap scroll
+
+# Script JavaScript untuk harvest incremental: mengambil ID video dari link Shorts yang belum pernah
+# di-harvest, lalu menandai elemen tersebut agar tidak dikirim ulang pada scroll berikutnya.
+# Hasilnya dikirim dalam SATU round-trip WebDriver, bukan satu round-trip per elemen.
+# arguments: [ambil metadata DOM]. Jika arguments[0] true, setiap item berupa
+# {id, title, view_count, thumbnail_url} yang dibaca dari tile, bukan hanya string ID.
+HARVEST_NEW_SHORTS_IDS_JS = """
+const ids = [];
+const withMetadata = arguments[0];
+const tileSelector = 'ytd-rich-item-renderer, ytd-reel-item-renderer, ytd-grid-video-renderer, ytm-shorts-lockup-view-model';
+const anchors = document.querySelectorAll("a[href^='/shorts/']:not([data-shorts-harvested])");
+for (const anchor of anchors) {
+    anchor.setAttribute('data-shorts-harvested', '1');
+    const match = anchor.getAttribute('href').match(/^\\/shorts\\/([A-Za-z0-9_-]+)/);
+    if (!match) continue;
+    if (!withMetadata) {
+        ids.push(match[1]);
+        continue;
+    }
+    const tile = anchor.closest(tileSelector) || anchor;
+    const text = (selector) => {
+        const element = tile.querySelector(selector);
+        return element ? element.textContent.trim() : '';
+    };
+    const image = tile.querySelector("img[src^='http']");
+    ids.push({
+        id: match[1],
+        title: text('h3, #video-title, .shortsLockupViewModelHostMetadataTitle') || (anchor.getAttribute('title') || '').trim(),
+        view_count: text('.shortsLockupViewModelHostMetadataSubhead, .shortsLockupViewModelHostOutsideMetadataSubhead, #metadata-line span'),
+        thumbnail_url: image ? image.getAttribute('src') : '',
+    });
+}
+return ids;
+"""
+
+# Script JavaScript untuk mode pruning (dijalankan terpisah dari harvest): menghapus tile Shorts yang sudah
+# di-harvest (ditandai data-shorts-harvested oleh HARVEST_NEW_SHORTS_IDS_JS) dari DOM, kecuali arguments[0]
+# tile terakhir. Jumlah node (dan memori browser serta biaya querySelectorAll per scroll) tetap kira-kira
+# konstan, berapa pun panjang feed channel. Mengembalikan jumlah tile yang dihapus.
+PRUNE_HARVESTED_SHORTS_TILES_JS = """
+const keepTiles = arguments[0];
+const tileSelector = 'ytd-rich-item-renderer, ytd-reel-item-renderer, ytd-grid-video-renderer, ytm-shorts-lockup-view-model';
+const tiles = [];
+const tileSet = new Set();
+for (const anchor of document.querySelectorAll("a[href^='/shorts/'][data-shorts-harvested]")) {
+    const tile = anchor.closest(tileSelector) || anchor;
+    if (!tileSet.has(tile)) {
+        tileSet.add(tile);
+        tiles.push(tile);
+    }
+}
+const pruned = tiles.slice(0, Math.max(0, tiles.length - keepTiles));
+for (const tile of pruned) tile.remove();
+return pruned.length;
+"""
+
+# Script JavaScript untuk memasang MutationObserver (sekali per halaman) yang menghitung
+# berapa kali tile/link Shorts baru ditambahkan ke DOM. Mengembalikan nilai counter saat ini.
+INSTALL_SHORTS_TILE_OBSERVER_JS = """
+if (!window.__shortsTileObserver) {
+    window.__shortsTilesAdded = 0;
+    window.__shortsLastMutation = 0;
+    const isShortsLink = (node) => node.nodeType === 1 && (
+        (node.matches && node.matches("a[href^='/shorts/']")) ||
+        (node.querySelector && node.querySelector("a[href^='/shorts/']")));
+    window.__shortsTileObserver = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            const nodes = mutation.type === 'attributes' ? [mutation.target] : mutation.addedNodes;
+            for (const node of nodes) {
+                if (isShortsLink(node)) {
+                    window.__shortsTilesAdded++;
+                    window.__shortsLastMutation = Date.now();
+                }
+            }
+        }
+    });
+    window.__shortsTileObserver.observe(document.body, {
+        childList: true, subtree: true, attributes: true, attributeFilter: ['href']
+    });
+}
+return window.__shortsTilesAdded;
+"""
+
+# Script JavaScript async (execute_async_script) yang menunggu hingga tile Shorts baru muncul
+# (counter observer > nilai terakhir dan DOM sudah "tenang"), feed habis (tidak ada elemen
+# continuation YouTube), atau timeout fallback tercapai.
+# arguments: [counter terakhir, timeout ms, settle ms, end grace ms, callback]
+WAIT_FOR_NEW_SHORTS_TILES_JS = """
+const lastSeen = arguments[0], timeoutMs = arguments[1], settleMs = arguments[2], endGraceMs = arguments[3];
+const done = arguments[arguments.length - 1];
+const start = Date.now();
+const hasContinuation = () => !!document.querySelector(
+    'ytd-continuation-item-renderer, ytm-continuation-item-renderer, #continuations tp-yt-paper-spinner');
+(function check() {
+    const added = window.__shortsTilesAdded || 0;
+    const elapsed = Date.now() - start;
+    if (added > lastSeen && Date.now() - (window.__shortsLastMutation || 0) >= settleMs) {
+        return done({added: added, new_tiles: true, has_continuation: hasContinuation()});
+    }
+    if (added <= lastSeen && !hasContinuation() && elapsed >= endGraceMs) {
+        return done({added: added, new_tiles: false, has_continuation: false});
+    }
+    if (elapsed >= timeoutMs) {
+        return done({added: added, new_tiles: added > lastSeen, has_continuation: hasContinuation()});
+    }
+    setTimeout(check, 100);
+})();
+"""
+
 # --- Variabel Global untuk Kontrol Proses ---
 cancel_event = Event() # Event untuk memberi sinyal pembatalan ke thread download
-current_subprocess = None # Menyimpan referensi ke proses yt-dlp yang sedang berjalan
-current_driver = None # Menyimpan referensi ke WebDriver Selenium yang sedang berjalan
+active_subprocesses = set() # Menyimpan semua proses yt-dlp yang sedang berjalan (satu per worker download)
+active_subprocesses_lock = Lock() # Melindungi active_subprocesses dari akses bersamaan
+active_drivers = set() # Menyimpan semua WebDriver Selenium yang sedang dipakai (satu per channel yang sedang di-scrape)
+active_drivers_lock = Lock() # Melindungi active_drivers dari akses bersamaan
+resolved_chromedriver_path = None # Path ChromeDriver yang sudah di-resolve di proses ini (lihat resolve_chromedriver_path)
+resolved_chromedriver_path_lock = Lock() # Mencegah beberapa thread menjalankan ChromeDriverManager().install() bersamaan
+root = None # Jendela utama Tkinter (None jika dijalankan tanpa GUI, misal lewat cli.py)
+progress_bus = None # ProgressEventBus GUI (None jika dijalankan tanpa GUI)
 # Variabel global untuk menyimpan status download semua video
-all_videos_download_status = [] # List of dicts: [{'url': '...', 'title': '...', 'status': 'No'}]
+all_videos_download_status = None # StatusStore berisi status semua video di run terakhir (terindeks per ID video)
+active_status_compactors = {} # Folder output -> MasterStatusCompactor terakhir untuk folder itu (menulis master status di background)
+active_status_compactors_lock = Lock() # Melindungi active_status_compactors dari akses bersamaan
+
+# --- Fungsi Bantu untuk Pesan Error ---
+
+def show_error(title, message):
+    """
+    Menampilkan pesan error ke user dari thread mana pun: kotak pesan jika GUI berjalan,
+    atau ke stderr jika dijalankan tanpa GUI (messagebox membutuhkan Tk root dan display).
+    Di GUI, pesan dikirim lewat progress_bus sehingga messagebox selalu dibuka dari main thread Tk.
+
+    Args:
+        title (str): Judul pesan.
+        message (str): Isi pesan.
+    """
+    if progress_bus is not None:
+        progress_bus.publish('error', (title, message))
+    elif root is not None:
+        messagebox.showerror(title, message)
+    else:
+        print(f"{title}: {message}", file=sys.stderr)
+
+# --- Fungsi Bantu untuk URL Channel dan ID Video Shorts ---
+
+def build_channel_shorts_url(channel_url):
+    """
+    Memodifikasi URL channel YouTube agar mengarah ke halaman/tab Shorts channel tersebut.
+
+    Args:
+        channel_url (str): URL channel YouTube (format @handle, /channel/, /user/, /c/, atau lainnya).
+
+    Returns:
+        str: URL halaman Shorts channel (misal: 'https://www.youtube.com/@NamaChannel/shorts').
+    """
+    channel_url_shorts = channel_url.strip()
+    try:
+        if '/@' in channel_url_shorts:
+            parts = channel_url_shorts.split('/@')
+            username_part = parts[1].split('/')[0]
+            channel_url_shorts = f'https://www.youtube.com/@{username_part}/shorts'
+        elif '/channel/' in channel_url_shorts:
+             channel_id = channel_url_shorts.split('/channel/')[1].split('/')[0]
+             channel_url_shorts = f'https://www.youtube.com/channel/{channel_id}/shorts'
+        elif '/user/' in channel_url_shorts:
+             user_id = channel_url_shorts.split('/user/')[1].split('/')[0]
+             channel_url_shorts = f'https://www.youtube.com/user/{user_id}/shorts'
+        elif '/c/' in channel_url_shorts: # Custom URL
+             custom_id = channel_url_shorts.split('/c/')[1].split('/')[0]
+             channel_url_shorts = f'https://www.youtube.com/c/{custom_id}/shorts'
+        else: # Fallback atau jika URL sudah base channel, coba tambahkan /shorts
+             channel_url_shorts = channel_url_shorts.rstrip('/') + '/shorts'
+             if any(p in channel_url_shorts for p in ['/about', '/community', '/playlist', '/playlists', '/streams', '/featured', '/videos']):
+                  print(f"Warning: URL '{channel_url}' might contain extra path, attempting to clean.")
+                  channel_url_shorts = channel_url_shorts.split('/about')[0].split('/community')[0].split('/playlist')[0].split('/playlists')[0].split('/streams')[0].split('/featured')[0].split('/videos')[0].rstrip('/') + '/shorts'
+    except Exception as e:
+         print(f"Warning: Could not parse channel URL {channel_url}. Attempting to add /shorts directly. Error: {e}")
+         channel_url_shorts = channel_url.strip().rstrip('/') + '/shorts'
+    return channel_url_shorts
+
+def extract_video_id_from_shorts_url(url):
+    """
+    Mengambil ID video dari URL/href Shorts ('/shorts/ID' atau 'https://www.youtube.com/shorts/ID').
+
+    Args:
+        url (str): URL atau href Shorts.
+
+    Returns:
+        str or None: ID video, atau None jika URL bukan format Shorts yang dikenali.
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if url.startswith('https://www.youtube.com/shorts/'):
+        url = url[len('https://www.youtube.com'):]
+    if not url.startswith('/shorts/'):
+        return None
+    # Buang query string / fragment / path tambahan setelah ID
+    video_id = url[len('/shorts/'):].split('?')[0].split('#')[0].split('/')[0]
+    return video_id or None
+
+def update_known_id_streak(video_ids, known_video_ids, known_streak):
+    """
+    Memperbarui jumlah ID berturut-turut (sesuai urutan feed, terbaru dulu) yang sudah dikenal dari run sebelumnya.
+
+    Args:
+        video_ids (list): ID video baru sesuai urutan kemunculan di feed.
+        known_video_ids (set): ID video yang sudah dikenal.
+        known_streak (int): Jumlah ID dikenal berturut-turut sebelum video_ids.
+
+    Returns:
+        int: Jumlah ID dikenal berturut-turut setelah video_ids (0 jika ID terakhir belum dikenal).
+    """
+    for video_id in video_ids:
+        known_streak = known_streak + 1 if video_id in known_video_ids else 0
+    return known_streak
+
+def harvest_new_shorts_ids(driver, seen_ids, page_metadata=None):
+    """
+    Menjalankan HARVEST_NEW_SHORTS_IDS_JS (satu round-trip WebDriver) dan mengembalikan
+    ID video yang belum ada di seen_ids. seen_ids diperbarui langsung (in-place).
+
+    Args:
+        driver (webdriver.Chrome): Instance WebDriver yang aktif.
+        seen_ids (set): Set ID video yang sudah di-harvest sebelumnya (disimpan di sisi Python).
+        page_metadata (dict or None): Jika diisi, title/view count/thumbnail dari tile ikut di-harvest dalam
+            round-trip yang sama dan disimpan ke dict ini (ID video -> field, lihat store_page_metadata).
+
+    Returns:
+        list: Daftar ID video baru sesuai urutan kemunculan di halaman.
+    """
+    harvested = driver.execute_script(HARVEST_NEW_SHORTS_IDS_JS, page_metadata is not None)
+    new_ids = []
+    for item in harvested or []:
+        if isinstance(item, dict):
+            video_id = item.get('id')
+            store_page_metadata(page_metadata, video_id, item.get('title'), item.get('view_count'), item.get('thumbnail_url'))
+        else:
+            video_id = item
+        if video_id and video_id not in seen_ids:
+            seen_ids.add(video_id)
+            new_ids.append(video_id)
+    return new_ids
+
+def prune_harvested_shorts_tiles(driver, keep_tiles):
+    """
+    Menghapus tile Shorts yang sudah di-harvest dari DOM (PRUNE_HARVESTED_SHORTS_TILES_JS), kecuali
+    sejumlah tile terakhir, agar memori browser dan latensi per scroll tetap datar pada feed yang panjang.
+
+    Args:
+        driver (webdriver.Chrome): Instance WebDriver yang aktif.
+        keep_tiles (int): Jumlah tile terakhir yang tetap di DOM.
+
+    Returns:
+        int: Jumlah tile yang dihapus.
+    """
+    return driver.execute_script(PRUNE_HARVESTED_SHORTS_TILES_JS, keep_tiles) or 0
+
+def store_page_metadata(page_metadata, video_id, title, view_count=None, thumbnail_url=None):
+    """
+    Menyimpan metadata satu video yang dibaca langsung dari halaman channel (tile DOM atau data InnerTube).
+    Video tanpa title tidak disimpan, sehingga Step 2 tetap mengambilnya lewat yt-dlp.
+
+    Args:
+        page_metadata (dict or None): ID video -> {'title', 'view_count', 'thumbnail_url'}. None = tidak dipakai.
+        video_id (str): ID video.
+        title (str or None): Judul video dari halaman.
+        view_count (str or None): Teks jumlah penonton seperti yang tampil di halaman (misal '1.2M views').
+        thumbnail_url (str or None): URL thumbnail. Jika kosong, dipakai URL thumbnail standar i.ytimg.com.
+    """
+    if page_metadata is None or not video_id or not title or video_id in page_metadata:
+        return
+    page_metadata[video_id] = {
+        'title': title.strip(),
+        'view_count': (view_count or '').strip(),
+        'thumbnail_url': thumbnail_url or f'https://i.ytimg.com/vi/{video_id}/hqdefault.jpg',
+    }
+
+def wait_for_new_shorts_tiles(driver, last_added_count, timeout_seconds=SELENIUM_ADAPTIVE_WAIT_TIMEOUT):
+    """
+    Menunggu secara event-driven hingga tile Shorts baru dimuat setelah scroll, menggunakan
+    MutationObserver yang dipasang oleh INSTALL_SHORTS_TILE_OBSERVER_JS.
+    Kembali segera setelah tile baru muncul; timeout hanya sebagai fallback.
+
+    Args:
+        driver (webdriver.Chrome): Instance WebDriver yang aktif.
+        last_added_count (int): Nilai counter observer dari pemanggilan sebelumnya.
+        timeout_seconds (int or float): Timeout fallback dalam detik.
+
+    Returns:
+        dict: {'added': int, 'new_tiles': bool, 'has_continuation': bool}.
+              has_continuation False berarti YouTube tidak lagi menyediakan halaman lanjutan (feed habis).
+    """
+    # Beri ruang di atas timeout JS agar WebDriver tidak memotong script lebih dulu
+    driver.set_script_timeout(timeout_seconds + 5)
+    result = driver.execute_async_script(
+        WAIT_FOR_NEW_SHORTS_TILES_JS,
+        last_added_count,
+        int(timeout_seconds * 1000),
+        SELENIUM_ADAPTIVE_SETTLE_MS,
+        SELENIUM_ADAPTIVE_END_GRACE_MS,
+    )
+    if not result:
+        return {'added': last_added_count, 'new_tiles': False, 'has_continuation': True}
+    return result
+
+
+# --- Resolusi ChromeDriver & Pool WebDriver ---
+
+def load_cached_chromedriver_path(max_age_seconds):
+    """
+    Membaca path ChromeDriver dari CHROMEDRIVER_PATH_CACHE_FILE.
+
+    Args:
+        max_age_seconds (float or None): Umur maksimum cache dalam detik. None = abaikan umur cache
+            (dipakai sebagai fallback saat resolve online gagal).
+
+    Returns:
+        str or None: Path ChromeDriver jika cache valid dan binary-nya masih ada, selain itu None.
+    """
+    try:
+        with open(CHROMEDRIVER_PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        driver_path = cached['driver_path']
+        resolved_at = float(cached.get('resolved_at', 0))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if not driver_path or not os.path.isfile(driver_path):
+        return None
+    if max_age_seconds is not None and time.time() - resolved_at > max_age_seconds:
+        return None
+    return driver_path
+
+def save_cached_chromedriver_path(driver_path):
+    """
+    Menyimpan path ChromeDriver ke CHROMEDRIVER_PATH_CACHE_FILE (ditulis atomik).
+    Kegagalan menulis cache hanya dicatat, karena driver tetap bisa dipakai.
+
+    Args:
+        driver_path (str): Path binary ChromeDriver.
+    """
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_PATH_CACHE_FILE), exist_ok=True)
+        partial_filepath = get_partial_filepath(CHROMEDRIVER_PATH_CACHE_FILE)
+        with open(partial_filepath, 'w', encoding='utf-8') as f:
+            json.dump({'driver_path': driver_path, 'resolved_at': time.time()}, f)
+        os.replace(partial_filepath, CHROMEDRIVER_PATH_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not save ChromeDriver path cache: {e}")
+
+def resolve_chromedriver_path(force_refresh=False):
+    """
+    Mendapatkan path binary ChromeDriver tanpa menjalankan ChromeDriverManager().install()
+    (yang mengecek versi lewat jaringan) di setiap Step 1. Urutan: path yang sudah di-resolve
+    di proses ini, lalu cache di disk yang belum kedaluwarsa, lalu install(). Jika install() gagal
+    (misal offline), path cache lama tetap dipakai selama binary-nya masih ada.
+
+    Args:
+        force_refresh (bool): True untuk melewati cache (misal setelah driver dari cache gagal dijalankan).
+
+    Returns:
+        str: Path binary ChromeDriver.
+    """
+    global resolved_chromedriver_path
+    with resolved_chromedriver_path_lock:
+        if not force_refresh:
+            if resolved_chromedriver_path and os.path.isfile(resolved_chromedriver_path):
+                return resolved_chromedriver_path
+            cached_path = load_cached_chromedriver_path(CHROMEDRIVER_PATH_CACHE_TTL_HOURS * 3600)
+            if cached_path:
+                print(f"Using cached ChromeDriver: {cached_path}")
+                resolved_chromedriver_path = cached_path
+                return cached_path
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            # Cache yang baru saja gagal dijalankan tidak dipakai lagi sebagai fallback
+            stale_path = None if force_refresh else load_cached_chromedriver_path(None)
+            if not stale_path:
+                raise
+            print(f"Could not resolve ChromeDriver online ({e}). Using previously cached ChromeDriver: {stale_path}")
+            resolved_chromedriver_path = stale_path
+            return stale_path
+        save_cached_chromedriver_path(driver_path)
+        resolved_chromedriver_path = driver_path
+        return driver_path
+
+def create_chrome_driver(options):
+    """
+    Menjalankan Chrome WebDriver baru dengan ChromeDriver dari resolve_chromedriver_path.
+    Jika driver dari cache gagal dijalankan (misal versinya tidak cocok lagi setelah Chrome ter-update),
+    path di-resolve ulang sekali lalu dicoba lagi.
+
+    Args:
+        options (webdriver.ChromeOptions): Opsi Chrome.
+
+    Returns:
+        webdriver.Chrome: Instance WebDriver baru.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.common.exceptions import WebDriverException
+
+    driver_path = resolve_chromedriver_path()
+    try:
+        return webdriver.Chrome(service=ChromeService(driver_path), options=options)
+    except WebDriverException as e:
+        print(f"Starting ChromeDriver {driver_path} failed ({e}). Resolving ChromeDriver again...")
+        driver_path = resolve_chromedriver_path(force_refresh=True)
+        return webdriver.Chrome(service=ChromeService(driver_path), options=options)
+
+def apply_lean_profile(driver):
+    """
+    Memblokir request gambar, video dan font pada sesi WebDriver lewat CDP (Network.setBlockedURLs).
+    Pengaturan berlaku per sesi, sehingga dipanggil lagi setiap sesi dipinjam dari pool (idempotent).
+
+    Args:
+        driver (webdriver.Chrome): Sesi WebDriver yang aktif.
+
+    Returns:
+        bool: True jika pemblokiran aktif, False jika CDP tidak tersedia (scraping tetap berjalan tanpa pemblokiran).
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(LEAN_PROFILE_BLOCKED_URL_PATTERNS)})
+        return True
+    except Exception as e:
+        print(f"Could not enable request blocking for the lean scraping profile ({e}). Continuing without it.")
+        return False
+
+def quit_webdriver(driver):
+    """Menutup WebDriver tanpa meneruskan error (browser mungkin sudah mati atau sudah di-quit saat pembatalan)."""
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"Error quitting Selenium WebDriver: {e}")
+
+
+class PooledWebDriver:
+    """Sesi WebDriver milik WebDriverPool beserta kunci opsi Chrome dan jumlah halaman channel yang sudah dibuka."""
+
+    __slots__ = ('driver', 'options_key', 'pages_loaded')
+
+    def __init__(self, driver, options_key):
+        """
+        Args:
+            driver (webdriver.Chrome): Instance WebDriver.
+            options_key (tuple): Argumen Chrome saat sesi dibuat (sesi hanya dipakai ulang untuk opsi yang sama).
+        """
+        self.driver = driver
+        self.options_key = options_key
+        self.pages_loaded = 0
+
+
+class WebDriverPool:
+    """
+    Pool kecil sesi WebDriver "hangat" yang dipakai ulang oleh scrape channel berikutnya, sehingga Chrome
+    tidak perlu dijalankan ulang untuk setiap channel. Sesi idle hanya dipinjamkan untuk opsi Chrome yang
+    sama, dicek kesehatannya sebelum dipinjamkan, dan di-recycle setelah max_pages halaman channel
+    (memori renderer terus bertambah selama sesi hidup). Jumlah browser yang dipinjam bersamaan dibatasi
+    max_active; peminjam berikutnya menunggu sampai ada sesi yang dikembalikan.
+    """
+
+    def __init__(self, max_idle=WEBDRIVER_POOL_SIZE, max_pages=WEBDRIVER_MAX_PAGES_PER_SESSION, max_active=DEFAULT_BROWSER_SLOTS):
+        """
+        Args:
+            max_idle (int): Jumlah maksimum sesi idle yang disimpan (0 = tidak pernah dipakai ulang).
+            max_pages (int): Jumlah halaman channel per sesi sebelum sesi di-recycle.
+            max_active (int): Jumlah maksimum sesi yang dipinjam (browser berjalan) bersamaan.
+        """
+        self.max_idle = max(0, max_idle)
+        self.max_pages = max(1, max_pages)
+        self.max_active = max(1, max_active)
+        self.active_count = 0
+        self.idle_sessions = []
+        self.lock = Lock()
+        self.slot_available = Condition(self.lock)
+
+    def set_max_active(self, max_active):
+        """
+        Mengubah batas browser bersamaan (misal dari pengaturan antrian multi-channel). Sesi idle yang disimpan
+        ikut dinaikkan agar setiap slot bisa tetap hangat untuk channel berikutnya.
+
+        Args:
+            max_active (int): Jumlah maksimum browser yang berjalan bersamaan.
+        """
+        with self.lock:
+            self.max_active = max(1, max_active)
+            self.max_idle = max(self.max_idle, self.max_active) if self.max_idle > 0 else 0
+            self.slot_available.notify_all()
+
+    def acquire_slot(self, cancel_event=None):
+        """
+        Menunggu slot browser kosong (bisa diinterupsi oleh pembatalan).
+
+        Returns:
+            bool: True jika slot didapat, False jika dibatalkan.
+        """
+        with self.lock:
+            if self.active_count >= self.max_active:
+                print(f"Waiting for a free browser slot ({self.active_count}/{self.max_active} in use)...")
+            while self.active_count >= self.max_active:
+                if cancel_event is not None and cancel_event.is_set():
+                    return False
+                self.slot_available.wait(STREAMING_POLL_INTERVAL)
+            self.active_count += 1
+            return True
+
+    def release_slot(self):
+        """Mengembalikan slot browser dan membangunkan peminjam yang menunggu."""
+        with self.lock:
+            self.active_count = max(0, self.active_count - 1)
+            self.slot_available.notify()
+
+    @staticmethod
+    def is_healthy(driver):
+        """Health check: browser masih merespons perintah WebDriver."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def borrow(self, options, cancel_event=None):
+        """
+        Meminjam sesi idle yang sehat dengan opsi Chrome yang sama, atau menjalankan Chrome baru.
+        Menunggu terlebih dulu jika max_active browser sedang dipakai.
+
+        Args:
+            options (webdriver.ChromeOptions): Opsi Chrome yang diminta.
+            cancel_event (threading.Event or None): Event pembatalan selama menunggu slot browser.
+
+        Returns:
+            PooledWebDriver or None: Sesi yang siap dipakai, atau None jika dibatalkan saat menunggu slot.
+        """
+        if not self.acquire_slot(cancel_event):
+            return None
+        try:
+            return self.take_session(options)
+        except BaseException:
+            self.release_slot()
+            raise
+
+    def take_session(self, options):
+        """Mengambil sesi idle yang sehat untuk opsi ini, atau menjalankan Chrome baru (slot sudah dipegang)."""
+        options_key = tuple(options.arguments)
+        while True:
+            with self.lock:
+                session = next((idle for idle in self.idle_sessions if idle.options_key == options_key), None)
+                if session is not None:
+                    self.idle_sessions.remove(session)
+            if session is None:
+                break
+            if self.is_healthy(session.driver):
+                print(f"Reusing warm Selenium WebDriver ({session.pages_loaded} channel page(s) loaded so far).")
+                return session
+            print("Discarding unresponsive pooled Selenium WebDriver.")
+            quit_webdriver(session.driver)
+        return PooledWebDriver(create_chrome_driver(options), options_key)
+
+    def give_back(self, session, reusable=True):
+        """
+        Mengembalikan sesi setelah satu halaman channel selesai. Sesi disimpan idle jika masih bisa dipakai
+        ulang, selain itu (error, pembatalan, batas halaman tercapai, pool penuh) browser ditutup.
+
+        Args:
+            session (PooledWebDriver): Sesi yang dikembalikan.
+            reusable (bool): False jika sesi tidak boleh dipakai ulang (error/pembatalan/reuse dinonaktifkan).
+        """
+        try:
+            self.store_or_quit(session, reusable)
+        finally:
+            self.release_slot()
+
+    def store_or_quit(self, session, reusable):
+        """Menyimpan sesi sebagai idle jika masih layak dipakai ulang, selain itu menutup browser."""
+        session.pages_loaded += 1
+        if reusable and self.max_idle > 0 and session.pages_loaded < self.max_pages:
+            try:
+                # Tinggalkan halaman channel agar script dan memori YouTube tidak terus berjalan selama idle
+                session.driver.get("about:blank")
+            except Exception as e:
+                print(f"Pooled Selenium WebDriver failed to reset ({e}).")
+            else:
+                with self.lock:
+                    self.idle_sessions.append(session)
+                    evicted = self.idle_sessions[:-self.max_idle]
+                    del self.idle_sessions[:-self.max_idle]
+                for evicted_session in evicted:
+                    quit_webdriver(evicted_session.driver)
+                print("Selenium WebDriver kept warm for the next channel.")
+                return
+        elif reusable and session.pages_loaded >= self.max_pages:
+            print(f"Recycling Selenium WebDriver after {session.pages_loaded} channel page(s).")
+        quit_webdriver(session.driver)
+        print("Selenium WebDriver closed.")
+
+    def close(self):
+        """Menutup semua sesi idle (dipanggil saat aplikasi/CLI selesai)."""
+        with self.lock:
+            sessions, self.idle_sessions = self.idle_sessions, []
+        for session in sessions:
+            quit_webdriver(session.driver)
+        if sessions:
+            print(f"Closed {len(sessions)} warm Selenium WebDriver(s).")
+
+
+webdriver_pool = WebDriverPool() # Pool sesi WebDriver bersama untuk semua run di proses ini (GUI maupun CLI)
+atexit.register(webdriver_pool.close) # Jaring pengaman: jangan tinggalkan proses Chrome saat Python keluar
+
 
 # --- Fungsi Selenium untuk Mendapatkan Semua URL Shorts ---
 
-def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options, scrolling_method, proxy, progress_label_var, cancel_event):
+def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options, scrolling_method, proxy, progress_label_var, cancel_event,
+                                 harvest_mode=HARVEST_MODES["Incremental JS Harvest (Fast)"],
+                                 scroll_wait_mode=SCROLL_WAIT_MODES["Adaptive (Wait for New Tiles)"], on_new_urls=None,
+                                 known_video_ids=None, known_stop_threshold=DEFAULT_KNOWN_STOP_THRESHOLD, page_metadata=None):
     """
     Menggunakan Selenium untuk membuka halaman Shorts channel YouTube, melakukan auto-scrolling
     hingga semua video dimuat, dan mengekstrak semua URL Shorts yang ditemukan.
-    Deteksi akhir halaman berdasarkan jumlah elemen video yang ditemukan.
+    Deteksi akhir halaman berdasarkan jumlah video yang ditemukan (ID yang sudah di-harvest
+    untuk mode incremental, atau jumlah elemen untuk mode legacy).
 
     Args:
         channel_url (str): URL channel YouTube.
         num_videos_limit (int or None): Jumlah maksimum video yang akan diambil URL-nya. None untuk semua.
-        selenium_options (dict): Dictionary berisi opsi konfigurasi Selenium (headless, proxy, dll).
+        selenium_options (dict): Dictionary berisi opsi konfigurasi Selenium (headless, reuse_browser, lean_profile, dll).
         scrolling_method (str): Metode scrolling yang akan digunakan (lihat SCROLLING_METHODS).
         proxy (str or None): Alamat proxy untuk Selenium. None atau string kosong jika tidak pakai proxy.
         progress_label_var (tk.StringVar): Variabel Tkinter untuk mengupdate teks label status.
         cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        harvest_mode (str): Metode pengambilan URL (lihat HARVEST_MODES).
+        scroll_wait_mode (str): Cara menunggu konten baru setelah scroll (lihat SCROLL_WAIT_MODES).
+        on_new_urls (callable or None): Callback on_new_urls(list_url) yang dipanggil dengan URL baru
+            segera setelah ditemukan (setiap scroll pada mode incremental, sekali di akhir pada mode legacy).
+        known_video_ids (set or None): ID video dari run sebelumnya (run inkremental). Feed Shorts urut dari
+            yang terbaru, jadi scrolling berhenti setelah known_stop_threshold ID berturut-turut sudah dikenal.
+            Hanya berlaku pada mode harvest incremental.
+        known_stop_threshold (int): Jumlah ID dikenal berturut-turut untuk berhenti scrolling (0 = nonaktif).
+        page_metadata (dict or None): Jika diisi, title/view count/thumbnail setiap tile ikut di-harvest ke dict ini
+            (ID video -> field) untuk mode metadata DOM. Hanya berlaku pada mode harvest incremental.
 
     Returns:
         list: Daftar string URL Shorts ('https://www.youtube.com/shorts/VIDEO_ID'),
               atau list kosong jika tidak ditemukan atau terjadi kesalahan/pembatalan.
     """
-    global current_driver # Deklarasikan untuk memodifikasi variabel global
+    # --- Import Modul Selenium (lazy: hanya dimuat jika mesin discovery Selenium dipakai) ---
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import WebDriverException, TimeoutException
 
     print(f"Starting Selenium process for channel: {channel_url}")
     progress_label_var.set("Step 1/4: Starting browser and navigating...")
@@ -101,6 +881,11 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
     if selenium_options.get("enable_webgl", False): options.add_argument("--enable-webgl") # Mungkin tidak selalu perlu, tergantung konten
     if selenium_options.get("lang_en_US", True): options.add_argument("--lang=en-US") # Set bahasa
     if selenium_options.get("start_maximized", False): options.add_argument("--start-maximized") # Mungkin tidak relevan di headless
+    lean_profile = selenium_options.get("lean_profile", False) # Opt-in sampai ada data benchmark
+    if lean_profile:
+        # Profil ringan: argumen ini juga masuk kunci pool, jadi sesi lean dan non-lean tidak tertukar
+        for argument in LEAN_PROFILE_CHROME_ARGUMENTS:
+            options.add_argument(argument)
     # Pengaturan tambahan yang penting untuk headless dan stabilitas
     options.add_argument("--disable-blink-features=AutomationControlled") # Meminimalkan deteksi sebagai bot
     options.add_argument("--disable-infobars")
@@ -109,7 +894,7 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
     options.add_argument("--remote-allow-origins=*") # Mungkin diperlukan untuk koneksi remote/debugger
     options.add_argument("--log-level=3") # Suppress logging messages
     # Menambahkan User-Agent (opsional, bisa membantu menghindari deteksi)
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Safari/537.36")
+    options.add_argument(f"user-agent={DEFAULT_USER_AGENT}")
 
     # Menambahkan opsi proxy jika disediakan
     if proxy:
@@ -117,41 +902,25 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
         print(f"Using proxy for Selenium: {proxy}")
 
     # Memodifikasi URL channel untuk mengarah ke halaman Shorts channel
-    # Menggunakan logika parsing yang sama seperti di fungsi get_shorts_metadata
-    channel_url_shorts = channel_url.strip()
-    try:
-        if '/@' in channel_url_shorts:
-            parts = channel_url_shorts.split('/@')
-            username_part = parts[1].split('/')[0]
-            channel_url_shorts = f'https://www.youtube.com/@{username_part}/shorts'
-        elif '/channel/' in channel_url_shorts:
-             channel_id = channel_url_shorts.split('/channel/')[1].split('/')[0]
-             channel_url_shorts = f'https://www.youtube.com/channel/{channel_id}/shorts'
-        elif '/user/' in channel_url_shorts:
-             user_id = channel_url_shorts.split('/user/')[1].split('/')[0]
-             channel_url_shorts = f'https://www.youtube.com/user/{user_id}/shorts'
-        elif '/c/' in channel_url_shorts: # Custom URL
-             custom_id = channel_url_shorts.split('/c/')[1].split('/')[0]
-             channel_url_shorts = f'https://www.youtube.com/c/{custom_id}/shorts'
-        else: # Fallback atau jika URL sudah base channel, coba tambahkan /shorts
-             channel_url_shorts = channel_url_shorts.rstrip('/') + '/shorts'
-             if any(p in channel_url_shorts for p in ['/about', '/community', '/playlist', '/playlists', '/streams', '/featured', '/videos']):
-                  print(f"Warning: URL '{channel_url}' might contain extra path, attempting to clean.")
-                  channel_url_shorts = channel_url_shorts.split('/about')[0].split('/community')[0].split('/playlist')[0].split('/playlists')[0].split('/streams')[0].split('/featured')[0].split('/videos')[0].rstrip('/') + '/shorts'
-    except Exception as e:
-         print(f"Warning: Could not parse channel URL {channel_url}. Attempting to add /shorts directly. Error: {e}")
-         channel_url_shorts = channel_url.strip().rstrip('/') + '/shorts'
+    channel_url_shorts = build_channel_shorts_url(channel_url)
 
     print(f"Navigating to: {channel_url_shorts}")
 
-    driver = None
+    session = None
+    session_healthy = True # False jika WebDriver error, sehingga sesi tidak dikembalikan ke pool
     all_shorts_urls = [] # Initialize list here
     try:
         # --- Inisialisasi WebDriver ---
-        # Menggunakan ChromeDriverManager untuk mengelola versi chromedriver secara otomatis
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        current_driver = driver # Simpan referensi global
+        # Pinjam sesi hangat dari pool jika ada; path ChromeDriver di-cache (lihat resolve_chromedriver_path)
+        session = webdriver_pool.borrow(options, cancel_event)
+        if session is None:
+            print("Scrolling cancelled by user while waiting for a browser slot.")
+            return []
+        driver = session.driver
+        with active_drivers_lock:
+            active_drivers.add(driver) # Simpan referensi global (agar bisa dihentikan saat pembatalan)
+        if lean_profile and apply_lean_profile(driver):
+            print("Lean scraping profile active: images, video and fonts are blocked.")
 
         driver.get(channel_url_shorts)
 
@@ -172,6 +941,26 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
 
         last_video_count = 0
         no_new_elements_count = 0 # Counter untuk scroll attempt tanpa elemen baru
+        seen_ids = set() # ID video yang sudah di-harvest (mode incremental)
+        harvested_ids = [] # ID video sesuai urutan kemunculan di halaman (mode incremental)
+        adaptive_wait = scroll_wait_mode == SCROLL_WAIT_MODES["Adaptive (Wait for New Tiles)"]
+        known_streak = 0 # Jumlah ID berturut-turut yang sudah dikenal (run inkremental)
+        stop_on_known = bool(known_video_ids) and known_stop_threshold > 0
+        incremental_harvest = harvest_mode in INCREMENTAL_HARVEST_MODES
+        # Mode pruning (opt-in): tile lama dihapus dari DOM setelah di-harvest agar memori dan latensi per scroll tetap datar
+        prune_tiles = harvest_mode == HARVEST_MODES["Streaming Harvest + DOM Pruning (Long Feeds)"]
+        unpruned_count = 0 # Jumlah ID yang di-harvest sejak pruning terakhir
+        check_after_prune = False # True setelah pruning: scroll berikutnya harus memunculkan tile baru
+        if stop_on_known and not incremental_harvest:
+            print("Early stop on already-known videos requires the incremental harvest mode. Scrolling the full feed.")
+            stop_on_known = False
+        if page_metadata is not None and not incremental_harvest:
+            print("DOM metadata requires the incremental harvest mode. Metadata will be fetched with yt-dlp.")
+        feed_end_confirmations = 0 # Counter konfirmasi akhir feed (mode adaptive)
+        feed_ended = False
+        if adaptive_wait:
+            # Pasang observer sekali; nilai awal counter menjadi baseline
+            tiles_added_counter = driver.execute_script(INSTALL_SHORTS_TILE_OBSERVER_JS) or 0
         start_time = time.time()
 
         # Temukan elemen yang bisa di-scroll. Pada halaman channel, ini seringkali adalah body atau elemen spesifik.
@@ -210,21 +999,57 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
 
 
             # Tunggu konten baru dimuat
-            time.sleep(SELENIUM_SCROLL_PAUSE_TIME)
-
-            # Hitung jumlah elemen video yang ditemukan saat ini
-            current_video_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='/shorts/']")
-            current_video_count = len(current_video_elements)
+            if adaptive_wait:
+                wait_result = wait_for_new_shorts_tiles(driver, tiles_added_counter)
+                tiles_added_counter = wait_result.get('added', tiles_added_counter)
+                feed_ended = not wait_result.get('new_tiles') and not wait_result.get('has_continuation', True)
+            else:
+                time.sleep(SELENIUM_SCROLL_PAUSE_TIME)
+
+            # Hitung jumlah video yang ditemukan saat ini
+            if incremental_harvest:
+                # Satu round-trip: ambil hanya ID baru, seen-set tetap di sisi Python
+                new_ids = harvest_new_shorts_ids(driver, seen_ids, page_metadata)
+                harvested_ids.extend(new_ids)
+                if prune_tiles:
+                    if check_after_prune and not new_ids:
+                        # Fallback: halaman mungkin butuh tile yang dihapus untuk memuat lanjutan feed
+                        print("No new Shorts tiles appeared after pruning the page. Disabling DOM pruning for this channel.")
+                        prune_tiles = False
+                    check_after_prune = False
+                    unpruned_count += len(new_ids)
+                    if prune_tiles and unpruned_count >= SELENIUM_PRUNE_MIN_NEW_TILES:
+                        check_after_prune = prune_harvested_shorts_tiles(driver, SELENIUM_PRUNE_KEEP_TILES) > 0
+                        unpruned_count = 0
+                if on_new_urls is not None and new_ids:
+                    on_new_urls([f'https://www.youtube.com/shorts/{video_id}' for video_id in new_ids])
+                if stop_on_known:
+                    known_streak = update_known_id_streak(new_ids, known_video_ids, known_streak)
+                current_video_count = len(seen_ids)
+            else:
+                current_video_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='/shorts/']")
+                current_video_count = len(current_video_elements)
 
-            # --- Logika Deteksi Akhir Halaman Berbasis Jumlah Elemen ---
+            # --- Logika Deteksi Akhir Halaman ---
+            # Mode adaptive: akhir feed ditentukan dari state continuation YouTube,
+            # streak tanpa elemen baru hanya sebagai fallback (misal koneksi macet)
+            no_new_threshold = SELENIUM_ADAPTIVE_NO_NEW_THRESHOLD if adaptive_wait else SELENIUM_NO_NEW_ELEMENTS_THRESHOLD
             if current_video_count == last_video_count:
-                no_new_elements_count += 1
-                print(f"Scroll attempt: No new videos found. Consecutive attempts without new videos: {no_new_elements_count}/{SELENIUM_NO_NEW_ELEMENTS_THRESHOLD}")
-                if no_new_elements_count >= SELENIUM_NO_NEW_ELEMENTS_THRESHOLD:
-                    print(f"Stopped scrolling after {SELENIUM_NO_NEW_ELEMENTS_THRESHOLD} attempts without finding new videos.")
-                    break # Keluar dari loop jika tidak ada elemen baru setelah beberapa kali coba
+                if adaptive_wait and feed_ended:
+                    feed_end_confirmations += 1
+                    if feed_end_confirmations >= SELENIUM_ADAPTIVE_END_CONFIRMATIONS:
+                        print("Reached end of Shorts feed (no continuation item left). Stopping scroll.")
+                        break
+                else:
+                    feed_end_confirmations = 0
+                    no_new_elements_count += 1
+                    print(f"Scroll attempt: No new videos found. Consecutive attempts without new videos: {no_new_elements_count}/{no_new_threshold}")
+                    if no_new_elements_count >= no_new_threshold:
+                        print(f"Stopped scrolling after {no_new_threshold} attempts without finding new videos.")
+                        break # Keluar dari loop jika tidak ada elemen baru setelah beberapa kali coba
             else:
                 no_new_elements_count = 0 # Reset counter jika menemukan elemen baru
+                feed_end_confirmations = 0
                 # print(f"Scroll attempt: Found {current_video_count} videos (added {current_video_count - last_video_count}).") # Kurangi log ini agar tidak terlalu verbose
 
             last_video_count = current_video_count
@@ -242,6 +1067,11 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
                       print(f"Found approximately {current_video_count} videos, which is >= {num_videos_limit}. Stopping scroll.")
                       break # Berhenti jika jumlah video yang ditemukan sudah cukup
 
+            # Run inkremental: deretan video yang sudah dikenal berarti sisa feed sudah diproses di run sebelumnya
+            if stop_on_known and known_streak >= known_stop_threshold:
+                print(f"Found {known_streak} consecutive already-known videos. Stopping scroll (incremental run).")
+                break
+
             # Update status GUI selama scrolling
             progress_label_var.set(f"Step 1/4: Scrolling... Found ~{current_video_count} videos...")
 
@@ -252,8 +1082,18 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
         # Setelah scrolling selesai (atau dibatalkan/timeout), ekstrak URL dari semua elemen yang ditemukan
         progress_label_var.set("Step 1/4: Extracting video URLs from loaded page...")
         print("Extracting video URLs from loaded page...")
-        # Temukan semua elemen <a> yang memiliki atribut href yang dimulai dengan '/shorts/'
-        video_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='/shorts/']")
+        if incremental_harvest:
+            # Harvest terakhir untuk elemen yang dimuat setelah scroll terakhir, lalu bangun URL dari ID
+            if not cancel_event.is_set():
+                new_ids = harvest_new_shorts_ids(driver, seen_ids, page_metadata)
+                harvested_ids.extend(new_ids)
+                if on_new_urls is not None and new_ids:
+                    on_new_urls([f'https://www.youtube.com/shorts/{video_id}' for video_id in new_ids])
+            video_elements = [] # Tidak perlu get_attribute('href') per elemen
+            all_shorts_urls = [f'https://www.youtube.com/shorts/{video_id}' for video_id in harvested_ids]
+        else:
+            # Temukan semua elemen <a> yang memiliki atribut href yang dimulai dengan '/shorts/'
+            video_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='/shorts/']")
 
         for element in video_elements:
             # Dapatkan nilai atribut 'href'
@@ -278,33 +1118,40 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
              all_shorts_urls = all_shorts_urls[:num_videos_limit]
              print(f"Trimmed URL list to {len(all_shorts_urls)} based on user limit.")
 
+        # Mode legacy baru mengetahui URL di akhir, jadi kirim semuanya sekaligus
+        if on_new_urls is not None and not incremental_harvest and all_shorts_urls:
+            on_new_urls(list(all_shorts_urls))
+
         print(f"Successfully extracted {len(all_shorts_urls)} Shorts URLs.")
         return all_shorts_urls
 
     except WebDriverException as e:
+        session_healthy = False
         error_msg = f"Selenium WebDriver error: {e}"
         print(error_msg)
         progress_label_var.set(f"Step 1/4: WebDriver Error: {e}")
-        messagebox.showerror("WebDriver Error", error_msg)
+        show_error("WebDriver Error", error_msg)
         return []
     except TimeoutException:
         error_msg = f"Selenium Timeout: Initial element not found within {SELENIUM_ELEMENT_TIMEOUT} seconds."
         print(error_msg)
         progress_label_var.set(f"Step 1/4: Timeout Error: Initial element not found.")
-        messagebox.showerror("Timeout Error", error_msg)
+        show_error("Timeout Error", error_msg)
         return []
     except Exception as e:
+        session_healthy = False
         error_msg = f"An unexpected error occurred during Selenium process: {e}"
         print(error_msg)
         progress_label_var.set(f"Step 1/4: Unexpected Error: {e}")
-        messagebox.showerror("Selenium Error", error_msg)
+        show_error("Selenium Error", error_msg)
         return []
     finally:
-        # Pastikan browser ditutup setelah selesai atau terjadi error
-        if driver:
-            driver.quit()
-            current_driver = None
-            print("Selenium WebDriver closed.")
+        # Kembalikan browser ke pool (tetap hangat untuk channel berikutnya), atau tutup jika error/dibatalkan
+        if session is not None:
+            with active_drivers_lock:
+                active_drivers.discard(session.driver)
+            reusable = session_healthy and selenium_options.get("reuse_browser", True) and not cancel_event.is_set()
+            webdriver_pool.give_back(session, reusable=reusable)
         # Jika dibatalkan, status GUI sudah diupdate di dalam loop scrolling
         if not cancel_event.is_set() and all_shorts_urls: # Update final status only if not cancelled and URLs were found
              progress_label_var.set(f"Step 1/4 finished. Found {len(all_shorts_urls)} Shorts URLs.")
@@ -312,404 +1159,3292 @@ def get_all_shorts_urls_selenium(channel_url, num_videos_limit, selenium_options
              progress_label_var.set("Step 1/4 finished. No Shorts URLs found.")
 
 
-# --- Fungsi yt-dlp untuk Mendapatkan Metadata dari Daftar URL ---
+# --- Fungsi InnerTube (HTTP tanpa Browser) untuk Mendapatkan Semua URL Shorts ---
 
-def get_metadata_for_urls(urls, proxy, progress_label_var, cancel_event):
+def innertube_http_request(url, proxy=None, payload=None):
     """
-    Mengambil metadata (URL, Title, Description) dari daftar URL video menggunakan yt-dlp.
-    Memproses setiap URL satu per satu karena API yt-dlp extract_info mengharapkan string tunggal.
+    Melakukan request HTTP GET (atau POST JSON jika payload diberikan) dan mengembalikan body sebagai teks.
 
     Args:
-        urls (list): Daftar string URL video.
-        proxy (str or None): Alamat proxy (misal: "http://host:port"). None atau string kosong jika tidak pakai proxy.
-        progress_label_var (tk.StringVar): Variabel Tkinter untuk mengupdate teks label status.
-        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        url (str): URL tujuan.
+        proxy (str or None): Alamat proxy (misal: "http://host:port"). None jika tidak pakai proxy.
+        payload (dict or None): Body JSON untuk request POST. None untuk GET.
 
     Returns:
-        list: Daftar dictionary, di mana setiap dictionary berisi metadata satu Shorts
-              (keys: 'url', 'title', 'description'), atau list kosong jika gagal atau dibatalkan.
+        str: Body response (UTF-8).
     """
-    if not urls:
-        print("No URLs provided to fetch metadata.")
-        return []
-
-    total_urls = len(urls)
-    print(f"Step 2/4: Fetching metadata for {total_urls} URLs using yt-dlp (one by one)...")
-    progress_label_var.set(f"Step 2/4: Fetching metadata for {total_urls} videos...")
-
-    # Opsi untuk yt_dlp saat mengambil informasi video individual
-    ydl_opts = {
-        'quiet': True,
-        'extract_flat': False, # Kita perlu metadata lengkap
-        'ignoreerrors': True, # Lanjutkan meskipun ada error pada satu atau beberapa video
-        'no_warnings': True, # Sembunyikan peringatan
-        'force_generic_extractor': True, # Mungkin membantu untuk URL individual
-        # 'skip_download': True, # Opsi ini sudah implisit dengan download=False di extract_info
+    headers = {
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Accept-Language': 'en-US,en;q=0.9',
     }
+    data = None
+    if payload is not None:
+        data = json.dumps(payload).encode('utf-8')
+        headers['Content-Type'] = 'application/json'
 
-    # Tambahkan opsi proxy jika disediakan
+    handlers = []
     if proxy:
-        ydl_opts['proxy'] = proxy
-        print(f"Using proxy for yt-dlp metadata fetch: {proxy}")
+        handlers.append(urllib.request.ProxyHandler({'http': proxy, 'https': proxy}))
+    opener = urllib.request.build_opener(*handlers)
+    request = urllib.request.Request(url, data=data, headers=headers)
+    with opener.open(request, timeout=INNERTUBE_REQUEST_TIMEOUT) as response:
+        return response.read().decode('utf-8', errors='replace')
 
-    all_shorts_metadata = []
-    failed_metadata_urls = [] # Untuk melacak URL yang gagal diambil metadatanya
+def extract_json_after_marker(text, marker):
+    """
+    Mengambil objek JSON yang dimulai tepat setelah marker tertentu di dalam teks (misal HTML).
 
-    try:
-        # Inisialisasi YoutubeDL object sekali di luar loop
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Iterasi melalui setiap URL dalam list
-            for index, url in enumerate(urls):
-                if cancel_event.is_set():
-                    print("Metadata fetching cancelled by user.")
-                    progress_label_var.set("Step 2/4: Metadata fetching cancelled.")
-                    return [] # Kembalikan list kosong jika dibatalkan
-
-                # Update status GUI untuk video saat ini
-                progress_label_var.set(f"Step 2/4: Fetching metadata for video {index + 1}/{total_urls}...")
-                # print(f"Attempting to fetch metadata for: {url}") # Debugging per URL
+    Args:
+        text (str): Teks sumber.
+        marker (str): Penanda sebelum objek JSON (misal: 'var ytInitialData = ').
 
-                try:
-                    # Panggil extract_info untuk SATU URL
-                    # Jika extract_info gagal untuk URL tertentu, dengan ignoreerrors=True,
-                    # ia akan mencetak error ke stderr dan mengembalikan None atau dictionary error.
-                    entry = ydl.extract_info(url, download=False)
-
-                    # Memproses hasil ekstraksi untuk URL tunggal
-                    if entry and entry.get('id'):
-                        video_id = entry['id']
-                        video_title = entry.get('title', 'Untitled')
-                        video_description = entry.get('description', '')
-                        short_url = f'https://www.youtube.com/shorts/{video_id}' # Pastikan format URL Shorts
-                        all_shorts_metadata.append({
-                            'url': short_url,
-                            'title': video_title,
-                            'description': video_description
-                        })
-                        # print(f"Successfully fetched metadata for {url}") # Debugging per URL
-                    else:
-                        # Ini akan muncul di konsol jika yt-dlp mengembalikan None atau entri invalid
-                        print(f"Failed to fetch metadata for {url}. Result was: {entry}")
-                        failed_metadata_urls.append(url)
+    Returns:
+        dict or None: Objek JSON hasil parsing, atau None jika marker tidak ditemukan/JSON tidak valid.
+    """
+    start = text.find(marker)
+    if start == -1:
+        return None
+    start = text.find('{', start + len(marker))
+    if start == -1:
+        return None
+    try:
+        obj, _ = json.JSONDecoder().raw_decode(text, start)
+        return obj
+    except ValueError:
+        return None
 
-                except Exception as e:
-                    # Tangkap error spesifik jika extract_info melempar exception untuk URL ini
-                    print(f"An error occurred fetching metadata for {url}: {e}")
-                    failed_metadata_urls.append(url)
-                    # Lanjutkan ke URL berikutnya meskipun ada error pada satu URL
+def read_innertube_shorts_tile(tile, page_metadata=None):
+    """
+    Membaca ID video dari satu tile Shorts InnerTube, dan (jika page_metadata diisi) title, view count,
+    serta thumbnail-nya, sama seperti yang di-harvest dari DOM pada mode Selenium.
 
-        # Setelah loop selesai
-        if cancel_event.is_set():
-             # Status sudah diupdate di dalam loop
-             pass
-        else:
-            print(f"Finished metadata extraction. Successfully fetched metadata for {len(all_shorts_metadata)} out of {total_urls} URLs.")
-            if failed_metadata_urls:
-                print(f"Failed to fetch metadata for {len(failed_metadata_urls)} URLs.")
-                # Opsional: simpan daftar URL yang gagal diambil metadatanya
-                # save_failed_urls_to_file(failed_metadata_urls, output_directory_main, "metadata_fetch") # Perlu path utama
-            progress_label_var.set(f"Step 2/4 finished. Fetched metadata for {len(all_shorts_metadata)} videos.")
+    Args:
+        tile (dict): Isi tile grid (reelItemRenderer/shortsLockupViewModel, boleh dibungkus richItemRenderer).
+        page_metadata (dict or None): ID video -> field metadata (lihat store_page_metadata).
 
-        return all_shorts_metadata
+    Returns:
+        str or None: ID video, atau None jika node bukan tile Shorts.
+    """
+    content = (tile.get('richItemRenderer') or {}).get('content') or tile
+    reel_item = content.get('reelItemRenderer') # Layout lama
+    if isinstance(reel_item, dict) and reel_item.get('videoId'):
+        thumbnails = (reel_item.get('thumbnail') or {}).get('thumbnails') or [{}]
+        store_page_metadata(page_metadata, reel_item['videoId'],
+                            (reel_item.get('headline') or {}).get('simpleText'),
+                            (reel_item.get('viewCountText') or {}).get('simpleText'),
+                            thumbnails[-1].get('url'))
+        return reel_item['videoId']
+    lockup = content.get('shortsLockupViewModel') # Layout baru
+    if isinstance(lockup, dict):
+        reel_endpoint = ((lockup.get('onTap') or {}).get('innertubeCommand') or {}).get('reelWatchEndpoint') or {}
+        if not reel_endpoint.get('videoId'):
+            return None
+        overlay = lockup.get('overlayMetadata') or {}
+        sources = (lockup.get('thumbnail') or {}).get('sources') or [{}]
+        store_page_metadata(page_metadata, reel_endpoint['videoId'],
+                            (overlay.get('primaryText') or {}).get('content'),
+                            (overlay.get('secondaryText') or {}).get('content'),
+                            sources[0].get('url'))
+        return reel_endpoint['videoId']
+    return None
+
+def read_innertube_continuation_token(item):
+    """
+    Membaca continuation token grid dari item continuationItemRenderer (item terakhir grid Shorts).
 
-    except Exception as e:
-        # Menangkap kesalahan selama proses inisialisasi YDL atau error tak terduga
-        print(f"An error occurred during yt-dlp metadata extraction process: {e}")
-        progress_label_var.set(f"Step 2/4: Error fetching metadata: {e}")
-        return []
+    Args:
+        item (dict): Item grid.
 
+    Returns:
+        str or None: Token, atau None jika item bukan continuationItemRenderer.
+    """
+    endpoint = (item.get('continuationItemRenderer') or {}).get('continuationEndpoint') or {}
+    # Layout baru membungkus continuationCommand di dalam commandExecutorCommand
+    commands = [endpoint] + ((endpoint.get('commandExecutorCommand') or {}).get('commands') or [])
+    for command in commands:
+        token = (command.get('continuationCommand') or {}).get('token')
+        if token:
+            return token
+    return None
+
+def find_innertube_grid_items(data):
+    """
+    Mencari daftar item grid Shorts di dalam data InnerTube: richGridRenderer.contents pada ytInitialData
+    halaman, atau appendContinuationItemsAction.continuationItems pada response continuation.
+    Header grid (chip urutan Popular/Oldest) dan bagian lain halaman tidak ikut dibaca.
 
-# --- Fungsi Download Video (Diperbarui untuk Melacak Status) ---
+    Args:
+        data (dict or list): Data JSON InnerTube.
 
-def download_videos_from_links(metadata_list, output_path, format_string, retries, download_delay_seconds, proxy, global_status_list, progress_var, progress_label_var, batch_info="", cancel_event=None):
+    Returns:
+        list: Item grid sesuai urutan dokumen.
     """
-    Mendownload daftar video dari metadata yang diberikan menggunakan subprocess yt-dlp
-    ke dalam direktori output yang ditentukan, dengan pilihan format, retries, delay, proxy, dan pembatalan.
-    Melacak status download setiap video dalam global_status_list.
+    grid_items = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            grid = node.get('richGridRenderer')
+            if isinstance(grid, dict):
+                grid_items.extend(grid.get('contents') or [])
+            append_action = node.get('appendContinuationItemsAction')
+            if isinstance(append_action, dict):
+                grid_items.extend(append_action.get('continuationItems') or [])
+            # Tambahkan anak dalam urutan terbalik agar urutan traversal sesuai urutan dokumen
+            stack.extend(reversed([value for key, value in node.items()
+                                   if key not in ('richGridRenderer', 'appendContinuationItemsAction')]))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return grid_items
+
+def parse_innertube_shorts_page(data, page_metadata=None):
+    """
+    Mengambil ID video Shorts dan continuation token grid dari data InnerTube
+    (ytInitialData halaman atau response /youtubei/v1/browse).
+    Hanya tile di dalam grid Shorts yang dibaca, dan token hanya diambil dari continuationItemRenderer grid,
+    sehingga token chip urutan di header tidak mengubah urutan pagination.
 
     Args:
-        metadata_list (list): Daftar dictionary berisi metadata Shorts untuk batch ini.
-        output_path (str): Path direktori tempat video akan disimpan (subfolder batch).
-        format_string (str): String format yt-dlp yang akan digunakan (misal: "bestvideo+bestaudio/best").
-        retries (int): Jumlah percobaan ulang download per video.
-        download_delay_seconds (int): Jeda dalam detik antara setiap upaya download video.
+        data (dict or list): Data JSON InnerTube.
+        page_metadata (dict or None): Jika diisi, title/view count/thumbnail setiap tile juga disimpan ke sini.
+
+    Returns:
+        tuple: (list ID video sesuai urutan, continuation token grid atau None).
+    """
+    video_ids = []
+    continuation_token = None
+    for item in find_innertube_grid_items(data):
+        if not isinstance(item, dict):
+            continue
+        video_id = read_innertube_shorts_tile(item, page_metadata)
+        if video_id:
+            video_ids.append(video_id)
+        continuation_token = read_innertube_continuation_token(item) or continuation_token
+    # Hapus duplikat dengan tetap menjaga urutan
+    return list(dict.fromkeys(video_ids)), continuation_token
+
+def get_all_shorts_urls_innertube(channel_url, num_videos_limit, proxy, progress_label_var, cancel_event, base_url=INNERTUBE_BASE_URL,
+                                  on_new_urls=None, known_video_ids=None, known_stop_threshold=DEFAULT_KNOWN_STOP_THRESHOLD,
+                                  page_metadata=None):
+    """
+    Mengambil semua URL Shorts dari channel YouTube tanpa browser: membuka tab Shorts via HTTP,
+    membaca ytInitialData, lalu mengikuti continuation token melalui endpoint InnerTube /youtubei/v1/browse.
+
+    Args:
+        channel_url (str): URL channel YouTube.
+        num_videos_limit (int or None): Jumlah maksimum video yang akan diambil URL-nya. None untuk semua.
+        proxy (str or None): Alamat proxy. None atau string kosong jika tidak pakai proxy.
+        progress_label_var (tk.StringVar): Variabel Tkinter untuk mengupdate teks label status.
+        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        base_url (str): Base URL YouTube. Bisa diarahkan ke stub server lokal yang menyajikan halaman JSON rekaman.
+        on_new_urls (callable or None): Callback on_new_urls(list_url) yang dipanggil dengan URL baru setiap halaman.
+        known_video_ids (set or None): ID video dari run sebelumnya (run inkremental). Pagination berhenti setelah
+            known_stop_threshold ID berturut-turut (urut dari yang terbaru) sudah dikenal.
+        known_stop_threshold (int): Jumlah ID dikenal berturut-turut untuk berhenti pagination (0 = nonaktif).
+        page_metadata (dict or None): Jika diisi, title/view count/thumbnail dari data tile disimpan ke dict ini
+            (ID video -> field) untuk mode metadata DOM.
+
+    Returns:
+        list: Daftar string URL Shorts ('https://www.youtube.com/shorts/VIDEO_ID'),
+              atau list kosong jika tidak ditemukan atau terjadi kesalahan/pembatalan.
+    """
+    base_url = base_url.rstrip('/')
+    # Gunakan path halaman Shorts channel, tapi host dari base_url
+    channel_path = urllib.parse.urlsplit(build_channel_shorts_url(channel_url)).path
+    page_url = f"{base_url}{channel_path}"
+
+    print(f"Starting InnerTube discovery for channel: {channel_url} ({page_url})")
+    progress_label_var.set("Step 1/4: Fetching Shorts tab over HTTP (browserless)...")
+    if proxy:
+        print(f"Using proxy for InnerTube discovery: {proxy}")
+
+    all_video_ids = []
+    seen_ids = set()
+    known_streak = 0 # Jumlah ID berturut-turut yang sudah dikenal (run inkremental)
+    stop_on_known = bool(known_video_ids) and known_stop_threshold > 0
+    try:
+        html = innertube_http_request(page_url, proxy)
+        initial_data = extract_json_after_marker(html, 'var ytInitialData = ') or extract_json_after_marker(html, 'window["ytInitialData"] = ')
+        if initial_data is None:
+            raise ValueError("ytInitialData not found in channel page.")
+
+        api_key_match = re.search(r'"INNERTUBE_API_KEY"\s*:\s*"([^"]+)"', html)
+        innertube_context = extract_json_after_marker(html, '"INNERTUBE_CONTEXT":')
+        if innertube_context is None:
+            # Fallback context minimal jika ytcfg tidak ditemukan
+            client_version_match = re.search(r'"INNERTUBE_CLIENT_VERSION"\s*:\s*"([^"]+)"', html)
+            innertube_context = {'client': {
+                'clientName': 'WEB',
+                'clientVersion': client_version_match.group(1) if client_version_match else '2.20240101.00.00',
+                'hl': 'en',
+            }}
+
+        page_ids, continuation_token = parse_innertube_shorts_page(initial_data, page_metadata)
+        pages_fetched = 1
+        while True:
+            new_ids = []
+            for video_id in page_ids:
+                if video_id not in seen_ids:
+                    seen_ids.add(video_id)
+                    new_ids.append(video_id)
+            all_video_ids.extend(new_ids)
+            if on_new_urls is not None and new_ids:
+                on_new_urls([f'https://www.youtube.com/shorts/{video_id}' for video_id in new_ids])
+            if stop_on_known:
+                known_streak = update_known_id_streak(new_ids, known_video_ids, known_streak)
+
+            progress_label_var.set(f"Step 1/4: Paging Shorts feed over HTTP... Found {len(all_video_ids)} videos...")
+
+            if cancel_event.is_set():
+                print("InnerTube discovery cancelled by user.")
+                progress_label_var.set("Step 1/4: Discovery cancelled.")
+                break
+            if num_videos_limit is not None and num_videos_limit > 0 and len(all_video_ids) >= num_videos_limit:
+                print(f"Found {len(all_video_ids)} videos, which is >= {num_videos_limit}. Stopping pagination.")
+                break
+            if stop_on_known and known_streak >= known_stop_threshold:
+                print(f"Found {known_streak} consecutive already-known videos. Stopping pagination (incremental run).")
+                break
+            if not continuation_token:
+                print("Reached end of Shorts feed (no continuation token).")
+                break
+            if pages_fetched >= INNERTUBE_MAX_PAGES:
+                print(f"Stopped pagination after {INNERTUBE_MAX_PAGES} pages.")
+                break
+
+            browse_url = f"{base_url}/youtubei/v1/browse?prettyPrint=false"
+            if api_key_match:
+                browse_url += f"&key={api_key_match.group(1)}"
+            response_text = innertube_http_request(
+                browse_url, proxy, payload={'context': innertube_context, 'continuation': continuation_token}
+            )
+            page_ids, continuation_token = parse_innertube_shorts_page(json.loads(response_text), page_metadata)
+            pages_fetched += 1
+
+        all_shorts_urls = [f'https://www.youtube.com/shorts/{video_id}' for video_id in all_video_ids]
+        if num_videos_limit is not None and num_videos_limit > 0:
+            all_shorts_urls = all_shorts_urls[:num_videos_limit]
+            print(f"Trimmed URL list to {len(all_shorts_urls)} based on user limit.")
+
+        print(f"Successfully extracted {len(all_shorts_urls)} Shorts URLs over {pages_fetched} InnerTube page(s).")
+        if not cancel_event.is_set():
+            if all_shorts_urls:
+                progress_label_var.set(f"Step 1/4 finished. Found {len(all_shorts_urls)} Shorts URLs.")
+            else:
+                progress_label_var.set("Step 1/4 finished. No Shorts URLs found.")
+        return all_shorts_urls
+
+    except (urllib.error.URLError, OSError) as e:
+        error_msg = f"InnerTube HTTP error: {e}"
+        print(error_msg)
+        progress_label_var.set(f"Step 1/4: HTTP Error: {e}")
+        show_error("InnerTube Error", error_msg)
+        return []
+    except Exception as e:
+        error_msg = f"An unexpected error occurred during InnerTube discovery: {e}"
+        print(error_msg)
+        progress_label_var.set(f"Step 1/4: Unexpected Error: {e}")
+        show_error("InnerTube Error", error_msg)
+        return []
+
+
+# --- Pembatas Laju Request (Dipakai Bersama oleh Worker Thread) ---
+
+class RateScheduler:
+    """
+    Penjadwal laju request berbasis token bucket (GCRA) yang aman dipakai bersama oleh banyak thread.
+    Satu instance dipakai bersama oleh metadata dan download: setiap request mengambil token dari anggaran
+    bersama (rata-rata requests_per_second request per detik), dan tahap yang punya batas sendiri
+    (misal jeda antar download) juga harus menunggu jadwal tahapnya. Hingga `burst` request boleh berjalan
+    langsung tanpa menunggu. Jitter opsional mengacak jarak antar request tanpa mengubah laju rata-ratanya.
+    Waktu tunggu bisa diinterupsi oleh cancel_event.
+    """
+
+    def __init__(self, requests_per_second, burst=DEFAULT_RATE_BURST, jitter=RATE_JITTER_MODES["None"], stage_rates=None):
+        """
+        Args:
+            requests_per_second (float): Laju rata-rata request bersama per detik. 0 atau None berarti tanpa batas.
+            burst (int): Jumlah request yang boleh berjalan berturut-turut tanpa menunggu.
+            jitter (str): Distribusi jitter jarak antar request (lihat RATE_JITTER_MODES).
+            stage_rates (dict or None): Batas laju tambahan per tahap (nama tahap -> request per detik).
+                Tahap tanpa batas sendiri (atau 0) hanya dibatasi anggaran bersama.
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.burst = max(1, int(burst))
+        self.jitter = jitter
+        self.stage_intervals = {stage: 1.0 / rate for stage, rate in (stage_rates or {}).items() if rate}
+        self.theoretical_arrival_time = 0.0
+        self.stage_arrival_times = dict.fromkeys(self.stage_intervals, 0.0)
+        self.lock = Lock()
+
+    def next_interval(self, interval):
+        """Mengembalikan jarak ke request berikutnya (dengan jitter jika diaktifkan); rata-ratanya tetap interval."""
+        if self.jitter == RATE_JITTER_MODES["Uniform (0.5x - 1.5x)"]:
+            return random.uniform(0.5 * interval, 1.5 * interval)
+        if self.jitter == RATE_JITTER_MODES["Exponential (Poisson)"]:
+            return random.expovariate(1.0 / interval)
+        return interval
+
+    def wait(self, cancel_event=None, stage=None):
+        """
+        Menunggu hingga request berikutnya diizinkan oleh anggaran bersama dan (jika ada) batas tahapnya.
+
+        Args:
+            cancel_event (threading.Event or None): Jika di-set selama menunggu, tunggu dihentikan.
+            stage (str or None): Nama tahap yang meminta (misal RATE_STAGE_DOWNLOAD). None = hanya anggaran bersama.
+
+        Returns:
+            bool: True jika request boleh dijalankan, False jika dibatalkan saat menunggu.
+        """
+        stage_interval = self.stage_intervals.get(stage, 0.0)
+        if self.interval <= 0 and stage_interval <= 0:
+            return not (cancel_event and cancel_event.is_set())
+        with self.lock:
+            now = time.monotonic()
+            # Jadwal paling awal yang memenuhi anggaran bersama dan batas tahap sekaligus
+            scheduled_time = now
+            if self.interval > 0:
+                scheduled_time = max(scheduled_time, self.theoretical_arrival_time - (self.burst - 1) * self.interval)
+            if stage_interval > 0:
+                scheduled_time = max(scheduled_time, self.stage_arrival_times[stage] - (self.burst - 1) * stage_interval)
+            if self.interval > 0:
+                self.theoretical_arrival_time = max(self.theoretical_arrival_time, scheduled_time) + self.next_interval(self.interval)
+            if stage_interval > 0:
+                self.stage_arrival_times[stage] = max(self.stage_arrival_times[stage], scheduled_time) + self.next_interval(stage_interval)
+        delay = scheduled_time - time.monotonic()
+        if delay > 0:
+            if cancel_event is not None:
+                return not cancel_event.wait(delay)
+            time.sleep(delay)
+        return not (cancel_event and cancel_event.is_set())
+
+
+# --- Cache Metadata Persisten (SQLite) ---
+
+class MetadataCache:
+    """
+    Cache metadata video (Title, Description) berbasis SQLite, dengan key ID video.
+    Menyimpan waktu pengambilan setiap entri, mengabaikan entri yang lebih tua dari TTL,
+    dan membuang entri paling lama jika jumlahnya melebihi max_entries.
+    Aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, db_path, ttl_seconds, max_entries=METADATA_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            db_path (str): Path file database SQLite.
+            ttl_seconds (float): Umur maksimum entri (detik) agar dianggap valid.
+            max_entries (int): Jumlah maksimum entri yang disimpan.
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_cache ("
+            " video_id TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " title TEXT,"
+            " description TEXT,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_cache_fetched_at ON metadata_cache (fetched_at)")
+        self.conn.commit()
+
+    def get(self, video_id):
+        """
+        Mengambil metadata dari cache dan menghitung hit/miss.
+
+        Args:
+            video_id (str): ID video.
+
+        Returns:
+            dict or None: Metadata (keys: 'url', 'title', 'description') jika ada dan belum kedaluwarsa, selain itu None.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, title, description FROM metadata_cache WHERE video_id = ? AND fetched_at >= ?",
+                (video_id, time.time() - self.ttl_seconds),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return {'url': row[0], 'title': row[1], 'description': row[2]}
+
+    def put(self, video_id, metadata):
+        """
+        Menyimpan (atau memperbarui) metadata satu video ke cache dengan timestamp saat ini.
+
+        Args:
+            video_id (str): ID video.
+            metadata (dict): Metadata (keys: 'url', 'title', 'description').
+        """
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO metadata_cache (video_id, url, title, description, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (video_id, metadata['url'], metadata.get('title'), metadata.get('description'), time.time()),
+            )
+            self.conn.commit()
+
+    def evict(self):
+        """Menghapus entri kedaluwarsa dan entri paling lama di atas max_entries."""
+        with self.lock:
+            self.conn.execute("DELETE FROM metadata_cache WHERE fetched_at < ?", (time.time() - self.ttl_seconds,))
+            self.conn.execute(
+                "DELETE FROM metadata_cache WHERE video_id IN ("
+                " SELECT video_id FROM metadata_cache ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self.conn.commit()
+
+    def close(self):
+        """Menjalankan eviction lalu menutup koneksi database."""
+        try:
+            self.evict()
+        finally:
+            self.conn.close()
+
+
+# --- Arsip Download Lintas Run (Format --download-archive yt-dlp) ---
+
+class DownloadArchive:
+    """
+    Arsip ID video yang sudah berhasil didownload, disimpan lintas run dalam format --download-archive
+    yt-dlp (satu baris "youtube <ID>" per video), sehingga file yang sama juga bisa dipakai langsung oleh yt-dlp.
+    Aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, archive_path):
+        """
+        Args:
+            archive_path (str): Path file arsip (dibuat saat video pertama dicatat jika belum ada).
+        """
+        self.archive_path = archive_path
+        self.video_ids = set()
+        self.lock = Lock()
+        if os.path.exists(archive_path):
+            with open(archive_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0] == DOWNLOAD_ARCHIVE_EXTRACTOR_KEY:
+                        self.video_ids.add(parts[1])
+
+    def __len__(self):
+        return len(self.video_ids)
+
+    def contains(self, video_id):
+        """Mengembalikan True jika ID video sudah tercatat di arsip."""
+        with self.lock:
+            return video_id in self.video_ids
+
+    def add(self, video_id):
+        """Mencatat ID video yang berhasil didownload (langsung ditulis ke file agar aman jika proses terhenti)."""
+        if not video_id:
+            return
+        with self.lock:
+            if video_id in self.video_ids:
+                return
+            self.video_ids.add(video_id)
+            with open(self.archive_path, 'a', encoding='utf-8') as f:
+                f.write(f"{DOWNLOAD_ARCHIVE_EXTRACTOR_KEY} {video_id}\n")
+
+    def snapshot(self):
+        """Mengembalikan salinan ID video di arsip saat ini (untuk discovery inkremental)."""
+        with self.lock:
+            return frozenset(self.video_ids)
+
+    def filter_new_urls(self, urls):
+        """
+        Membuang URL yang ID videonya sudah ada di arsip.
+
+        Args:
+            urls (list): Daftar URL Shorts.
+
+        Returns:
+            tuple: (daftar URL yang belum didownload, jumlah URL yang dilewati).
+        """
+        new_urls = [url for url in urls if not self.contains(extract_video_id_from_shorts_url(url))]
+        return new_urls, len(urls) - len(new_urls)
+
+
+# --- Checkpoint Pipeline (Jurnal JSONL untuk Resume) ---
+
+def load_pipeline_checkpoint(checkpoint_path):
+    """
+    Membaca jurnal checkpoint pipeline dan menyusun ulang state run terakhir.
+    Baris yang rusak (misal baris terakhir yang terpotong saat crash) dilewati.
+
+    Args:
+        checkpoint_path (str): Path file jurnal checkpoint.
+
+    Returns:
+        dict or None: State dengan keys 'channel_url', 'urls' (urutan discovery), 'discovery_complete',
+                      'metadata' (dict url -> metadata), 'batches' (dict nomor batch -> list url),
+                      'statuses' (dict url -> status), dan 'complete'. None jika jurnal tidak ada.
+    """
+    if not os.path.exists(checkpoint_path):
+        return None
+    state = {'channel_url': None, 'urls': [], 'discovery_complete': False, 'metadata': {},
+             'batches': {}, 'statuses': {}, 'complete': False}
+    seen_urls = set()
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            record_type = record.get('type')
+            if record_type == 'run':
+                state['channel_url'] = record.get('channel_url')
+            elif record_type == 'urls':
+                for url in record.get('urls', []):
+                    if url not in seen_urls:
+                        seen_urls.add(url)
+                        state['urls'].append(url)
+            elif record_type == 'discovery_complete':
+                state['discovery_complete'] = True
+            elif record_type == 'metadata':
+                metadata = record.get('metadata') or {}
+                if metadata.get('url'):
+                    state['metadata'][metadata['url']] = metadata
+            elif record_type == 'batch':
+                batch_urls = state['batches'].setdefault(record.get('batch_number'), [])
+                batch_urls.extend(url for url in record.get('urls', []) if url not in batch_urls)
+            elif record_type == 'status':
+                state['statuses'][record.get('url')] = record.get('status')
+            elif record_type == 'complete':
+                state['complete'] = True
+    return state
+
+class PipelineCheckpoint:
+    """
+    Jurnal checkpoint pipeline (JSONL append-only) di folder output utama. Mencatat URL hasil discovery,
+    metadata, pembagian batch, dan status per video saat terjadi, sehingga run yang crash atau dibatalkan
+    bisa dilanjutkan tanpa scrolling ulang dan tanpa mengambil ulang metadata.
+    Satu file handle dipakai selama run; setiap record di-flush ke OS, dan fsync hanya dilakukan
+    di batas tahap/batch (sync) serta sekali saat jurnal ditutup (close, juga saat dibatalkan).
+    Aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, checkpoint_path, channel_url, resume=False):
+        """
+        Args:
+            checkpoint_path (str): Path file jurnal checkpoint.
+            channel_url (str): URL channel run ini (resume hanya berlaku untuk channel yang sama).
+            resume (bool): True untuk melanjutkan jurnal yang belum selesai. Jika False (atau tidak ada
+                jurnal yang bisa dilanjutkan), jurnal lama diganti dengan jurnal baru.
+        """
+        self.checkpoint_path = checkpoint_path
+        self.lock = Lock()
+        self.resume_state = None
+        if resume:
+            state = load_pipeline_checkpoint(checkpoint_path)
+            if state is not None and not state['complete'] and state['channel_url'] == channel_url:
+                self.resume_state = state
+            else:
+                print("No unfinished checkpoint found for this channel. Starting a fresh run.")
+        # Jurnal lama dilanjutkan (append), atau diganti dengan jurnal baru
+        self.file = open(checkpoint_path, 'a' if self.resume_state is not None else 'w', encoding='utf-8')
+        self.unsynced = False # True jika ada record yang belum di-fsync
+        if self.resume_state is None:
+            self.write({'type': 'run', 'channel_url': channel_url, 'started_at': time.time()}, sync=True)
+
+    def write(self, record, sync=False):
+        """Menambahkan satu record ke jurnal (fsync jika sync=True, untuk batas tahap). Diabaikan setelah close()."""
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.file.flush()
+            self.unsynced = True
+            if sync:
+                self._fsync()
+
+    def _fsync(self):
+        """fsync record yang belum tersimpan permanen (lock harus sudah dipegang)."""
+        if self.unsynced:
+            os.fsync(self.file.fileno())
+            self.unsynced = False
+
+    def sync(self):
+        """Menyimpan permanen semua record sejauh ini (dipanggil di batas batch)."""
+        with self.lock:
+            if self.file is not None:
+                self._fsync()
+
+    def close(self):
+        """fsync terakhir lalu menutup jurnal. Aman dipanggil lebih dari sekali."""
+        with self.lock:
+            if self.file is None:
+                return
+            try:
+                self._fsync()
+            finally:
+                self.file.close()
+                self.file = None
+
+    def record_urls(self, urls):
+        """Mencatat URL yang baru ditemukan oleh discovery."""
+        if urls:
+            self.write({'type': 'urls', 'urls': list(urls)})
+
+    def record_discovery_complete(self):
+        """Mencatat bahwa discovery selesai (resume tidak perlu scrolling ulang)."""
+        self.write({'type': 'discovery_complete'}, sync=True)
+
+    def record_metadata(self, metadata):
+        """Mencatat metadata satu video."""
+        if metadata:
+            self.write({'type': 'metadata', 'metadata': metadata})
+
+    def record_batch(self, batch_number, urls):
+        """Mencatat video yang dimasukkan ke sebuah batch (ditambahkan ke isi batch sebelumnya)."""
+        self.write({'type': 'batch', 'batch_number': batch_number, 'urls': list(urls)})
+
+    def record_status(self, url, status):
+        """Mencatat status download terbaru satu video."""
+        self.write({'type': 'status', 'url': url, 'status': status})
+
+    def record_complete(self):
+        """Mencatat bahwa run selesai tanpa pembatalan (jurnal ini tidak akan dilanjutkan lagi)."""
+        self.write({'type': 'complete', 'finished_at': time.time()}, sync=True)
+
+
+# --- Fungsi yt-dlp untuk Mendapatkan Metadata dari Daftar URL ---
+
+def build_metadata_ydl_opts(proxy, metadata_profile=METADATA_PROFILES["Full Extraction (Default)"], keep_formats=False):
+    """
+    Menyusun opsi yt_dlp untuk pengambilan metadata sesuai profil (lihat METADATA_PROFILES).
+
+    Args:
+        proxy (str or None): Alamat proxy untuk yt-dlp. None jika tidak pakai proxy.
+        metadata_profile (str): Profil ekstraksi metadata.
+        keep_formats (bool): True untuk mode single-pass: info dict dipakai ulang untuk download, jadi
+            extractor YouTube dipakai langsung tanpa melewati player JS/manifest (profil diabaikan).
+
+    Returns:
+        dict: Opsi untuk yt_dlp.YoutubeDL.
+    """
+    ydl_opts = {
+        'quiet': True,
+        'ignoreerrors': True, # Lanjutkan meskipun ada error pada satu atau beberapa video
+        'no_warnings': True, # Sembunyikan peringatan
+        # 'skip_download': True, # Opsi ini sudah implisit dengan download=False di extract_info
+    }
+    if keep_formats:
+        ydl_opts['noplaylist'] = True
+    elif metadata_profile == METADATA_PROFILES["Full Extraction (Default)"]:
+        ydl_opts.update({
+            'extract_flat': False, # Kita perlu metadata lengkap
+            'force_generic_extractor': True, # Mungkin membantu untuk URL individual
+        })
+    else:
+        # Title dan description sudah ada di player response; player JS hanya dibutuhkan untuk signature URL format,
+        # dan manifest DASH/HLS hanya untuk daftar format, jadi keduanya dilewati
+        ydl_opts.update({
+            'noplaylist': True,
+            'extractor_args': {'youtube': {'player_skip': ['js'], 'skip': ['dash', 'hls', 'translated_subs']}},
+        })
+    # Tambahkan opsi proxy jika disediakan
+    if proxy:
+        ydl_opts['proxy'] = proxy
+    return ydl_opts
+
+def get_info_json_path(info_json_directory, video_id):
+    """Mengembalikan path file .info.json satu video di folder single-pass."""
+    return os.path.join(info_json_directory, f"{video_id}.info.json")
+
+def save_info_json(ydl, entry, info_json_path):
+    """
+    Menyimpan info dict hasil extract_info ke file .info.json (format yang sama dengan --write-info-json yt-dlp),
+    ditulis ke file sementara lalu di-rename agar tidak pernah terbaca setengah jadi.
+
+    Args:
+        ydl (yt_dlp.YoutubeDL): Instance YoutubeDL yang menghasilkan entry.
+        entry (dict): Info dict mentah dari extract_info.
+        info_json_path (str): Path tujuan.
+    """
+    partial_path = get_partial_filepath(info_json_path)
+    try:
+        with open(partial_path, 'w', encoding='utf-8') as info_file:
+            json.dump(ydl.sanitize_info(entry), info_file)
+        os.replace(partial_path, info_json_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not save {info_json_path}, the video will be resolved again for download: {e}")
+
+def get_fresh_info_json_path(info_json_directory, video_id):
+    """
+    Mencari file .info.json dari Step 2 yang masih bisa dipakai untuk download (mode single-pass).
+
+    Args:
+        info_json_directory (str or None): Folder single-pass. None jika mode single-pass tidak aktif.
+        video_id (str or None): ID video.
+
+    Returns:
+        str or None: Path file jika ada dan umurnya di bawah INFO_JSON_MAX_AGE_SECONDS (URL stream masih berlaku),
+            selain itu None (video di-resolve ulang dari URL seperti biasa).
+    """
+    if not info_json_directory or not video_id:
+        return None
+    info_json_path = get_info_json_path(info_json_directory, video_id)
+    try:
+        if time.time() - os.path.getmtime(info_json_path) < INFO_JSON_MAX_AGE_SECONDS:
+            return info_json_path
+        os.remove(info_json_path) # Sudah kedaluwarsa
+    except OSError:
+        pass
+    return None
+
+def remove_info_json(info_json_path):
+    """Menghapus file .info.json yang sudah dipakai untuk download (error diabaikan)."""
+    try:
+        os.remove(info_json_path)
+    except OSError:
+        pass
+
+def fetch_metadata_for_url(ydl, url, process=True, info_json_path=None):
+    """
+    Mengambil metadata satu URL video menggunakan instance YoutubeDL yang diberikan.
+
+    Args:
+        ydl (yt_dlp.YoutubeDL): Instance YoutubeDL yang sudah dikonfigurasi.
+        url (str): URL video.
+        process (bool): False untuk melewati pemrosesan hasil ekstraksi (pemilihan format, dll),
+            karena hanya title dan description yang dipakai (profil metadata cepat).
+        info_json_path (str or None): Jika diisi (mode single-pass), info dict disimpan ke file ini
+            agar Step 4 bisa mendownload tanpa me-resolve video lagi.
+
+    Returns:
+        dict or None: Dictionary metadata (keys: 'url', 'title', 'description'), atau None jika gagal.
+    """
+    # Jika extract_info gagal untuk URL tertentu, dengan ignoreerrors=True,
+    # ia akan mencetak error ke stderr dan mengembalikan None atau dictionary error.
+    entry = ydl.extract_info(url, download=False, process=process)
+
+    # Memproses hasil ekstraksi untuk URL tunggal
+    if entry and entry.get('id'):
+        video_id = entry['id']
+        if info_json_path is not None:
+            save_info_json(ydl, entry, info_json_path)
+        return {
+            'url': f'https://www.youtube.com/shorts/{video_id}', # Pastikan format URL Shorts
+            'title': entry.get('title', 'Untitled'),
+            'description': entry.get('description', ''),
+        }
+    # Ini akan muncul di konsol jika yt-dlp mengembalikan None atau entri invalid
+    print(f"Failed to fetch metadata for {url}. Result was: {entry}")
+    return None
+
+class MetadataFetcher:
+    """
+    Mengambil metadata video per URL dan aman dipanggil dari banyak worker thread.
+    Menggabungkan cache metadata, rate limiter bersama, dan pool instance YoutubeDL
+    (YoutubeDL tidak aman dipakai bersama antar thread, jadi setiap worker meminjam
+    instance sendiri; instance dibuat saat pertama dibutuhkan lalu dipakai ulang).
+    """
+
+    def __init__(self, proxy, max_workers=DEFAULT_METADATA_WORKERS, rate_scheduler=None, metadata_cache=None,
+                 page_metadata=None, fetch_description=True, metadata_profile=METADATA_PROFILES["Full Extraction (Default)"],
+                 info_json_directory=None):
+        """
+        Args:
+            proxy (str or None): Alamat proxy untuk yt-dlp. None jika tidak pakai proxy.
+            max_workers (int): Jumlah maksimum instance YoutubeDL (sama dengan jumlah worker).
+            rate_scheduler (RateScheduler or None): Penjadwal laju request bersama. None untuk tanpa batas.
+            metadata_cache (MetadataCache or None): Cache metadata persisten. None untuk tanpa cache.
+            page_metadata (dict or None): Metadata yang di-harvest dari halaman channel saat discovery
+                (ID video -> field, lihat store_page_metadata). None untuk mode yt-dlp.
+            fetch_description (bool): False jika description tidak diminta, sehingga video yang ada di
+                page_metadata tidak diproses yt-dlp sama sekali.
+            metadata_profile (str): Profil ekstraksi yt-dlp (lihat METADATA_PROFILES).
+            info_json_directory (str or None): Folder single-pass. Jika diisi, info dict setiap video disimpan
+                sebagai .info.json untuk dipakai ulang saat download (profil metadata tidak berlaku).
+        """
+        # Opsi untuk yt_dlp saat mengambil informasi video individual
+        self.ydl_opts = build_metadata_ydl_opts(proxy, metadata_profile, keep_formats=info_json_directory is not None)
+        self.metadata_profile = metadata_profile
+        self.info_json_directory = info_json_directory
+        # Info dict single-pass disimpan mentah; pemilihan format dilakukan oleh downloader di Step 4
+        self.process_results = metadata_profile == METADATA_PROFILES["Full Extraction (Default)"] and info_json_directory is None
+        if proxy:
+            print(f"Using proxy for yt-dlp metadata fetch: {proxy}")
+
+        self.max_workers = max(1, int(max_workers or 1))
+        self.rate_scheduler = rate_scheduler
+        self.metadata_cache = metadata_cache
+        self.page_metadata = page_metadata
+        self.fetch_description = fetch_description
+        self.page_hits = 0 # Jumlah video yang metadatanya diambil dari halaman tanpa yt-dlp
+        self.ytdlp_requests = 0 # Jumlah extract_info yang dijalankan (untuk laporan latensi per video)
+        self.ytdlp_seconds = 0.0 # Total waktu extract_info (detik)
+        self.idle_ydls = queue.Queue()
+        self.ydl_instances = []
+        self.lock = Lock()
+
+    def borrow_ydl(self):
+        """Meminjam instance YoutubeDL yang sedang tidak dipakai (membuat baru jika pool belum penuh)."""
+        try:
+            return self.idle_ydls.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if len(self.ydl_instances) < self.max_workers:
+                ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+                self.ydl_instances.append(ydl)
+                return ydl
+        return self.idle_ydls.get()
+
+    def fetch(self, url, cancel_event=None):
+        """
+        Mengambil metadata satu URL: dari cache jika ada, selain itu via yt-dlp (lalu disimpan ke cache).
+
+        Args:
+            url (str): URL video.
+            cancel_event (threading.Event or None): Event untuk memeriksa apakah proses dibatalkan.
+
+        Returns:
+            dict or None: Metadata (keys: 'url', 'title', 'description', ditambah 'view_count' dan 'thumbnail_url'
+                pada mode metadata DOM), atau None jika gagal/dibatalkan.
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        video_id = extract_video_id_from_shorts_url(url)
+        page_fields = self.page_metadata.get(video_id) if self.page_metadata and video_id else None
+        # Semua field yang diminta sudah ada di halaman: yt-dlp (dan rate limiter) tidak disentuh sama sekali
+        if page_fields is not None and not self.fetch_description:
+            with self.lock:
+                self.page_hits += 1
+            return {'url': f'https://www.youtube.com/shorts/{video_id}', 'description': '', **page_fields}
+        metadata = self.fetch_with_ytdlp(url, video_id, cancel_event)
+        if metadata is not None and page_fields is not None:
+            # Title dari yt-dlp tetap dipakai; view count dan thumbnail hanya ada di halaman
+            metadata = dict(metadata, view_count=page_fields['view_count'], thumbnail_url=page_fields['thumbnail_url'])
+        return metadata
+
+    def fetch_with_ytdlp(self, url, video_id, cancel_event=None):
+        """Mengambil metadata satu URL dari cache jika ada, selain itu via yt-dlp (lalu disimpan ke cache)."""
+        # Cache hit tidak perlu menyentuh yt-dlp (dan rate limiter) sama sekali
+        if self.metadata_cache is not None:
+            cached_metadata = self.metadata_cache.get(video_id) if video_id else None
+            if cached_metadata is not None:
+                return cached_metadata
+        if self.rate_scheduler is not None and not self.rate_scheduler.wait(cancel_event):
+            return None # Dibatalkan saat menunggu giliran
+        ydl = self.borrow_ydl()
+        start_time = time.perf_counter()
+        try:
+            info_json_path = get_info_json_path(self.info_json_directory, video_id) if self.info_json_directory and video_id else None
+            metadata = fetch_metadata_for_url(ydl, url, process=self.process_results, info_json_path=info_json_path)
+        finally:
+            self.idle_ydls.put(ydl)
+            with self.lock:
+                self.ytdlp_requests += 1
+                self.ytdlp_seconds += time.perf_counter() - start_time
+        if metadata is not None and self.metadata_cache is not None:
+            self.metadata_cache.put(extract_video_id_from_shorts_url(metadata['url']), metadata)
+        return metadata
+
+    def summary(self):
+        """
+        Mengembalikan ringkasan Step 2 (string): latensi rata-rata extract_info per video untuk profil yang dipakai,
+        metadata dari halaman, dan hit/miss cache. None jika tidak ada yang perlu dilaporkan.
+        """
+        summaries = []
+        if self.ytdlp_requests:
+            profile_name = "Single-Pass" if self.info_json_directory else get_option_name(METADATA_PROFILES, self.metadata_profile)
+            summaries.append(f"yt-dlp metadata ({profile_name}): {self.ytdlp_requests} request(s), "
+                             f"{self.ytdlp_seconds / self.ytdlp_requests:.2f}s per video on average.")
+        if self.page_metadata is not None:
+            summaries.append(f"Metadata from channel page: {self.page_hits} video(s) without yt-dlp.")
+        if self.metadata_cache is not None:
+            summaries.append(f"Metadata cache: {self.metadata_cache.hits} hit(s), {self.metadata_cache.misses} miss(es).")
+        return " ".join(summaries) or None
+
+    def close(self):
+        """Menutup semua instance YoutubeDL yang pernah dibuat."""
+        for ydl in self.ydl_instances:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+        self.ydl_instances = []
+
+def get_metadata_for_urls(urls, proxy, progress_label_var, cancel_event, max_workers=DEFAULT_METADATA_WORKERS,
+                          rate_scheduler=None, progress_var=None, on_result=None, metadata_cache=None,
+                          page_metadata=None, fetch_description=True,
+                          metadata_profile=METADATA_PROFILES["Full Extraction (Default)"], info_json_directory=None):
+    """
+    Mengambil metadata (URL, Title, Description) dari daftar URL video menggunakan yt-dlp.
+    URL diproses secara concurrent oleh beberapa worker thread (masing-masing dengan instance
+    YoutubeDL sendiri), dibatasi oleh rate limiter bersama. Urutan hasil tetap sama dengan urutan input.
+
+    Args:
+        urls (list): Daftar string URL video.
         proxy (str or None): Alamat proxy (misal: "http://host:port"). None atau string kosong jika tidak pakai proxy.
-        global_status_list (list): Referensi ke daftar status global untuk diperbarui.
-        progress_var (tk.IntVar): Variabel Tkinter untuk mengupdate nilai progress bar.
         progress_label_var (tk.StringVar): Variabel Tkinter untuk mengupdate teks label status.
-        batch_info (str): String tambahan untuk label status (misal: "Batch 1/5").
-        cancel_event (threading.Event or None): Event untuk memeriksa apakah proses dibatalkan.
+        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        max_workers (int): Jumlah worker concurrent. 1 berarti satu per satu seperti sebelumnya.
+        rate_scheduler (RateScheduler or None): Penjadwal laju request bersama. None untuk tanpa batas.
+        progress_var (tk.IntVar or None): Variabel Tkinter progress bar (0-100), diupdate setiap URL selesai.
+        on_result (callable or None): Callback on_result(index, metadata_or_None) yang dipanggil
+            segera setelah setiap URL selesai (urutan selesai, bukan urutan input).
+        metadata_cache (MetadataCache or None): Cache metadata persisten. URL yang ada di cache
+            tidak diproses yt-dlp sama sekali. None untuk tanpa cache.
+        page_metadata (dict or None): Metadata yang di-harvest dari halaman channel (mode metadata DOM).
+        fetch_description (bool): False jika description tidak diminta (video di page_metadata tidak diproses yt-dlp).
+        metadata_profile (str): Profil ekstraksi yt-dlp (lihat METADATA_PROFILES).
+        info_json_directory (str or None): Folder single-pass untuk menyimpan info dict per video (lihat MetadataFetcher).
+
+    Returns:
+        list: Daftar dictionary, di mana setiap dictionary berisi metadata satu Shorts
+              (keys: 'url', 'title', 'description'), atau list kosong jika gagal atau dibatalkan.
+    """
+    if not urls:
+        print("No URLs provided to fetch metadata.")
+        return []
+
+    total_urls = len(urls)
+    max_workers = max(1, min(int(max_workers or 1), total_urls))
+    print(f"Step 2/4: Fetching metadata for {total_urls} URLs using yt-dlp ({max_workers} worker(s))...")
+    progress_label_var.set(f"Step 2/4: Fetching metadata for {total_urls} videos...")
+
+    results = [None] * total_urls # Hasil per index agar urutan input tetap terjaga
+    failed_metadata_urls = [] # Untuk melacak URL yang gagal diambil metadatanya
+    fetcher = MetadataFetcher(proxy, max_workers, rate_scheduler, metadata_cache, page_metadata, fetch_description, metadata_profile,
+                              info_json_directory)
+    executor = None
+    try:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="metadata")
+        future_to_index = {executor.submit(fetcher.fetch, url, cancel_event): index for index, url in enumerate(urls)}
+
+        completed = 0
+        # Hasil di-stream kembali segera setelah setiap URL selesai
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            url = urls[index]
+            try:
+                metadata = future.result()
+            except Exception as e:
+                # Tangkap error spesifik jika extract_info melempar exception untuk URL ini
+                print(f"An error occurred fetching metadata for {url}: {e}")
+                metadata = None
+
+            if cancel_event.is_set():
+                print("Metadata fetching cancelled by user.")
+                progress_label_var.set("Step 2/4: Metadata fetching cancelled.")
+                executor.shutdown(wait=False, cancel_futures=True) # Batalkan URL yang belum dimulai
+                return [] # Kembalikan list kosong jika dibatalkan
+
+            completed += 1
+            results[index] = metadata
+            if metadata is None:
+                failed_metadata_urls.append(url)
+            if on_result is not None:
+                on_result(index, metadata)
+
+            # Update status GUI sesuai jumlah URL yang benar-benar selesai
+            progress_label_var.set(f"Step 2/4: Fetched metadata for {completed}/{total_urls} videos...")
+            if progress_var is not None:
+                progress_var.set(int((completed / total_urls) * 100))
+
+        all_shorts_metadata = [metadata for metadata in results if metadata is not None]
+
+        # Setelah loop selesai
+        print(f"Finished metadata extraction. Successfully fetched metadata for {len(all_shorts_metadata)} out of {total_urls} URLs.")
+        if failed_metadata_urls:
+            print(f"Failed to fetch metadata for {len(failed_metadata_urls)} URLs.")
+            # Opsional: simpan daftar URL yang gagal diambil metadatanya
+            # save_failed_urls_to_file(failed_metadata_urls, output_directory_main, "metadata_fetch") # Perlu path utama
+        fetch_summary = fetcher.summary()
+        if fetch_summary:
+            print(fetch_summary)
+            progress_label_var.set(f"Step 2/4 finished. Fetched metadata for {len(all_shorts_metadata)} videos. {fetch_summary}")
+        else:
+            progress_label_var.set(f"Step 2/4 finished. Fetched metadata for {len(all_shorts_metadata)} videos.")
+
+        return all_shorts_metadata
+
+    except Exception as e:
+        # Menangkap kesalahan selama proses inisialisasi YDL atau error tak terduga
+        print(f"An error occurred during yt-dlp metadata extraction process: {e}")
+        progress_label_var.set(f"Step 2/4: Error fetching metadata: {e}")
+        return []
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        fetcher.close()
+
+
+# --- Mesin Download In-Process (yt_dlp.YoutubeDL yang Dipakai Ulang) ---
+
+class YtDlpErrorCollector:
+    """Logger untuk yt_dlp yang menyembunyikan output dan menyimpan pesan error terakhir."""
+
+    def __init__(self):
+        self.messages = []
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        self.messages.append(msg)
+
+class InProcessDownloader:
+    """
+    Mendownload video di dalam proses Python ini menggunakan instance yt_dlp.YoutubeDL yang berumur panjang,
+    sehingga biaya startup interpreter, import yt-dlp, inisialisasi extractor, dan player JS tidak dibayar per video.
+    Satu instance dibuat per folder output (batch) dan dipakai ulang untuk semua video di folder tersebut.
+    """
+
+    def __init__(self, format_string, retries, proxy):
+        """
+        Args:
+            format_string (str): String format yt-dlp.
+            retries (int): Jumlah percobaan ulang download per video.
+            proxy (str or None): Alamat proxy. None jika tidak pakai proxy.
+        """
+        self.format_string = format_string
+        self.retries = retries
+        self.proxy = proxy
+        self.output_path = None
+        self.ydl = None
+        self.error_collector = YtDlpErrorCollector()
+        self.cancel_event = None
+        self.on_progress = None
+
+    def progress_hook(self, status):
+        """Progress hook yt-dlp: meneruskan persentase dan menghentikan download jika dibatalkan."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise yt_dlp.utils.DownloadCancelled("Download cancelled by user.")
+        if self.on_progress is not None and status.get('status') == 'downloading':
+            total_bytes = status.get('total_bytes') or status.get('total_bytes_estimate')
+            if total_bytes:
+                self.on_progress(int(status.get('downloaded_bytes', 0) * 100 / total_bytes))
+
+    def get_ydl(self, output_path):
+        """Mengembalikan instance YoutubeDL untuk folder output ini (membuat baru jika folder berganti)."""
+        if self.ydl is not None and self.output_path == output_path:
+            return self.ydl
+        self.close()
+        # Opsi yang sama dengan perintah subprocess yt-dlp
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'noprogress': True,
+            'nopart': True, # Opsional: jangan gunakan file .part
+            'retries': self.retries,
+            'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
+            'format': self.format_string,
+            'logger': self.error_collector,
+            'progress_hooks': [self.progress_hook],
+        }
+        if self.proxy:
+            ydl_opts['proxy'] = self.proxy
+        self.ydl = yt_dlp.YoutubeDL(ydl_opts)
+        self.output_path = output_path
+        return self.ydl
+
+    def download(self, link, output_path, cancel_event=None, on_progress=None, info_json_path=None):
+        """
+        Mendownload satu video.
+
+        Args:
+            link (str): URL video.
+            output_path (str): Folder tujuan.
+            cancel_event (threading.Event or None): Event pembatalan (dicek di setiap progress hook).
+            on_progress (callable or None): Callback on_progress(persen) selama download berlangsung.
+            info_json_path (str or None): File .info.json dari Step 2 (mode single-pass). Jika diisi, video
+                didownload dari info dict tersebut tanpa di-resolve ulang (yt-dlp kembali ke URL jika gagal).
+
+        Returns:
+            tuple: (return_code, error_text) dengan arti yang sama seperti subprocess yt-dlp
+                   (0 berarti berhasil).
+        """
+        ydl = self.get_ydl(output_path)
+        self.cancel_event = cancel_event
+        self.on_progress = on_progress
+        self.error_collector.messages = []
+        try:
+            if info_json_path is not None:
+                return_code = ydl.download_with_info_file(info_json_path)
+            else:
+                return_code = ydl.download([link])
+        except yt_dlp.utils.DownloadCancelled as e:
+            return 1, str(e)
+        except yt_dlp.utils.DownloadError as e:
+            return 1, '\n'.join(self.error_collector.messages) or str(e)
+        finally:
+            self.on_progress = None
+        return return_code, '\n'.join(self.error_collector.messages)
+
+    def close(self):
+        """Menutup instance YoutubeDL yang aktif."""
+        if self.ydl is not None:
+            try:
+                self.ydl.close()
+            except Exception:
+                pass
+        self.ydl = None
+        self.output_path = None
+
+
+class InProcessDownloaderPool:
+    """
+    Pool InProcessDownloader untuk download paralel. Instance YoutubeDL tidak aman dipakai bersamaan
+    oleh beberapa thread, jadi setiap worker meminjam downloader sendiri dan mengembalikannya setelah selesai.
+    Downloader dibuat saat dibutuhkan, maksimal sebanyak jumlah worker.
+    """
+
+    def __init__(self, format_string, retries, proxy, size=1):
+        """
+        Args:
+            format_string (str): String format yt-dlp.
+            retries (int): Jumlah percobaan ulang download per video.
+            proxy (str or None): Alamat proxy. None jika tidak pakai proxy.
+            size (int): Jumlah maksimum downloader (sama dengan jumlah worker download).
+        """
+        self.format_string = format_string
+        self.retries = retries
+        self.proxy = proxy
+        self.size = max(1, size)
+        self.downloaders = []
+        self.idle_downloaders = queue.Queue()
+        self.lock = Lock()
+
+    def borrow(self):
+        """Meminjam downloader yang sedang tidak dipakai (membuat baru jika pool belum penuh)."""
+        try:
+            return self.idle_downloaders.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if len(self.downloaders) < self.size:
+                downloader = InProcessDownloader(self.format_string, self.retries, self.proxy)
+                self.downloaders.append(downloader)
+                return downloader
+        return self.idle_downloaders.get()
+
+    def give_back(self, downloader):
+        """Mengembalikan downloader ke pool."""
+        self.idle_downloaders.put(downloader)
+
+    def close(self):
+        """Menutup semua downloader di pool."""
+        with self.lock:
+            for downloader in self.downloaders:
+                downloader.close()
+
+
+def run_subprocess_download(link, output_path, format_string, retries, proxy, info_json_path=None):
+    """
+    Mendownload satu video dengan menjalankan yt-dlp sebagai subprocess.
+    Proses didaftarkan di active_subprocesses selama berjalan agar bisa dihentikan saat pembatalan.
+
+    Args:
+        link (str): URL video.
+        output_path (str): Folder tujuan.
+        format_string (str): String format yt-dlp.
+        retries (int): Jumlah percobaan ulang download.
+        proxy (str or None): Alamat proxy. None jika tidak pakai proxy.
+        info_json_path (str or None): File .info.json dari Step 2 (mode single-pass), dipakai lewat --load-info-json.
+
+    Returns:
+        tuple: (return_code, stderr) dari proses yt-dlp.
+
+    Raises:
+        FileNotFoundError: Jika perintah yt-dlp tidak ditemukan.
+    """
+    # Menjalankan yt-dlp sebagai subprocess menggunakan Popen untuk control
+    command = [
+        'yt-dlp',
+        '--quiet',
+        '--no-part', # Opsional: jangan gunakan file .part
+        '--retries', str(retries), # Menggunakan nilai retries dari input GUI
+        '--output', os.path.join(output_path, '%(title)s.%(ext)s'),
+        '--format', format_string, # Menggunakan nilai format dari input GUI
+        '--no-warnings', # Suppress yt-dlp warnings in console output
+    ]
+
+    # Tambahkan opsi proxy jika disediakan
+    if proxy:
+        command.extend(['--proxy', proxy])
+
+    # Tambahkan link video terakhir (atau info dict dari Step 2 pada mode single-pass)
+    if info_json_path is not None:
+        command.extend(['--load-info-json', info_json_path])
+    else:
+        command.append(link)
+
+    # print(f"Executing download command: {' '.join(command)}") # Debugging: tampilkan perintah lengkap
+
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE, # Tangkap output standar
+        stderr=subprocess.PIPE, # Tangkap error standar
+        text=True # Menggunakan teks untuk output yang ditangkap
+    )
+    with active_subprocesses_lock:
+        active_subprocesses.add(process)
+
+    # Tunggu subprocess selesai. Menggunakan communicate() dengan timeout=None
+    # adalah cara sederhana untuk menunggu tanpa polling manual yang kompleks.
+    # Pembatalan ditangani oleh on_cancel_button_click yang me-kill semua subprocess aktif.
+    try:
+        stdout, stderr = process.communicate(timeout=None) # Tunggu tanpa timeout
+    except subprocess.TimeoutExpired:
+        # Ini seharusnya tidak terjadi dengan timeout=None, tapi tetap jaga
+        print(f"yt-dlp process for {link} timed out.")
+        process.kill() # Paksa hentikan jika timeout
+        stdout, stderr = process.communicate()
+    finally:
+        with active_subprocesses_lock:
+            active_subprocesses.discard(process)
+    return process.returncode, stderr
+
+
+# --- Penyimpanan Status Download (Terindeks per ID Video) ---
+
+class VideoStatusRecord:
+    """Record status satu video. Memakai __slots__ agar ringan untuk channel dengan puluhan ribu video."""
+
+    __slots__ = ('video_id', 'url', 'title', 'status')
+
+    def __init__(self, video_id, url, title, status):
+        self.video_id = video_id
+        self.url = url
+        self.title = title
+        self.status = status
+
+class StatusStore:
+    """
+    Penyimpanan status download semua video, terindeks per ID video sehingga pencarian dan update O(1)
+    (menggantikan pencarian linear di list of dicts). Jumlah video per status selalu diperbarui,
+    dan urutan video sesuai urutan penambahan (urutan master Excel).
+    Aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self):
+        self.records = {} # ID video (atau URL jika ID tidak dikenali) -> VideoStatusRecord
+        self.status_counts = {}
+        self.version = 0 # Bertambah setiap ada perubahan (dipakai compactor untuk melewati penulisan yang tidak perlu)
+        self.lock = Lock()
+
+    @staticmethod
+    def record_key(url):
+        """Key record untuk sebuah URL: ID video jika URL Shorts dikenali, selain itu URL itu sendiri."""
+        url = url.strip()
+        return extract_video_id_from_shorts_url(url) or url
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        with self.lock:
+            return iter(list(self.records.values()))
+
+    def add(self, url, title, status='No'):
+        """
+        Menambahkan video (jika belum ada) dan mengembalikan record-nya.
+
+        Args:
+            url (str): URL video.
+            title (str): Judul video.
+            status (str): Status awal ('No' = belum didownload).
+
+        Returns:
+            VideoStatusRecord: Record video (record lama jika video sudah ada).
+        """
+        key = self.record_key(url)
+        with self.lock:
+            record = self.records.get(key)
+            if record is None:
+                record = VideoStatusRecord(key, url.strip(), title, status)
+                self.records[key] = record
+                self.status_counts[status] = self.status_counts.get(status, 0) + 1
+                self.version += 1
+            return record
+
+    def get(self, url):
+        """Mengembalikan record untuk URL, atau None jika video belum ada."""
+        return self.records.get(self.record_key(url))
+
+    def set_status(self, url, status):
+        """Mengubah status video (O(1)) dan memperbarui jumlah per status. Mengembalikan record atau None."""
+        key = self.record_key(url)
+        with self.lock:
+            record = self.records.get(key)
+            if record is None or record.status == status:
+                return record
+            self.status_counts[record.status] -= 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            record.status = status
+            self.version += 1
+            return record
+
+    def count(self, status):
+        """Jumlah video dengan status tertentu."""
+        with self.lock:
+            return self.status_counts.get(status, 0)
+
+    def summary(self):
+        """Ringkasan jumlah video per status, misal 'Downloaded: 90, Error: 2'."""
+        with self.lock:
+            return ', '.join(f"{status}: {count}" for status, count in self.status_counts.items() if count)
+
+    def to_rows(self):
+        """Mengembalikan list tuple (url, title, status) sesuai urutan video, untuk ekspor ke Excel."""
+        with self.lock:
+            return [(record.url, record.title, record.status) for record in self.records.values()]
+
+
+# --- Fungsi Download Video (Diperbarui untuk Melacak Status) ---
+
+class DownloadSession:
+    """
+    Sesi download yang dipakai bersama oleh semua video dalam satu run (atau satu batch): pool downloader
+    in-process, penjadwal laju, arsip download, dan deteksi yt-dlp yang tidak terpasang.
+    Pipeline bertahap memakai satu sesi untuk semua batch, dan pipeline streaming satu sesi untuk seluruh tahap
+    download, sehingga setup dan penanganan yt-dlp yang hilang hanya terjadi sekali (bukan per batch/video).
+    Aman dipakai bersama oleh banyak worker thread.
+    """
+
+    def __init__(self, format_string, retries, proxy, status_store, cancel_event=None,
+                 download_engine=DOWNLOAD_ENGINES["In-Process yt-dlp (Fast)"], downloader_pool=None, max_workers=1,
+                 rate_scheduler=None, download_delay_seconds=0, download_archive=None, on_status=None,
+                 download_slots=None, info_json_directory=None):
+        """
+        Args:
+            format_string (str): String format yt-dlp yang akan digunakan (misal: "bestvideo+bestaudio/best").
+            retries (int): Jumlah percobaan ulang download per video.
+            proxy (str or None): Alamat proxy (misal: "http://host:port"). None atau string kosong jika tidak pakai proxy.
+            status_store (StatusStore): Penyimpanan status global yang diperbarui.
+            cancel_event (threading.Event or None): Event untuk memeriksa apakah proses dibatalkan.
+            download_engine (str): Mesin download (lihat DOWNLOAD_ENGINES).
+            downloader_pool (InProcessDownloaderPool or None): Pool downloader in-process yang dipakai ulang.
+                Jika None dan mesin in-process dipilih, pool baru dibuat dan ditutup oleh close().
+            max_workers (int): Jumlah download yang berjalan bersamaan (ukuran pool yang dibuat sesi).
+            rate_scheduler (RateScheduler or None): Penjadwal laju request bersama (lihat create_request_scheduler);
+                download mengambil token sebagai tahap RATE_STAGE_DOWNLOAD. Jika None, dibuat dari download_delay_seconds.
+            download_delay_seconds (int): Jarak rata-rata dalam detik antara mulai setiap download video
+                (hanya dipakai jika rate_scheduler None).
+            download_archive (DownloadArchive or None): Arsip download lintas run. Video yang sudah ada di arsip
+                dilewati, dan video yang berhasil didownload dicatat ke arsip.
+            on_status (callable or None): Callback on_status(url, status) setiap kali status video berubah
+                (misal untuk jurnal checkpoint).
+            download_slots (threading.Semaphore or None): Slot download bersama lintas channel (antrian multi-channel).
+                Setiap download memegang satu slot selama berjalan, sehingga total download bersamaan tetap terbatas.
+            info_json_directory (str or None): Folder single-pass. Video yang punya .info.json dari Step 2 (dan belum
+                kedaluwarsa) didownload dari info dict tersebut tanpa di-resolve ulang; file dihapus setelah dipakai.
+        """
+        self.format_string = format_string
+        self.retries = retries
+        self.proxy = proxy
+        self.status_store = status_store
+        self.cancel_event = cancel_event
+        self.use_in_process = download_engine == DOWNLOAD_ENGINES["In-Process yt-dlp (Fast)"]
+        self.owns_pool = self.use_in_process and downloader_pool is None
+        if self.owns_pool:
+            # Pool YoutubeDL untuk seluruh sesi ini
+            downloader_pool = InProcessDownloaderPool(format_string, retries, proxy, max_workers)
+        self.downloader_pool = downloader_pool
+        if rate_scheduler is None:
+            rate_scheduler = RateScheduler(0, stage_rates={RATE_STAGE_DOWNLOAD: 1.0 / download_delay_seconds if download_delay_seconds > 0 else 0})
+        self.rate_scheduler = rate_scheduler
+        self.download_archive = download_archive
+        self.on_status = on_status
+        self.download_slots = download_slots
+        self.info_json_directory = info_json_directory
+        self.lock = Lock() # Melindungi failed_links dan missing_reported
+        self.failed_links = set() # URL yang gagal selama sesi ini
+        self.yt_dlp_missing = Event() # Diset jika perintah yt-dlp tidak ditemukan; download berikutnya langsung gagal
+        self.missing_reported = False
+
+    def is_cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def set_status(self, video_status_entry, status, failed=False):
+        """Update status global (dan daftar gagal) secara thread-safe."""
+        self.status_store.set_status(video_status_entry.url, status)
+        if failed:
+            with self.lock:
+                self.failed_links.add(video_status_entry.url)
+        if self.on_status is not None:
+            self.on_status(video_status_entry.url, status)
+
+    def download(self, video_metadata, output_path, progress_label_var, batch_info="", index=1, total_videos=1):
+        """
+        Mendownload satu video dan mencatat hasilnya di status_store. Dijalankan oleh worker pool.
+
+        Args:
+            video_metadata (dict): Metadata video (minimal berisi 'url').
+            output_path (str): Path direktori tempat video akan disimpan (subfolder batch).
+            progress_label_var (tk.StringVar): Variabel Tkinter untuk mengupdate teks label status.
+            batch_info (str): String tambahan untuk label status (misal: "Batch 1/5").
+            index (int): Nomor urut video di dalam batch (untuk label status).
+            total_videos (int): Jumlah video di dalam batch (untuk label status).
+
+        Returns:
+            bool: True jika video gagal didownload, False jika berhasil, dilewati, atau dibatalkan.
+        """
+        link = video_metadata['url'].strip() # Ambil URL dari metadata
+        if self.is_cancelled():
+            return False
+
+        # Cari record video ini di status store (O(1), terindeks per ID video)
+        video_status_entry = self.status_store.get(link)
+        if video_status_entry is None:
+            # Ini seharusnya tidak terjadi jika alur data benar, tapi sebagai fallback
+            print(f"Warning: Video URL {link} not found in global status list. Adding it.")
+            video_status_entry = self.status_store.add(link, video_metadata.get('title', 'Untitled'))
+
+        if self.yt_dlp_missing.is_set():
+            # yt-dlp sudah diketahui tidak terpasang: tandai gagal tanpa mencoba lagi
+            self.set_status(video_status_entry, 'Error (yt-dlp not found)', failed=True)
+            return True
+
+        # Update label status sebelum memulai download
+        progress_label_var.set(f"{batch_info} Step 4/4: Downloading video {index}/{total_videos}...")
+        try:
+            # Lewati video yang sudah didownload di run sebelumnya (atau oleh worker/channel lain)
+            video_id = extract_video_id_from_shorts_url(link)
+            if self.download_archive is not None and self.download_archive.contains(video_id):
+                print(f"{batch_info} Skipping {link}: already in download archive.")
+                if self.info_json_directory:
+                    remove_info_json(get_info_json_path(self.info_json_directory, video_id)) # Tidak akan dipakai
+                progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} already downloaded.")
+                self.set_status(video_status_entry, 'Skipped (Already Downloaded)')
+                return False
+
+            # Tunggu giliran sesuai kebijakan laju download (bisa diinterupsi oleh pembatalan)
+            if not self.rate_scheduler.wait(self.cancel_event, stage=RATE_STAGE_DOWNLOAD):
+                return False
+
+            # Tunggu slot download bersama (antrian multi-channel) sebelum download dimulai
+            if self.download_slots is not None and not acquire_until_cancelled(self.download_slots, self.cancel_event):
+                return False
+            # Mode single-pass: pakai info dict dari Step 2 jika masih dalam batas umur URL stream
+            info_json_path = get_fresh_info_json_path(self.info_json_directory, video_id)
+            try:
+                if self.use_in_process:
+                    # Download di dalam proses ini menggunakan YoutubeDL yang dipakai ulang
+                    downloader = self.downloader_pool.borrow()
+                    try:
+                        return_code, stderr = downloader.download(
+                            link,
+                            output_path,
+                            cancel_event=self.cancel_event,
+                            on_progress=lambda percent: progress_label_var.set(
+                                f"{batch_info} Step 4/4: Downloading video {index}/{total_videos}... {percent}%"),
+                            info_json_path=info_json_path
+                        )
+                    finally:
+                        self.downloader_pool.give_back(downloader)
+                else:
+                    try:
+                        return_code, stderr = run_subprocess_download(link, output_path, self.format_string, self.retries,
+                                                                      self.proxy, info_json_path)
+                    except FileNotFoundError:
+                        # Executable yt-dlp tidak ditemukan saat Popen; download berikutnya di sesi ini langsung gagal
+                        self.yt_dlp_missing.set()
+                        self.set_status(video_status_entry, 'Error (yt-dlp not found)', failed=True)
+                        return True
+            finally:
+                if self.download_slots is not None:
+                    self.download_slots.release()
+            if info_json_path is not None and not self.is_cancelled():
+                remove_info_json(info_json_path) # Sudah dipakai; percobaan berikutnya me-resolve ulang dari URL
+
+            if self.is_cancelled():
+                 # Jika dibatalkan, proses sudah dihentikan di on_cancel_button_click
+                 print(f"{batch_info} Download of {link} was terminated.")
+                 progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} cancelled.")
+                 # Status di status_store tetap 'No' atau 'Error' jika sudah di-set sebelumnya
+                 return False
+
+            if return_code != 0:
+                # Jika yt-dlp mengembalikan kode error non-zero (dan tidak dibatalkan)
+                error_msg = f"yt-dlp failed for {link} (code {return_code}): {stderr.strip() if stderr else 'No error message'}"
+                print(error_msg)
+                stderr = stderr or ''
+                # Cek apakah error terkait sign-in/cookies (Pesan ini tetap relevan meskipun tanpa cookies)
+                if "Sign in to confirm you’re not a bot" in stderr or "confirm you're not a robot" in stderr or "Private video" in stderr or "Age-restricted video" in stderr:
+                    print(f"{batch_info} Download failed for {link} due to potential access restriction (sign-in/bot/age/private).")
+                    progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} failed (Access Denied).")
+                    self.set_status(video_status_entry, 'Error (Access Denied)', failed=True) # Update status global
+                else:
+                    progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} failed.") # Pesan lebih ringkas
+                    self.set_status(video_status_entry, 'Error', failed=True) # Update status global
+                # --- Lanjutkan ke video berikutnya meskipun gagal ---
+                return True
+
+            # Update label status setelah berhasil
+            progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} downloaded.") # Pesan lebih ringkas
+            print(f"{batch_info} Successfully downloaded: {link}") # Debugging/Informasi
+            self.set_status(video_status_entry, 'Downloaded') # Update status global
+            if self.download_archive is not None:
+                self.download_archive.add(video_id)
+            return False
+
+        except Exception as e:
+            # Termasuk FileNotFoundError dari engine in-process (file output/sementara hilang):
+            # hanya video ini yang gagal, worker lain tetap berjalan
+            error_msg = f"An unexpected error occurred while downloading {link}: {e}"
+            print(error_msg)
+            progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} failed.") # Pesan lebih ringkas
+            self.set_status(video_status_entry, 'Error (Unexpected)', failed=True) # Update status global
+            # --- Lanjutkan ke video berikutnya meskipun gagal ---
+            return True
+
+    def report_yt_dlp_missing(self, progress_label_var):
+        """Menampilkan error yt-dlp tidak ditemukan, hanya sekali per sesi (bukan per batch/video)."""
+        with self.lock:
+            if self.missing_reported:
+                return
+            self.missing_reported = True
+        error_msg = "Error: yt-dlp command not found. Make sure yt-dlp is installed and in your system's PATH."
+        print(error_msg)
+        progress_label_var.set(error_msg)
+        show_error("Error", error_msg) # Tampilkan pesan error di GUI (atau stderr tanpa GUI)
+
+    def close(self):
+        """Menutup pool downloader jika dibuat oleh sesi ini."""
+        if self.owns_pool:
+            self.downloader_pool.close()
+
+def download_videos_from_links(metadata_list, output_path, format_string, retries, download_delay_seconds, proxy, status_store, progress_var, progress_label_var, batch_info="", cancel_event=None,
+                               download_engine=DOWNLOAD_ENGINES["In-Process yt-dlp (Fast)"], downloader_pool=None, max_workers=1, rate_scheduler=None, download_archive=None, on_status=None,
+                               download_slots=None, info_json_directory=None, download_session=None):
+    """
+    Mendownload daftar video dari metadata yang diberikan menggunakan yt-dlp (in-process atau subprocess)
+    ke dalam direktori output yang ditentukan, dengan pilihan format, retries, delay, proxy, dan pembatalan.
+    Jika max_workers > 1, beberapa video didownload bersamaan oleh worker pool.
+    Setiap mulai download menunggu izin dari rate_scheduler (tanpa sleep tetap setelah download).
+    Melacak status download setiap video dalam status_store (thread-safe).
+
+    Args:
+        metadata_list (list): Daftar dictionary berisi metadata Shorts untuk batch ini.
+        output_path (str): Path direktori tempat video akan disimpan (subfolder batch).
+        format_string, retries, download_delay_seconds, proxy, status_store, cancel_event, download_engine,
+        downloader_pool, rate_scheduler, download_archive, on_status, download_slots, info_json_directory:
+            Konfigurasi sesi download untuk batch ini (lihat DownloadSession). Diabaikan jika download_session diisi.
+        progress_var (tk.IntVar): Variabel Tkinter untuk mengupdate nilai progress bar (gabungan semua worker).
+        progress_label_var (tk.StringVar): Variabel Tkinter untuk mengupdate teks label status.
+        batch_info (str): String tambahan untuk label status (misal: "Batch 1/5").
+        max_workers (int): Jumlah download yang berjalan bersamaan (1 = berurutan).
+        download_session (DownloadSession or None): Sesi yang dipakai ulang antar batch. Jika None, sesi baru
+            dibuat untuk batch ini dan ditutup di akhir batch.
+
+    Returns:
+        list: Daftar URL video yang gagal didownload dalam batch ini (sesuai urutan metadata_list).
+    """
+    total_videos = len(metadata_list)
+
+    if total_videos == 0:
+        progress_label_var.set(f"{batch_info} Step 4/4: No videos to download in this batch.")
+        progress_var.set(0)
+        return [] # Kembalikan list kosong
+
+    max_workers = max(1, min(max_workers, total_videos))
+    print(f"{batch_info} Step 4/4: Starting download of {total_videos} videos into {output_path} ({max_workers} worker(s))...")
+
+    session = download_session
+    if session is None:
+        session = DownloadSession(format_string, retries, proxy, status_store, cancel_event, download_engine, downloader_pool,
+                                  max_workers, rate_scheduler, download_delay_seconds, download_archive, on_status,
+                                  download_slots, info_json_directory)
+    cancel_event = session.cancel_event
+
+    progress_lock = Lock() # Melindungi counter progress
+    progress_counter = {'completed': 0}
+
+    def download_one(index, video_metadata):
+        """Mendownload satu video lewat sesi, lalu update progress bar gabungan batch ini."""
+        try:
+            session.download(video_metadata, output_path, progress_label_var, batch_info, index, total_videos)
+        finally:
+            # Update progress bar setelah setiap video (berhasil atau gagal/dibatalkan)
+            # Progress bar ini menunjukkan progress gabungan semua worker DALAM batch saat ini
+            with progress_lock:
+                progress_counter['completed'] += 1
+                completed = progress_counter['completed']
+            progress_var.set(int((completed / total_videos) * 100))
+
+    if max_workers == 1:
+        for index, video_metadata in enumerate(metadata_list, start=1):
+            download_one(index, video_metadata)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download") as executor:
+            futures = [executor.submit(download_one, index, video_metadata)
+                       for index, video_metadata in enumerate(metadata_list, start=1)]
+            for future in as_completed(futures):
+                future.result()
+
+    if download_session is None:
+        session.close()
+
+    if cancel_event and cancel_event.is_set():
+        print(f"{batch_info} Download cancelled by user.")
+        progress_label_var.set(f"{batch_info} Download cancelled.")
+
+    if session.yt_dlp_missing.is_set():
+        session.report_yt_dlp_missing(progress_label_var)
+
+    # Setelah semua worker selesai untuk batch ini (baik selesai semua, ada yang gagal, atau dibatalkan)
+    if not (cancel_event and cancel_event.is_set()):
+        batch_finish_status = f"{batch_info} Step 4/4: Finished processing videos for this batch."
+        progress_label_var.set(batch_finish_status)
+        print(batch_finish_status) # Debugging/Informasi
+        # progress_var.set(100) # Opsional: Pastikan progress bar penuh di akhir batch jika tidak dibatalkan
+
+    # Kembalikan daftar URL yang gagal, sesuai urutan batch
+    with session.lock:
+        failed_links = set(session.failed_links)
+    return [item['url'].strip() for item in metadata_list if item['url'].strip() in failed_links]
+
+
+# --- Fungsi Penyimpanan Metadata dan Error ---
+
+def write_rows_xlsx(output_filepath, columns, rows):
+    """Menulis baris ke .xlsx dengan openpyxl mode write-only (streaming per baris, tanpa DataFrame)."""
+    import openpyxl # Lazy: hanya dimuat untuk ekspor .xlsx
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE # Karakter kontrol yang tidak boleh ada di sel Excel
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+    for row in rows:
+        # Deskripsi kadang berisi karakter kontrol yang ditolak openpyxl
+        sheet.append([ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str) else value for value in row])
+    workbook.save(output_filepath)
+
+def write_rows_csv(output_filepath, columns, rows):
+    """Menulis baris ke .csv (utf-8-sig agar judul non-ASCII terbaca benar saat dibuka di Excel)."""
+    with open(output_filepath, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+def write_rows_jsonl(output_filepath, columns, rows):
+    """Menulis baris ke .jsonl (satu objek JSON per baris, key = nama kolom)."""
+    with open(output_filepath, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + '\n')
+
+def write_rows_parquet(output_filepath, columns, rows):
+    """Menulis baris ke .parquet lewat pandas (membutuhkan pyarrow atau fastparquet)."""
+    pd.DataFrame(rows, columns=columns).to_parquet(output_filepath, index=False)
+
+# Fungsi penulis untuk setiap format ekspor (lihat EXPORT_FORMATS)
+EXPORT_WRITERS = {
+    "xlsx": write_rows_xlsx,
+    "csv": write_rows_csv,
+    "jsonl": write_rows_jsonl,
+    "parquet": write_rows_parquet,
+}
+
+def get_partial_filepath(filepath):
+    """Path sementara untuk penulisan atomik (ekstensi tetap sama agar writer mengenali formatnya)."""
+    root, extension = os.path.splitext(filepath)
+    return f"{root}.partial{extension}"
+
+def export_rows(output_filepath, columns, rows, export_format):
+    """
+    Menulis tabel ke file dengan format yang dipilih. File ditulis ke path sementara lalu diganti
+    secara atomik, sehingga file lama tidak pernah setengah tertulis. Error diteruskan ke pemanggil.
+
+    Args:
+        output_filepath (str): Path file tujuan.
+        columns (list): Nama kolom.
+        rows (list): Daftar baris (tuple/list sesuai urutan kolom).
+        export_format (str): Format ekspor (lihat EXPORT_FORMATS).
+    """
+    partial_filepath = get_partial_filepath(output_filepath)
+    try:
+        EXPORT_WRITERS[export_format](partial_filepath, columns, rows)
+        os.replace(partial_filepath, output_filepath)
+    except Exception:
+        if os.path.exists(partial_filepath):
+            os.remove(partial_filepath)
+        raise
+
+def save_metadata_to_file(metadata_list, output_filepath, export_format=EXPORT_FORMATS["Excel (.xlsx)"]):
+    """
+    Menyimpan daftar metadata Shorts ke dalam file (Excel/CSV/JSONL/Parquet) di lokasi spesifik.
+
+    Args:
+        metadata_list (list): Daftar dictionary berisi metadata Shorts untuk batch ini.
+        output_filepath (str): Path lengkap file yang akan disimpan (termasuk nama file).
+        export_format (str): Format ekspor (lihat EXPORT_FORMATS).
+
+    Returns:
+        bool: True jika berhasil menyimpan, False jika gagal.
+    """
+    if not metadata_list:
+        print(f"No metadata to save to file: {output_filepath}")
+        return False
+
+    try:
+        # Urutan kolom: Link URL, Title, Description (+ Views, Thumbnail URL jika metadata berasal dari halaman channel)
+        if any('view_count' in item for item in metadata_list):
+            rows = [(item.get('url'), item.get('title'), item.get('description'), item.get('view_count'), item.get('thumbnail_url'))
+                    for item in metadata_list]
+            export_rows(output_filepath, ['Link URL', 'Title', 'Description', 'Views', 'Thumbnail URL'], rows, export_format)
+        else:
+            rows = [(item.get('url'), item.get('title'), item.get('description')) for item in metadata_list]
+            export_rows(output_filepath, ['Link URL', 'Title', 'Description'], rows, export_format)
+
+        print(f"Successfully saved metadata to {output_filepath}")
+        return True
+    except Exception as e:
+        print(f"Error saving metadata to file {output_filepath}: {e}")
+        return False
+
+def save_failed_urls_to_file(failed_urls, output_directory, batch_number):
+    """
+    Menyimpan daftar URL yang gagal ke file error.txt di subfolder error batch.
+
+    Args:
+        failed_urls (list): Daftar string URL yang gagal.
+        output_directory (str): Path direktori utama tempat folder error akan dibuat.
+        batch_number (int): Nomor batch.
+    """
+    if not failed_urls:
+        print(f"No failed URLs to save for Batch {batch_number}.")
+        return
+
+    # Buat path untuk folder error utama dan subfolder error batch
+    error_main_folder = os.path.join(output_directory, ERROR_FOLDER_NAME)
+    error_batch_folder = os.path.join(error_main_folder, f"Batch_{batch_number}_Errors")
+    error_filepath = os.path.join(error_batch_folder, "error.txt")
+
+    try:
+        # Buat folder error jika belum ada
+        os.makedirs(error_batch_folder, exist_ok=True)
+        print(f"Created error directory for Batch {batch_number}: {error_batch_folder}")
+
+        # Tulis URL yang gagal ke file error.txt
+        with open(error_filepath, 'w') as f:
+            for url in failed_urls:
+                f.write(url + '\n')
+
+        print(f"Successfully saved {len(failed_urls)} failed URLs to {error_filepath}")
+    except Exception as e:
+        print(f"Error saving failed URLs to file {error_filepath}: {e}")
+
+def get_master_status_filepath(output_directory, channel_name, extension):
+    """
+    Membuat path file master status untuk sebuah channel.
+
+    Args:
+        output_directory (str): Path direktori utama tempat file master disimpan.
+        channel_name (str): Nama channel, digunakan untuk nama file.
+        extension (str): Ekstensi file tanpa titik (misal 'xlsx' atau 'csv').
+    Returns:
+        str: Path file master status.
+    """
+    # Bersihkan nama channel untuk nama file
+    safe_channel_name = "".join(c for c in channel_name if c.isalnum() or c in (' ', '.', '_')).rstrip()
+    if not safe_channel_name:
+        safe_channel_name = "shorts_download_status"
+    else:
+        safe_channel_name = f"{safe_channel_name}_shorts_download_status"
+    return os.path.join(output_directory, f"{safe_channel_name}.{extension}")
+
+def save_master_status(status_store, output_directory, channel_name="channel", export_format=EXPORT_FORMATS["Excel (.xlsx)"], quiet=False):
+    """
+    Menyimpan daftar status download semua video ke dalam file master (Excel/CSV/JSONL/Parquet).
+
+    Args:
+        status_store (StatusStore): Penyimpanan status setiap video.
+        output_directory (str): Path direktori utama tempat file master akan disimpan.
+        channel_name (str): Nama channel, digunakan untuk nama file.
+        export_format (str): Format ekspor (lihat EXPORT_FORMATS).
+        quiet (bool): True untuk tidak mencetak pesan sukses (penulisan berkala).
+    Returns:
+        bool: True jika berhasil menyimpan, False jika gagal.
+    """
+    if not status_store:
+        if not quiet:
+            print("No video status data to save to master status file.")
+        return False
+
+    output_filepath = get_master_status_filepath(output_directory, channel_name, export_format)
+
+    try:
+        export_rows(output_filepath, ['Link URL', 'Title', 'D/N/E'], status_store.to_rows(), export_format)
+        if not quiet:
+            print(f"Successfully saved master download status to {output_filepath}")
+        return True
+    except Exception as e:
+        print(f"Error saving master download status to file {output_filepath}: {e}")
+        return False
+
+class CheckpointStatusView:
+    """
+    Status per video yang disusun dari jurnal checkpoint (append-only) dan dibaca bertahap: setiap refresh()
+    hanya membaca baris yang ditambahkan sejak pembacaan sebelumnya. Hanya judul, pembagian batch, dan status
+    terakhir yang disimpan (bukan metadata lengkap). Baris dengan urutan yang sama seperti StatusStore.to_rows().
+    """
+
+    def __init__(self, checkpoint_path):
+        """
+        Args:
+            checkpoint_path (str): Path file jurnal checkpoint.
+        """
+        self.checkpoint_path = checkpoint_path
+        self.offset = 0 # Posisi byte setelah baris lengkap terakhir yang sudah dibaca
+        self.version = 0 # Bertambah setiap ada record baru (dipakai compactor untuk melewati penulisan yang tidak perlu)
+        self.reset()
+
+    def reset(self):
+        """Mengosongkan state (jurnal diganti dengan jurnal baru)."""
+        self.batches = {} # Nomor batch -> dict URL (urutan masuk batch)
+        self.titles = {}
+        self.statuses = {}
+
+    def refresh(self):
+        """Membaca record baru dari jurnal. Baris terakhir yang belum lengkap dibaca lagi pada refresh berikutnya."""
+        try:
+            with open(self.checkpoint_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < self.offset:
+                    self.offset = 0 # Jurnal diganti oleh run baru
+                    self.reset()
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            return
+        complete_length = data.rfind(b'\n') + 1
+        if not complete_length:
+            return
+        self.offset += complete_length
+        for line in data[:complete_length].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue # Baris rusak dilewati, seperti load_pipeline_checkpoint
+            record_type = record.get('type')
+            if record_type == 'run':
+                self.reset()
+            elif record_type == 'metadata':
+                metadata = record.get('metadata') or {}
+                if metadata.get('url'):
+                    self.titles[metadata['url']] = metadata.get('title', 'Untitled')
+            elif record_type == 'batch':
+                self.batches.setdefault(record.get('batch_number'), {}).update(dict.fromkeys(record.get('urls', [])))
+            elif record_type == 'status':
+                self.statuses[record.get('url')] = record.get('status')
+        self.version += 1
+
+    def __len__(self):
+        return sum(len(batch_urls) for batch_urls in self.batches.values())
+
+    def to_rows(self):
+        """Mengembalikan list tuple (url, title, status) per batch, untuk ekspor master status."""
+        return [(url, self.titles.get(url, 'Untitled'), self.statuses.get(url, 'No'))
+                for batch_number in sorted(self.batches) for url in self.batches[batch_number]]
+
+class MasterStatusCompactor:
+    """
+    Menulis master status di background thread, sehingga status selalu ada di disk selama proses berjalan
+    dan penulisan akhir tidak memblokir thread proses.
+    Setiap perubahan status sudah dicatat saat terjadi di jurnal checkpoint (append-only); compactor
+    meringkas jurnal itu (CheckpointStatusView) menjadi master status dengan format ekspor yang dipilih,
+    secara berkala dan sekali lagi saat selesai. Run tanpa jurnal (gagal dibuka) diringkas dari StatusStore.
+    """
+
+    def __init__(self, status_store, output_directory, channel_name, export_format=EXPORT_FORMATS["Excel (.xlsx)"],
+                 interval_seconds=MASTER_STATUS_COMPACT_INTERVAL_SECONDS, checkpoint_path=None):
+        """
+        Args:
+            status_store (StatusStore): Penyimpanan status run ini (dipakai jika tidak ada jurnal).
+            output_directory (str): Folder output utama.
+            channel_name (str): Nama channel, digunakan untuk nama file master.
+            export_format (str): Format master status (lihat EXPORT_FORMATS).
+            interval_seconds (float): Jeda antar penulisan master status selama proses berjalan.
+            checkpoint_path (str or None): Path jurnal checkpoint run ini.
+        """
+        self.status_source = CheckpointStatusView(checkpoint_path) if checkpoint_path else status_store
+        self.output_directory = output_directory
+        self.channel_name = channel_name
+        self.export_format = export_format
+        self.interval_seconds = interval_seconds
+        self.written_version = 0 # Versi sumber status yang terakhir ditulis (0 = belum ada data)
+        self.finish_event = Event()
+        # Bukan daemon: penulisan akhir tetap selesai walaupun jendela GUI ditutup
+        self.thread = Thread(target=self.run, name="master-status-compactor")
+
+    def start(self):
+        """Memulai thread compactor."""
+        self.thread.start()
+
+    def refresh(self):
+        """Membaca perubahan terbaru dari jurnal dan mengembalikan versi sumber status."""
+        if isinstance(self.status_source, CheckpointStatusView):
+            self.status_source.refresh()
+        return self.status_source.version
+
+    def run(self):
+        """Loop compactor: tulis master status jika ada perubahan, lalu penulisan akhir setelah finish()."""
+        while not self.finish_event.wait(self.interval_seconds):
+            version = self.refresh()
+            if version != self.written_version and save_master_status(self.status_source, self.output_directory, self.channel_name,
+                                                                       self.export_format, quiet=True):
+                self.written_version = version
+
+        self.refresh()
+        if not self.status_source:
+            return
+        print("Saving overall download status to master status file...")
+        save_master_status(self.status_source, self.output_directory, self.channel_name, self.export_format)
+
+    def finish(self):
+        """Meminta penulisan akhir tanpa menunggu (idempotent)."""
+        self.finish_event.set()
+
+    def join(self, timeout=None):
+        """Menunggu penulisan akhir selesai."""
+        self.thread.join(timeout)
+
+def start_master_status_compactor(status_store, output_directory, channel_url, export_format=EXPORT_FORMATS["Excel (.xlsx)"],
+                                  checkpoint=None):
+    """
+    Memulai compactor master status untuk run baru. Compactor run sebelumnya di folder yang sama diselesaikan
+    dan ditunggu dulu agar dua penulisan ke file master yang sama tidak bertabrakan; compactor channel lain
+    (antrian multi-channel) tetap berjalan.
+
+    Args:
+        status_store (StatusStore): Penyimpanan status run ini.
+        output_directory (str): Folder output utama.
+        channel_url (str): URL channel (untuk nama file master).
+        export_format (str): Format master status (lihat EXPORT_FORMATS).
+        checkpoint (PipelineCheckpoint or None): Jurnal checkpoint run ini, sumber master status.
+
+    Returns:
+        MasterStatusCompactor: Compactor yang sudah berjalan.
+    """
+    directory_key = os.path.abspath(output_directory)
+    with active_status_compactors_lock:
+        previous_compactor = active_status_compactors.get(directory_key)
+        if previous_compactor is not None:
+            previous_compactor.finish()
+            previous_compactor.join()
+        # Buang compactor folder lain yang sudah selesai menulis, agar StatusStore lama tidak tertahan di memori
+        for finished_key in [key for key, compactor in active_status_compactors.items() if not compactor.thread.is_alive()]:
+            del active_status_compactors[finished_key]
+        compactor = MasterStatusCompactor(status_store, output_directory, get_channel_name_for_file(channel_url), export_format,
+                                          checkpoint_path=checkpoint.checkpoint_path if checkpoint is not None else None)
+        active_status_compactors[directory_key] = compactor
+        compactor.start()
+        return compactor
+
+def finish_master_status_compactor(wait=False, output_directory=None):
+    """
+    Meminta compactor menulis master status final di background.
+
+    Args:
+        wait (bool): True untuk menunggu sampai penulisan akhir selesai (misal sebelum CLI keluar).
+        output_directory (str or None): Hanya compactor folder ini (satu channel di antrian multi-channel).
+            None untuk semua compactor.
+    """
+    with active_status_compactors_lock:
+        if output_directory is None:
+            compactors = list(active_status_compactors.values())
+        else:
+            compactor = active_status_compactors.get(os.path.abspath(output_directory))
+            compactors = [compactor] if compactor is not None else []
+    for compactor in compactors:
+        compactor.finish()
+    if wait:
+        for compactor in compactors:
+            compactor.join()
+
+
+# --- Fungsi Pipeline (Staged & Streaming) ---
+
+class NullProgressVar:
+    """Pengganti tk.IntVar/tk.StringVar yang mengabaikan semua nilai (untuk progress yang tidak ditampilkan)."""
+
+    def set(self, value):
+        pass
+
+    def get(self):
+        return None
+
+def get_option_name(options, key):
+    """
+    Mencari nama user-friendly dari sebuah key opsi (kebalikan dari options[name]).
+
+    Args:
+        options (dict): Mapping nama -> key (misal: DISCOVERY_ENGINES).
+        key (str): Key yang dicari.
+
+    Returns:
+        str: Nama user-friendly, atau key itu sendiri jika tidak ditemukan.
+    """
+    return next((name for name, value in options.items() if value == key), key)
+
+def get_channel_name_for_file(channel_url):
+    """
+    Mencoba mengekstrak nama channel dari URL untuk dipakai sebagai nama file.
+
+    Args:
+        channel_url (str): URL channel YouTube.
+
+    Returns:
+        str: Nama channel (@handle atau ID channel), atau "channel" jika tidak dikenali.
+    """
+    if '/@' in channel_url:
+        return channel_url.split('/@')[1].split('/')[0]
+    if '/channel/' in channel_url:
+        return channel_url.split('/channel/')[1].split('/')[0]
+    return "channel"
+
+def discover_shorts_urls(settings, progress_label_var, cancel_event, on_new_urls=None, known_video_ids=None, page_metadata=None):
+    """
+    Step 1: Mengambil semua URL Shorts menggunakan mesin discovery yang dipilih di settings.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+        progress_label_var (tk.StringVar): Variabel Tkinter untuk label status.
+        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        on_new_urls (callable or None): Callback untuk URL baru segera setelah ditemukan.
+        known_video_ids (set or None): ID video yang sudah didownload di run sebelumnya, untuk berhenti lebih awal.
+        page_metadata (dict or None): Dict yang diisi metadata dari halaman channel (mode metadata DOM, lihat create_page_metadata).
+
+    Returns:
+        list: Daftar string URL Shorts.
+    """
+    if settings['discovery_engine'] == DISCOVERY_ENGINES["InnerTube HTTP (Browserless)"]:
+        print("Step 1/4: Fetching all Shorts URLs using InnerTube HTTP continuation...")
+        return get_all_shorts_urls_innertube(
+            settings['channel_url'],
+            settings['num_videos_limit'],
+            settings['proxy'],
+            progress_label_var,
+            cancel_event,
+            on_new_urls=on_new_urls,
+            known_video_ids=known_video_ids,
+            known_stop_threshold=settings['known_stop_threshold'],
+            page_metadata=page_metadata
+        )
+    print("Step 1/4: Fetching all Shorts URLs using Selenium...")
+    return get_all_shorts_urls_selenium(
+        settings['channel_url'],
+        settings['num_videos_limit'], # Pass limit to Selenium for potential early stop
+        settings['selenium_options'],
+        settings['scrolling_method'],
+        settings['proxy'], # Use the same proxy for Selenium
+        progress_label_var,
+        cancel_event,
+        harvest_mode=settings['harvest_mode'],
+        scroll_wait_mode=settings['scroll_wait_mode'],
+        on_new_urls=on_new_urls,
+        known_video_ids=known_video_ids,
+        known_stop_threshold=settings['known_stop_threshold'],
+        page_metadata=page_metadata
+    )
+
+def create_page_metadata(settings):
+    """
+    Membuat dict penampung metadata dari halaman channel jika mode metadata DOM dipilih.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+
+    Returns:
+        dict or None: Dict kosong (ID video -> field) yang diisi saat discovery, atau None untuk mode yt-dlp.
+    """
+    if settings['metadata_source'] == METADATA_SOURCES["yt-dlp Extraction (Default)"]:
+        return None
+    return {}
+
+def open_metadata_cache(settings):
+    """
+    Membuka cache metadata SQLite di folder output utama jika TTL > 0.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+
+    Returns:
+        MetadataCache or None: Cache yang terbuka, atau None jika dinonaktifkan/gagal dibuka.
+    """
+    if settings['metadata_cache_ttl_days'] <= 0:
+        return None
+    try:
+        return MetadataCache(
+            os.path.join(settings['main_output_directory'], METADATA_CACHE_FILENAME),
+            settings['metadata_cache_ttl_days'] * 24 * 60 * 60
+        )
+    except sqlite3.Error as e:
+        print(f"Warning: Could not open metadata cache, continuing without it: {e}")
+        return None
+
+def open_download_archive(settings):
+    """
+    Membuka arsip download di folder output utama jika diaktifkan.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+
+    Returns:
+        DownloadArchive or None: Arsip yang terbuka, atau None jika dinonaktifkan/gagal dibuka.
+    """
+    if not settings['use_download_archive']:
+        return None
+    try:
+        download_archive = DownloadArchive(os.path.join(settings['main_output_directory'], DOWNLOAD_ARCHIVE_FILENAME))
+        print(f"Download archive loaded with {len(download_archive)} previously downloaded videos.")
+        return download_archive
+    except OSError as e:
+        print(f"Warning: Could not open download archive, continuing without it: {e}")
+        return None
+
+def open_info_json_directory(settings):
+    """
+    Menyiapkan folder .info.json di folder output utama jika mode single-pass dipilih.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+
+    Returns:
+        str or None: Path folder, atau None jika mode single-pass tidak aktif atau folder gagal dibuat.
+    """
+    if not settings['single_pass']:
+        return None
+    info_json_directory = os.path.join(settings['main_output_directory'], INFO_JSON_DIRNAME)
+    try:
+        os.makedirs(info_json_directory, exist_ok=True)
+    except OSError as e:
+        print(f"Warning: Could not create {info_json_directory}, continuing without single-pass extraction: {e}")
+        return None
+    return info_json_directory
+
+def open_pipeline_checkpoint(settings):
+    """
+    Membuka jurnal checkpoint di folder output utama (melanjutkan jurnal lama jika mode resume dipilih).
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+
+    Returns:
+        PipelineCheckpoint or None: Jurnal yang terbuka, atau None jika gagal dibuka.
+    """
+    try:
+        return PipelineCheckpoint(
+            os.path.join(settings['main_output_directory'], CHECKPOINT_FILENAME),
+            settings['channel_url'],
+            resume=settings['resume']
+        )
+    except OSError as e:
+        print(f"Warning: Could not open pipeline checkpoint, continuing without it: {e}")
+        return None
+
+def get_next_batch_number(main_output_directory):
+    """
+    Mencari nomor batch berikutnya setelah folder Batch_N yang sudah ada, agar run ulang
+    (sinkronisasi inkremental) tidak menimpa folder dan file Excel batch sebelumnya.
+
+    Args:
+        main_output_directory (str): Folder output utama.
+
+    Returns:
+        int: Nomor batch pertama untuk run ini (1 jika belum ada folder batch).
+    """
+    existing_numbers = []
+    try:
+        for name in os.listdir(main_output_directory):
+            match = re.fullmatch(r'Batch_(\d+)', name)
+            if match and os.path.isdir(os.path.join(main_output_directory, name)):
+                existing_numbers.append(int(match.group(1)))
+    except OSError:
+        pass
+    return max(existing_numbers, default=0) + 1
+
+def create_request_scheduler(settings):
+    """
+    Membuat satu penjadwal laju untuk metadata (Step 2) dan download (Step 4), dipakai lintas batch.
+    Metadata rate limit adalah anggaran request bersama kedua tahap; download delay diartikan sebagai
+    jarak rata-rata antar mulai download (batas tambahan tahap download).
+    Jika settings berisi 'request_scheduler' (antrian multi-channel), penjadwal bersama itu yang dipakai,
+    sehingga laju request total tidak berlipat dengan jumlah channel yang berjalan bersamaan.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+
+    Returns:
+        RateScheduler: Penjadwal request bersama.
+    """
+    if settings.get('request_scheduler') is not None:
+        return settings['request_scheduler']
+    download_delay_seconds = settings['download_delay_seconds']
+    return RateScheduler(settings['metadata_rate_limit'], settings['rate_burst'], settings['rate_jitter'],
+                         stage_rates={RATE_STAGE_DOWNLOAD: 1.0 / download_delay_seconds if download_delay_seconds > 0 else 0})
+
+def create_download_session(settings, status_store, cancel_event, request_scheduler, download_archive, checkpoint, info_json_directory):
+    """
+    Membuat satu sesi download (Step 4) untuk seluruh run: pool downloader in-process dan penjadwal laju
+    dipakai ulang lintas batch, dan yt-dlp yang tidak terpasang hanya dilaporkan sekali.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+        status_store (StatusStore): Penyimpanan status run ini.
+        cancel_event (threading.Event): Event pembatalan.
+        request_scheduler (RateScheduler): Penjadwal laju bersama run ini (lihat create_request_scheduler).
+        download_archive (DownloadArchive or None): Arsip download lintas run.
+        checkpoint (PipelineCheckpoint or None): Jurnal checkpoint yang mencatat status setiap video.
+        info_json_directory (str or None): Folder single-pass (lihat open_info_json_directory).
+
+    Returns:
+        DownloadSession: Sesi baru; tutup dengan close() setelah semua download selesai.
+    """
+    return DownloadSession(
+        settings['format_string'],
+        settings['retries'],
+        settings['proxy'] or None,
+        status_store,
+        cancel_event,
+        download_engine=settings['download_engine'],
+        max_workers=max(1, settings['download_workers']),
+        rate_scheduler=request_scheduler,
+        download_archive=download_archive,
+        on_status=checkpoint.record_status if checkpoint is not None else None,
+        download_slots=settings.get('download_slots'),
+        info_json_directory=info_json_directory
+    )
+
+def put_until_cancelled(target_queue, item, cancel_event):
+    """
+    Memasukkan item ke queue terbatas (menunggu jika penuh = backpressure), sambil tetap
+    memeriksa pembatalan secara berkala.
+
+    Returns:
+        bool: True jika item berhasil dimasukkan, False jika dibatalkan.
+    """
+    while not cancel_event.is_set():
+        try:
+            target_queue.put(item, timeout=STREAMING_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def acquire_until_cancelled(semaphore, cancel_event):
+    """
+    Mengambil satu slot semaphore (menunggu jika semua slot dipakai), sambil tetap
+    memeriksa pembatalan secara berkala.
+
+    Returns:
+        bool: True jika slot didapat (wajib di-release oleh pemanggil), False jika dibatalkan.
+    """
+    while not (cancel_event and cancel_event.is_set()):
+        if semaphore.acquire(timeout=STREAMING_POLL_INTERVAL):
+            return True
+    return False
+
+def run_staged_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store=None, checkpoint=None):
+    """
+    Menjalankan pipeline bertahap: semua URL di-discover, lalu semua metadata diambil,
+    lalu setiap batch disimpan ke Excel dan didownload secara berurutan.
+    Semua langkah dicatat di jurnal checkpoint; pada mode resume, URL, metadata, dan pembagian batch
+    dari jurnal dipakai ulang dan download dilanjutkan dari video pertama yang belum selesai.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+        progress_var (tk.IntVar): Variabel Tkinter untuk progress bar.
+        progress_label_var (tk.StringVar): Variabel Tkinter untuk label status.
+        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        status_store (StatusStore or None): Penyimpanan status yang diisi run ini (None = buat baru).
+            Antrian multi-channel memberi setiap channel store sendiri.
+        checkpoint (PipelineCheckpoint or None): Jurnal checkpoint yang dibuka (dan ditutup) oleh run_pipeline.
+
+    Returns:
+        str: Hasil run (salah satu PIPELINE_RESULT_*).
+    """
+    global all_videos_download_status # Deklarasikan untuk memodifikasi variabel global
+    if status_store is None:
+        status_store = StatusStore() # Status baru untuk setiap proses
+    all_videos_download_status = status_store # Status run terakhir (dibaca GUI/CLI setelah run selesai)
+
+    channel_url = settings['channel_url']
+    num_videos_limit = settings['num_videos_limit']
+    main_output_directory = settings['main_output_directory']
+    selected_format_string = settings['format_string']
+    retries = settings['retries']
+    download_delay_seconds = settings['download_delay_seconds']
+    proxy_address = settings['proxy']
+    metadata_workers = settings['metadata_workers']
+    discovery_engine_name = get_option_name(DISCOVERY_ENGINES, settings['discovery_engine'])
+
+    # Jurnal checkpoint: state run sebelumnya (mode resume) atau jurnal baru
+    resume_state = checkpoint.resume_state if checkpoint is not None else None
+    assigned_batches = resume_state['batches'] if resume_state else {} # Pembagian batch dari run sebelumnya
+    assigned_urls = [url for batch_number in sorted(assigned_batches) for url in assigned_batches[batch_number]]
+    known_metadata = resume_state['metadata'] if resume_state else {}
+    known_statuses = resume_state['statuses'] if resume_state else {}
+
+    # Arsip download dibuka sebelum discovery, agar discovery bisa berhenti lebih awal pada video yang sudah dikenal
+    download_archive = open_download_archive(settings)
+    known_video_ids = download_archive.snapshot() if download_archive is not None else None
+    page_metadata = create_page_metadata(settings) # Diisi saat discovery pada mode metadata DOM
+    request_scheduler = create_request_scheduler(settings) # Satu anggaran request untuk metadata dan download
+    info_json_directory = open_info_json_directory(settings) # Info dict Step 2 untuk download (mode single-pass)
+
+    # 1. Ambil Semua URL Shorts (Selenium dengan Scrolling, atau InnerTube HTTP tanpa browser)
+    if resume_state and resume_state['discovery_complete']:
+        all_shorts_urls = list(resume_state['urls'])
+        print(f"Resuming from checkpoint: reusing {len(all_shorts_urls)} discovered Shorts URLs (no re-scrolling).")
+        progress_label_var.set(f"Step 1/4: Resumed {len(all_shorts_urls)} Shorts URLs from checkpoint.")
+    else:
+        all_shorts_urls = discover_shorts_urls(settings, progress_label_var, cancel_event, known_video_ids=known_video_ids,
+                                               on_new_urls=checkpoint.record_urls if checkpoint is not None else None,
+                                               page_metadata=page_metadata)
+        if resume_state:
+            # Discovery run sebelumnya belum selesai: gabungkan dengan URL yang sudah tercatat
+            all_shorts_urls = list(dict.fromkeys(resume_state['urls'] + all_shorts_urls))
+        if checkpoint is not None and not cancel_event.is_set():
+            checkpoint.record_discovery_complete()
+
+    if cancel_event.is_set():
+         print("Process cancelled after URL discovery.")
+         progress_label_var.set("Process cancelled.")
+         return PIPELINE_RESULT_CANCELLED # Keluar jika dibatalkan
+
+    if not all_shorts_urls:
+        progress_label_var.set(f"Process finished: No Shorts URLs found via {discovery_engine_name}.")
+        print(f"No Shorts URLs found via {discovery_engine_name}.")
+        progress_var.set(0) # Reset progress if no links
+        return PIPELINE_RESULT_NO_SHORTS
+
+    # Video yang sudah masuk batch pada run sebelumnya diproses lewat statusnya di jurnal
+    assigned_url_set = set(assigned_urls)
+    new_urls = [url for url in all_shorts_urls if url not in assigned_url_set]
+
+    # Lewati video yang sudah didownload di run sebelumnya, sebelum metadata diambil (sinkronisasi inkremental)
+    if download_archive is not None:
+        new_urls, skipped_count = download_archive.filter_new_urls(new_urls)
+        if skipped_count:
+            print(f"Skipping {skipped_count} Shorts already in the download archive. {len(new_urls)} new Shorts remaining.")
+        if not new_urls and not assigned_urls:
+            progress_label_var.set("Process finished: All discovered Shorts were already downloaded.")
+            print("All discovered Shorts were already downloaded. Nothing new to process.")
+            progress_var.set(100)
+            if checkpoint is not None:
+                checkpoint.record_complete()
+            return PIPELINE_RESULT_UP_TO_DATE
+
+    # 2. Ambil Metadata (Title, Description) untuk URL yang Ditemukan menggunakan yt-dlp
+    # Ini diperlukan untuk menyimpan ke file Excel
+    # Metadata yang sudah tercatat di jurnal checkpoint tidak diambil ulang
+    urls_to_fetch = [url for url in assigned_urls + new_urls if url not in known_metadata]
+    if known_metadata:
+        print(f"Resuming from checkpoint: reusing metadata for {len(assigned_urls) + len(new_urls) - len(urls_to_fetch)} videos.")
+    if page_metadata is not None:
+        print(f"Step 2/4: Collecting metadata for {len(urls_to_fetch)} URLs ({len(page_metadata)} harvested from the channel page)...")
+    else:
+        print(f"Step 2/4: Fetching metadata for {len(urls_to_fetch)} URLs using yt-dlp...")
+    progress_var.set(0)
+    metadata_cache = open_metadata_cache(settings)
+    try:
+        fetched_metadata = get_metadata_for_urls(
+            urls_to_fetch,
+            proxy_address if proxy_address else None, # Use the same proxy for yt-dlp metadata fetch
+            progress_label_var,
+            cancel_event,
+            max_workers=metadata_workers,
+            rate_scheduler=request_scheduler,
+            progress_var=progress_var,
+            on_result=(lambda index, metadata: checkpoint.record_metadata(metadata)) if checkpoint is not None else None,
+            metadata_cache=metadata_cache,
+            page_metadata=page_metadata,
+            fetch_description=settings['metadata_source'] != METADATA_SOURCES["DOM Harvest (Title/Views, Skip Step 2)"],
+            metadata_profile=settings['metadata_profile'],
+            info_json_directory=info_json_directory
+        ) if urls_to_fetch else []
+    finally:
+        if metadata_cache is not None:
+            metadata_cache.close()
+
+    if cancel_event.is_set():
+         print("Process cancelled during yt-dlp metadata fetching.")
+         progress_label_var.set("Process cancelled.")
+         return PIPELINE_RESULT_CANCELLED # Keluar jika dibatalkan
+
+    if urls_to_fetch and not fetched_metadata and not known_metadata:
+         progress_label_var.set("Process finished: Failed to fetch metadata for any URLs.")
+         print("Failed to fetch metadata for any URLs.")
+         progress_var.set(0)
+         return PIPELINE_RESULT_NO_SHORTS
+
+    metadata_by_url = dict(known_metadata)
+    metadata_by_url.update((item['url'], item) for item in fetched_metadata)
+    new_shorts_metadata = [metadata_by_url[url] for url in new_urls if url in metadata_by_url]
+
+    # Jika num_videos_limit diberikan, pastikan metadata list juga dibatasi
+    # (Meskipun Selenium sudah mencoba membatasi, ini double check)
+    if num_videos_limit is not None and num_videos_limit > 0:
+         new_shorts_metadata = new_shorts_metadata[:max(0, num_videos_limit - len(assigned_urls))]
+         print(f"Trimmed metadata list to {len(assigned_urls) + len(new_shorts_metadata)} based on user limit after fetching.")
+
+    # Susun rencana batch: batch dari jurnal (resume) dulu, lalu batch baru
+    # Nomor batch baru dilanjutkan setelah folder Batch_N yang sudah ada dari run sebelumnya
+    batch_plan = [
+        (batch_number, [metadata_by_url[url] for url in assigned_batches[batch_number] if url in metadata_by_url])
+        for batch_number in sorted(assigned_batches)
+    ]
+    if batch_plan and len(batch_plan[-1][1]) < BATCH_SIZE and new_shorts_metadata:
+        # Lengkapi batch terakhir yang belum penuh (misal run streaming yang terhenti di tengah batch)
+        last_batch_number, last_batch_metadata = batch_plan[-1]
+        fill_metadata = new_shorts_metadata[:BATCH_SIZE - len(last_batch_metadata)]
+        new_shorts_metadata = new_shorts_metadata[len(fill_metadata):]
+        if checkpoint is not None:
+            checkpoint.record_batch(last_batch_number, [item['url'] for item in fill_metadata])
+        last_batch_metadata.extend(fill_metadata)
+    next_batch_number = max([get_next_batch_number(main_output_directory)] + [batch_number + 1 for batch_number in assigned_batches])
+    for start_index in range(0, len(new_shorts_metadata), BATCH_SIZE):
+        batch_metadata = new_shorts_metadata[start_index:start_index + BATCH_SIZE]
+        if checkpoint is not None:
+            checkpoint.record_batch(next_batch_number, [item['url'] for item in batch_metadata])
+        batch_plan.append((next_batch_number, batch_metadata))
+        next_batch_number += 1
+    if checkpoint is not None:
+        checkpoint.sync() # Rencana batch tersimpan permanen sebelum download dimulai
+
+    all_shorts_metadata = [item for batch_number, batch_metadata in batch_plan for item in batch_metadata]
+    total_videos_to_process = len(all_shorts_metadata)
+    if total_videos_to_process == 0:
+         progress_label_var.set("Process finished: No Shorts found after metadata check/filtering.")
+         print("No Shorts found after metadata check/filtering.")
+         progress_var.set(0)
+         return PIPELINE_RESULT_NO_SHORTS
+
+    # Inisialisasi daftar status global untuk semua video yang akan diproses
+    # Status awal adalah 'No' (belum didownload/error), atau status terakhir dari jurnal saat resume
+    for item in all_shorts_metadata:
+        status_store.add(item['url'], item['title'], known_statuses.get(item['url'], 'No'))
+    print(f"Initialized global download status for {len(status_store)} videos.")
+    # Master status ditulis berkala di background; penulisan akhir dipicu setelah proses selesai
+    start_master_status_compactor(status_store, main_output_directory, channel_url, settings['export_format'], checkpoint)
+    finished_statuses = {record.url for record in status_store if record.status in CHECKPOINT_DONE_STATUSES}
+    if finished_statuses:
+        print(f"Resuming from checkpoint: {len(finished_statuses)} videos already finished, continuing with the rest.")
+
+
+    num_batches = len(batch_plan) # Jumlah batch
+    last_batch_number = batch_plan[-1][0]
+
+    progress_label_var.set(f"Step 2/4 finished. Ready to process {total_videos_to_process} videos in {num_batches} batches.")
+    print(f"Ready to process {total_videos_to_process} videos in {num_batches} batches.")
+
+    # Satu sesi download untuk semua batch: pool downloader in-process dan penjadwal laju dipakai ulang,
+    # sehingga jarak antar download tetap terjaga di batas batch
+    download_session = create_download_session(settings, status_store, cancel_event, request_scheduler, download_archive, checkpoint, info_json_directory)
+
+    # 3. Proses per Batch (Simpan Excel & Download)
+    try:
+        for batch_number, current_batch_metadata in batch_plan:
+            if cancel_event.is_set():
+                 print("Process cancelled between batches.")
+                 progress_label_var.set("Process cancelled.")
+                 break # Keluar dari loop batch jika dibatalkan
+
+            batch_folder_name = f"Batch_{batch_number}"
+            batch_output_directory = os.path.join(main_output_directory, batch_folder_name)
+            batch_info_str = f"[Batch {batch_number}/{last_batch_number}]"
+
+            # Saat resume, video yang sudah selesai di run sebelumnya tidak didownload ulang
+            pending_batch_metadata = [item for item in current_batch_metadata if item['url'] not in finished_statuses]
+            if current_batch_metadata and not pending_batch_metadata:
+                print(f"{batch_info_str} All videos in this batch were already finished. Skipping.")
+                continue
+
+            progress_label_var.set(f"{batch_info_str} Step 3/4: Processing batch with {len(current_batch_metadata)} videos...")
+            print(f"{batch_info_str} Processing batch with {len(current_batch_metadata)} videos...")
+
+            # Buat subfolder untuk batch ini
+            try:
+                os.makedirs(batch_output_directory, exist_ok=True)
+                print(f"{batch_info_str} Created batch directory: {batch_output_directory}")
+            except Exception as e:
+                error_msg = f"{batch_info_str} Error creating batch directory {batch_output_directory}: {e}"
+                print(error_msg)
+                progress_label_var.set(error_msg)
+                show_error("Directory Error", error_msg)
+                continue # Lanjutkan ke batch berikutnya jika pembuatan folder gagal
+
+            # 3a. Simpan Metadata Batch (Excel/CSV/JSONL/Parquet) di dalam subfolder batch
+            metadata_filename = f"shorts_metadata_batch_{batch_number}.{settings['export_format']}"
+            metadata_filepath = os.path.join(batch_output_directory, metadata_filename)
+
+            progress_label_var.set(f"{batch_info_str} Step 3/4: Saving metadata to {metadata_filename}...")
+            print(f"{batch_info_str} Saving metadata to {metadata_filename}...")
+            save_metadata_to_file(current_batch_metadata, metadata_filepath, settings['export_format'])
+            # Status berhasil/gagal disimpan di dalam fungsi save_metadata_to_file
+
+            # 3b. Mulai Proses Download Video untuk batch ini
+            if pending_batch_metadata: # Cek jika ada metadata untuk batch ini
+                 # Status download per video diupdate di dalam download_videos_from_links
+                 failed_urls_this_batch = download_videos_from_links(
+                     pending_batch_metadata, # Pass metadata list
+                     batch_output_directory,
+                     selected_format_string,
+                     retries,
+                     download_delay_seconds,
+                     proxy_address if proxy_address else None, # Use the same proxy for download
+                     status_store, # Pass reference to this run's status store
+                     progress_var,
+                     progress_label_var,
+                     batch_info=batch_info_str,
+                     max_workers=settings['download_workers'],
+                     download_session=download_session
+                 )
+
+                 # --- Simpan URL yang Gagal ke File Error ---
+                 if failed_urls_this_batch:
+                     progress_label_var.set(f"{batch_info_str} Saving failed URLs to error file...")
+                     print(f"{batch_info_str} Saving {len(failed_urls_this_batch)} failed URLs...")
+                     save_failed_urls_to_file(failed_urls_this_batch, main_output_directory, batch_number)
+                 # --- End Simpan URL yang Gagal ---
+
+            else:
+                 progress_label_var.set(f"{batch_info_str} Step 4/4: No valid videos to download in this batch.")
+                 print(f"{batch_info_str} No valid videos to download in this batch.")
+                 progress_var.set(0) # Reset progress for this batch
+
+            if checkpoint is not None:
+                checkpoint.sync() # Status download batch ini tersimpan permanen
+
+            # Jika dibatalkan saat download batch, keluar dari loop batch
+            if cancel_event.is_set():
+                print("Process cancelled during batch download.")
+                progress_label_var.set("Process cancelled.")
+                break
+
+    finally:
+        download_session.close() # Juga saat error di tengah batch, agar pool downloader tidak bocor
+
+    # Setelah semua batch selesai atau dibatalkan
+    if not cancel_event.is_set():
+        final_status = f"Process finished. Successfully processed {total_videos_to_process} videos in {num_batches} batches."
+        progress_label_var.set(final_status)
+        print(final_status)
+        progress_var.set(100) # Pastikan progress bar penuh di akhir
+
+        print(f"Download status summary: {status_store.summary()}")
+        if checkpoint is not None:
+            checkpoint.record_complete()
+        return PIPELINE_RESULT_COMPLETED
+
+    # Jika dibatalkan, status sudah diupdate di dalam loop; jurnal checkpoint tetap bisa dilanjutkan (resume)
+    return PIPELINE_RESULT_CANCELLED
+
+
+def run_streaming_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store=None, checkpoint=None):
+    """
+    Menjalankan pipeline streaming: discovery URL, pengambilan metadata, dan download berjalan
+    bersamaan sebagai tahap-tahap yang dihubungkan queue terbatas (dengan backpressure).
+    Download video pertama dimulai segera setelah tile pertama ditemukan dan metadatanya selesai.
+    Folder batch, file Excel batch, error.txt, dan master status tetap sama seperti pipeline bertahap.
+
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+        progress_var (tk.IntVar): Variabel Tkinter untuk progress bar.
+        progress_label_var (tk.StringVar): Variabel Tkinter untuk label status.
+        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        status_store (StatusStore or None): Penyimpanan status yang diisi run ini (None = buat baru).
+            Antrian multi-channel memberi setiap channel store sendiri.
+        checkpoint (PipelineCheckpoint or None): Jurnal checkpoint yang dibuka (dan ditutup) oleh run_pipeline.
 
     Returns:
-        list: Daftar URL video yang gagal didownload dalam batch ini.
+        str: Hasil run (salah satu PIPELINE_RESULT_*).
     """
-    global current_subprocess # Deklarasikan untuk memodifikasi variabel global
+    global all_videos_download_status # Deklarasikan untuk memodifikasi variabel global
+    if status_store is None:
+        status_store = StatusStore() # Status baru untuk setiap proses
+    all_videos_download_status = status_store # Status run terakhir (dibaca GUI/CLI setelah run selesai)
+
+    channel_url = settings['channel_url']
+    num_videos_limit = settings['num_videos_limit']
+    main_output_directory = settings['main_output_directory']
+    proxy_address = settings['proxy']
+    metadata_workers = max(1, settings['metadata_workers'])
+
+    # Master status ditulis berkala di background; penulisan akhir dipicu setelah proses selesai
+    start_master_status_compactor(status_store, main_output_directory, channel_url, settings['export_format'], checkpoint)
+
+    url_queue = queue.Queue(maxsize=STREAMING_QUEUE_SIZE) # Step 1 -> Step 2
+    metadata_queue = queue.Queue(maxsize=STREAMING_QUEUE_SIZE) # Step 2 -> Step 3/4
+    counters = {'discovered': 0, 'archived': 0, 'metadata': 0, 'downloaded': 0, 'failed': 0, 'skipped': 0}
+    download_archive = open_download_archive(settings)
+    page_metadata = create_page_metadata(settings) # Diisi tahap discovery sebelum URL masuk url_queue (mode metadata DOM)
+    request_scheduler = create_request_scheduler(settings) # Satu anggaran request untuk tahap metadata dan download
+    info_json_directory = open_info_json_directory(settings) # Info dict tahap metadata untuk download (mode single-pass)
+
+    def report(stage_text):
+        """Update label status dengan ringkasan semua tahap."""
+        progress_label_var.set(
+            f"[Streaming] {stage_text} | Found: {counters['discovered']}, "
+            f"metadata: {counters['metadata']}, downloaded: {counters['downloaded']}, failed: {counters['failed']}"
+        )
 
-    total_videos = len(metadata_list)
-    failed_links_in_batch = [] # List untuk menyimpan URL yang gagal dalam batch ini
+    # --- Tahap 1: Discovery URL ---
+    def discovery_stage():
+        def on_new_urls(new_urls):
+            for url in new_urls:
+                if num_videos_limit is not None and num_videos_limit > 0 and counters['discovered'] >= num_videos_limit:
+                    return
+                # Video yang sudah didownload di run sebelumnya tidak perlu diambil metadatanya
+                if download_archive is not None and download_archive.contains(extract_video_id_from_shorts_url(url)):
+                    counters['archived'] += 1
+                    continue
+                # put_until_cancelled memblokir jika queue penuh, sehingga scrolling ikut menunggu (backpressure)
+                if not put_until_cancelled(url_queue, url, cancel_event):
+                    return
+                counters['discovered'] += 1
+                if checkpoint is not None:
+                    checkpoint.record_urls([url])
+        try:
+            discover_shorts_urls(settings, NullProgressVar(), cancel_event, on_new_urls=on_new_urls,
+                                 known_video_ids=download_archive.snapshot() if download_archive is not None else None,
+                                 page_metadata=page_metadata)
+            if checkpoint is not None and not cancel_event.is_set():
+                checkpoint.record_discovery_complete()
+        except Exception as e:
+            print(f"An unexpected error occurred during streaming discovery: {e}")
+        finally:
+            put_until_cancelled(url_queue, STREAM_END, cancel_event)
+            print(f"[Streaming] Discovery finished. Found {counters['discovered']} new Shorts URLs ({counters['archived']} already downloaded).")
+
+    # --- Tahap 2: Metadata (concurrent, tetapi diteruskan sesuai urutan discovery) ---
+    def metadata_stage():
+        metadata_cache = open_metadata_cache(settings)
+        fetcher = MetadataFetcher(proxy_address, metadata_workers, request_scheduler, metadata_cache, page_metadata,
+                                  settings['metadata_source'] != METADATA_SOURCES["DOM Harvest (Title/Views, Skip Step 2)"],
+                                  settings['metadata_profile'], info_json_directory)
+        executor = ThreadPoolExecutor(max_workers=metadata_workers, thread_name_prefix="metadata")
+        in_flight = deque() # (url, future) sesuai urutan discovery
+        discovery_done = False
+        try:
+            while not cancel_event.is_set():
+                # Ambil URL baru selama masih ada slot in-flight
+                if not discovery_done and len(in_flight) < metadata_workers * 2:
+                    try:
+                        url = url_queue.get(timeout=STREAMING_POLL_INTERVAL if not in_flight else 0.01)
+                        if url is STREAM_END:
+                            discovery_done = True
+                        else:
+                            in_flight.append((url, executor.submit(fetcher.fetch, url, cancel_event)))
+                        continue
+                    except queue.Empty:
+                        pass
+                if in_flight and in_flight[0][1].done():
+                    url, future = in_flight.popleft()
+                    try:
+                        metadata = future.result()
+                    except Exception as e:
+                        print(f"An error occurred fetching metadata for {url}: {e}")
+                        metadata = None
+                    if metadata is None:
+                        print(f"Failed to fetch metadata for {url}. Skipping download.")
+                        continue
+                    counters['metadata'] += 1
+                    if checkpoint is not None:
+                        checkpoint.record_metadata(metadata)
+                    if not put_until_cancelled(metadata_queue, metadata, cancel_event):
+                        break
+                    continue
+                if discovery_done and not in_flight:
+                    break
+                if in_flight:
+                    wait_futures([in_flight[0][1]], timeout=STREAMING_POLL_INTERVAL)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            fetcher.close()
+            fetch_summary = fetcher.summary()
+            if metadata_cache is not None:
+                metadata_cache.close()
+            put_until_cancelled(metadata_queue, STREAM_END, cancel_event)
+            print(f"[Streaming] Metadata finished for {counters['metadata']} videos. {fetch_summary or ''}".rstrip())
+
+    discovery_thread = Thread(target=discovery_stage, name="streaming-discovery", daemon=True)
+    metadata_thread = Thread(target=metadata_stage, name="streaming-metadata", daemon=True)
+    discovery_thread.start()
+    metadata_thread.start()
+
+    # --- Tahap 3/4: Batch (Excel) & Download, dijalankan di thread proses ini ---
+    # Download dikerjakan oleh worker pool; paling banyak download_workers video berjalan bersamaan
+    download_workers = max(1, settings['download_workers'])
+    download_executor = ThreadPoolExecutor(max_workers=download_workers, thread_name_prefix="download")
+    download_lock = Lock() # Melindungi counters download dan daftar gagal batch
+    position = 0
+    batch_number = get_next_batch_number(main_output_directory) - 1 # Lanjutkan setelah folder Batch_N yang sudah ada
+    first_batch_number = batch_number + 1
+    batch_metadata = []
+    batch_failed_urls = []
+    batch_futures = []
+    batch_output_directory = None
+
+    # Satu sesi download untuk seluruh tahap: pool downloader, penjadwal laju (menggantikan jeda tetap
+    # antar download), dan deteksi yt-dlp yang tidak terpasang dipakai bersama oleh semua worker
+    download_session = create_download_session(settings, status_store, cancel_event, request_scheduler, download_archive, checkpoint, info_json_directory)
+
+    def download_stage_video(video_metadata, output_directory, batch_info_str, failed_urls_list):
+        """Mendownload satu video (dijalankan di worker pool) dan memperbarui counter secara thread-safe."""
+        # Label status per video tidak ditampilkan; report() menampilkan ringkasan semua tahap
+        failed = download_session.download(video_metadata, output_directory, NullProgressVar(), batch_info_str)
+        if download_session.yt_dlp_missing.is_set():
+            # Sisa video langsung ditandai gagal oleh sesi; error hanya ditampilkan sekali
+            download_session.report_yt_dlp_missing(progress_label_var)
+        with download_lock:
+            if failed:
+                failed_urls_list.append(video_metadata['url'].strip())
+                counters['failed'] += 1
+            else:
+                counters['downloaded'] += 1
+            finished = counters['downloaded'] + counters['failed']
+            expected_total = num_videos_limit if num_videos_limit else max(counters['discovered'], position)
+        progress_var.set(int((finished / expected_total) * 100) if expected_total else 0)
+
+    def finish_batch():
+        """Menunggu download batch yang sedang berjalan selesai, lalu menyimpan Excel dan error.txt-nya."""
+        if not batch_metadata:
+            return
+        wait_futures(batch_futures)
+        metadata_filepath = os.path.join(batch_output_directory, f"shorts_metadata_batch_{batch_number}.{settings['export_format']}")
+        print(f"[Batch {batch_number}] Saving metadata to {os.path.basename(metadata_filepath)}...")
+        save_metadata_to_file(batch_metadata, metadata_filepath, settings['export_format'])
+        if batch_failed_urls:
+            print(f"[Batch {batch_number}] Saving {len(batch_failed_urls)} failed URLs...")
+            save_failed_urls_to_file(batch_failed_urls, main_output_directory, batch_number)
+        if checkpoint is not None:
+            checkpoint.sync() # Isi dan status batch ini tersimpan permanen (bukan fsync per video)
 
-    if total_videos == 0:
-        progress_label_var.set(f"{batch_info} Step 4/4: No videos to download in this batch.")
+    try:
+        report("Starting browser/discovery...")
+        while not cancel_event.is_set():
+            try:
+                video_metadata = metadata_queue.get(timeout=STREAMING_POLL_INTERVAL)
+            except queue.Empty:
+                report("Waiting for next video...")
+                continue
+            if video_metadata is STREAM_END:
+                break
+
+            # Mulai batch baru setiap BATCH_SIZE video
+            if position % BATCH_SIZE == 0:
+                finish_batch()
+                batch_number += 1
+                batch_metadata = []
+                batch_failed_urls = []
+                batch_futures = []
+                batch_output_directory = os.path.join(main_output_directory, f"Batch_{batch_number}")
+                try:
+                    os.makedirs(batch_output_directory, exist_ok=True)
+                    print(f"[Batch {batch_number}] Created batch directory: {batch_output_directory}")
+                except Exception as e:
+                    error_msg = f"[Batch {batch_number}] Error creating batch directory {batch_output_directory}: {e}"
+                    print(error_msg)
+                    progress_label_var.set(error_msg)
+                    show_error("Directory Error", error_msg)
+                    # Seperti pipeline bertahap: batch ini dilewati dan batch berikutnya dicoba lagi. cancel_event tidak
+                    # di-set karena event itu dipakai bersama oleh semua channel di antrian
+                    batch_output_directory = None
+
+            if batch_output_directory is None:
+                # Video di batch tanpa folder tidak didownload (status tetap 'No'; resume akan mencobanya lagi)
+                position += 1
+                counters['skipped'] += 1
+                status_store.add(video_metadata['url'], video_metadata['title'])
+                if checkpoint is not None:
+                    checkpoint.record_batch(batch_number, [video_metadata['url']])
+                continue
+
+            # Backpressure: tunggu slot worker download kosong sebelum memulai video berikutnya
+            while not cancel_event.is_set() and sum(1 for future in batch_futures if not future.done()) >= download_workers:
+                wait_futures(batch_futures, timeout=STREAMING_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            if cancel_event.is_set():
+                break
+
+            position += 1
+            batch_metadata.append(video_metadata)
+            status_store.add(video_metadata['url'], video_metadata['title'])
+            if checkpoint is not None:
+                checkpoint.record_batch(batch_number, [video_metadata['url']])
+            batch_info_str = f"[Batch {batch_number}, video {position}]"
+            report(f"{batch_info_str} Downloading...")
+            batch_futures.append(download_executor.submit(download_stage_video, video_metadata, batch_output_directory, batch_info_str, batch_failed_urls))
+
+        # Simpan batch terakhir (juga saat dibatalkan, agar Excel sesuai video yang sudah diproses)
+        finish_batch()
+    finally:
+        # Juga saat error di loop konsumen: tunggu download yang berjalan, lalu tutup pool downloader
+        download_executor.shutdown(wait=True)
+        download_session.close()
+    discovery_thread.join()
+    metadata_thread.join()
+
+    if cancel_event.is_set():
+        print("Streaming process cancelled.")
+        progress_label_var.set("Process cancelled.")
+        return PIPELINE_RESULT_CANCELLED
+
+    if position == 0:
+        if counters['archived']:
+            progress_label_var.set("Process finished: All discovered Shorts were already downloaded.")
+            print(f"All {counters['archived']} discovered Shorts were already downloaded. Nothing new to process.")
+            progress_var.set(100)
+            if checkpoint is not None:
+                checkpoint.record_complete()
+            return PIPELINE_RESULT_UP_TO_DATE
+        progress_label_var.set("Process finished: No Shorts found (streaming).")
+        print("No Shorts found (streaming).")
         progress_var.set(0)
-        return failed_links_in_batch # Kembalikan list kosong
-
-    print(f"{batch_info} Step 4/4: Starting download of {total_videos} videos into {output_path}...")
+        return PIPELINE_RESULT_NO_SHORTS
 
-    for index, video_metadata in enumerate(metadata_list, start=1):
-        # --- Cek Pembatalan Sebelum Memulai Download Video Berikutnya ---
-        if cancel_event and cancel_event.is_set():
-            print(f"{batch_info} Download cancelled by user.")
-            progress_label_var.set(f"{batch_info} Download cancelled.")
-            break # Keluar dari loop download jika dibatalkan
-        # --- End Cek Pembatalan ---
+    final_status = f"Process finished. Successfully processed {position} videos in {batch_number - first_batch_number + 1} batches (streaming)."
+    if counters['skipped']:
+        final_status += f" {counters['skipped']} videos were skipped because their batch folder could not be created."
+    progress_label_var.set(final_status)
+    print(final_status)
+    progress_var.set(100)
 
-        link = video_metadata['url'].strip() # Ambil URL dari metadata
-        # Update label status sebelum memulai download
-        progress_label_var.set(f"{batch_info} Step 4/4: Downloading video {index}/{total_videos}...")
+    print(f"Download status summary: {status_store.summary()}")
+    if checkpoint is not None:
+        checkpoint.record_complete()
+    return PIPELINE_RESULT_COMPLETED
 
-        # Cari entri video ini di daftar status global untuk diperbarui
-        # Asumsi URL adalah unique identifier
-        video_status_entry = next((item for item in global_status_list if item['url'] == link), None)
-        if video_status_entry is None:
-            # Ini seharusnya tidak terjadi jika alur data benar, tapi sebagai fallback
-            print(f"Warning: Video URL {link} not found in global status list. Adding it.")
-            video_status_entry = {'url': link, 'title': video_metadata.get('title', 'Untitled'), 'status': 'No'}
-            global_status_list.append(video_status_entry)
+def run_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store=None):
+    """
+    Menjalankan pipeline sesuai mode yang dipilih (bertahap atau streaming). Dipakai oleh GUI dan CLI.
 
+    Args:
+        settings (dict): Konfigurasi proses (lihat PIPELINE_SETTINGS_KEYS).
+        progress_var: Variabel progress bar (tk.IntVar, atau objek lain dengan set()/get()).
+        progress_label_var: Variabel label status (tk.StringVar, atau objek lain dengan set()/get()).
+        cancel_event (threading.Event): Event untuk memeriksa apakah proses dibatalkan.
+        status_store (StatusStore or None): Penyimpanan status yang diisi run ini (None = buat baru).
+            Antrian multi-channel memberi setiap channel store sendiri.
 
-        try:
-            # Menjalankan yt-dlp sebagai subprocess menggunakan Popen untuk control
-            command = [
-                'yt-dlp',
-                '--quiet',
-                '--no-part', # Opsional: jangan gunakan file .part
-                '--retries', str(retries), # Menggunakan nilai retries dari input GUI
-                '--output', os.path.join(output_path, '%(title)s.%(ext)s'),
-                '--format', format_string, # Menggunakan nilai format dari input GUI
-                '--no-warnings', # Suppress yt-dlp warnings in console output
-            ]
-
-            # Tambahkan opsi proxy jika disediakan
-            if proxy:
-                command.extend(['--proxy', proxy])
-
-            # Tambahkan link video terakhir
-            command.append(link)
-
-            # print(f"Executing download command: {' '.join(command)}") # Debugging: tampilkan perintah lengkap
-
-            current_subprocess = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE, # Tangkap output standar
-                stderr=subprocess.PIPE, # Tangkap error standar
-                text=True # Menggunakan teks untuk output yang ditangkap
-            )
+    Returns:
+        str: Hasil run (salah satu PIPELINE_RESULT_*).
+    """
+    # Master status run sebelumnya di folder ini dibaca dari jurnalnya; tunggu sampai selesai ditulis
+    # sebelum jurnal diganti oleh run ini
+    finish_master_status_compactor(wait=True, output_directory=settings['main_output_directory'])
+    # Jurnal checkpoint: satu file handle untuk seluruh run, ditutup (dengan fsync terakhir) di akhir,
+    # juga saat dibatalkan atau error
+    checkpoint = open_pipeline_checkpoint(settings)
+    try:
+        streaming = settings['pipeline_mode'] == PIPELINE_MODES["Streaming (Download While Scanning)"]
+        if streaming and checkpoint is not None and checkpoint.resume_state is not None:
+            # Resume dijalankan lewat pipeline bertahap, yang memakai ulang URL, metadata, dan pembagian batch
+            # yang sudah tercatat
+            print("Resuming from checkpoint using the staged pipeline.")
+            streaming = False
+        if streaming:
+            return run_streaming_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store, checkpoint)
+        return run_staged_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store, checkpoint)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
 
-            # Tunggu subprocess selesai. Menggunakan communicate() dengan timeout=None
-            # adalah cara sederhana untuk menunggu tanpa polling manual yang kompleks.
-            # Pembatalan ditangani oleh on_cancel_button_click yang me-kill subprocess.
-            try:
-                stdout, stderr = current_subprocess.communicate(timeout=None) # Tunggu tanpa timeout
-                return_code = current_subprocess.returncode
-            except subprocess.TimeoutExpired:
-                 # Ini seharusnya tidak terjadi dengan timeout=None, tapi tetap jaga
-                print(f"{batch_info} yt-dlp process for {link} timed out.")
-                current_subprocess.kill() # Paksa hentikan jika timeout
-                stdout, stderr = current_subprocess.communicate()
-                return_code = current_subprocess.returncode # Akan jadi non-zero
-
-            current_subprocess = None # Reset variabel global
-
-            if cancel_event and cancel_event.is_set():
-                 # Jika dibatalkan, proses sudah dihentikan di on_cancel_button_click
-                 print(f"{batch_info} Download of {link} was terminated.")
-                 progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} cancelled.")
-                 # Status di global_status_list tetap 'No' atau 'Error' jika sudah di-set sebelumnya
-                 break # Keluar dari loop download
+def request_cancellation():
+    """
+    Memberi sinyal pembatalan ke semua tahap pipeline dan menghentikan subprocess yt-dlp serta
+    WebDriver Selenium yang sedang berjalan. Dipakai oleh tombol Cancel (GUI) dan Ctrl+C (CLI).
+    """
+    cancel_event.set() # Set event untuk memberi sinyal pembatalan
 
-            if return_code != 0:
-                # Jika yt-dlp mengembalikan kode error non-zero (dan tidak dibatalkan)
-                error_msg = f"yt-dlp failed for {link} (code {return_code}): {stderr.strip() if stderr else 'No error message'}"
-                print(error_msg)
-                # Cek apakah error terkait sign-in/cookies (Pesan ini tetap relevan meskipun tanpa cookies)
-                if "Sign in to confirm you’re not a bot" in stderr or "confirm you're not a robot" in stderr or "Private video" in stderr or "Age-restricted video" in stderr:
-                    print(f"{batch_info} Download failed for {link} due to potential access restriction (sign-in/bot/age/private).")
-                    progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} failed (Access Denied).")
-                    video_status_entry['status'] = 'Error (Access Denied)' # Update status global
-                else:
-                    progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} failed.") # Pesan lebih ringkas
-                    video_status_entry['status'] = 'Error' # Update status global
-                # --- Tambahkan URL ke daftar gagal ---
-                failed_links_in_batch.append(link)
-                # --- End Tambahkan URL ---
-                # --- Lanjutkan ke video berikutnya meskipun gagal ---
-                pass
-                # --- End Lanjutkan ---
-            else:
-                # Update label status setelah berhasil
-                progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} downloaded.") # Pesan lebih ringkas
-                print(f"{batch_info} Successfully downloaded: {link}") # Debugging/Informasi
-                video_status_entry['status'] = 'Downloaded' # Update status global
-
-        except FileNotFoundError:
-             error_msg = "Error: yt-dlp command not found. Make sure yt-dlp is installed and in your system's PATH."
-             print(error_msg)
-             progress_label_var.set(error_msg)
-             messagebox.showerror("Error", error_msg) # Tampilkan pesan error di GUI
-             # Hentikan proses download jika yt-dlp tidak ditemukan
-             # --- Tambahkan sisa link di batch ke daftar gagal karena proses terhenti ---
-             # Ambil URL dari sisa metadata_list
-             remaining_urls = [item['url'] for item in metadata_list[index-1:]]
-             failed_links_in_batch.extend(remaining_urls)
-             # Update status untuk sisa video yang tidak diproses di batch ini
-             for remaining_video_metadata in metadata_list[index-1:]:
-                 remaining_link = remaining_video_metadata['url']
-                 entry_to_update = next((item for item in global_status_list if item['url'] == remaining_link), None)
-                 if entry_to_update and entry_to_update['status'] == 'No': # Hanya update jika belum diproses
-                     entry_to_update['status'] = 'Error (yt-dlp not found)'
-             # --- End Tambahkan sisa link ---
-             break # Keluar dari loop download untuk batch ini
+    # Coba terminasi semua subprocess yt-dlp yang sedang berjalan (satu per worker download)
+    # Download in-process berhenti sendiri melalui progress hook yang memeriksa cancel_event
+    with active_subprocesses_lock:
+        running_subprocesses = [process for process in active_subprocesses if process.poll() is None]
+    if running_subprocesses:
+        print(f"Attempting to terminate {len(running_subprocesses)} running yt-dlp subprocess(es)...")
+    for process in running_subprocesses:
+        try:
+            process.kill() # Kirim sinyal kill (lebih paksa)
         except Exception as e:
-            error_msg = f"An unexpected error occurred while downloading {link}: {e}"
-            print(error_msg)
-            progress_label_var.set(f"{batch_info} Step 4/4: Video {index}/{total_videos} failed.") # Pesan lebih ringkas
-            video_status_entry['status'] = 'Error (Unexpected)' # Update status global
-            # --- Tambahkan URL ke daftar gagal ---
-            failed_links_in_batch.append(link)
-            # --- End Tambahkan URL ---
-            # --- Lanjutkan ke video berikutnya meskipun gagal ---
-            pass
-            # --- End Lanjutkan ---
-        finally:
-            # Update progress bar setelah setiap video (berhasil atau gagal/dibatalkan)
-            # Progress bar ini menunjukkan progress DALAM batch saat ini
-            # Jika dibatalkan, progress bar mungkin tidak mencapai 100% untuk batch ini
-            progress_var.set(int((index / total_videos) * 100))
-
-            # --- Tambahkan Jeda Antar Download ---
-            # Jeda hanya jika bukan video terakhir dalam batch dan proses belum dibatalkan
-            if index < total_videos and not (cancel_event and cancel_event.is_set()):
-                print(f"Waiting for {download_delay_seconds} seconds before next download...")
-                time.sleep(download_delay_seconds)
-            # --- End Tambahkan Jeda ---
+            print(f"Error terminating yt-dlp subprocess: {e}")
+    if running_subprocesses:
+        print("yt-dlp subprocesses terminated.")
 
+    # Coba terminasi semua Selenium WebDriver yang sedang berjalan (satu per channel yang sedang di-scrape)
+    with active_drivers_lock:
+        running_drivers = list(active_drivers)
+        active_drivers.clear()
+    if running_drivers:
+        print(f"Attempting to quit {len(running_drivers)} running Selenium WebDriver(s)...")
+    for driver in running_drivers:
+        quit_webdriver(driver)
+    if running_drivers:
+        print("Selenium WebDriver quit.")
 
-    # Setelah loop selesai untuk batch ini (baik selesai semua, ada yang gagal, atau dibatalkan)
-    if not (cancel_event and cancel_event.is_set()):
-        batch_finish_status = f"{batch_info} Step 4/4: Finished processing videos for this batch."
-        progress_label_var.set(batch_finish_status)
-        print(batch_finish_status) # Debugging/Informasi
-        # progress_var.set(100) # Opsional: Pastikan progress bar penuh di akhir batch jika tidak dibatalkan
 
-    return failed_links_in_batch # Kembalikan daftar URL yang gagal
+# --- Antrian Job Multi-Channel ---
 
+def parse_channel_urls(lines):
+    """
+    Mengambil URL channel dari baris-baris teks (isi entry GUI atau file daftar channel).
+    Baris kosong dan komentar '#' diabaikan; satu baris boleh berisi beberapa URL yang dipisah spasi atau koma.
 
-# --- Fungsi Penyimpanan Metadata dan Error ---
+    Args:
+        lines (iterable): Baris-baris teks.
 
-def save_metadata_to_excel(metadata_list, output_filepath):
+    Returns:
+        list: Daftar URL channel (urutan dipertahankan, duplikat dibuang).
     """
-    Menyimpan daftar metadata Shorts ke dalam file Excel di lokasi spesifik.
+    channel_urls = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        channel_urls.extend(url for url in re.split(r'[\s,]+', line) if url)
+    return list(dict.fromkeys(channel_urls))
+
+def read_channel_urls_file(filepath):
+    """
+    Membaca file daftar channel (satu URL per baris). Error baca diteruskan ke pemanggil.
 
     Args:
-        metadata_list (list): Daftar dictionary berisi metadata Shorts untuk batch ini.
-        output_filepath (str): Path lengkap file Excel yang akan disimpan (termasuk nama file).
+        filepath (str): Path file teks.
 
     Returns:
-        bool: True jika berhasil menyimpan, False jika gagal.
+        list: Daftar URL channel (lihat parse_channel_urls).
     """
-    if not metadata_list:
-        print(f"No metadata to save to Excel file: {output_filepath}")
-        return False
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return parse_channel_urls(f)
 
-    try:
-        # Buat DataFrame pandas dari list metadata
-        df = pd.DataFrame(metadata_list)
 
-        # Urutkan kolom sesuai keinginan
-        df = df[['url', 'title', 'description']]
+class ForwardingProgressVar:
+    """Pengganti tk.IntVar/tk.StringVar yang meneruskan setiap nilai ke callback (misal ke progress gabungan antrian)."""
 
-        # Ganti nama kolom agar lebih user-friendly di Excel
-        df.rename(columns={'url': 'Link URL', 'title': 'Title', 'description': 'Description'}, inplace=True)
+    def __init__(self, on_set):
+        """
+        Args:
+            on_set (callable): Callback on_set(value) untuk setiap nilai baru.
+        """
+        self.on_set = on_set
+        self.value = None
 
-        # Simpan DataFrame ke file Excel
-        df.to_excel(output_filepath, index=False) # index=False agar tidak menyimpan index DataFrame
+    def set(self, value):
+        self.value = value
+        self.on_set(value)
 
-        print(f"Successfully saved metadata to {output_filepath}")
-        return True
-    except Exception as e:
-        print(f"Error saving metadata to Excel file {output_filepath}: {e}")
-        return False
+    def get(self):
+        return self.value
 
-def save_failed_urls_to_file(failed_urls, output_directory, batch_number):
-    """
-    Menyimpan daftar URL yang gagal ke file error.txt di subfolder error batch.
 
-    Args:
-        failed_urls (list): Daftar string URL yang gagal.
-        output_directory (str): Path direktori utama tempat folder error akan dibuat.
-        batch_number (int): Nomor batch.
-    """
-    if not failed_urls:
-        print(f"No failed URLs to save for Batch {batch_number}.")
-        return
+class ChannelJob:
+    """Satu channel di ChannelJobQueue beserta settings, status download, dan hasil run-nya."""
 
-    # Buat path untuk folder error utama dan subfolder error batch
-    error_main_folder = os.path.join(output_directory, ERROR_FOLDER_NAME)
-    error_batch_folder = os.path.join(error_main_folder, f"Batch_{batch_number}_Errors")
-    error_filepath = os.path.join(error_batch_folder, "error.txt")
+    __slots__ = ('index', 'label', 'settings', 'status_store', 'outcome', 'progress', 'finished')
 
-    try:
-        # Buat folder error jika belum ada
-        os.makedirs(error_batch_folder, exist_ok=True)
-        print(f"Created error directory for Batch {batch_number}: {error_batch_folder}")
+    def __init__(self, index, label, settings):
+        """
+        Args:
+            index (int): Nomor urut channel di antrian (mulai dari 1).
+            label (str): Nama pendek channel untuk log dan label status.
+            settings (dict): Konfigurasi proses channel ini (lihat PIPELINE_SETTINGS_KEYS).
+        """
+        self.index = index
+        self.label = label
+        self.settings = settings
+        self.status_store = StatusStore() # Status milik channel ini saja (bukan global)
+        self.outcome = None # Salah satu PIPELINE_RESULT_*, atau None jika run error
+        self.progress = 0 # Progress terakhir channel ini (0-100)
+        self.finished = False
 
-        # Tulis URL yang gagal ke file error.txt
-        with open(error_filepath, 'w') as f:
-            for url in failed_urls:
-                f.write(url + '\n')
+    @property
+    def channel_url(self):
+        return self.settings['channel_url']
+
+    @property
+    def output_directory(self):
+        return self.settings['main_output_directory']
+
+    def failed_count(self):
+        """Jumlah video yang gagal didownload pada run channel ini."""
+        return sum(1 for record in self.status_store if record.status.startswith('Error'))
 
-        print(f"Successfully saved {len(failed_urls)} failed URLs to {error_filepath}")
-    except Exception as e:
-        print(f"Error saving failed URLs to file {error_filepath}: {e}")
 
-def save_master_status_to_excel(status_list, output_directory, channel_name="channel"):
+class ChannelJobQueue:
+    """
+    Antrian job multi-channel. Setiap channel dijalankan dengan run_pipeline di folder output sendiri
+    (batch, arsip, checkpoint, dan master status tidak tercampur), paling banyak channel_workers channel
+    bersamaan. Discovery Selenium semua channel berbagi webdriver_pool yang dibatasi browser_slots browser,
+    download semua channel berbagi download_workers slot download, dan metadata serta download semua channel
+    berbagi satu penjadwal laju request, sehingga throughput total dan laju request ke YouTube mengikuti
+    konfigurasi, bukan jumlah channel yang berjalan bersamaan. Dengan satu channel, folder output dan
+    label status sama persis seperti run biasa.
     """
-    Menyimpan daftar status download semua video ke dalam file Excel utama.
 
-    Args:
-        status_list (list): Daftar dictionary berisi status setiap video.
-        output_directory (str): Path direktori utama tempat file Excel akan disimpan.
-        channel_name (str): Nama channel, digunakan untuk nama file.
-    Returns:
-        bool: True jika berhasil menyimpan, False jika gagal.
+    def __init__(self, base_settings, channel_urls, progress_var, progress_label_var, cancel_event,
+                 channel_workers=DEFAULT_CHANNEL_WORKERS, browser_slots=DEFAULT_BROWSER_SLOTS):
+        """
+        Args:
+            base_settings (dict): Konfigurasi proses bersama (lihat PIPELINE_SETTINGS_KEYS); channel_url dan
+                main_output_directory diisi per channel. main_output_directory adalah folder induk semua channel.
+            channel_urls (list): Daftar URL channel sesuai urutan antrian.
+            progress_var: Variabel progress bar gabungan (tk.IntVar, atau objek lain dengan set()/get()).
+            progress_label_var: Variabel label status (tk.StringVar, atau objek lain dengan set()/get()).
+            cancel_event (threading.Event): Event pembatalan untuk semua channel.
+            channel_workers (int): Jumlah channel yang diproses bersamaan.
+            browser_slots (int): Jumlah maksimum browser Selenium yang berjalan bersamaan.
+        """
+        self.progress_var = progress_var
+        self.progress_label_var = progress_label_var
+        self.cancel_event = cancel_event
+        self.channel_workers = max(1, min(channel_workers, len(channel_urls)))
+        self.browser_slots = max(1, browser_slots)
+        self.download_slot_count = max(1, base_settings['download_workers'])
+        self.download_slots = BoundedSemaphore(self.download_slot_count) # Pool slot download bersama semua channel
+        self.request_scheduler = create_request_scheduler(base_settings) # Anggaran request bersama semua channel
+        self.jobs = self.build_jobs(base_settings, channel_urls)
+        self.lock = Lock() # Melindungi progress dan counter job selesai
+        self.progress_sum = 0 # Jumlah progress semua job (job selesai dihitung 100)
+        self.finished_count = 0
+
+    def build_jobs(self, base_settings, channel_urls):
+        """Membuat ChannelJob per channel, masing-masing dengan folder output sendiri jika ada lebih dari satu channel."""
+        main_output_directory = base_settings['main_output_directory']
+        used_directories = set()
+        jobs = []
+        for index, channel_url in enumerate(channel_urls, start=1):
+            label = get_channel_name_for_file(channel_url)
+            if label == "channel":
+                label = f"channel_{index}"
+            output_directory = main_output_directory
+            if len(channel_urls) > 1:
+                # Setiap channel punya folder sendiri agar batch, arsip, checkpoint, dan master status tidak tercampur
+                output_directory = os.path.join(main_output_directory, label)
+                if output_directory in used_directories:
+                    output_directory = f"{output_directory}_{index}"
+                used_directories.add(output_directory)
+            settings = dict(base_settings, channel_url=channel_url, main_output_directory=output_directory,
+                            download_slots=self.download_slots, request_scheduler=self.request_scheduler)
+            jobs.append(ChannelJob(index, label, settings))
+        return jobs
+
+    def run(self):
+        """
+        Menjalankan semua job dan kembali setelah semuanya selesai (atau dibatalkan).
+        Job yang belum dimulai saat pembatalan ditandai PIPELINE_RESULT_CANCELLED tanpa dijalankan.
+
+        Returns:
+            list: Daftar ChannelJob sesuai urutan antrian, dengan outcome dan status_store masing-masing.
+        """
+        webdriver_pool.set_max_active(self.browser_slots)
+        if len(self.jobs) > 1:
+            print(f"Processing {len(self.jobs)} channels, {self.channel_workers} at a time "
+                  f"({self.browser_slots} browser slot(s), {self.download_slot_count} shared download slot(s)).")
+        if self.channel_workers == 1:
+            for job in self.jobs:
+                self.run_job(job)
+        else:
+            with ThreadPoolExecutor(max_workers=self.channel_workers, thread_name_prefix="channel") as executor:
+                for future in [executor.submit(self.run_job, job) for job in self.jobs]:
+                    future.result()
+        if len(self.jobs) > 1:
+            outcomes = Counter(job.outcome or 'error' for job in self.jobs)
+            print(f"All channels finished: {dict(outcomes)}")
+            if not self.cancel_event.is_set():
+                self.progress_label_var.set(f"Finished {len(self.jobs)} channels: {', '.join(f'{count} {outcome}' for outcome, count in outcomes.items())}.")
+        return self.jobs
+
+    def run_job(self, job):
+        """Menjalankan pipeline satu channel (dipanggil oleh worker antrian). Error dicatat di job, tidak diteruskan."""
+        total_jobs = len(self.jobs)
+        if self.cancel_event.is_set():
+            job.outcome = PIPELINE_RESULT_CANCELLED
+            self.mark_finished(job)
+            return
+        if total_jobs > 1:
+            print(f"=== Channel {job.index}/{total_jobs}: {job.channel_url} -> {job.output_directory} ===", flush=True)
+        try:
+            os.makedirs(job.output_directory, exist_ok=True)
+            job.outcome = run_pipeline(
+                job.settings,
+                ForwardingProgressVar(lambda value: self.update_progress(job, value)),
+                ForwardingProgressVar(lambda value: self.update_status(job, value)),
+                self.cancel_event,
+                job.status_store
+            )
+        except Exception as e:
+            # Tangani error tak terduga per channel; channel lain di antrian tetap berjalan
+            error_msg = f"An unexpected error occurred during the process for {job.channel_url}: {e}"
+            print(error_msg)
+            self.update_status(job, f"Process error: {e}")
+            show_error("Process Error", error_msg)
+        finally:
+            # Tulis master status final channel ini di background (juga saat dibatalkan atau error)
+            finish_master_status_compactor(output_directory=job.output_directory)
+            self.mark_finished(job)
+            if total_jobs > 1:
+                print(f"=== Channel {job.index}/{total_jobs} finished: {job.outcome or 'error'} ===", flush=True)
+
+    def update_progress(self, job, value):
+        """Memperbarui progress satu channel dan meneruskan progress gabungan semua channel."""
+        with self.lock:
+            if job.finished:
+                return
+            value = value or 0
+            self.progress_sum += value - job.progress
+            job.progress = value
+            overall_progress = int(self.progress_sum / len(self.jobs))
+        self.progress_var.set(overall_progress)
+
+    def update_status(self, job, value):
+        """Meneruskan status satu channel ke label status, diberi awalan channel jika ada lebih dari satu channel."""
+        if len(self.jobs) == 1:
+            self.progress_label_var.set(value)
+            return
+        self.progress_label_var.set(f"[{self.finished_count}/{len(self.jobs)} channels done] [{job.label}] {value}")
+
+    def mark_finished(self, job):
+        """Menandai job selesai (progress channel dihitung 100%, kecuali channel yang dibatalkan)."""
+        with self.lock:
+            if job.finished:
+                return
+            if len(self.jobs) > 1 and job.outcome != PIPELINE_RESULT_CANCELLED:
+                self.progress_sum += 100 - job.progress
+                job.progress = 100
+            job.finished = True
+            self.finished_count += 1
+            overall_progress = int(self.progress_sum / len(self.jobs))
+        if len(self.jobs) > 1:
+            self.progress_var.set(overall_progress)
+
+
+# --- Event Bus Progress GUI ---
+
+class QueuedProgressVar:
+    """
+    Pengganti tk.StringVar/tk.IntVar untuk worker thread: set() hanya mengirim event ke ProgressEventBus,
+    nilai diterapkan ke widget oleh main loop Tk. Aman dipanggil dari thread mana pun.
     """
-    if not status_list:
-        print("No video status data to save to master Excel file.")
-        return False
 
-    # Bersihkan nama channel untuk nama file
-    safe_channel_name = "".join(c for c in channel_name if c.isalnum() or c in (' ', '.', '_')).rstrip()
-    if not safe_channel_name:
-        safe_channel_name = "shorts_download_status"
-    else:
-        safe_channel_name = f"{safe_channel_name}_shorts_download_status"
+    def __init__(self, bus, kind):
+        self.bus = bus
+        self.kind = kind
+        self.value = None
 
-    output_filepath = os.path.join(output_directory, f"{safe_channel_name}.xlsx")
+    def set(self, value):
+        self.value = value
+        self.bus.publish(self.kind, value)
 
-    try:
-        df = pd.DataFrame(status_list)
-        df = df[['url', 'title', 'status']] # Pastikan urutan kolom
-        df.rename(columns={'url': 'Link URL', 'title': 'Title', 'status': 'D/N/E'}, inplace=True)
-        df.to_excel(output_filepath, index=False)
-        print(f"Successfully saved master download status to {output_filepath}")
-        return True
-    except Exception as e:
-        print(f"Error saving master download status to Excel file {output_filepath}: {e}")
-        return False
+    def get(self):
+        return self.value
+
+class ProgressEventBus:
+    """
+    Event bus progress antara worker thread dan GUI. Worker mengirim event (jenis, nilai) ke queue tanpa
+    menyentuh Tkinter; main loop Tk mengambil semua event setiap PROGRESS_UPDATE_INTERVAL_MS dan
+    menerapkannya. Event yang di-coalesce (progress, status) hanya diterapkan nilai terakhirnya per tick,
+    sehingga biaya UI tetap konstan berapa pun jumlah worker yang melapor.
+    """
+
+    def __init__(self):
+        self.events = queue.SimpleQueue()
+        self.handlers = {} # jenis event -> (callback di main thread, coalesce)
+
+    def bind(self, kind, callback, coalesce=True):
+        """
+        Mendaftarkan callback (dijalankan di main thread Tk) untuk satu jenis event.
+
+        Args:
+            kind (str): Jenis event, misal 'progress' atau 'status'.
+            callback (callable): Fungsi yang menerima nilai event.
+            coalesce (bool): True untuk hanya menerapkan nilai terakhir per tick; False untuk
+                menjalankan callback untuk setiap event (misal pesan error).
+        """
+        self.handlers[kind] = (callback, coalesce)
+
+    def publish(self, kind, value=None):
+        """Mengirim event dari thread mana pun."""
+        self.events.put((kind, value))
+
+    def var(self, kind):
+        """Membuat QueuedProgressVar yang mengirim event jenis ini (untuk diberikan ke fungsi pipeline)."""
+        return QueuedProgressVar(self, kind)
+
+    def start(self, tk_root, interval_ms=PROGRESS_UPDATE_INTERVAL_MS):
+        """Mulai menguras queue secara berkala di main loop Tk."""
+        def tick():
+            self.drain()
+            tk_root.after(interval_ms, tick)
+        tk_root.after(interval_ms, tick)
+
+    def drain(self):
+        """Mengambil semua event yang menunggu dan menerapkannya (harus dipanggil dari main thread Tk)."""
+        latest_values = {}
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+            callback, coalesce = self.handlers.get(kind, (None, True))
+            if callback is None:
+                continue
+            if coalesce:
+                # dict menjaga urutan kemunculan pertama; nilai terakhir yang dipakai
+                latest_values[kind] = value
+            else:
+                # Terapkan nilai coalesced yang tertunda dulu agar urutan relatif tetap terjaga
+                for pending_kind, pending_value in latest_values.items():
+                    self.handlers[pending_kind][0](pending_value)
+                latest_values.clear()
+                callback(value)
+        for kind, value in latest_values.items():
+            self.handlers[kind][0](value)
 
 
 # --- Fungsi GUI ---
 
+# Field angka pada form GUI: key -> (nama untuk pesan error, tipe, nilai minimum, default jika kosong)
+# channel_workers dan browser_slots bukan settings pipeline, melainkan opsi ChannelJobQueue
+GUI_NUMBER_FIELDS = {
+    'num_videos_limit': ("Number of videos", int, 1, None),
+    'download_delay_seconds': ("Download delay", int, 0, DEFAULT_DOWNLOAD_DELAY_SECONDS),
+    'retries': ("Number of retries", int, 0, DEFAULT_RETRIES),
+    'metadata_workers': ("Number of metadata workers", int, 1, DEFAULT_METADATA_WORKERS),
+    'metadata_rate_limit': ("Shared request rate", float, 0, DEFAULT_METADATA_RATE_LIMIT),
+    'metadata_cache_ttl_days': ("Metadata cache TTL", float, 0, DEFAULT_METADATA_CACHE_TTL_DAYS),
+    'download_workers': ("Number of download workers", int, 1, DEFAULT_DOWNLOAD_WORKERS),
+    'rate_burst': ("Rate burst", int, 1, DEFAULT_RATE_BURST),
+    'known_stop_threshold': ("Known-video stop threshold", int, 0, DEFAULT_KNOWN_STOP_THRESHOLD),
+    'channel_workers': ("Number of concurrent channels", int, 1, DEFAULT_CHANNEL_WORKERS),
+    'browser_slots': ("Number of browser slots", int, 1, DEFAULT_BROWSER_SLOTS),
+}
+
+# Combobox pada form GUI: key -> (pilihan nama -> nilai settings, nama default)
+GUI_CHOICE_FIELDS = {
+    'format_string': (FORMAT_OPTIONS, "Best Quality (Default)"),
+    'pipeline_mode': (PIPELINE_MODES, "Staged (Default)"),
+    'discovery_engine': (DISCOVERY_ENGINES, "Selenium (Browser)"),
+    'scrolling_method': (SCROLLING_METHODS, "Send END Key"),
+    'harvest_mode': (HARVEST_MODES, "Incremental JS Harvest (Fast)"),
+    'scroll_wait_mode': (SCROLL_WAIT_MODES, "Adaptive (Wait for New Tiles)"),
+    'download_engine': (DOWNLOAD_ENGINES, "In-Process yt-dlp (Fast)"),
+    'rate_jitter': (RATE_JITTER_MODES, "None"),
+    'export_format': (EXPORT_FORMATS, "Excel (.xlsx)"),
+    'metadata_source': (METADATA_SOURCES, "yt-dlp Extraction (Default)"),
+    'metadata_profile': (METADATA_PROFILES, "Full Extraction (Default)"),
+}
+
+# Checkbutton pada form GUI (tk.BooleanVar) yang langsung menjadi settings pipeline
+GUI_CHECKBOX_FIELDS = ('use_download_archive', 'resume', 'single_pass')
+
 def browse_folder(folder_var):
     """
     Membuka dialog untuk memilih folder utama dan mengupdate variabel Tkinter.
@@ -722,128 +4457,122 @@ def browse_folder(folder_var):
         folder_var.set(folder_selected)
         print(f"Main output folder selected: {folder_selected}") # Debugging/Informasi
 
+def load_channel_list(channel_entry):
+    """
+    Membuka dialog untuk memilih file daftar channel (satu URL per baris) dan menambahkan URL-nya
+    ke entry channel (dipisah spasi).
+
+    Args:
+        channel_entry (ttk.Entry): Widget entry yang berisi URL channel.
+    """
+    filepath = filedialog.askopenfilename(title="Select a channel list file", filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+    if not filepath:
+        return
+    try:
+        loaded_channel_urls = read_channel_urls_file(filepath)
+    except OSError as e:
+        messagebox.showerror("File Error", f"Could not read channel list file: {e}")
+        return
+    channel_urls = parse_channel_urls([channel_entry.get()] + loaded_channel_urls)
+    channel_entry.delete(0, tk.END)
+    channel_entry.insert(0, " ".join(channel_urls))
+    print(f"Loaded {len(loaded_channel_urls)} channel URL(s) from {filepath}") # Debugging/Informasi
+
+
+def read_number_field(text, label, number_type, minimum, default):
+    """
+    Membaca dan memvalidasi satu field angka dari form GUI.
+
+    Args:
+        text (str): Isi field.
+        label (str): Nama field untuk pesan error (lihat GUI_NUMBER_FIELDS).
+        number_type (type): int atau float.
+        minimum (int): Nilai terkecil yang diizinkan (1 = harus positif, 0 = boleh nol).
+        default: Nilai yang dipakai jika field kosong.
+
+    Returns:
+        int or float: Nilai field, atau default jika kosong.
+
+    Raises:
+        ValueError: Dengan pesan untuk user jika isi field tidak valid.
+    """
+    text = text.strip()
+    if not text:
+        return default
+    try:
+        value = number_type(text)
+    except ValueError:
+        raise ValueError(f"Please enter a valid number for {label.lower()}.") from None
+    if value < minimum:
+        qualifier = "a positive" if minimum > 0 else "a non-negative"
+        kind = "integer" if number_type is int else "number"
+        raise ValueError(f"{label} must be {qualifier} {kind}.")
+    return value
+
+
+def read_gui_settings(form):
+    """
+    Membaca form GUI menjadi dictionary settings pipeline yang sama dengan cli.build_settings
+    (lihat PIPELINE_SETTINGS_KEYS), plus opsi antrian channel.
+
+    Args:
+        form (dict): Key settings -> widget/variabel Tkinter (apa pun yang punya .get()), dibuat di main().
+                     'channel_urls' berisi URL channel (dipisah spasi/koma) dan 'selenium_options'
+                     berisi dict opsi Selenium -> tk.BooleanVar.
+
+    Returns:
+        tuple: (settings, channel_urls, queue_options), queue_options berisi channel_workers dan browser_slots.
+
+    Raises:
+        ValueError: Dengan pesan untuk user jika ada field yang kosong atau tidak valid.
+    """
+    main_output_directory = form['main_output_directory'].get()
+    channel_urls = parse_channel_urls([form['channel_urls'].get()]) # Satu atau beberapa URL (antrian multi-channel)
+    if not main_output_directory:
+        raise ValueError("Please select a main output folder.")
+    if not channel_urls:
+        raise ValueError("Please enter a YouTube channel URL.")
+
+    values = {key: read_number_field(form[key].get(), *field) for key, field in GUI_NUMBER_FIELDS.items()}
+    queue_options = {key: values.pop(key) for key in ('channel_workers', 'browser_slots')}
+    for key, (options, default_name) in GUI_CHOICE_FIELDS.items():
+        values[key] = options.get(form[key].get(), options[default_name])
+    for key in GUI_CHECKBOX_FIELDS:
+        values[key] = form[key].get()
+
+    # channel_url diisi per channel oleh ChannelJobQueue; dengan beberapa channel, main_output_directory
+    # adalah folder induk dan setiap channel mendapat subfolder sendiri
+    settings = {
+        'channel_url': None,
+        'main_output_directory': main_output_directory,
+        'proxy': form['proxy'].get().strip() or None, # Proxy yang sama untuk Selenium, metadata, dan download
+        'selenium_options': {option: var.get() for option, var in form['selenium_options'].items()},
+        **values,
+    }
+    return settings, channel_urls, queue_options
+
 
-def on_start_button_click(folder_var, channel_entry, num_videos_entry, format_combobox, delay_entry, retries_entry, proxy_entry,
-                          selenium_headless_var, selenium_no_sandbox_var, selenium_dev_shm_usage_var,
-                          selenium_notifications_var, selenium_extensions_var, selenium_gpu_var,
-                          selenium_webgl_var, selenium_smooth_scrolling_var, selenium_lang_en_US_var,
-                          selenium_start_maximized_var,
-                          scrolling_method_combobox,
-                          progress_var, progress_label_var, start_button, cancel_button):
+def on_start_button_click(form, progress_var, progress_label_var, start_button, cancel_button):
     """
     Fungsi yang dipanggil saat tombol 'Start Process' diklik.
     Memulai proses pengambilan URL via Selenium, pengambilan metadata via yt-dlp,
     batching, penyimpanan Excel, dan download video di thread terpisah.
 
     Args:
-        folder_var (tk.StringVar): Variabel Tkinter yang menyimpan path folder output utama.
-        channel_entry (ttk.Entry): Widget entry yang berisi URL channel.
-        num_videos_entry (ttk.Entry): Widget entry yang berisi jumlah video yang diinginkan.
-        format_combobox (ttk.Combobox): Widget combobox untuk pilihan format.
-        delay_entry (ttk.Entry): Widget entry untuk download delay.
-        retries_entry (ttk.Entry): Widget entry untuk jumlah retries.
-        proxy_entry (ttk.Entry): Widget entry untuk alamat proxy.
-        selenium_headless_var (tk.BooleanVar): Variabel untuk opsi headless.
-        selenium_no_sandbox_var (tk.BooleanVar): Variabel untuk opsi no-sandbox.
-        selenium_dev_shm_usage_var (tk.BooleanVar): Variabel untuk opsi disable-dev-shm-usage.
-        selenium_notifications_var (tk.BooleanVar): Variabel untuk opsi disable-notifications.
-        selenium_extensions_var (tk.BooleanVar): Variabel untuk opsi disable-extensions.
-        selenium_gpu_var (tk.BooleanVar): Variabel untuk opsi disable-gpu.
-        selenium_webgl_var (tk.BooleanVar): Variabel untuk opsi enable-webgl.
-        selenium_smooth_scrolling_var (tk.BooleanVar): Variabel untuk opsi enable-smooth-scrolling.
-        selenium_lang_en_US_var (tk.BooleanVar): Variabel untuk opsi lang=en-US.
-        selenium_start_maximized_var (tk.BooleanVar): Variabel untuk opsi start-maximized.
-        scrolling_method_combobox (ttk.Combobox): Widget combobox untuk metode scrolling.
+        form (dict): Widget/variabel form GUI per key settings (lihat read_gui_settings).
         progress_var (tk.IntVar): Variabel Tkinter untuk progress bar.
         progress_label_var (tk.StringVar): Variabel Tkinter untuk label status.
         start_button (ttk.Button): Tombol Start Process.
         cancel_button (ttk.Button): Tombol Cancel Process.
     """
-    main_output_directory = folder_var.get()
-    channel_url = channel_entry.get().strip() # Ambil URL dan hapus spasi
-    num_videos_str = num_videos_entry.get().strip()
-    selected_format_name = format_combobox.get()
-    selected_format_string = FORMAT_OPTIONS.get(selected_format_name, FORMAT_OPTIONS["Best Quality (Default)"]) # Ambil string format yt-dlp
-    proxy_address = proxy_entry.get().strip() # Ambil alamat proxy
-
-    # Ambil konfigurasi Selenium dari GUI
-    selenium_options = {
-        "headless": selenium_headless_var.get(),
-        "no_sandbox": selenium_no_sandbox_var.get(),
-        "disable_dev_shm_usage": selenium_dev_shm_usage_var.get(),
-        "disable_notifications": selenium_notifications_var.get(),
-        "disable_extensions": selenium_extensions_var.get(),
-        "disable_gpu": selenium_gpu_var.get(),
-        "enable_webgl": selenium_webgl_var.get(),
-        "enable_smooth_scrolling": selenium_smooth_scrolling_var.get(),
-        "lang_en_US": selenium_lang_en_US_var.get(),
-        "start_maximized": selenium_start_maximized_var.get(),
-    }
-    selected_scrolling_method = scrolling_method_combobox.get()
-    scrolling_method_key = SCROLLING_METHODS.get(selected_scrolling_method, SCROLLING_METHODS["Send END Key"]) # Default ke Send END Key
-
-    # Validasi input dasar
-    if not main_output_directory:
-        progress_label_var.set("Please select a main output folder.")
-        messagebox.showwarning("Input Missing", "Please select a main output folder.")
-        print("Error: Main output folder not selected.")
-        return
-    if not channel_url:
-        progress_label_var.set("Please enter a YouTube channel URL.")
-        messagebox.showwarning("Input Missing", "Please enter a YouTube channel URL.")
-        print("Error: Channel URL not entered.")
+    try:
+        settings, channel_urls, queue_options = read_gui_settings(form)
+    except ValueError as e:
+        messagebox.showwarning("Invalid Input", str(e))
+        progress_label_var.set(str(e))
+        print(f"Error: {e}")
         return
 
-    # Validasi input jumlah video
-    num_videos_limit = None
-    if num_videos_str:
-        try:
-            num_videos_limit = int(num_videos_str)
-            if num_videos_limit <= 0:
-                messagebox.showwarning("Invalid Input", "Number of videos must be a positive integer.")
-                progress_label_var.set("Invalid number of videos.")
-                print("Error: Invalid number of videos entered.")
-                return
-        except ValueError:
-            messagebox.showwarning("Invalid Input", "Please enter a valid number for videos.")
-            progress_label_var.set("Invalid number format.")
-            print("Error: Non-integer number of videos entered.")
-            return
-
-    # Validasi input delay
-    download_delay_seconds = DEFAULT_DOWNLOAD_DELAY_SECONDS # Default value
-    delay_str = delay_entry.get().strip()
-    if delay_str:
-        try:
-            download_delay_seconds = int(delay_str)
-            if download_delay_seconds < 0: # Allow 0 delay
-                 messagebox.showwarning("Invalid Input", "Download delay must be a non-negative integer.")
-                 progress_label_var.set("Invalid download delay.")
-                 print("Error: Invalid download delay entered.")
-                 return
-        except ValueError:
-            messagebox.showwarning("Invalid Input", "Please enter a valid number for download delay.")
-            progress_label_var.set("Invalid delay format.")
-            print("Error: Non-integer delay entered.")
-            return
-
-    # Validasi input retries
-    retries = DEFAULT_RETRIES # Default value
-    retries_str = retries_entry.get().strip()
-    if retries_str:
-        try:
-            retries = int(retries_str)
-            if retries < 0: # Allow 0 retries
-                 messagebox.showwarning("Invalid Input", "Number of retries must be a non-negative integer.")
-                 progress_label_var.set("Invalid number of retries.")
-                 print("Error: Invalid number of retries entered.")
-                 return
-        except ValueError:
-            messagebox.showwarning("Invalid Input", "Please enter a valid number for retries.")
-            progress_label_var.set("Invalid retries format.")
-            print("Error: Non-integer retries entered.")
-            return
-
     # Nonaktifkan tombol Start dan aktifkan tombol Cancel
     start_button.config(state=tk.DISABLED)
     cancel_button.config(state=tk.NORMAL)
@@ -851,16 +4580,16 @@ def on_start_button_click(folder_var, channel_entry, num_videos_entry, format_co
     # Reset progress bar dan label status
     progress_var.set(0)
     progress_label_var.set("Starting process...")
-    print(f"Starting process for channel: {channel_url}, limit: {num_videos_limit if num_videos_limit is not None else 'All'}, format: {selected_format_name} ({selected_format_string}), delay: {download_delay_seconds}s, retries: {retries}, proxy: {proxy_address if proxy_address else 'None'}")
-    print(f"Selenium Options: {selenium_options}, Scrolling Method: {selected_scrolling_method} ({scrolling_method_key})")
+    print(f"Starting process for {len(channel_urls)} channel(s): {', '.join(channel_urls)}, Concurrent Channels: {queue_options['channel_workers']}, Browser Slots: {queue_options['browser_slots']}")
+    print("Settings: " + ", ".join(f"{key}={settings[key]}" for key in PIPELINE_SETTINGS_KEYS if key != 'channel_url'))
 
     # Reset cancel event
     cancel_event.clear()
 
     # Buat direktori output utama jika belum ada
     try:
-        os.makedirs(main_output_directory, exist_ok=True)
-        print(f"Ensured main output directory exists: {main_output_directory}")
+        os.makedirs(settings['main_output_directory'], exist_ok=True)
+        print(f"Ensured main output directory exists: {settings['main_output_directory']}")
     except Exception as e:
         error_msg = f"Error creating main output directory: {e}"
         print(error_msg)
@@ -871,194 +4600,31 @@ def on_start_button_click(folder_var, channel_entry, num_videos_entry, format_co
         root.after(100, lambda: cancel_button.config(state=tk.DISABLED))
         return
 
+    # Worker thread tidak menyentuh variabel Tkinter langsung; update dikirim lewat progress_bus
+    # dan diterapkan (di-coalesce) oleh main loop Tk
+    thread_progress_var = progress_bus.var('progress')
+    thread_progress_label_var = progress_bus.var('status')
 
     # Jalankan seluruh proses di thread terpisah
     def process_thread():
         """Fungsi wrapper untuk menjalankan seluruh proses batching dalam thread."""
-        global all_videos_download_status # Deklarasikan untuk memodifikasi variabel global
-        all_videos_download_status = [] # Reset status list untuk setiap proses baru
-
         try:
-            # 1. Ambil Semua URL Shorts menggunakan Selenium dengan Scrolling
-            print("Step 1/4: Fetching all Shorts URLs using Selenium...")
-            all_shorts_urls = get_all_shorts_urls_selenium(
-                channel_url,
-                num_videos_limit, # Pass limit to Selenium for potential early stop
-                selenium_options,
-                scrolling_method_key,
-                proxy_address if proxy_address else None, # Use the same proxy for Selenium
-                progress_label_var,
-                cancel_event
-            )
-
-            if cancel_event.is_set():
-                 print("Process cancelled after Selenium URL fetching.")
-                 progress_label_var.set("Process cancelled.")
-                 return # Keluar jika dibatalkan
-
-            if not all_shorts_urls:
-                progress_label_var.set("Process finished: No Shorts URLs found via Selenium.")
-                print("No Shorts URLs found via Selenium.")
-                progress_var.set(0) # Reset progress if no links
-                return
-
-            # 2. Ambil Metadata (Title, Description) untuk URL yang Ditemukan menggunakan yt-dlp
-            # Ini diperlukan untuk menyimpan ke file Excel
-            # Fungsi ini sekarang mengiterasi list URL dan memanggil yt-dlp per URL
-            print(f"Step 2/4: Fetching metadata for {len(all_shorts_urls)} URLs using yt-dlp...")
-            all_shorts_metadata = get_metadata_for_urls(
-                all_shorts_urls,
-                proxy_address if proxy_address else None, # Use the same proxy for yt-dlp metadata fetch
-                progress_label_var,
-                cancel_event
-            )
-
-            if cancel_event.is_set():
-                 print("Process cancelled during yt-dlp metadata fetching.")
-                 progress_label_var.set("Process cancelled.")
-                 return # Keluar jika dibatalkan
-
-            if not all_shorts_metadata:
-                 progress_label_var.set("Process finished: Failed to fetch metadata for any URLs.")
-                 print("Failed to fetch metadata for any URLs.")
-                 progress_var.set(0)
-                 return
-
-            # Jika num_videos_limit diberikan, pastikan metadata list juga dibatasi
-            # (Meskipun Selenium sudah mencoba membatasi, ini double check)
-            if num_videos_limit is not None and num_videos_limit > 0:
-                 all_shorts_metadata = all_shorts_metadata[:num_videos_limit]
-                 print(f"Trimmed metadata list to {len(all_shorts_metadata)} based on user limit after fetching.")
-
-            total_videos_to_process = len(all_shorts_metadata)
-            if total_videos_to_process == 0:
-                 progress_label_var.set("Process finished: No Shorts found after metadata check/filtering.")
-                 print("No Shorts found after metadata check/filtering.")
-                 progress_var.set(0)
-                 return
-
-            # Inisialisasi daftar status global untuk semua video yang akan diproses
-            # Status awal adalah 'No' (belum didownload/error)
-            all_videos_download_status = [
-                {'url': item['url'], 'title': item['title'], 'status': 'No'}
-                for item in all_shorts_metadata
-            ]
-            print(f"Initialized global download status for {len(all_videos_download_status)} videos.")
-
-
-            num_batches = math.ceil(total_videos_to_process / BATCH_SIZE) # Hitung jumlah batch
-
-            progress_label_var.set(f"Step 2/4 finished. Ready to process {total_videos_to_process} videos in {num_batches} batches.")
-            print(f"Ready to process {total_videos_to_process} videos in {num_batches} batches.")
-
-            # 3. Proses per Batch (Simpan Excel & Download)
-            for i in range(num_batches):
-                if cancel_event.is_set():
-                     print("Process cancelled between batches.")
-                     progress_label_var.set("Process cancelled.")
-                     break # Keluar dari loop batch jika dibatalkan
-
-                start_index = i * BATCH_SIZE
-                end_index = min(start_index + BATCH_SIZE, total_videos_to_process) # Pastikan tidak melebihi jumlah total
-                current_batch_metadata = all_shorts_metadata[start_index:end_index]
-
-                batch_number = i + 1
-                batch_folder_name = f"Batch_{batch_number}"
-                batch_output_directory = os.path.join(main_output_directory, batch_folder_name)
-                batch_info_str = f"[Batch {batch_number}/{num_batches}]"
-
-                progress_label_var.set(f"{batch_info_str} Step 3/4: Processing batch with {len(current_batch_metadata)} videos...")
-                print(f"{batch_info_str} Processing batch with {len(current_batch_metadata)} videos...")
-
-                # Buat subfolder untuk batch ini
-                try:
-                    os.makedirs(batch_output_directory, exist_ok=True)
-                    print(f"{batch_info_str} Created batch directory: {batch_output_directory}")
-                except Exception as e:
-                    error_msg = f"{batch_info_str} Error creating batch directory {batch_output_directory}: {e}"
-                    print(error_msg)
-                    progress_label_var.set(error_msg)
-                    messagebox.showerror("Directory Error", error_msg)
-                    continue # Lanjutkan ke batch berikutnya jika pembuatan folder gagal
-
-                # 3a. Simpan Metadata Batch ke Excel di dalam subfolder batch
-                excel_filename = f"shorts_metadata_batch_{batch_number}.xlsx"
-                excel_filepath = os.path.join(batch_output_directory, excel_filename)
-
-                progress_label_var.set(f"{batch_info_str} Step 3/4: Saving metadata to Excel...")
-                print(f"{batch_info_str} Saving metadata to Excel...")
-                save_metadata_to_excel(current_batch_metadata, excel_filepath)
-                # Status berhasil/gagal disimpan di dalam fungsi save_metadata_to_excel
-
-                # 3b. Mulai Proses Download Video untuk batch ini
-                if current_batch_metadata: # Cek jika ada metadata untuk batch ini
-                     # Status download per video diupdate di dalam download_videos_from_links
-                     failed_urls_this_batch = download_videos_from_links(
-                         current_batch_metadata, # Pass metadata list
-                         batch_output_directory,
-                         selected_format_string,
-                         retries,
-                         download_delay_seconds,
-                         proxy_address if proxy_address else None, # Use the same proxy for download
-                         all_videos_download_status, # Pass reference to global status list
-                         progress_var,
-                         progress_label_var,
-                         batch_info=batch_info_str,
-                         cancel_event=cancel_event
-                     )
-
-                     # --- Simpan URL yang Gagal ke File Error ---
-                     if failed_urls_this_batch:
-                         progress_label_var.set(f"{batch_info_str} Saving failed URLs to error file...")
-                         print(f"{batch_info_str} Saving {len(failed_urls_this_batch)} failed URLs...")
-                         save_failed_urls_to_file(failed_urls_this_batch, main_output_directory, batch_number)
-                     # --- End Simpan URL yang Gagal ---
-
-                else:
-                     progress_label_var.set(f"{batch_info_str} Step 4/4: No valid videos to download in this batch.")
-                     print(f"{batch_info_str} No valid videos to download in this batch.")
-                     progress_var.set(0) # Reset progress for this batch
-
-                # Jika dibatalkan saat download batch, keluar dari loop batch
-                if cancel_event.is_set():
-                    print("Process cancelled during batch download.")
-                    progress_label_var.set("Process cancelled.")
-                    break
-
-
-            # Setelah semua batch selesai atau dibatalkan
-            if not cancel_event.is_set():
-                final_status = f"Process finished. Successfully processed {total_videos_to_process} videos in {num_batches} batches."
-                progress_label_var.set(final_status)
-                print(final_status)
-                progress_var.set(100) # Pastikan progress bar penuh di akhir
-
-                # --- Simpan Master Status ke Excel ---
-                print("Saving overall download status to master Excel file...")
-                # Coba ekstrak nama channel dari URL untuk nama file
-                channel_name_for_file = "channel"
-                if '/@' in channel_url:
-                    channel_name_for_file = channel_url.split('/@')[1].split('/')[0]
-                elif '/channel/' in channel_url:
-                    channel_name_for_file = channel_url.split('/channel/')[1].split('/')[0]
-                save_master_status_to_excel(all_videos_download_status, main_output_directory, channel_name_for_file)
-                # --- End Simpan Master Status ---
-
-            else:
-                 # Jika dibatalkan, status sudah diupdate di dalam loop
-                 pass # Do nothing, status is already set to cancelled
+            # Setiap channel dijalankan dengan mode pipeline yang dipilih (bertahap atau streaming)
+            ChannelJobQueue(settings, channel_urls, thread_progress_var, thread_progress_label_var, cancel_event,
+                            **queue_options).run()
 
         except Exception as e:
             # Tangani error tak terduga di dalam thread proses
             error_msg = f"An unexpected error occurred during the process: {e}"
             print(error_msg)
-            progress_label_var.set(f"Process error: {e}")
-            messagebox.showerror("Process Error", error_msg)
+            thread_progress_label_var.set(f"Process error: {e}")
+            show_error("Process Error", error_msg)
         finally:
+            # Tulis master status final di background (juga saat dibatalkan atau error), tanpa memblokir thread ini
+            finish_master_status_compactor()
             # Pastikan tombol kembali ke keadaan semula setelah proses selesai atau dibatalkan
-            # Gunakan root.after karena ini di thread lain
-            root.after(100, lambda: start_button.config(state=tk.NORMAL))
-            root.after(100, lambda: cancel_button.config(state=tk.DISABLED))
+            # (diterapkan oleh main loop Tk lewat progress_bus, karena ini di thread lain)
+            progress_bus.publish('process_finished')
             print("Process thread finished.")
 
 
@@ -1078,219 +4644,437 @@ def on_cancel_button_click(start_button, cancel_button, progress_label_var):
     """
     print("Cancel button clicked. Signaling cancellation...")
     progress_label_var.set("Cancellation requested...")
-    cancel_event.set() # Set event untuk memberi sinyal pembatalan
+    request_cancellation()
 
-    # Coba terminasi subprocess yt-dlp jika sedang berjalan
-    global current_subprocess
-    if current_subprocess and current_subprocess.poll() is None:
-        try:
-            print("Attempting to terminate running yt-dlp subprocess...")
-            current_subprocess.kill() # Kirim sinyal kill (lebih paksa)
-            print("yt-dlp subprocess terminated.")
-        except Exception as e:
-            print(f"Error terminating yt-dlp subprocess: {e}")
+    # Status GUI akan diupdate oleh thread setelah benar-benar berhenti (di blok finally)
 
-    # Coba terminasi Selenium WebDriver jika sedang berjalan
-    global current_driver
-    if current_driver:
-        try:
-            print("Attempting to quit running Selenium WebDriver...")
-            current_driver.quit()
-            current_driver = None
-            print("Selenium WebDriver quit.")
-        except Exception as e:
-            print(f"Error quitting Selenium WebDriver: {e}")
 
+def main():
+    """Membangun dan menjalankan aplikasi GUI Tkinter. Untuk menjalankan tanpa GUI, lihat cli.py."""
+    # --- Konfigurasi GUI ---
+
+    # Membuat jendela utama
+    global root
+    root = tk.Tk()
+    root.title("Shorts Bulk DL & Metadata Batcher By Sewer (with Selenium Scrolling)") # Judul aplikasi diperbarui
+    root.geometry("800x860") # Opsi lanjutan ada di tab, sehingga jendela muat di layar 1080p
+    root.minsize(640, 560) # Tab opsi yang menyusut lebih dulu; tombol Start/Cancel tetap terlihat
+
+    # Konfigurasi style untuk widget ttk (tema gelap)
+    style = ttk.Style()
+    style.theme_use("clam") # Menggunakan tema 'clam' sebagai dasar
+    style.configure("TLabel", background="#2E2E2E", foreground="#FFFFFF") # Label
+    style.configure("TButton", background="#555555", foreground="#FFFFFF", borderwidth=1) # Tombol
+    style.map("TButton", background=[('active', '#777777')]) # Warna tombol saat di-hover/aktif
+    style.configure("TEntry", fieldbackground="#555555", foreground="#FFFFFF", insertbackground="#FFFFFF") # Entry (input teks)
+    style.configure("TCombobox", fieldbackground="#555555", foreground="#FFFFFF", selectbackground="#777777", selectforeground="#FFFFFF", background="#555555", bordercolor="#555555", arrowcolor="#FFFFFF") # Combobox
+    style.map("TCombobox", fieldbackground=[('readonly', '#555555')])
+    style.configure("Horizontal.TProgressbar", troughcolor="#555555", bordercolor="#555555", background="#009688") # Progress bar
+    style.configure("TFrame", background="#2E2E2E") # Frame
+    style.configure("TLabelframe", background="#2E2E2E", foreground="#FFFFFF", bordercolor="#555555") # Labelframe
+    style.configure("TLabelframe.Label", background="#2E2E2E", foreground="#FFFFFF") # Label di Labelframe
+    style.configure("TCheckbutton", background="#2E2E2E", foreground="#FFFFFF") # Checkbutton
+    style.configure("TNotebook", background="#2E2E2E", bordercolor="#555555") # Notebook (tab opsi)
+    style.configure("TNotebook.Tab", background="#555555", foreground="#FFFFFF", padding=(10, 4)) # Tab
+    style.map("TNotebook.Tab", background=[('selected', '#777777')]) # Warna tab yang aktif
+
+    # Mengatur warna background jendela utama
+    root.configure(bg="#2E2E2E")
+
+    # Membuat frame utama untuk menampung semua widget
+    main_frame = ttk.Frame(root, padding="15") # Tambahkan padding
+    main_frame.grid(column=0, row=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    # Konfigurasi grid agar frame utama bisa mengembang bersama jendela
+    root.columnconfigure(0, weight=1)
+    root.rowconfigure(0, weight=1)
+    main_frame.columnconfigure(2, weight=1) # Kolom entry folder/channel akan mengembang
+
+    # --- Widget GUI ---
+
+    # Label dan Tombol untuk memilih folder output utama
+    folder_label = ttk.Label(main_frame, text="Select the MAIN folder to save batches:") # Teks diperbarui
+    folder_label.grid(column=0, row=0, sticky=tk.W, pady=5, padx=5) # Tambahkan padx/pady kecil
+
+    browse_button = ttk.Button(main_frame, text="Browse", command=lambda: browse_folder(folder_var)) # Gunakan lambda untuk meneruskan folder_var
+    browse_button.grid(column=1, row=0, sticky=tk.W, pady=5, padx=5)
+
+    # Entry untuk menampilkan path folder utama yang dipilih (readonly)
+    folder_var = tk.StringVar() # Variabel untuk menyimpan path folder
+    folder_entry = ttk.Entry(main_frame, textvariable=folder_var, state="readonly", width=50)
+    folder_entry.grid(column=2, row=0, sticky=(tk.W, tk.E), pady=5, padx=5)
+
+    # Label dan Entry untuk URL channel YouTube
+    channel_label = ttk.Label(main_frame, text="Enter the YouTube channel URL(s):")
+    channel_label.grid(column=0, row=1, sticky=tk.W, pady=5, padx=5)
+
+    # Beberapa URL boleh dipisah spasi/koma, atau dimuat dari file daftar channel (antrian multi-channel)
+    channel_frame = ttk.Frame(main_frame)
+    channel_frame.grid(column=1, row=1, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
+    channel_frame.columnconfigure(0, weight=1)
+
+    channel_entry = ttk.Entry(channel_frame, width=50)
+    channel_entry.grid(column=0, row=0, sticky=(tk.W, tk.E))
+
+    load_channels_button = ttk.Button(channel_frame, text="Load List...", command=lambda: load_channel_list(channel_entry))
+    load_channels_button.grid(column=1, row=0, sticky=tk.W, padx=(5, 0))
+
+    # Label dan Entry untuk Jumlah Video
+    num_videos_label = ttk.Label(main_frame, text="Number of videos to process (empty for all):")
+    num_videos_label.grid(column=0, row=2, sticky=tk.W, pady=5, padx=5)
+
+    num_videos_entry = ttk.Entry(main_frame, width=10) # Entry untuk jumlah video
+    num_videos_entry.grid(column=1, row=2, sticky=tk.W, pady=5, padx=5)
+    # Opsional: Set nilai default atau placeholder
+    # num_videos_entry.insert(0, "100")
+
+    # Label dan Combobox untuk Pilihan Format Video
+    format_label = ttk.Label(main_frame, text="Select Video Format/Quality:")
+    format_label.grid(column=0, row=3, sticky=tk.W, pady=5, padx=5)
+
+    format_combobox = ttk.Combobox(main_frame, values=list(FORMAT_OPTIONS.keys()), state="readonly", width=30)
+    format_combobox.grid(column=1, row=3, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
+    format_combobox.set("Best Quality (Default)") # Set nilai default
+
+    # Label dan Entry untuk Download Delay
+    delay_label = ttk.Label(main_frame, text="Download Delay (seconds):")
+    delay_label.grid(column=0, row=4, sticky=tk.W, pady=5, padx=5)
+
+    delay_entry = ttk.Entry(main_frame, width=10) # Entry untuk delay
+    delay_entry.grid(column=1, row=4, sticky=tk.W, pady=5, padx=5)
+    delay_entry.insert(0, str(DEFAULT_DOWNLOAD_DELAY_SECONDS)) # Set nilai default
+
+    # Label dan Entry untuk Number of Retries
+    retries_label = ttk.Label(main_frame, text="Number of Retries:")
+    retries_label.grid(column=0, row=5, sticky=tk.W, pady=5, padx=5)
+
+    retries_entry = ttk.Entry(main_frame, width=10) # Entry untuk retries
+    retries_entry.grid(column=1, row=5, sticky=tk.W, pady=5, padx=5)
+    retries_entry.insert(0, str(DEFAULT_RETRIES)) # Set nilai default
+
+    # Label dan Entry untuk Proxy (Digunakan oleh Selenium dan yt-dlp)
+    proxy_label = ttk.Label(main_frame, text="Proxy (optional, e.g., http://host:port):")
+    proxy_label.grid(column=0, row=6, sticky=tk.W, pady=5, padx=5)
+
+    proxy_entry = ttk.Entry(main_frame, width=30) # Entry untuk proxy
+    proxy_entry.grid(column=1, row=6, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
+
+    # Label dan Combobox untuk Mesin Discovery URL (Step 1)
+    discovery_engine_label = ttk.Label(main_frame, text="URL Discovery Engine:")
+    discovery_engine_label.grid(column=0, row=7, sticky=tk.W, pady=5, padx=5)
+
+    discovery_engine_combobox = ttk.Combobox(main_frame, values=list(DISCOVERY_ENGINES.keys()), state="readonly", width=30)
+    discovery_engine_combobox.grid(column=1, row=7, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
+    discovery_engine_combobox.set("Selenium (Browser)") # Default: mesin yang sudah terbukti
+
+    # Label dan Combobox untuk Mode Pipeline
+    pipeline_mode_label = ttk.Label(main_frame, text="Pipeline Mode:")
+    pipeline_mode_label.grid(column=0, row=8, sticky=tk.W, pady=5, padx=5)
+
+    pipeline_mode_combobox = ttk.Combobox(main_frame, values=list(PIPELINE_MODES.keys()), state="readonly", width=30)
+    pipeline_mode_combobox.grid(column=1, row=8, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
+    pipeline_mode_combobox.set("Staged (Default)") # Default: alur bertahap seperti sebelumnya
 
-    # Status GUI akan diupdate oleh thread setelah benar-benar berhenti (di blok finally)
+    # --- Tab Opsi Lanjutan ---
+    # Opsi performa, Selenium dan penjelasan proses ada di tab terpisah agar jendela tidak terlalu tinggi;
+    # baris notebook yang mengembang/menyusut saat jendela diubah ukurannya
+    options_notebook = ttk.Notebook(main_frame)
+    options_notebook.grid(column=0, row=9, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5, padx=5)
+    main_frame.rowconfigure(9, weight=1)
+
+    # --- Performance Options Section ---
+    performance_frame = ttk.Frame(options_notebook, padding="10")
+    options_notebook.add(performance_frame, text="Performance Options")
+
+    # Label dan Entry untuk jumlah worker metadata concurrent (Step 2)
+    metadata_workers_label = ttk.Label(performance_frame, text="Metadata Workers:")
+    metadata_workers_label.grid(column=0, row=0, sticky=tk.W, pady=2, padx=5)
+
+    metadata_workers_entry = ttk.Entry(performance_frame, width=8)
+    metadata_workers_entry.grid(column=1, row=0, sticky=tk.W, pady=2, padx=5)
+    metadata_workers_entry.insert(0, str(DEFAULT_METADATA_WORKERS)) # Set nilai default
 
+    # Label dan Entry untuk batas laju request metadata (dibagi semua worker)
+    metadata_rate_label = ttk.Label(performance_frame, text="Shared Requests/sec (0 = unlimited):")
+    metadata_rate_label.grid(column=2, row=0, sticky=tk.W, pady=2, padx=5)
 
-# --- Konfigurasi GUI ---
-
-# Membuat jendela utama
-root = tk.Tk()
-root.title("Shorts Bulk DL & Metadata Batcher By Sewer (with Selenium Scrolling)") # Judul aplikasi diperbarui
-root.geometry("700x700") # Ukuran jendela disesuaikan setelah menghapus bagian cookies
-root.resizable(False, False) # Mencegah jendela diubah ukurannya (opsional)
-
-# Konfigurasi style untuk widget ttk (tema gelap)
-style = ttk.Style()
-style.theme_use("clam") # Menggunakan tema 'clam' sebagai dasar
-style.configure("TLabel", background="#2E2E2E", foreground="#FFFFFF") # Label
-style.configure("TButton", background="#555555", foreground="#FFFFFF", borderwidth=1) # Tombol
-style.map("TButton", background=[('active', '#777777')]) # Warna tombol saat di-hover/aktif
-style.configure("TEntry", fieldbackground="#555555", foreground="#FFFFFF", insertbackground="#FFFFFF") # Entry (input teks)
-style.configure("TCombobox", fieldbackground="#555555", foreground="#FFFFFF", selectbackground="#777777", selectforeground="#FFFFFF", background="#555555", bordercolor="#555555", arrowcolor="#FFFFFF") # Combobox
-style.map("TCombobox", fieldbackground=[('readonly', '#555555')])
-style.configure("Horizontal.TProgressbar", troughcolor="#555555", bordercolor="#555555", background="#009688") # Progress bar
-style.configure("TFrame", background="#2E2E2E") # Frame
-style.configure("TLabelframe", background="#2E2E2E", foreground="#FFFFFF", bordercolor="#555555") # Labelframe
-style.configure("TLabelframe.Label", background="#2E2E2E", foreground="#FFFFFF") # Label di Labelframe
-style.configure("TCheckbutton", background="#2E2E2E", foreground="#FFFFFF") # Checkbutton
-
-# Mengatur warna background jendela utama
-root.configure(bg="#2E2E2E")
-
-# Membuat frame utama untuk menampung semua widget
-main_frame = ttk.Frame(root, padding="15") # Tambahkan padding
-main_frame.grid(column=0, row=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-# Konfigurasi grid agar frame utama bisa mengembang bersama jendela
-root.columnconfigure(0, weight=1)
-root.rowconfigure(0, weight=1)
-main_frame.columnconfigure(2, weight=1) # Kolom entry folder/channel akan mengembang
-
-# --- Widget GUI ---
-
-# Label dan Tombol untuk memilih folder output utama
-folder_label = ttk.Label(main_frame, text="Select the MAIN folder to save batches:") # Teks diperbarui
-folder_label.grid(column=0, row=0, sticky=tk.W, pady=5, padx=5) # Tambahkan padx/pady kecil
-
-browse_button = ttk.Button(main_frame, text="Browse", command=lambda: browse_folder(folder_var)) # Gunakan lambda untuk meneruskan folder_var
-browse_button.grid(column=1, row=0, sticky=tk.W, pady=5, padx=5)
-
-# Entry untuk menampilkan path folder utama yang dipilih (readonly)
-folder_var = tk.StringVar() # Variabel untuk menyimpan path folder
-folder_entry = ttk.Entry(main_frame, textvariable=folder_var, state="readonly", width=50)
-folder_entry.grid(column=2, row=0, sticky=(tk.W, tk.E), pady=5, padx=5)
-
-# Label dan Entry untuk URL channel YouTube
-channel_label = ttk.Label(main_frame, text="Enter the YouTube channel URL:")
-channel_label.grid(column=0, row=1, sticky=tk.W, pady=5, padx=5)
-
-channel_entry = ttk.Entry(main_frame, width=50)
-channel_entry.grid(column=1, row=1, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
-
-# Label dan Entry untuk Jumlah Video
-num_videos_label = ttk.Label(main_frame, text="Number of videos to process (empty for all):")
-num_videos_label.grid(column=0, row=2, sticky=tk.W, pady=5, padx=5)
-
-num_videos_entry = ttk.Entry(main_frame, width=10) # Entry untuk jumlah video
-num_videos_entry.grid(column=1, row=2, sticky=tk.W, pady=5, padx=5)
-# Opsional: Set nilai default atau placeholder
-# num_videos_entry.insert(0, "100")
-
-# Label dan Combobox untuk Pilihan Format Video
-format_label = ttk.Label(main_frame, text="Select Video Format/Quality:")
-format_label.grid(column=0, row=3, sticky=tk.W, pady=5, padx=5)
-
-format_combobox = ttk.Combobox(main_frame, values=list(FORMAT_OPTIONS.keys()), state="readonly", width=30)
-format_combobox.grid(column=1, row=3, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
-format_combobox.set("Best Quality (Default)") # Set nilai default
-
-# Label dan Entry untuk Download Delay
-delay_label = ttk.Label(main_frame, text="Download Delay (seconds):")
-delay_label.grid(column=0, row=4, sticky=tk.W, pady=5, padx=5)
-
-delay_entry = ttk.Entry(main_frame, width=10) # Entry untuk delay
-delay_entry.grid(column=1, row=4, sticky=tk.W, pady=5, padx=5)
-delay_entry.insert(0, str(DEFAULT_DOWNLOAD_DELAY_SECONDS)) # Set nilai default
-
-# Label dan Entry untuk Number of Retries
-retries_label = ttk.Label(main_frame, text="Number of Retries:")
-retries_label.grid(column=0, row=5, sticky=tk.W, pady=5, padx=5)
-
-retries_entry = ttk.Entry(main_frame, width=10) # Entry untuk retries
-retries_entry.grid(column=1, row=5, sticky=tk.W, pady=5, padx=5)
-retries_entry.insert(0, str(DEFAULT_RETRIES)) # Set nilai default
-
-# Label dan Entry untuk Proxy (Digunakan oleh Selenium dan yt-dlp)
-proxy_label = ttk.Label(main_frame, text="Proxy (optional, e.g., http://host:port):")
-proxy_label.grid(column=0, row=6, sticky=tk.W, pady=5, padx=5)
-
-proxy_entry = ttk.Entry(main_frame, width=30) # Entry untuk proxy
-proxy_entry.grid(column=1, row=6, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
-
-# --- Selenium Configuration Section ---
-selenium_frame = ttk.Labelframe(main_frame, text="Selenium Configuration", padding="10")
-selenium_frame.grid(column=0, row=7, columnspan=3, sticky=(tk.W, tk.E), pady=10, padx=5)
-
-# Checkbuttons untuk opsi Selenium WebDriver
-selenium_headless_var = tk.BooleanVar(value=True) # Default: True
-selenium_no_sandbox_var = tk.BooleanVar(value=True) # Default: True
-selenium_dev_shm_usage_var = tk.BooleanVar(value=True) # Default: True
-selenium_notifications_var = tk.BooleanVar(value=True) # Default: True
-selenium_extensions_var = tk.BooleanVar(value=True) # Default: True
-selenium_gpu_var = tk.BooleanVar(value=True) # Default: True
-selenium_webgl_var = tk.BooleanVar(value=False) # Default: False
-selenium_smooth_scrolling_var = tk.BooleanVar(value=False) # Default: False (Tidak relevan di headless)
-selenium_lang_en_US_var = tk.BooleanVar(value=True) # Default: True
-selenium_start_maximized_var = tk.BooleanVar(value=False) # Default: False (Tidak relevan di headless)
-
-# Layout Checkbuttons dalam 2 kolom
-checkbutton_col1 = ttk.Frame(selenium_frame)
-checkbutton_col1.grid(column=0, row=0, sticky=tk.N, padx=5)
-checkbutton_col2 = ttk.Frame(selenium_frame)
-checkbutton_col2.grid(column=1, row=0, sticky=tk.N, padx=5)
-
-ttk.Checkbutton(checkbutton_col1, text="Headless (--headless=new)", variable=selenium_headless_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col1, text="Disable Sandbox (--no-sandbox)", variable=selenium_no_sandbox_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col1, text="Disable /dev/shm usage (--disable-dev-shm-usage)", variable=selenium_dev_shm_usage_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col1, text="Disable Notifications (--disable-notifications)", variable=selenium_notifications_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col1, text="Disable Extensions (--disable-extensions)", variable=selenium_extensions_var).pack(anchor=tk.W)
-
-ttk.Checkbutton(checkbutton_col2, text="Disable GPU (--disable-gpu)", variable=selenium_gpu_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col2, text="Enable WebGL (--enable-webgl)", variable=selenium_webgl_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col2, text="Enable Smooth Scrolling (--enable-smooth-scrolling)", variable=selenium_smooth_scrolling_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col2, text="Set Language to en-US (--lang=en-US)", variable=selenium_lang_en_US_var).pack(anchor=tk.W)
-ttk.Checkbutton(checkbutton_col2, text="Start Maximized (--start-maximized)", variable=selenium_start_maximized_var).pack(anchor=tk.W)
-
-# Label dan Combobox untuk Metode Scrolling
-scrolling_method_label = ttk.Label(selenium_frame, text="Scrolling Method:")
-scrolling_method_label.grid(column=0, row=1, sticky=tk.W, pady=5, padx=5)
-
-scrolling_method_combobox = ttk.Combobox(selenium_frame, values=list(SCROLLING_METHODS.keys()), state="readonly", width=30)
-scrolling_method_combobox.grid(column=1, row=1, sticky=(tk.W, tk.E), pady=5, padx=5)
-scrolling_method_combobox.set("Send END Key") # Set nilai default ke metode yang terbukti efektif
-
-
-# Frame untuk tombol Start dan Cancel
-button_frame = ttk.Frame(main_frame)
-button_frame.grid(column=0, row=8, columnspan=3, pady=15)
-button_frame.columnconfigure(0, weight=1) # Agar tombol bisa di tengah
-button_frame.columnconfigure(1, weight=1)
-
-# Tombol untuk memulai proses batching
-start_button = ttk.Button(button_frame, text="Start Batch Process",
-                          command=lambda: on_start_button_click(
-                              folder_var, channel_entry, num_videos_entry,
-                              format_combobox, delay_entry, retries_entry, proxy_entry,
-                              selenium_headless_var, selenium_no_sandbox_var, selenium_dev_shm_usage_var,
-                              selenium_notifications_var, selenium_extensions_var, selenium_gpu_var,
-                              selenium_webgl_var, selenium_smooth_scrolling_var, selenium_lang_en_US_var,
-                              selenium_start_maximized_var,
-                              scrolling_method_combobox,
-                              progress_var, progress_label_var, start_button, cancel_button
-                          ))
-start_button.grid(column=0, row=0, padx=10) # Tambahkan padx antar tombol
-
-# Tombol untuk membatalkan proses
-cancel_button = ttk.Button(button_frame, text="Cancel Process",
-                           command=lambda: on_cancel_button_click(start_button, cancel_button, progress_label_var),
-                           state=tk.DISABLED) # Nonaktifkan secara default
-cancel_button.grid(column=1, row=0, padx=10)
-
-# Progress bar untuk menunjukkan kemajuan download (per batch)
-progress_var = tk.IntVar() # Variabel untuk nilai progress bar (0-100)
-progress_bar = ttk.Progressbar(main_frame, orient="horizontal", mode="determinate", variable=progress_var, style="Horizontal.TProgressbar")
-progress_bar.grid(column=0, row=9, columnspan=3, pady=5, sticky=(tk.W, tk.E))
-
-# Label untuk menampilkan status proses (termasuk info batch)
-progress_label_var = tk.StringVar() # Variabel untuk teks status
-progress_label = ttk.Label(main_frame, textvariable=progress_label_var, anchor=tk.CENTER) # anchor=tk.CENTER untuk teks di tengah
-progress_label.grid(column=0, row=10, columnspan=3, pady=5, sticky=(tk.W, tk.E))
-
-# Label penjelasan langkah-langkah proses
-explanation_text = f"""Process Steps:
-1. Fetching all Shorts URLs using Selenium with scrolling (based on element count).
-2. Fetching metadata (Title, Description) for found URLs using yt-dlp (one by one).
-3. Saving metadata to Excel file(s) in batch folders.
-4. Downloading videos batch by batch with selected format/quality, delay, retries, and proxy.
-   An overall download status Excel file (Link URL, Title, D/N/E) will be created in the main folder.
+    metadata_rate_entry = ttk.Entry(performance_frame, width=8)
+    metadata_rate_entry.grid(column=3, row=0, sticky=tk.W, pady=2, padx=5)
+    metadata_rate_entry.insert(0, str(DEFAULT_METADATA_RATE_LIMIT)) # Set nilai default
+
+    # Label dan Entry untuk TTL cache metadata SQLite
+    metadata_cache_ttl_label = ttk.Label(performance_frame, text="Metadata Cache TTL (days, 0 = off):")
+    metadata_cache_ttl_label.grid(column=0, row=1, sticky=tk.W, pady=2, padx=5)
+
+    metadata_cache_ttl_entry = ttk.Entry(performance_frame, width=8)
+    metadata_cache_ttl_entry.grid(column=1, row=1, sticky=tk.W, pady=2, padx=5)
+    metadata_cache_ttl_entry.insert(0, str(DEFAULT_METADATA_CACHE_TTL_DAYS)) # Set nilai default
+
+    # Label dan Combobox untuk mesin download (Step 4)
+    download_engine_label = ttk.Label(performance_frame, text="Download Engine:")
+    download_engine_label.grid(column=2, row=1, sticky=tk.W, pady=2, padx=5)
+
+    download_engine_combobox = ttk.Combobox(performance_frame, values=list(DOWNLOAD_ENGINES.keys()), state="readonly", width=26)
+    download_engine_combobox.grid(column=3, row=1, sticky=tk.W, pady=2, padx=5)
+    download_engine_combobox.set("In-Process yt-dlp (Fast)") # Default: tanpa spawn proses per video
+
+    # Label dan Entry untuk jumlah download yang berjalan bersamaan (Step 4)
+    download_workers_label = ttk.Label(performance_frame, text="Download Workers:")
+    download_workers_label.grid(column=0, row=2, sticky=tk.W, pady=2, padx=5)
+
+    download_workers_entry = ttk.Entry(performance_frame, width=8)
+    download_workers_entry.grid(column=1, row=2, sticky=tk.W, pady=2, padx=5)
+    download_workers_entry.insert(0, str(DEFAULT_DOWNLOAD_WORKERS)) # Set nilai default
+
+    # Label dan Entry untuk burst penjadwal laju (berlaku untuk metadata & download)
+    rate_burst_label = ttk.Label(performance_frame, text="Rate Burst (requests):")
+    rate_burst_label.grid(column=2, row=2, sticky=tk.W, pady=2, padx=5)
+
+    rate_burst_entry = ttk.Entry(performance_frame, width=8)
+    rate_burst_entry.grid(column=3, row=2, sticky=tk.W, pady=2, padx=5)
+    rate_burst_entry.insert(0, str(DEFAULT_RATE_BURST)) # Set nilai default
+
+    # Label dan Combobox untuk distribusi jitter penjadwal laju
+    rate_jitter_label = ttk.Label(performance_frame, text="Rate Jitter:")
+    rate_jitter_label.grid(column=0, row=3, sticky=tk.W, pady=2, padx=5)
+
+    rate_jitter_combobox = ttk.Combobox(performance_frame, values=list(RATE_JITTER_MODES.keys()), state="readonly", width=22)
+    rate_jitter_combobox.grid(column=1, row=3, columnspan=2, sticky=tk.W, pady=2, padx=5)
+    rate_jitter_combobox.set("None") # Default: jarak antar request tetap
+
+    # Checkbutton untuk arsip download lintas run (sinkronisasi inkremental channel)
+    download_archive_var = tk.BooleanVar(value=True) # Default: True
+    ttk.Checkbutton(performance_frame, text=f"Skip Shorts already downloaded ({DOWNLOAD_ARCHIVE_FILENAME})", variable=download_archive_var).grid(column=0, row=4, columnspan=4, sticky=tk.W, pady=2, padx=5)
+
+    # Label dan Entry untuk berhenti discovery setelah N video berturut-turut yang sudah ada di arsip
+    known_stop_label = ttk.Label(performance_frame, text="Stop After N Known Shorts (0 = off):")
+    known_stop_label.grid(column=0, row=5, columnspan=2, sticky=tk.W, pady=2, padx=5)
+
+    known_stop_entry = ttk.Entry(performance_frame, width=8)
+    known_stop_entry.grid(column=2, row=5, sticky=tk.W, pady=2, padx=5)
+    known_stop_entry.insert(0, str(DEFAULT_KNOWN_STOP_THRESHOLD)) # Set nilai default
+
+    # Checkbutton untuk melanjutkan run yang crash/dibatalkan dari jurnal checkpoint
+    resume_var = tk.BooleanVar(value=False) # Default: False (run baru)
+    ttk.Checkbutton(performance_frame, text=f"Resume unfinished run ({CHECKPOINT_FILENAME})", variable=resume_var).grid(column=0, row=6, columnspan=4, sticky=tk.W, pady=2, padx=5)
+
+    # Label dan Combobox untuk format file metadata batch dan master status
+    export_format_label = ttk.Label(performance_frame, text="Export Format:")
+    export_format_label.grid(column=0, row=7, sticky=tk.W, pady=2, padx=5)
+
+    export_format_combobox = ttk.Combobox(performance_frame, values=list(EXPORT_FORMATS.keys()), state="readonly", width=30)
+    export_format_combobox.grid(column=1, row=7, columnspan=2, sticky=tk.W, pady=2, padx=5)
+    export_format_combobox.set("Excel (.xlsx)") # Default: file Excel seperti sebelumnya
+
+    # Label dan Entry untuk jumlah channel yang diproses bersamaan (antrian multi-channel)
+    channel_workers_label = ttk.Label(performance_frame, text="Concurrent Channels:")
+    channel_workers_label.grid(column=0, row=8, sticky=tk.W, pady=2, padx=5)
+
+    channel_workers_entry = ttk.Entry(performance_frame, width=8)
+    channel_workers_entry.grid(column=1, row=8, sticky=tk.W, pady=2, padx=5)
+    channel_workers_entry.insert(0, str(DEFAULT_CHANNEL_WORKERS)) # Set nilai default
+
+    # Label dan Entry untuk jumlah maksimum browser Selenium yang berjalan bersamaan
+    browser_slots_label = ttk.Label(performance_frame, text="Browser Slots:")
+    browser_slots_label.grid(column=2, row=8, sticky=tk.W, pady=2, padx=5)
+
+    browser_slots_entry = ttk.Entry(performance_frame, width=8)
+    browser_slots_entry.grid(column=3, row=8, sticky=tk.W, pady=2, padx=5)
+    browser_slots_entry.insert(0, str(DEFAULT_BROWSER_SLOTS)) # Set nilai default
+
+    # Label dan Combobox untuk sumber metadata (yt-dlp per video atau title/views dari halaman channel)
+    metadata_source_label = ttk.Label(performance_frame, text="Metadata Source:")
+    metadata_source_label.grid(column=0, row=9, sticky=tk.W, pady=2, padx=5)
+
+    metadata_source_combobox = ttk.Combobox(performance_frame, values=list(METADATA_SOURCES.keys()), state="readonly", width=36)
+    metadata_source_combobox.grid(column=1, row=9, columnspan=3, sticky=tk.W, pady=2, padx=5)
+    metadata_source_combobox.set("yt-dlp Extraction (Default)") # Default: title + description lengkap dari yt-dlp
+
+    # Label dan Combobox untuk profil ekstraksi metadata yt-dlp (Step 2)
+    metadata_profile_label = ttk.Label(performance_frame, text="Metadata Profile:")
+    metadata_profile_label.grid(column=0, row=10, sticky=tk.W, pady=2, padx=5)
+
+    metadata_profile_combobox = ttk.Combobox(performance_frame, values=list(METADATA_PROFILES.keys()), state="readonly", width=36)
+    metadata_profile_combobox.grid(column=1, row=10, columnspan=3, sticky=tk.W, pady=2, padx=5)
+    metadata_profile_combobox.set("Full Extraction (Default)") # Default: ekstraksi lengkap; profil Fast opt-in
+
+    # Checkbutton untuk mode single-pass (info dict Step 2 dipakai ulang oleh Step 4, tanpa resolve ulang)
+    single_pass_var = tk.BooleanVar(value=False) # Default: False (Step 4 me-resolve ulang setiap video)
+    ttk.Checkbutton(performance_frame, text="Single-Pass Extraction (Reuse Step 2 Info for Downloads)", variable=single_pass_var).grid(column=0, row=11, columnspan=4, sticky=tk.W, pady=2, padx=5)
+
+    # --- Selenium Configuration Section ---
+    selenium_frame = ttk.Frame(options_notebook, padding="10")
+    options_notebook.add(selenium_frame, text="Selenium Configuration")
+
+    # Checkbuttons untuk opsi Selenium WebDriver
+    selenium_headless_var = tk.BooleanVar(value=True) # Default: True
+    selenium_no_sandbox_var = tk.BooleanVar(value=True) # Default: True
+    selenium_dev_shm_usage_var = tk.BooleanVar(value=True) # Default: True
+    selenium_notifications_var = tk.BooleanVar(value=True) # Default: True
+    selenium_extensions_var = tk.BooleanVar(value=True) # Default: True
+    selenium_gpu_var = tk.BooleanVar(value=True) # Default: True
+    selenium_webgl_var = tk.BooleanVar(value=False) # Default: False
+    selenium_smooth_scrolling_var = tk.BooleanVar(value=False) # Default: False (Tidak relevan di headless)
+    selenium_lang_en_US_var = tk.BooleanVar(value=True) # Default: True
+    selenium_start_maximized_var = tk.BooleanVar(value=False) # Default: False (Tidak relevan di headless)
+    selenium_reuse_browser_var = tk.BooleanVar(value=True) # Default: True (browser tetap hangat untuk channel berikutnya)
+    selenium_lean_profile_var = tk.BooleanVar(value=False) # Default: False (opt-in: blokir gambar, video dan font saat scraping)
+
+    # Layout Checkbuttons dalam 2 kolom
+    checkbutton_col1 = ttk.Frame(selenium_frame)
+    checkbutton_col1.grid(column=0, row=0, sticky=tk.N, padx=5)
+    checkbutton_col2 = ttk.Frame(selenium_frame)
+    checkbutton_col2.grid(column=1, row=0, sticky=tk.N, padx=5)
+
+    ttk.Checkbutton(checkbutton_col1, text="Headless (--headless=new)", variable=selenium_headless_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col1, text="Disable Sandbox (--no-sandbox)", variable=selenium_no_sandbox_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col1, text="Disable /dev/shm usage (--disable-dev-shm-usage)", variable=selenium_dev_shm_usage_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col1, text="Disable Notifications (--disable-notifications)", variable=selenium_notifications_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col1, text="Disable Extensions (--disable-extensions)", variable=selenium_extensions_var).pack(anchor=tk.W)
+
+    ttk.Checkbutton(checkbutton_col2, text="Disable GPU (--disable-gpu)", variable=selenium_gpu_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col2, text="Enable WebGL (--enable-webgl)", variable=selenium_webgl_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col2, text="Enable Smooth Scrolling (--enable-smooth-scrolling)", variable=selenium_smooth_scrolling_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col2, text="Set Language to en-US (--lang=en-US)", variable=selenium_lang_en_US_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col2, text="Start Maximized (--start-maximized)", variable=selenium_start_maximized_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col1, text="Keep Browser Warm Between Channels", variable=selenium_reuse_browser_var).pack(anchor=tk.W)
+    ttk.Checkbutton(checkbutton_col2, text="Lean Scraping (Block Images/Video/Fonts)", variable=selenium_lean_profile_var).pack(anchor=tk.W)
+
+    # Opsi Selenium untuk settings pipeline (key sama dengan cli.SELENIUM_OPTION_FLAGS)
+    selenium_option_vars = {
+        "headless": selenium_headless_var,
+        "no_sandbox": selenium_no_sandbox_var,
+        "disable_dev_shm_usage": selenium_dev_shm_usage_var,
+        "disable_notifications": selenium_notifications_var,
+        "disable_extensions": selenium_extensions_var,
+        "disable_gpu": selenium_gpu_var,
+        "enable_webgl": selenium_webgl_var,
+        "enable_smooth_scrolling": selenium_smooth_scrolling_var,
+        "lang_en_US": selenium_lang_en_US_var,
+        "start_maximized": selenium_start_maximized_var,
+        "reuse_browser": selenium_reuse_browser_var,
+        "lean_profile": selenium_lean_profile_var,
+    }
+
+    # Label dan Combobox untuk Metode Scrolling
+    scrolling_method_label = ttk.Label(selenium_frame, text="Scrolling Method:")
+    scrolling_method_label.grid(column=0, row=1, sticky=tk.W, pady=5, padx=5)
+
+    scrolling_method_combobox = ttk.Combobox(selenium_frame, values=list(SCROLLING_METHODS.keys()), state="readonly", width=30)
+    scrolling_method_combobox.grid(column=1, row=1, sticky=(tk.W, tk.E), pady=5, padx=5)
+    scrolling_method_combobox.set("Send END Key") # Set nilai default ke metode yang terbukti efektif
+
+    # Label dan Combobox untuk Metode Harvest URL
+    harvest_mode_label = ttk.Label(selenium_frame, text="URL Harvest Mode:")
+    harvest_mode_label.grid(column=0, row=2, sticky=tk.W, pady=5, padx=5)
+
+    harvest_mode_combobox = ttk.Combobox(selenium_frame, values=list(HARVEST_MODES.keys()), state="readonly", width=30)
+    harvest_mode_combobox.grid(column=1, row=2, sticky=(tk.W, tk.E), pady=5, padx=5)
+    harvest_mode_combobox.set("Incremental JS Harvest (Fast)") # Default: satu round-trip per scroll
+
+    # Label dan Combobox untuk Cara Menunggu Setelah Scroll
+    scroll_wait_mode_label = ttk.Label(selenium_frame, text="Scroll Wait Mode:")
+    scroll_wait_mode_label.grid(column=0, row=3, sticky=tk.W, pady=5, padx=5)
+
+    scroll_wait_mode_combobox = ttk.Combobox(selenium_frame, values=list(SCROLL_WAIT_MODES.keys()), state="readonly", width=30)
+    scroll_wait_mode_combobox.grid(column=1, row=3, sticky=(tk.W, tk.E), pady=5, padx=5)
+    scroll_wait_mode_combobox.set("Adaptive (Wait for New Tiles)") # Default: waktu scroll mengikuti latensi load sebenarnya
+
+
+    # Frame untuk tombol Start dan Cancel
+    button_frame = ttk.Frame(main_frame)
+    button_frame.grid(column=0, row=10, columnspan=3, pady=10)
+    button_frame.columnconfigure(0, weight=1) # Agar tombol bisa di tengah
+    button_frame.columnconfigure(1, weight=1)
+
+    # Tombol untuk memulai proses batching
+    # Semua field form per key settings, dibaca oleh read_gui_settings saat Start diklik
+    form = {
+        'main_output_directory': folder_var,
+        'channel_urls': channel_entry,
+        'num_videos_limit': num_videos_entry,
+        'format_string': format_combobox,
+        'download_delay_seconds': delay_entry,
+        'retries': retries_entry,
+        'proxy': proxy_entry,
+        'discovery_engine': discovery_engine_combobox,
+        'pipeline_mode': pipeline_mode_combobox,
+        'metadata_workers': metadata_workers_entry,
+        'metadata_rate_limit': metadata_rate_entry,
+        'metadata_cache_ttl_days': metadata_cache_ttl_entry,
+        'download_engine': download_engine_combobox,
+        'download_workers': download_workers_entry,
+        'rate_burst': rate_burst_entry,
+        'rate_jitter': rate_jitter_combobox,
+        'use_download_archive': download_archive_var,
+        'known_stop_threshold': known_stop_entry,
+        'resume': resume_var,
+        'export_format': export_format_combobox,
+        'channel_workers': channel_workers_entry,
+        'browser_slots': browser_slots_entry,
+        'metadata_source': metadata_source_combobox,
+        'metadata_profile': metadata_profile_combobox,
+        'single_pass': single_pass_var,
+        'selenium_options': selenium_option_vars,
+        'scrolling_method': scrolling_method_combobox,
+        'harvest_mode': harvest_mode_combobox,
+        'scroll_wait_mode': scroll_wait_mode_combobox,
+    }
+
+    # Tombol untuk memulai proses batching
+    start_button = ttk.Button(button_frame, text="Start Batch Process",
+                              command=lambda: on_start_button_click(form, progress_var, progress_label_var, start_button, cancel_button))
+    start_button.grid(column=0, row=0, padx=10) # Tambahkan padx antar tombol
+
+    # Tombol untuk membatalkan proses
+    cancel_button = ttk.Button(button_frame, text="Cancel Process",
+                               command=lambda: on_cancel_button_click(start_button, cancel_button, progress_label_var),
+                               state=tk.DISABLED) # Nonaktifkan secara default
+    cancel_button.grid(column=1, row=0, padx=10)
+
+    # Progress bar untuk menunjukkan kemajuan download (per batch)
+    progress_var = tk.IntVar() # Variabel untuk nilai progress bar (0-100)
+    progress_bar = ttk.Progressbar(main_frame, orient="horizontal", mode="determinate", variable=progress_var, style="Horizontal.TProgressbar")
+    progress_bar.grid(column=0, row=11, columnspan=3, pady=5, sticky=(tk.W, tk.E))
+
+    # Label untuk menampilkan status proses (termasuk info batch)
+    progress_label_var = tk.StringVar() # Variabel untuk teks status
+    progress_label = ttk.Label(main_frame, textvariable=progress_label_var, anchor=tk.CENTER) # anchor=tk.CENTER untuk teks di tengah
+    progress_label.grid(column=0, row=12, columnspan=3, pady=5, sticky=(tk.W, tk.E))
+
+    # Event bus progress: update dari worker thread diterapkan di sini, di main thread Tk
+    global progress_bus
+    progress_bus = ProgressEventBus()
+    progress_bus.bind('progress', progress_var.set)
+    progress_bus.bind('status', progress_label_var.set)
+    progress_bus.bind('error', lambda error: messagebox.showerror(*error), coalesce=False)
+    progress_bus.bind('process_finished', lambda _: (start_button.config(state=tk.NORMAL), cancel_button.config(state=tk.DISABLED)), coalesce=False)
+    progress_bus.start(root)
+
+    # Label penjelasan langkah-langkah proses (tab tersendiri)
+    process_steps_frame = ttk.Frame(options_notebook, padding="10")
+    options_notebook.add(process_steps_frame, text="Process Steps")
+    explanation_text = f"""Process Steps:
+1. Fetching all Shorts URLs using Selenium with scrolling, or browserless over InnerTube HTTP continuations.
+2. Fetching metadata (Title, Description) for found URLs using yt-dlp (concurrent workers, rate limited;
+   the Fast profile skips format, player JS and manifest work).
+   With a DOM Metadata Source, titles/views are read from the channel page in step 1 and yt-dlp is skipped.
+3. Saving metadata to Excel/CSV/JSONL/Parquet file(s) in batch folders (see Export Format).
+4. Downloading videos batch by batch with selected format/quality, delay, retries, and proxy
+   (in-process yt-dlp by default; the legacy subprocess engine is still selectable).
+   An overall download status file (Link URL, Title, D/N/E) will be created in the main folder.
+   Streaming mode runs steps 1-4 concurrently so downloads start while the channel is still being scanned.
+Several channel URLs (or Load List...) run as a queue: each channel gets its own subfolder and master status,
+   with Concurrent Channels, Browser Slots and Download Workers shared across the whole queue.
 Failed video URLs will be saved to '{ERROR_FOLDER_NAME}/Batch_X_Errors/error.txt'.""" # Teks diperbarui
-explanation_label = ttk.Label(main_frame, text=explanation_text, justify=tk.LEFT, foreground="#AAAAAA", background="#2E2E2E")
-explanation_label.grid(column=0, row=11, columnspan=3, pady=10, padx=5, sticky=tk.W)
+    explanation_label = ttk.Label(process_steps_frame, text=explanation_text, justify=tk.LEFT, foreground="#AAAAAA", background="#2E2E2E")
+    explanation_label.grid(column=0, row=0, pady=5, padx=5, sticky=tk.W)
+
+
+    # --- Menjalankan Aplikasi GUI ---
+    root.mainloop()
+    webdriver_pool.close() # Tutup browser yang masih hangat saat jendela ditutup
 
 
-# --- Menjalankan Aplikasi GUI ---
-root.mainloop()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+# Fixture bersama untuk test pipeline (tanpa GUI, browser, maupun jaringan)
+import pytest
+
+import cli
+import gui
+
+
+@pytest.fixture
+def errors(monkeypatch):
+    """Mencatat pesan show_error alih-alih mencetaknya ke stderr."""
+    shown = []
+    monkeypatch.setattr(gui, "show_error", lambda title, message: shown.append((title, message)))
+    return shown
+
+
+@pytest.fixture
+def pipeline_settings(tmp_path):
+    """Settings pipeline lengkap (default CLI) dengan folder output sementara."""
+    args = cli.build_argument_parser().parse_args(["-o", str(tmp_path), "https://www.youtube.com/@stub"])
+    settings = cli.build_settings(args, str(tmp_path))
+    settings.update(channel_url="https://www.youtube.com/@stub", export_format="csv", metadata_cache_ttl_days=0,
+                    download_delay_seconds=0, metadata_rate_limit=0)
+    yield settings
+    gui.finish_master_status_compactor(wait=True, output_directory=str(tmp_path))
+
@@ -0,0 +1,34 @@
+# Fungsi bantu bersama untuk test pipeline (juga dipakai benchmarks/ untuk data rekaman yang sama)
+import json
+import os
+
+import gui
+
+INNERTUBE_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "innertube")
+
+
+def fake_discovery(video_ids, with_page_metadata=True):
+    """Pengganti discover_shorts_urls: mengembalikan video_ids dan (opsional) title dari halaman channel."""
+    def discover(settings, progress_label_var, cancel_event, on_new_urls=None, known_video_ids=None, page_metadata=None):
+        urls = [f"https://www.youtube.com/shorts/{video_id}" for video_id in video_ids]
+        if with_page_metadata:
+            for video_id in video_ids:
+                gui.store_page_metadata(page_metadata, video_id, f"Title {video_id}", "1 view")
+        if on_new_urls is not None:
+            on_new_urls(urls)
+        return urls
+    return discover
+
+
+def load_innertube_fixture(name):
+    """Membaca data JSON InnerTube rekaman (dipotong) dari tests/fixtures/innertube."""
+    with open(os.path.join(INNERTUBE_FIXTURES_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_innertube_channel_page(initial_data):
+    """Halaman tab Shorts minimal: ytcfg + ytInitialData, seperti yang dibaca get_all_shorts_urls_innertube."""
+    ytcfg = {"INNERTUBE_API_KEY": "stub-key",
+             "INNERTUBE_CONTEXT": {"client": {"clientName": "WEB", "clientVersion": "2.20240101.00.00"}}}
+    return (f"<html><script>ytcfg.set({json.dumps(ytcfg)});</script>"
+            f"<script>var ytInitialData = {json.dumps(initial_data)};</script></html>")
@@ -0,0 +1,39 @@
+# Test ChannelJobQueue dengan pipeline palsu (tanpa browser dan jaringan)
+import threading
+
+import gui
+
+
+def run_queue(pipeline_settings, monkeypatch, channel_urls, **kwargs):
+    seen_settings = []
+
+    def fake_run_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store=None):
+        seen_settings.append(settings)
+        return gui.PIPELINE_RESULT_COMPLETED
+
+    monkeypatch.setattr(gui, "run_pipeline", fake_run_pipeline)
+    job_queue = gui.ChannelJobQueue(pipeline_settings, channel_urls, gui.NullProgressVar(), gui.NullProgressVar(),
+                                    threading.Event(), **kwargs)
+    return job_queue, job_queue.run(), seen_settings
+
+
+def test_channels_share_one_request_scheduler_and_download_slots(pipeline_settings, monkeypatch):
+    channel_urls = [f"https://www.youtube.com/@channel{i}" for i in range(4)]
+    job_queue, jobs, seen_settings = run_queue(pipeline_settings, monkeypatch, channel_urls, channel_workers=3)
+    assert [job.outcome for job in jobs] == [gui.PIPELINE_RESULT_COMPLETED] * 4
+    assert len(seen_settings) == 4
+    # Semua channel memakai penjadwal dan slot download yang sama, sehingga laju total tidak berlipat
+    assert all(settings['request_scheduler'] is job_queue.request_scheduler for settings in seen_settings)
+    assert all(gui.create_request_scheduler(settings) is job_queue.request_scheduler for settings in seen_settings)
+    assert all(settings['download_slots'] is job_queue.download_slots for settings in seen_settings)
+
+
+def test_each_channel_gets_its_own_output_folder(pipeline_settings, monkeypatch, tmp_path):
+    channel_urls = ["https://www.youtube.com/@alpha", "https://www.youtube.com/@beta", "https://www.youtube.com/@alpha"]
+    _, jobs, _ = run_queue(pipeline_settings, monkeypatch, channel_urls)
+    assert [job.output_directory for job in jobs] == [str(tmp_path / "alpha"), str(tmp_path / "beta"), str(tmp_path / "alpha_3")]
+
+
+def test_single_channel_uses_main_output_folder(pipeline_settings, monkeypatch, tmp_path):
+    _, jobs, _ = run_queue(pipeline_settings, monkeypatch, ["https://www.youtube.com/@alpha"])
+    assert jobs[0].output_directory == str(tmp_path)
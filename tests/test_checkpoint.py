@@ -0,0 +1,116 @@
+# Test jurnal checkpoint pipeline (PipelineCheckpoint / load_pipeline_checkpoint)
+import threading
+
+import pytest
+
+import gui
+from tests.helpers import fake_discovery
+
+CHANNEL_URL = "https://www.youtube.com/@stub"
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    """Mencatat jumlah pemanggilan os.fsync (tetap dijalankan sungguhan)."""
+    calls = []
+    real_fsync = gui.os.fsync
+    def counting_fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+    monkeypatch.setattr(gui.os, "fsync", counting_fsync)
+    return calls
+
+
+def test_records_round_trip_through_the_journal(tmp_path):
+    path = str(tmp_path / gui.CHECKPOINT_FILENAME)
+    checkpoint = gui.PipelineCheckpoint(path, CHANNEL_URL)
+    checkpoint.record_urls(["u1", "u2"])
+    checkpoint.record_urls(["u2", "u3"])
+    checkpoint.record_discovery_complete()
+    checkpoint.record_metadata({"url": "u1", "title": "One", "description": ""})
+    checkpoint.record_batch(1, ["u1", "u2"])
+    checkpoint.record_batch(1, ["u2", "u3"])
+    checkpoint.record_status("u1", "Downloaded")
+    checkpoint.record_status("u1", "Error (Download)")
+    checkpoint.close()
+
+    state = gui.load_pipeline_checkpoint(path)
+    assert state["channel_url"] == CHANNEL_URL
+    assert state["urls"] == ["u1", "u2", "u3"]
+    assert state["discovery_complete"] is True
+    assert state["metadata"] == {"u1": {"url": "u1", "title": "One", "description": ""}}
+    assert state["batches"] == {1: ["u1", "u2", "u3"]}
+    assert state["statuses"] == {"u1": "Error (Download)"}
+    assert state["complete"] is False
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / gui.CHECKPOINT_FILENAME)
+    checkpoint = gui.PipelineCheckpoint(path, CHANNEL_URL)
+    checkpoint.record_urls(["u1"])
+    checkpoint.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "urls", "urls": ["u2"')
+    assert gui.load_pipeline_checkpoint(path)["urls"] == ["u1"]
+
+
+def test_missing_journal_loads_as_none(tmp_path):
+    assert gui.load_pipeline_checkpoint(str(tmp_path / "missing.jsonl")) is None
+
+
+@pytest.mark.parametrize("channel_url, complete, resumed", [
+    (CHANNEL_URL, False, True),
+    (CHANNEL_URL, True, False),
+    ("https://www.youtube.com/@other", False, False),
+])
+def test_resume_only_continues_unfinished_run_of_same_channel(tmp_path, channel_url, complete, resumed):
+    path = str(tmp_path / gui.CHECKPOINT_FILENAME)
+    checkpoint = gui.PipelineCheckpoint(path, CHANNEL_URL)
+    checkpoint.record_urls(["u1"])
+    if complete:
+        checkpoint.record_complete()
+    checkpoint.close()
+
+    checkpoint = gui.PipelineCheckpoint(path, channel_url, resume=True)
+    checkpoint.record_urls(["u2"])
+    checkpoint.close()
+    assert (checkpoint.resume_state is not None) == resumed
+    # Jurnal yang dilanjutkan ditambah, jurnal yang tidak bisa dilanjutkan diganti
+    assert gui.load_pipeline_checkpoint(path)["urls"] == (["u1", "u2"] if resumed else ["u2"])
+
+
+def test_fsync_only_at_boundaries_and_on_close(tmp_path, fsyncs):
+    checkpoint = gui.PipelineCheckpoint(str(tmp_path / gui.CHECKPOINT_FILENAME), CHANNEL_URL)
+    assert len(fsyncs) == 1 # Record 'run'
+    for i in range(100):
+        checkpoint.record_batch(1, [f"u{i}"])
+        checkpoint.record_status(f"u{i}", "Downloaded")
+    assert len(fsyncs) == 1
+    checkpoint.sync()
+    checkpoint.sync() # Tidak ada record baru: tidak ada fsync lagi
+    assert len(fsyncs) == 2
+    checkpoint.record_status("u0", "Downloaded")
+    checkpoint.close()
+    checkpoint.close()
+    assert len(fsyncs) == 3
+    checkpoint.record_status("u1", "Downloaded") # Setelah close diabaikan
+    assert len(fsyncs) == 3
+
+
+def test_streaming_run_fsyncs_per_batch_not_per_video(pipeline_settings, fsyncs, errors, monkeypatch):
+    video_ids = [f"video{i:05d}" for i in range(250)] # 3 batch
+    monkeypatch.setattr(gui, "discover_shorts_urls", fake_discovery(video_ids))
+    def missing_executable(*args, **kwargs):
+        raise FileNotFoundError("yt-dlp")
+    monkeypatch.setattr(gui.subprocess, "Popen", missing_executable)
+    pipeline_settings.update(pipeline_mode="streaming", metadata_source="dom",
+                             download_engine=gui.DOWNLOAD_ENGINES["Subprocess yt-dlp (Legacy)"])
+
+    result = gui.run_pipeline(pipeline_settings, gui.NullProgressVar(), gui.NullProgressVar(), threading.Event(), gui.StatusStore())
+    assert result == gui.PIPELINE_RESULT_COMPLETED
+    # run + discovery_complete + 3 batch + complete, bukan satu fsync per video
+    assert len(fsyncs) <= 6
+    state = gui.load_pipeline_checkpoint(gui.os.path.join(pipeline_settings["main_output_directory"], gui.CHECKPOINT_FILENAME))
+    assert state["complete"] is True
+    assert sum(len(urls) for urls in state["batches"].values()) == len(video_ids)
+    assert set(state["statuses"].values()) == {"Error (yt-dlp not found)"}
@@ -0,0 +1,138 @@
+# Test parser argumen, settings, dan exit code cli.py dengan pipeline palsu (tanpa browser dan jaringan)
+import pytest
+
+import cli
+import gui
+
+CHANNEL = "https://www.youtube.com/@alpha"
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    """
+    Mengganti gui.run_pipeline: setiap channel menjalankan aksi dari dict outcomes (URL channel -> hasil).
+    Hasil berupa PIPELINE_RESULT_*, exception, atau ("failed", n) untuk run selesai dengan n download gagal.
+    """
+    outcomes = {}
+
+    def fake_run_pipeline(settings, progress_var, progress_label_var, cancel_event, status_store=None):
+        outcome = outcomes.get(settings['channel_url'], gui.PIPELINE_RESULT_COMPLETED)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, tuple):
+            for i in range(outcome[1]):
+                status_store.add(f"https://www.youtube.com/shorts/failed{i}", "Failed", status='Error')
+            return gui.PIPELINE_RESULT_COMPLETED
+        if outcome == gui.PIPELINE_RESULT_CANCELLED:
+            gui.request_cancellation() # Seperti Ctrl+C di tengah run
+        return outcome
+
+    monkeypatch.setattr(gui, "run_pipeline", fake_run_pipeline)
+    yield outcomes
+    gui.cancel_event.clear()
+
+
+def run_main(tmp_path, *argv):
+    return cli.main(["-o", str(tmp_path), *argv])
+
+
+def test_parser_defaults_match_gui_defaults(tmp_path):
+    args = cli.build_argument_parser().parse_args(["-o", str(tmp_path), CHANNEL])
+    assert args.channels == [CHANNEL] and args.limit is None
+    assert args.pipeline_mode == gui.PIPELINE_MODES["Staged (Default)"]
+    assert args.metadata_source == gui.METADATA_SOURCES["yt-dlp Extraction (Default)"]
+    assert args.metadata_workers == gui.DEFAULT_METADATA_WORKERS
+    assert args.channel_workers == gui.DEFAULT_CHANNEL_WORKERS and args.browser_slots == gui.DEFAULT_BROWSER_SLOTS
+    assert args.selenium_headless is True and args.selenium_lean_profile is False
+    assert not args.resume and not args.single_pass and not args.no_download_archive
+
+
+def test_build_settings_covers_pipeline_settings_keys(tmp_path):
+    args = cli.build_argument_parser().parse_args(["-o", str(tmp_path), "--no-headless", "--no-download-archive",
+                                                   "--proxy", "", CHANNEL])
+    settings = cli.build_settings(args, str(tmp_path))
+    assert set(settings) == set(gui.PIPELINE_SETTINGS_KEYS)
+    assert settings['selenium_options']['headless'] is False
+    assert set(settings['selenium_options']) == {option_key for option_key, _, _, _ in cli.SELENIUM_OPTION_FLAGS}
+    assert settings['use_download_archive'] is False
+    assert settings['proxy'] is None
+
+
+@pytest.mark.parametrize("format_argument, format_string", [
+    ("Best Quality (Default)", gui.FORMAT_OPTIONS["Best Quality (Default)"]),
+    ("bv*[height<=720]+ba", "bv*[height<=720]+ba"), # String format yt-dlp mentah diteruskan apa adanya
+])
+def test_build_settings_resolves_format_labels(tmp_path, format_argument, format_string):
+    args = cli.build_argument_parser().parse_args(["-o", str(tmp_path), "--format", format_argument, CHANNEL])
+    assert cli.build_settings(args, str(tmp_path))['format_string'] == format_string
+
+
+@pytest.mark.parametrize("outcome, failed, exit_code", [
+    (gui.PIPELINE_RESULT_COMPLETED, 0, cli.EXIT_OK),
+    (gui.PIPELINE_RESULT_UP_TO_DATE, 0, cli.EXIT_OK),
+    (gui.PIPELINE_RESULT_COMPLETED, 2, cli.EXIT_DOWNLOAD_FAILURES),
+    (gui.PIPELINE_RESULT_NO_SHORTS, 0, cli.EXIT_NO_SHORTS),
+    (gui.PIPELINE_RESULT_CANCELLED, 0, cli.EXIT_CANCELLED),
+    (None, 0, cli.EXIT_PIPELINE_ERROR),
+])
+def test_get_job_exit_code(outcome, failed, exit_code):
+    job = gui.ChannelJob(1, "alpha", {'channel_url': CHANNEL, 'main_output_directory': "out"})
+    job.outcome = outcome
+    for i in range(failed):
+        job.status_store.add(f"https://www.youtube.com/shorts/v{i}", "t", status='Error (Access Denied)')
+    assert cli.get_job_exit_code(job) == exit_code
+
+
+@pytest.mark.parametrize("argv", [
+    [], # Tanpa URL channel
+    ["--limit", "0", CHANNEL],
+    ["--download-workers", "-1", CHANNEL],
+    ["--metadata-profile", "turbo", CHANNEL],
+])
+def test_main_usage_errors_exit_2(tmp_path, fake_pipeline, argv):
+    with pytest.raises(SystemExit) as excinfo:
+        run_main(tmp_path, *argv)
+    assert excinfo.value.code == cli.EXIT_USAGE
+
+
+def test_main_missing_channels_file_exits_2(tmp_path, fake_pipeline):
+    with pytest.raises(SystemExit) as excinfo:
+        run_main(tmp_path, "--channels-file", str(tmp_path / "missing.txt"))
+    assert excinfo.value.code == cli.EXIT_USAGE
+
+
+@pytest.mark.parametrize("outcome, exit_code", [
+    (gui.PIPELINE_RESULT_COMPLETED, cli.EXIT_OK),
+    (("failed", 1), cli.EXIT_DOWNLOAD_FAILURES),
+    (gui.PIPELINE_RESULT_NO_SHORTS, cli.EXIT_NO_SHORTS),
+    (RuntimeError("boom"), cli.EXIT_PIPELINE_ERROR),
+    (gui.PIPELINE_RESULT_CANCELLED, cli.EXIT_CANCELLED),
+])
+def test_main_exit_code_for_single_channel(tmp_path, fake_pipeline, errors, outcome, exit_code):
+    fake_pipeline[CHANNEL] = outcome
+    assert run_main(tmp_path, CHANNEL) == exit_code
+
+
+def test_main_returns_most_severe_exit_code_across_channels(tmp_path, fake_pipeline, capsys):
+    channels = ["https://www.youtube.com/@alpha", "https://www.youtube.com/@beta", "https://www.youtube.com/@gamma"]
+    fake_pipeline[channels[1]] = ("failed", 3)
+    fake_pipeline[channels[2]] = gui.PIPELINE_RESULT_NO_SHORTS
+    assert run_main(tmp_path, *channels) == cli.EXIT_NO_SHORTS
+    output = capsys.readouterr().out
+    assert f"Channel 2/3 {channels[1]}: exit code {cli.EXIT_DOWNLOAD_FAILURES}" in output
+    assert f"Channel 3/3 {channels[2]}: exit code {cli.EXIT_NO_SHORTS}" in output
+
+
+def test_main_cancellation_wins_over_other_exit_codes(tmp_path, fake_pipeline):
+    channels = ["https://www.youtube.com/@alpha", "https://www.youtube.com/@beta"]
+    fake_pipeline[channels[0]] = gui.PIPELINE_RESULT_NO_SHORTS
+    fake_pipeline[channels[1]] = gui.PIPELINE_RESULT_CANCELLED
+    assert run_main(tmp_path, "--channel-workers", "1", *channels) == cli.EXIT_CANCELLED
+
+
+def test_main_queue_failure_exits_4(tmp_path, fake_pipeline, monkeypatch):
+    def broken_run(self):
+        raise RuntimeError("queue failed")
+
+    monkeypatch.setattr(gui.ChannelJobQueue, "run", broken_run)
+    assert run_main(tmp_path, CHANNEL) == cli.EXIT_PIPELINE_ERROR
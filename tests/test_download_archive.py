@@ -0,0 +1,38 @@
+# Test arsip download lintas run (format --download-archive yt-dlp)
+import threading
+
+import gui
+
+
+def test_download_archive_uses_yt_dlp_format_and_reloads(tmp_path):
+    archive_path = tmp_path / gui.DOWNLOAD_ARCHIVE_FILENAME
+    archive_path.write_text("youtube aaa\nyoutube bbb\nvimeo 123\n\nbroken line here\n", encoding="utf-8")
+    archive = gui.DownloadArchive(str(archive_path))
+    assert len(archive) == 2 and archive.contains("aaa") and not archive.contains("123")
+    archive.add("ccc")
+    archive.add("ccc") # Duplikat tidak ditulis ulang
+    archive.add("")
+    assert archive_path.read_text(encoding="utf-8").splitlines()[-1] == "youtube ccc"
+    assert archive_path.read_text(encoding="utf-8").count("ccc") == 1
+    assert gui.DownloadArchive(str(archive_path)).snapshot() == {"aaa", "bbb", "ccc"}
+
+
+def test_download_archive_filters_known_urls(tmp_path):
+    archive = gui.DownloadArchive(str(tmp_path / gui.DOWNLOAD_ARCHIVE_FILENAME))
+    archive.add("known1")
+    urls = ["https://www.youtube.com/shorts/known1", "https://www.youtube.com/shorts/fresh1",
+            "https://www.youtube.com/shorts/fresh2"]
+    assert archive.filter_new_urls(urls) == (urls[1:], 1)
+
+
+def test_download_archive_concurrent_adds(tmp_path):
+    archive_path = tmp_path / gui.DOWNLOAD_ARCHIVE_FILENAME
+    archive = gui.DownloadArchive(str(archive_path))
+    threads = [threading.Thread(target=lambda start=start: [archive.add(f"v{i % 50}") for i in range(start, start + 50)])
+               for start in range(0, 200, 25)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    lines = archive_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(set(lines)) == 50
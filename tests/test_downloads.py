@@ -0,0 +1,147 @@
+# Test download_videos_from_links dengan downloader palsu (tanpa yt-dlp dan tanpa jaringan)
+import threading
+
+import pytest
+
+import gui
+from tests.helpers import fake_discovery
+
+
+class FakeDownloader:
+    """Pengganti InProcessDownloader: mencatat link dan menjalankan aksi per video (return code atau exception)."""
+
+    def __init__(self, actions):
+        self.actions = actions
+        self.downloaded = []
+
+    def download(self, link, output_path, cancel_event=None, on_progress=None, info_json_path=None):
+        self.downloaded.append(link)
+        action = self.actions.get(link, 0)
+        if isinstance(action, Exception):
+            raise action
+        return action, ""
+
+
+class FakeDownloaderPool:
+    def __init__(self, downloader):
+        self.downloader = downloader
+
+    def borrow(self):
+        return self.downloader
+
+    def give_back(self, downloader):
+        pass
+
+    def close(self):
+        pass
+
+
+def make_batch(count):
+    status_store = gui.StatusStore()
+    metadata_list = []
+    for i in range(count):
+        url = f"https://www.youtube.com/shorts/video{i:05d}"
+        status_store.add(url, f"Video {i}")
+        metadata_list.append({"url": url, "title": f"Video {i}", "description": ""})
+    return metadata_list, status_store
+
+
+def run_batch(metadata_list, status_store, tmp_path, **kwargs):
+    return gui.download_videos_from_links(metadata_list, str(tmp_path), "best", 1, 0, None, status_store,
+                                          gui.NullProgressVar(), gui.NullProgressVar(),
+                                          cancel_event=threading.Event(), **kwargs)
+
+
+def test_in_process_file_not_found_fails_only_that_video(tmp_path, errors):
+    metadata_list, status_store = make_batch(3)
+    downloader = FakeDownloader({metadata_list[1]["url"]: FileNotFoundError("video00001.mp4.part")})
+    failed = run_batch(metadata_list, status_store, tmp_path, downloader_pool=FakeDownloaderPool(downloader))
+    assert failed == [metadata_list[1]["url"]]
+    assert [status_store.get(item["url"]).status for item in metadata_list] == ["Downloaded", "Error (Unexpected)", "Downloaded"]
+    assert len(downloader.downloaded) == 3
+    assert errors == [] # Tidak ada error "yt-dlp not found"
+
+
+def test_subprocess_missing_executable_stops_batch(tmp_path, errors, monkeypatch):
+    def missing_executable(*args, **kwargs):
+        raise FileNotFoundError("yt-dlp")
+    monkeypatch.setattr(gui.subprocess, "Popen", missing_executable)
+    metadata_list, status_store = make_batch(3)
+    failed = run_batch(metadata_list, status_store, tmp_path, download_engine=gui.DOWNLOAD_ENGINES["Subprocess yt-dlp (Legacy)"])
+    assert failed == [item["url"] for item in metadata_list]
+    assert {status_store.get(item["url"]).status for item in metadata_list} == {"Error (yt-dlp not found)"}
+    assert len(errors) == 1
+
+
+@pytest.fixture
+def missing_yt_dlp(monkeypatch):
+    launches = []
+    def missing_executable(command, *args, **kwargs):
+        launches.append(command)
+        raise FileNotFoundError("yt-dlp")
+    monkeypatch.setattr(gui.subprocess, "Popen", missing_executable)
+    return launches
+
+
+@pytest.mark.parametrize("pipeline_mode", ["staged", "streaming"])
+def test_missing_yt_dlp_is_reported_once_per_run(pipeline_mode, pipeline_settings, errors, missing_yt_dlp, monkeypatch):
+    video_ids = [f"video{i:05d}" for i in range(250)] # 3 batch
+    monkeypatch.setattr(gui, "discover_shorts_urls", fake_discovery(video_ids))
+    pipeline_settings.update(pipeline_mode=pipeline_mode, metadata_source="dom", download_workers=2,
+                             download_engine=gui.DOWNLOAD_ENGINES["Subprocess yt-dlp (Legacy)"])
+    status_store = gui.StatusStore()
+    result = gui.run_pipeline(pipeline_settings, gui.NullProgressVar(), gui.NullProgressVar(), threading.Event(), status_store)
+    assert result == gui.PIPELINE_RESULT_COMPLETED
+    assert status_store.count("Error (yt-dlp not found)") == len(video_ids)
+    assert len(errors) == 1
+    assert len(missing_yt_dlp) <= 2 # Hanya worker yang sudah berjalan saat yt-dlp pertama gagal yang mencoba launch
+
+
+@pytest.mark.parametrize("pipeline_mode", ["staged", "streaming"])
+def test_batch_folder_error_skips_only_that_batch(pipeline_mode, pipeline_settings, errors, missing_yt_dlp, monkeypatch):
+    video_ids = [f"video{i:05d}" for i in range(250)] # 3 batch
+    monkeypatch.setattr(gui, "discover_shorts_urls", fake_discovery(video_ids))
+    real_makedirs = gui.os.makedirs
+    def makedirs(path, *args, **kwargs):
+        if gui.os.path.basename(path) == "Batch_2":
+            raise PermissionError(13, "Permission denied", path)
+        return real_makedirs(path, *args, **kwargs)
+    monkeypatch.setattr(gui.os, "makedirs", makedirs)
+    pipeline_settings.update(pipeline_mode=pipeline_mode, metadata_source="dom",
+                             download_engine=gui.DOWNLOAD_ENGINES["Subprocess yt-dlp (Legacy)"])
+    # Event pembatalan dipakai bersama oleh semua channel di antrian; error folder tidak boleh men-set-nya
+    cancel_event = threading.Event()
+    status_store = gui.StatusStore()
+    result = gui.run_pipeline(pipeline_settings, gui.NullProgressVar(), gui.NullProgressVar(), cancel_event, status_store)
+    assert result == gui.PIPELINE_RESULT_COMPLETED
+    assert not cancel_event.is_set()
+    assert status_store.count("No") == gui.BATCH_SIZE # Video Batch_2 dilewati
+    assert status_store.count("Error (yt-dlp not found)") == len(video_ids) - gui.BATCH_SIZE
+    assert [title for title, _ in errors].count("Directory Error") == 1
+
+
+@pytest.mark.parametrize("pipeline_mode", ["staged", "streaming"])
+def test_download_session_closed_when_batch_loop_raises(pipeline_mode, pipeline_settings, errors, missing_yt_dlp, monkeypatch):
+    monkeypatch.setattr(gui, "discover_shorts_urls", fake_discovery([f"video{i:05d}" for i in range(10)]))
+    sessions = []
+    real_create_download_session = gui.create_download_session
+    def create_download_session(*args, **kwargs):
+        session = real_create_download_session(*args, **kwargs)
+        real_close = session.close
+        session.closed = False
+        def close():
+            session.closed = True
+            real_close()
+        session.close = close
+        sessions.append(session)
+        return session
+    monkeypatch.setattr(gui, "create_download_session", create_download_session)
+    def broken_save(metadata_list, output_filepath, export_format):
+        raise RuntimeError("exporter crashed")
+    monkeypatch.setattr(gui, "save_metadata_to_file", broken_save)
+    pipeline_settings.update(pipeline_mode=pipeline_mode, metadata_source="dom",
+                             download_engine=gui.DOWNLOAD_ENGINES["Subprocess yt-dlp (Legacy)"])
+
+    with pytest.raises(RuntimeError, match="exporter crashed"):
+        gui.run_pipeline(pipeline_settings, gui.NullProgressVar(), gui.NullProgressVar(), threading.Event(), gui.StatusStore())
+    assert [session.closed for session in sessions] == [True]
@@ -0,0 +1,55 @@
+# Test ekspor metadata batch (CSV/JSONL) dan penulisan atomik
+import csv
+import json
+
+import pytest
+
+import gui
+
+COLUMNS = ['Link URL', 'Title', 'Description']
+ROWS = [
+    ("https://www.youtube.com/shorts/abc", "Judul dengan émoji 🎬", "Baris satu\nBaris dua, dengan koma"),
+    ("https://www.youtube.com/shorts/def", "Second", ""),
+]
+
+
+def test_export_rows_csv(tmp_path):
+    output_filepath = tmp_path / "batch.csv"
+    gui.export_rows(str(output_filepath), COLUMNS, ROWS, gui.EXPORT_FORMATS["CSV (.csv)"])
+    assert output_filepath.read_bytes().startswith(b"\xef\xbb\xbf") # BOM agar Excel membaca UTF-8
+    with open(output_filepath, encoding="utf-8-sig", newline="") as f:
+        assert list(csv.reader(f)) == [COLUMNS] + [list(row) for row in ROWS]
+    assert [path.name for path in tmp_path.iterdir()] == ["batch.csv"]
+
+
+def test_export_rows_jsonl(tmp_path):
+    output_filepath = tmp_path / "batch.jsonl"
+    gui.export_rows(str(output_filepath), COLUMNS, ROWS, gui.EXPORT_FORMATS["JSON Lines (.jsonl)"])
+    lines = output_filepath.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [dict(zip(COLUMNS, row)) for row in ROWS]
+    assert "émoji 🎬" in lines[0] # ensure_ascii=False
+
+
+def test_export_rows_failure_keeps_previous_file(tmp_path, monkeypatch):
+    output_filepath = tmp_path / "master.csv"
+    output_filepath.write_text("previous", encoding="utf-8")
+
+    def failing_writer(filepath, columns, rows):
+        with open(filepath, "w") as f:
+            f.write("half")
+        raise OSError("disk full")
+
+    monkeypatch.setitem(gui.EXPORT_WRITERS, "csv", failing_writer)
+    with pytest.raises(OSError):
+        gui.export_rows(str(output_filepath), COLUMNS, ROWS, "csv")
+    assert output_filepath.read_text(encoding="utf-8") == "previous"
+    assert [path.name for path in tmp_path.iterdir()] == ["master.csv"] # File .partial dihapus
+
+
+def test_save_metadata_to_file_adds_page_columns(tmp_path):
+    output_filepath = tmp_path / "batch.jsonl"
+    metadata_list = [dict(url=ROWS[0][0], title="t", description="", view_count="1.2K views", thumbnail_url="https://i.ytimg.com/x.jpg")]
+    assert gui.save_metadata_to_file(metadata_list, str(output_filepath), "jsonl") is True
+    assert json.loads(output_filepath.read_text(encoding="utf-8")) == {
+        'Link URL': ROWS[0][0], 'Title': "t", 'Description': "", 'Views': "1.2K views", 'Thumbnail URL': "https://i.ytimg.com/x.jpg"}
+    assert gui.save_metadata_to_file([], str(tmp_path / "empty.csv"), "csv") is False
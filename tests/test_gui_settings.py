@@ -0,0 +1,72 @@
+# Test pembacaan form GUI menjadi settings pipeline (read_gui_settings), tanpa membuat jendela Tk
+import pytest
+
+import cli
+import gui
+
+
+class FieldStub:
+    """Pengganti widget/variabel Tkinter: cukup punya .get()."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def make_form(**overrides):
+    """Form GUI dengan nilai default seperti yang diisi main()."""
+    values = {
+        'main_output_directory': "/tmp/shorts",
+        'channel_urls': "https://www.youtube.com/@a, https://www.youtube.com/@b",
+        'proxy': "",
+        'use_download_archive': True,
+        'resume': False,
+        'single_pass': False,
+    }
+    values.update({key: "" for key in gui.GUI_NUMBER_FIELDS})
+    values.update({key: default_name for key, (_, default_name) in gui.GUI_CHOICE_FIELDS.items()})
+    values.update(overrides)
+    form = {key: FieldStub(value) for key, value in values.items()}
+    form['selenium_options'] = {option_key: FieldStub(default) for option_key, _, default, _ in cli.SELENIUM_OPTION_FLAGS}
+    return form
+
+
+def test_form_builds_the_same_settings_keys_as_the_cli():
+    settings, channel_urls, queue_options = gui.read_gui_settings(make_form())
+
+    args = cli.build_argument_parser().parse_args(["-o", "/tmp/shorts", "https://www.youtube.com/@a"])
+    assert set(settings) == set(gui.PIPELINE_SETTINGS_KEYS) == set(cli.build_settings(args, "/tmp/shorts"))
+    assert channel_urls == ["https://www.youtube.com/@a", "https://www.youtube.com/@b"]
+    assert queue_options == {'channel_workers': gui.DEFAULT_CHANNEL_WORKERS, 'browser_slots': gui.DEFAULT_BROWSER_SLOTS}
+    assert settings['num_videos_limit'] is None
+    assert settings['retries'] == gui.DEFAULT_RETRIES
+    assert settings['proxy'] is None
+    assert settings['format_string'] == gui.FORMAT_OPTIONS["Best Quality (Default)"]
+
+
+def test_form_parses_numbers_and_choices():
+    settings, _, queue_options = gui.read_gui_settings(make_form(
+        num_videos_limit=" 25 ", metadata_rate_limit="2.5", browser_slots="3",
+        export_format="CSV (.csv)", proxy=" http://host:8080 "))
+
+    assert settings['num_videos_limit'] == 25
+    assert settings['metadata_rate_limit'] == 2.5
+    assert settings['export_format'] == gui.EXPORT_FORMATS["CSV (.csv)"]
+    assert settings['proxy'] == "http://host:8080"
+    assert queue_options['browser_slots'] == 3
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({'main_output_directory': ""}, "Please select a main output folder."),
+    ({'channel_urls': " "}, "Please enter a YouTube channel URL."),
+    ({'num_videos_limit': "0"}, "Number of videos must be a positive integer."),
+    ({'retries': "-1"}, "Number of retries must be a non-negative integer."),
+    ({'metadata_cache_ttl_days': "-0.5"}, "Metadata cache TTL must be a non-negative number."),
+    ({'download_workers': "two"}, "Please enter a valid number for number of download workers."),
+])
+def test_invalid_form_reports_one_message(overrides, message):
+    with pytest.raises(ValueError) as error:
+        gui.read_gui_settings(make_form(**overrides))
+    assert str(error.value) == message
@@ -0,0 +1,116 @@
+# Test parser dan discovery InnerTube terhadap data JSON rekaman (dipotong) yang disajikan stub server lokal
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import gui
+from tests.helpers import build_innertube_channel_page, load_innertube_fixture
+
+CONTINUATION_FIXTURES = {
+    "PAGE_2": "shorts_continuation_page_2.json",
+    "PAGE_3": "shorts_continuation_page_3.json",
+}
+ALL_IDS = [f"short0000{i}" for i in range(1, 10)]
+
+
+@pytest.fixture
+def stub_server():
+    """Stub server YouTube lokal. Token yang tidak dikenal (misal token chip urutan) dijawab 404."""
+    requests_seen = {"pages": [], "tokens": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen["pages"].append(self.path)
+            if self.path != "/@stub/shorts":
+                self.send_error(404)
+                return
+            self.reply(build_innertube_channel_page(load_innertube_fixture("shorts_tab_initial_data.json")))
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            token = payload.get("continuation")
+            requests_seen["tokens"].append(token)
+            if not self.path.startswith("/youtubei/v1/browse") or token not in CONTINUATION_FIXTURES:
+                self.send_error(404)
+                return
+            self.reply(json.dumps(load_innertube_fixture(CONTINUATION_FIXTURES[token])))
+
+        def reply(self, body):
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", requests_seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def discover(base_url, **kwargs):
+    return gui.get_all_shorts_urls_innertube("https://www.youtube.com/@stub", None, None, gui.NullProgressVar(),
+                                             threading.Event(), base_url=base_url, **kwargs)
+
+
+def test_initial_page_reads_only_grid_tiles_and_grid_token():
+    video_ids, token = gui.parse_innertube_shorts_page(load_innertube_fixture("shorts_tab_initial_data.json"))
+    assert video_ids == ALL_IDS[:4]
+    # Token chip Popular/Oldest di header grid tidak boleh dipakai
+    assert token == "PAGE_2"
+
+
+def test_continuation_page_ignores_tokens_outside_grid():
+    video_ids, token = gui.parse_innertube_shorts_page(load_innertube_fixture("shorts_continuation_page_2.json"))
+    assert video_ids == ALL_IDS[4:7]
+    assert token == "PAGE_3" # Dibungkus commandExecutorCommand; token entity di frameworkUpdates diabaikan
+
+
+def test_last_page_has_no_token():
+    video_ids, token = gui.parse_innertube_shorts_page(load_innertube_fixture("shorts_continuation_page_3.json"))
+    assert video_ids == ALL_IDS[7:]
+    assert token is None
+
+
+def test_page_metadata_from_both_tile_layouts():
+    page_metadata = {}
+    gui.parse_innertube_shorts_page(load_innertube_fixture("shorts_tab_initial_data.json"), page_metadata)
+    assert sorted(page_metadata) == ALL_IDS[:4]
+    assert page_metadata["short00001"] == {"title": "First short", "view_count": "1.2M views",
+                                           "thumbnail_url": "https://i.ytimg.com/vi/short00001/frame0.jpg"}
+    assert page_metadata["short00002"]["title"] == "Second short"
+    assert page_metadata["short00002"]["view_count"] == "980K views"
+
+
+def test_discovery_follows_grid_continuations(stub_server):
+    base_url, requests_seen = stub_server
+    pages = []
+    urls = discover(base_url, on_new_urls=pages.append)
+    assert urls == [f"https://www.youtube.com/shorts/{video_id}" for video_id in ALL_IDS]
+    assert requests_seen["tokens"] == ["PAGE_2", "PAGE_3"]
+    assert [len(page) for page in pages] == [4, 3, 2]
+
+
+def test_discovery_respects_video_limit(stub_server):
+    base_url, requests_seen = stub_server
+    urls = gui.get_all_shorts_urls_innertube("https://www.youtube.com/@stub", 5, None, gui.NullProgressVar(),
+                                             threading.Event(), base_url=base_url)
+    assert urls == [f"https://www.youtube.com/shorts/{video_id}" for video_id in ALL_IDS[:5]]
+    assert requests_seen["tokens"] == ["PAGE_2"]
+
+
+def test_discovery_stops_after_known_streak(stub_server):
+    base_url, requests_seen = stub_server
+    # Run inkremental: dua video terbaru baru, sisanya sudah ada di arsip
+    urls = discover(base_url, known_video_ids=set(ALL_IDS[2:]), known_stop_threshold=2)
+    assert urls == [f"https://www.youtube.com/shorts/{video_id}" for video_id in ALL_IDS[:4]]
+    assert requests_seen["tokens"] == []
@@ -0,0 +1,83 @@
+# Test master status: ringkasan dari jurnal checkpoint (CheckpointStatusView) dan file master hasil pipeline
+import csv
+import glob
+import json
+import os
+import threading
+
+import pytest
+
+import gui
+from tests.helpers import fake_discovery
+
+CHANNEL_URL = "https://www.youtube.com/@stub"
+
+
+def test_view_reads_only_complete_new_lines(tmp_path):
+    path = str(tmp_path / gui.CHECKPOINT_FILENAME)
+    checkpoint = gui.PipelineCheckpoint(path, CHANNEL_URL)
+    checkpoint.record_metadata({"url": "u1", "title": "One", "description": ""})
+    checkpoint.record_metadata({"url": "u2", "title": "Two", "description": ""})
+    checkpoint.record_batch(2, ["u2"])
+    checkpoint.record_batch(1, ["u1"])
+    checkpoint.record_status("u1", "Downloaded")
+
+    view = gui.CheckpointStatusView(path)
+    view.refresh()
+    assert view.to_rows() == [("u1", "One", "Downloaded"), ("u2", "Two", "No")]
+    version = view.version
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "status", "url": "u2", "status": "Err') # Baris yang sedang ditulis
+    view.refresh()
+    assert view.version == version
+    assert view.to_rows()[1] == ("u2", "Two", "No")
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('or"}\n')
+    view.refresh()
+    assert view.to_rows()[1] == ("u2", "Two", "Error")
+    checkpoint.close()
+
+
+def test_view_starts_over_when_the_journal_is_replaced(tmp_path):
+    path = str(tmp_path / gui.CHECKPOINT_FILENAME)
+    checkpoint = gui.PipelineCheckpoint(path, CHANNEL_URL)
+    checkpoint.record_batch(1, ["u1", "u2", "u3"])
+    checkpoint.close()
+    view = gui.CheckpointStatusView(path)
+    view.refresh()
+    assert len(view) == 3
+
+    checkpoint = gui.PipelineCheckpoint(path, CHANNEL_URL) # Run baru mengganti jurnal
+    checkpoint.record_batch(1, ["u9"])
+    checkpoint.close()
+    view.refresh()
+    assert view.to_rows() == [("u9", "Untitled", "No")]
+
+
+@pytest.mark.parametrize("pipeline_mode", ["staged", "streaming"])
+@pytest.mark.parametrize("export_format", ["csv", "jsonl"])
+def test_pipeline_writes_master_from_journal_in_selected_format_only(pipeline_mode, export_format, pipeline_settings, errors, monkeypatch):
+    video_ids = [f"video{i:05d}" for i in range(5)]
+    monkeypatch.setattr(gui, "discover_shorts_urls", fake_discovery(video_ids))
+    def missing_executable(*args, **kwargs):
+        raise FileNotFoundError("yt-dlp")
+    monkeypatch.setattr(gui.subprocess, "Popen", missing_executable)
+    pipeline_settings.update(pipeline_mode=pipeline_mode, metadata_source="dom", export_format=export_format,
+                             download_engine=gui.DOWNLOAD_ENGINES["Subprocess yt-dlp (Legacy)"])
+    output_directory = pipeline_settings["main_output_directory"]
+
+    status_store = gui.StatusStore()
+    gui.run_pipeline(pipeline_settings, gui.NullProgressVar(), gui.NullProgressVar(), threading.Event(), status_store)
+    gui.finish_master_status_compactor(wait=True, output_directory=output_directory)
+
+    master_files = glob.glob(os.path.join(output_directory, "*_shorts_download_status.*"))
+    assert [os.path.splitext(path)[1] for path in master_files] == [f".{export_format}"]
+    with open(master_files[0], encoding="utf-8") as f:
+        if export_format == "csv":
+            rows = [tuple(row) for row in csv.reader(f)][1:]
+        else:
+            rows = [tuple(json.loads(line).values()) for line in f]
+    assert rows == status_store.to_rows()
+    assert {status for _, _, status in rows} == {"Error (yt-dlp not found)"}
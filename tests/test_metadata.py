@@ -0,0 +1,96 @@
+# Test profil metadata (Full vs Fast) dengan YoutubeDL palsu (tanpa yt-dlp dan tanpa jaringan)
+import types
+
+import pytest
+
+import cli
+import gui
+
+FULL = gui.METADATA_PROFILES["Full Extraction (Default)"]
+FAST = gui.METADATA_PROFILES["Fast (Skip Formats/Player JS)"]
+
+VIDEOS = {
+    "abc123def45": {"title": "First short", "description": "Line one\nLine two"},
+    "zyx987wvu65": {"title": "Second short", "description": ""},
+    "noDescript1": {"title": "No description field"},
+}
+
+
+class FakeYoutubeDL:
+    """
+    Meniru extract_info yt-dlp: process=True menambahkan hasil pemrosesan format (yang diabaikan saat ekspor),
+    process=False mengembalikan hasil extractor mentah. Title/description sama untuk kedua mode.
+    """
+    instances = []
+
+    def __init__(self, opts):
+        self.opts = opts
+        self.calls = []
+        FakeYoutubeDL.instances.append(self)
+
+    def extract_info(self, url, download=False, process=True):
+        self.calls.append((url, download, process))
+        video_id = url.rsplit("/", 1)[1]
+        entry = {"id": video_id, "webpage_url": f"https://www.youtube.com/watch?v={video_id}", **VIDEOS[video_id]}
+        if process:
+            entry.update(formats=[{"format_id": "18"}], requested_formats=None, format_id="18")
+        return entry
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_ydl(monkeypatch):
+    FakeYoutubeDL.instances = []
+    monkeypatch.setattr(gui, "yt_dlp", types.SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+    return FakeYoutubeDL
+
+
+def fetch_all(profile):
+    fetcher = gui.MetadataFetcher(None, max_workers=1, metadata_profile=profile)
+    try:
+        return [fetcher.fetch(f"https://www.youtube.com/shorts/{video_id}") for video_id in VIDEOS]
+    finally:
+        fetcher.close()
+
+
+def test_full_is_the_default_profile():
+    assert gui.GUI_CHOICE_FIELDS["metadata_profile"] == (gui.METADATA_PROFILES, "Full Extraction (Default)")
+    args = cli.build_argument_parser().parse_args(["-o", "out", "https://www.youtube.com/@stub"])
+    assert args.metadata_profile == FULL
+    assert gui.MetadataFetcher(None).process_results is True
+
+
+def test_fast_and_full_profiles_export_identical_fields(fake_ydl):
+    full_rows = fetch_all(FULL)
+    fast_rows = fetch_all(FAST)
+
+    assert full_rows == fast_rows
+    assert [sorted(row) for row in fast_rows] == [["description", "title", "url"]] * len(VIDEOS)
+    assert fast_rows[0] == {"url": "https://www.youtube.com/shorts/abc123def45", "title": "First short",
+                            "description": "Line one\nLine two"}
+    assert fast_rows[2]["description"] == ""
+    full_ydl, fast_ydl = fake_ydl.instances
+    assert {process for _, _, process in full_ydl.calls} == {True}
+    assert {process for _, _, process in fast_ydl.calls} == {False}
+    assert all(download is False for _, download, _ in full_ydl.calls + fast_ydl.calls)
+
+
+def test_build_metadata_ydl_opts_per_profile():
+    full_opts = gui.build_metadata_ydl_opts(None, FULL)
+    assert full_opts["force_generic_extractor"] is True and full_opts["extract_flat"] is False
+    assert "extractor_args" not in full_opts and "proxy" not in full_opts
+
+    fast_opts = gui.build_metadata_ydl_opts("http://127.0.0.1:8080", FAST)
+    assert fast_opts["noplaylist"] is True and "force_generic_extractor" not in fast_opts
+    assert fast_opts["extractor_args"]["youtube"]["player_skip"] == ["js"]
+    assert set(fast_opts["extractor_args"]["youtube"]["skip"]) == {"dash", "hls", "translated_subs"}
+    assert fast_opts["proxy"] == "http://127.0.0.1:8080"
+
+    # Single-pass menyimpan info dict lengkap untuk download, jadi profil diabaikan
+    for profile in (FULL, FAST):
+        single_pass_opts = gui.build_metadata_ydl_opts(None, profile, keep_formats=True)
+        assert single_pass_opts["noplaylist"] is True
+        assert "extractor_args" not in single_pass_opts and "force_generic_extractor" not in single_pass_opts
+    assert all(opts["ignoreerrors"] and opts["quiet"] for opts in (full_opts, fast_opts))
@@ -0,0 +1,65 @@
+# Test cache metadata SQLite (TTL, eviction, persistensi)
+import gui
+
+
+def metadata_for(video_id, title="Title"):
+    return {'url': f"https://www.youtube.com/shorts/{video_id}", 'title': title, 'description': f"About {video_id}"}
+
+
+class Clock:
+    """Pengganti time.time yang bisa dimajukan manual."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_metadata_cache_hit_miss_and_persistence(tmp_path):
+    db_path = str(tmp_path / gui.METADATA_CACHE_FILENAME)
+    cache = gui.MetadataCache(db_path, ttl_seconds=3600)
+    assert cache.get("abc") is None
+    cache.put("abc", metadata_for("abc"))
+    cache.put("abc", metadata_for("abc", title="Updated")) # Entri yang sama ditimpa
+    assert cache.get("abc") == metadata_for("abc", title="Updated")
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    reopened = gui.MetadataCache(db_path, ttl_seconds=3600)
+    assert reopened.get("abc") == metadata_for("abc", title="Updated")
+    reopened.close()
+
+
+def test_metadata_cache_ignores_and_evicts_expired_entries(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(gui.time, "time", clock)
+    cache = gui.MetadataCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+    cache.put("old", metadata_for("old"))
+    clock.now += 30
+    cache.put("new", metadata_for("new"))
+    clock.now += 45 # "old" berumur 75 detik (> TTL), "new" 45 detik
+    assert cache.get("old") is None
+    assert cache.get("new") == metadata_for("new")
+    cache.evict()
+    assert [row[0] for row in cache.conn.execute("SELECT video_id FROM metadata_cache")] == ["new"]
+    cache.close()
+
+
+def test_metadata_cache_keeps_only_newest_max_entries(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(gui.time, "time", clock)
+    cache = gui.MetadataCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=3600, max_entries=3)
+    for i in range(5):
+        clock.now += 1
+        cache.put(f"v{i}", metadata_for(f"v{i}"))
+    cache.evict()
+    assert sorted(row[0] for row in cache.conn.execute("SELECT video_id FROM metadata_cache")) == ["v2", "v3", "v4"]
+    cache.close()
+
+
+def test_open_metadata_cache_disabled_with_zero_ttl(pipeline_settings):
+    assert gui.open_metadata_cache(dict(pipeline_settings, metadata_cache_ttl_days=0)) is None
+    cache = gui.open_metadata_cache(dict(pipeline_settings, metadata_cache_ttl_days=1))
+    assert cache.ttl_seconds == 24 * 60 * 60
+    cache.close()
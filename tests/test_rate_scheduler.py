@@ -0,0 +1,79 @@
+# Test RateScheduler dengan jam palsu (tanpa sleep sungguhan)
+import random
+import threading
+import types
+
+import pytest
+
+import gui
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(gui, "time", types.SimpleNamespace(monotonic=fake_clock.monotonic, sleep=fake_clock.sleep))
+    return fake_clock
+
+
+def start_times(scheduler, clock, stages):
+    """Menjalankan wait() untuk setiap tahap secara berurutan dan mengembalikan waktu mulai masing-masing."""
+    times = []
+    for stage in stages:
+        assert scheduler.wait(stage=stage)
+        times.append(round(clock.now, 6))
+    return times
+
+
+def test_unlimited_scheduler_never_waits(clock):
+    scheduler = gui.RateScheduler(0)
+    assert start_times(scheduler, clock, [None, gui.RATE_STAGE_DOWNLOAD, None]) == [0.0, 0.0, 0.0]
+
+
+def test_shared_rate_spaces_requests(clock):
+    scheduler = gui.RateScheduler(2)
+    assert start_times(scheduler, clock, [None] * 4) == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_burst_runs_back_to_back_then_paces(clock):
+    scheduler = gui.RateScheduler(1, burst=3)
+    assert start_times(scheduler, clock, [None] * 5) == [0.0, 0.0, 0.0, 1.0, 2.0]
+
+
+def test_metadata_and_downloads_share_one_budget(clock):
+    # Tanpa batas tahap download, setiap download mengambil token dari anggaran yang sama dengan metadata
+    scheduler = gui.RateScheduler(1)
+    stages = [None, gui.RATE_STAGE_DOWNLOAD] * 3
+    assert start_times(scheduler, clock, stages) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_download_stage_limit_applies_on_top_of_shared_budget(clock):
+    scheduler = gui.RateScheduler(10, stage_rates={gui.RATE_STAGE_DOWNLOAD: 0.5}) # Jeda download 2 detik
+    times = start_times(scheduler, clock, [gui.RATE_STAGE_DOWNLOAD, None, None, gui.RATE_STAGE_DOWNLOAD, None])
+    assert times == [0.0, 0.1, 0.2, 2.0, 2.1]
+
+
+def test_wait_is_interrupted_by_cancellation(clock):
+    scheduler = gui.RateScheduler(0.001)
+    cancel_event = threading.Event()
+    assert scheduler.wait(cancel_event)
+    cancel_event.set()
+    assert not scheduler.wait(cancel_event)
+
+
+@pytest.mark.parametrize("jitter", ["uniform", "exponential"])
+def test_jitter_keeps_average_rate(clock, jitter):
+    random.seed(1234)
+    scheduler = gui.RateScheduler(4, jitter=jitter)
+    times = start_times(scheduler, clock, [None] * 2001)
+    assert times[-1] / 2000 == pytest.approx(0.25, rel=0.05)
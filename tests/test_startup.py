@@ -0,0 +1,33 @@
+# Test startup: cli.py/gui.py tidak boleh memuat library berat saat diimpor (dijalankan di proses Python baru,
+# karena proses pytest sendiri mungkin sudah memuat sebagian modul)
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("tkinter", "ttkthemes", "yt_dlp", "pandas", "openpyxl", "selenium", "webdriver_manager", "pyarrow")
+
+# Membuat import library berat gagal (ImportError), seperti di mesin tanpa display atau sebelum pip install
+BLOCK_HEAVY_MODULES_CODE = "import sys\nfor name in %r:\n    sys.modules[name] = None\n" % (HEAVY_MODULES,)
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], cwd=REPO_DIRECTORY, capture_output=True, text=True, timeout=60)
+
+
+@pytest.mark.parametrize("module_name", ["cli", "gui"])
+def test_import_loads_no_heavy_modules(module_name):
+    result = run_python(f"import sys, {module_name}\n"
+                        f"print(sorted({{name.split('.')[0] for name in sys.modules}} & set({HEAVY_MODULES!r})))")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_cli_help_works_without_tk_or_yt_dlp():
+    result = run_python(BLOCK_HEAVY_MODULES_CODE +
+                        "import runpy\nsys.argv = ['cli.py', '--help']\nrunpy.run_path('cli.py', run_name='__main__')")
+    assert result.returncode == 0, result.stderr
+    assert "--metadata-profile" in result.stdout